@@ -1,57 +1,153 @@
 from conan.api.conan_api import ConanAPI
 from conan.cli.command import conan_command
 import json
+import os
+import sys
+from pathlib import Path
+
+# extensions/graph lives next to extensions/commands both in this repository
+# and in $CONAN_HOME/extensions after install-extensions.sh
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "graph"))
+
+from analyzer import (  # noqa: E402
+    GraphCache,
+    analyze_graph,
+    compact_graph,
+    graph_cache_key,
+    load_graph,
+    save_graph,
+)
+
+
+def _read(path):
+    if path and os.path.exists(path):
+        with open(path, "r") as f:
+            return f.read()
+    return ""
+
+
+def _lockfile_path(lockfile, conanfile):
+    """
+    Lockfile the graph is resolved with, as ConanAPI.lockfile.get_lockfile
+    picks it: the given path, else a conan.lock next to the conanfile (or in
+    the current folder without one); None when there is none.
+    """
+    if lockfile == "":
+        return None
+    if lockfile is None:
+        folder = os.path.dirname(conanfile) if conanfile else os.getcwd()
+        default = os.path.join(folder, "conan.lock")
+        return default if os.path.isfile(default) else None
+    return os.path.abspath(lockfile)
+
+
+def _load_build_costs(path):
+    """Per-package build durations (name -> seconds) from earlier builds"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return {k: float(v) for k, v in json.load(f).items()}
+
 
 @conan_command(group="OpenSSL")
 def graph(conan_api: ConanAPI, parser, *args):
     """
     Analyze OpenSSL dependency graph
-    
+
     Usage:
-        conan openssl:graph [--json]
-    
+        conan openssl:graph [PATH] [--json] [--profile=PROFILE] [--lockfile=LOCK]
+                            [--export=FILE] [--load=FILE] [--no-cache]
+
     Examples:
         conan openssl:graph
         conan openssl:graph --json > graph.json
+        conan openssl:graph --export=graph.min.json
+        conan openssl:graph --load=graph.min.json --json
     """
+    parser.add_argument("path", nargs="?", default=".",
+                       help="Folder containing a conanfile (default: .)")
     parser.add_argument("--json", action="store_true",
                        help="Output in JSON format")
-    
+    parser.add_argument("--profile", default="default",
+                       help="Host profile (default: default)")
+    parser.add_argument("--profile-build", default=None,
+                       help="Build profile (default: same as --profile)")
+    parser.add_argument("--lockfile", default=None,
+                       help="Lockfile used to resolve the graph")
+    parser.add_argument("--requires", action="append", default=None,
+                       help="Requirements when no conanfile exists (default: openssl/[>=3.0])")
+    parser.add_argument("--check-updates", action="store_true",
+                       help="Query remotes for newer recipe revisions (outdated refs)")
+    parser.add_argument("--build-costs", default=None,
+                       help="JSON file mapping package name to build seconds")
+    parser.add_argument("--export", default=None,
+                       help="Write the compact resolved graph to FILE")
+    parser.add_argument("--load", default=None,
+                       help="Analyze a previously exported graph instead of resolving")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always resolve the graph, ignoring the graph cache")
+
     args = parser.parse_args(*args)
-    
-    # Simple analysis without complex graph loading
+
+    cache_home = getattr(conan_api, "home_folder", None) or getattr(conan_api, "cache_folder")
+    cache = GraphCache(os.path.join(cache_home, "openssl-tools", "graph-cache"))
+    source = "resolved"
+
     try:
-        # Try to get basic dependency info from conanfile.txt
-        import os
-        if os.path.exists("conanfile.txt"):
-            with open("conanfile.txt", "r") as f:
-                content = f.read()
-                # Simple parsing for requires
-                requires = []
-                in_requires = False
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line == "[requires]":
-                        in_requires = True
-                        continue
-                    elif line.startswith('[') and line != "[requires]":
-                        in_requires = False
-                        continue
-                    elif in_requires and line and not line.startswith('#'):
-                        requires.append(line)
-                
-                results = {
-                    "total_deps": len(requires),
-                    "dependencies": [{"name": req.split('/')[0], "version": req.split('/')[1] if '/' in req else "unknown"} for req in requires],
-                    "fips_enabled": []
-                }
+        if args.load:
+            compact = load_graph(args.load)
+            source = "loaded"
         else:
-            results = {
-                "total_deps": 0,
-                "dependencies": [],
-                "fips_enabled": [],
-                "message": "No conanfile.txt found in current directory"
-            }
+            path = os.path.abspath(args.path)
+            conanfile = None
+            for candidate in ("conanfile.py", "conanfile.txt"):
+                if os.path.exists(os.path.join(path, candidate)):
+                    conanfile = os.path.join(path, candidate)
+                    break
+            requires = args.requires or ["openssl/[>=3.0]"]
+
+            profile_host = conan_api.profiles.get_profile([args.profile])
+            profile_build = conan_api.profiles.get_profile([args.profile_build or args.profile])
+            lockfile_path = _lockfile_path(args.lockfile, conanfile)
+
+            key = graph_cache_key(
+                _read(conanfile), requires if conanfile is None else "",
+                _read(lockfile_path), profile_host.dumps(), profile_build.dumps(),
+                args.check_updates,
+            )
+            compact = None if args.no_cache else cache.get(key)
+            if compact is not None:
+                source = "cache"
+            else:
+                remotes = conan_api.remotes.list()
+                # The lockfile hashed into the key, and no other ("" disables the default)
+                lockfile = conan_api.lockfile.get_lockfile(
+                    lockfile=lockfile_path or "", conanfile_path=conanfile, partial=True
+                )
+                if conanfile:
+                    deps_graph = conan_api.graph.load_graph_consumer(
+                        conanfile, None, None, None, None,
+                        profile_host, profile_build, lockfile, remotes, None,
+                        check_updates=args.check_updates,
+                    )
+                else:
+                    deps_graph = conan_api.graph.load_graph_requires(
+                        requires, None, profile_host, profile_build,
+                        lockfile, remotes, None, check_updates=args.check_updates,
+                    )
+                if not deps_graph.error:
+                    conan_api.graph.analyze_binaries(
+                        deps_graph, None, remotes=remotes, lockfile=lockfile
+                    )
+                compact = compact_graph(deps_graph)
+                if not compact["error"]:
+                    cache.put(key, compact)
+
+        if args.export:
+            save_graph(compact, args.export)
+
+        results = analyze_graph(compact, build_costs=_load_build_costs(args.build_costs))
+        results["source"] = source
     except Exception as e:
         results = {
             "total_deps": 0,
@@ -59,35 +155,28 @@ def graph(conan_api: ConanAPI, parser, *args):
             "fips_enabled": [],
             "error": str(e)
         }
-    
+
     # Output
     if args.json:
         print(json.dumps(results, indent=2))
     else:
         print(f"📊 Total dependencies: {results['total_deps']}")
-        if "fips_enabled" in results and results["fips_enabled"]:
+        if results.get("fips_enabled"):
             print(f"🔒 FIPS enabled: {', '.join(results['fips_enabled'])}")
-        if "dependencies" in results and results["dependencies"]:
+        if results.get("dependencies"):
             print("Dependencies:")
             for dep in results["dependencies"]:
-                print(f"  - {dep['name']}/{dep['version']}")
-        if "message" in results:
-            print(f"ℹ️  {results['message']}")
+                print(f"  - {dep['name']}/{dep['version']} ({dep['context']})")
+        if results.get("conflicts"):
+            print("⚠️  Conflicts:")
+            for conflict in results["conflicts"]:
+                print(f"  - {conflict}")
+        if results.get("outdated"):
+            print(f"⬆️  Outdated: {', '.join(results['outdated'])}")
+        if results.get("critical_path"):
+            print(f"⏱️  Critical build path ({results['critical_path_cost']:.1f}s): "
+                  f"{' -> '.join(results['critical_path'])}")
+        if "source" in results:
+            print(f"ℹ️  Graph source: {results['source']}")
         if "error" in results:
             print(f"❌ Error: {results['error']}")
-
-    conan_api.graph.load_graph_consumer(".", requires=["openssl/[>=3.0]"])      
-
-def analyze_dependencies(graph):
-    results = {
-        "total_deps": len(graph.dependencies),
-        "conflicts": [],
-        "outdated": [],
-        "fips_enabled": []
-    }
-    
-    for dep in graph.dependencies.values():
-        # Detekce FIPS
-        if hasattr(dep.conanfile, "options") and \
-           dep.conanfile.options.get_safe("enable_fips"):
-            results["fips_enabled"].append(str(dep.ref))
@@ -1,32 +1,233 @@
 import os
 import json
+import errno
+import hashlib
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+MANIFEST_NAME = ".deploy_manifest.json"
+CHUNK_SIZE = 1024 * 1024
+# Deployed files up to this size are re-hashed when checking an unchanged package
+SMALL_FILE_SIZE = 64 * 1024
+# Linux FICLONE ioctl (copy-on-write clone on btrfs/xfs/overlayfs)
+FICLONE = 0x40049409
+
+
 def deploy(graph, output_folder: str, **kwargs):
-    """Enhanced deployer s SBOM generation a FIPS artifacts"""
+    """Enhanced deployer s SBOM generation a FIPS artifacts
+
+    Packages are materialized in parallel straight from the Conan cache.
+    Behaviour is controlled through conf (or the matching environment
+    variables):
+
+    - ``user.openssl:deploy_mode`` (``OPENSSL_DEPLOY_MODE``): ``auto``
+      (reflink, then hardlink, then copy), ``reflink``, ``hardlink`` or
+      ``copy``. Hardlinked files share their inode with the cache and must
+      not be modified in place.
+    - ``user.openssl:deploy_jobs`` (``OPENSSL_DEPLOY_JOBS``): worker count.
+
+    Packages whose package reference is unchanged since the previous deploy
+    (recorded in ``full_deploy/.deploy_manifest.json``) and whose deployed
+    files still match their recorded size and mtime (and hash, for small
+    files) are skipped. Packages no longer in the graph are removed.
+    Symlinks, including symlinked directories, are recreated as symlinks.
+    """
     conanfile = graph.root.conanfile
-    
-    # Deploy all packages
-    for dep in graph.dependencies.values():
-        _deploy_package(dep, output_folder)
-    
+    mode = _setting(conanfile, "deploy_mode", "OPENSSL_DEPLOY_MODE", "auto")
+    jobs = int(_setting(conanfile, "deploy_jobs", "OPENSSL_DEPLOY_JOBS",
+                        min(8, os.cpu_count() or 1)))
+
+    deps = [dep for dep in _dependencies(graph) if dep.package_folder]
+    manifest_path = os.path.join(output_folder, "full_deploy", MANIFEST_NAME)
+    previous = _load_manifest(manifest_path)
+
+    # Deploy all packages, hashing files as they are materialized
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        entries = list(pool.map(
+            lambda dep: _deploy_package(dep, output_folder, mode, previous), deps
+        ))
+
+    manifest = {entry["key"]: entry for entry in entries}
+    for key in set(previous) - set(manifest):
+        _remove_package(output_folder, key)
+    _save_manifest(manifest_path, manifest)
+
+    skipped = sum(1 for entry in entries if entry["skipped"])
+    conanfile.output.info(
+        f"Deployed {len(entries) - skipped} packages ({skipped} unchanged) using mode '{mode}'"
+    )
+
     # Generate SBOM
-    sbom_path = _generate_sbom(graph, output_folder)
+    sbom_path = _generate_sbom(deps, entries, output_folder)
     conanfile.output.info(f"SBOM: {sbom_path}")
-    
+
     # FIPS artifacts
-    if _is_fips_enabled(graph):
-        _deploy_fips_artifacts(graph, output_folder)
+    if _is_fips_enabled(deps):
+        _deploy_fips_artifacts(deps, output_folder)
+
+
+def _setting(conanfile, name, env_var, default):
+    value = None
+    conf = getattr(conanfile, "conf", None)
+    if conf is not None:
+        value = conf.get(f"user.openssl:{name}")
+    if value is None:
+        value = os.environ.get(env_var)
+    return default if value is None else value
+
+
+def _dependencies(graph):
+    return list(graph.root.conanfile.dependencies.values())
+
+
+def _package_key(dep):
+    return f"{getattr(dep, 'context', 'host')}/{dep.ref.name}/{dep.ref.version}"
+
+
+def _load_manifest(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path, manifest):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
 
-def _deploy_package(dep, output_folder):
-    from conan.tools.files import copy
+
+def _remove_package(output_folder, key):
+    """Delete the deployed folder of a package that left the graph, and its empty parents"""
+    root = os.path.join(output_folder, "full_deploy")
+    parts = key.split("/")
+    if len(parts) != 3 or any(part in ("", ".", "..") for part in parts):
+        return
+    target = os.path.join(root, *parts)
+    if os.path.islink(target):
+        os.unlink(target)
+    elif os.path.isdir(target):
+        shutil.rmtree(target)
+    for parent in (os.path.dirname(target), os.path.dirname(os.path.dirname(target))):
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+
+
+def _deploy_package(dep, output_folder, mode, previous):
+    key = _package_key(dep)
+    pref = str(getattr(dep, "pref", dep.ref))
     target = os.path.join(
-        output_folder, "full_deploy", "host",
+        output_folder, "full_deploy", getattr(dep, "context", "host"),
         dep.ref.name, str(dep.ref.version)
     )
-    copy(dep.conanfile, "*", src=dep.package_folder, dst=target)
 
-def _generate_sbom(graph, output_folder):
+    old = previous.get(key)
+    if old and old.get("pref") == pref and _target_intact(target, old["files"], old.get("links", {})):
+        return dict(old, skipped=True)
+
+    if os.path.isdir(target):
+        shutil.rmtree(target)
+
+    files = {}
+    links = {}
+    src_root = dep.package_folder
+    for root, dirs, names in os.walk(src_root):
+        rel_root = os.path.relpath(root, src_root)
+        dst_root = target if rel_root == "." else os.path.join(target, rel_root)
+        os.makedirs(dst_root, exist_ok=True)
+        # os.walk lists symlinked directories without descending into them
+        for name in [d for d in dirs if os.path.islink(os.path.join(root, d))] + names:
+            src = os.path.join(root, name)
+            dst = os.path.join(dst_root, name)
+            rel = name if rel_root == "." else os.path.join(rel_root, name).replace(os.sep, "/")
+            if os.path.islink(src):
+                links[rel] = os.readlink(src)
+                os.symlink(links[rel], dst)
+                continue
+            sha256 = _materialize(src, dst, mode)
+            stat = os.stat(dst)
+            files[rel] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": sha256}
+
+    return {"key": key, "pref": pref, "name": dep.ref.name, "version": str(dep.ref.version),
+            "files": files, "links": links, "skipped": False}
+
+
+def _target_intact(target, files, links):
+    for rel, info in files.items():
+        path = os.path.join(target, rel)
+        try:
+            stat = os.stat(path, follow_symlinks=False)
+            if stat.st_size != info["size"] or stat.st_mtime_ns != info.get("mtime"):
+                return False
+            if stat.st_size <= SMALL_FILE_SIZE and _hash_file(path) != info["sha256"]:
+                return False
+        except OSError:
+            return False
+    for rel, link in links.items():
+        try:
+            if os.readlink(os.path.join(target, rel)) != link:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _materialize(src, dst, mode):
+    """Place src at dst and return its SHA-256"""
+    if mode in ("auto", "reflink") and _reflink(src, dst):
+        return _hash_file(src)
+    if mode in ("auto", "hardlink"):
+        try:
+            os.link(src, dst)
+            return _hash_file(src)
+        except OSError:
+            pass
+    return _copy_and_hash(src, dst)
+
+
+def _reflink(src, dst):
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except OSError as e:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY):
+            raise
+        return False
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_and_hash(src, dst):
+    digest = hashlib.sha256()
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        for chunk in iter(lambda: fsrc.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            fdst.write(chunk)
+    shutil.copystat(src, dst)
+    return digest.hexdigest()
+
+
+def _generate_sbom(deps, entries, output_folder):
     sbom = {
         "bomFormat": "CycloneDX",
         "specVersion": "1.4",
@@ -35,9 +236,17 @@ def _generate_sbom(graph, output_folder):
                 "type": "library",
                 "name": dep.ref.name,
                 "version": str(dep.ref.version),
-                "purl": f"pkg:conan/{dep.ref.name}@{dep.ref.version}"
+                "purl": f"pkg:conan/{dep.ref.name}@{dep.ref.version}",
+                "components": [
+                    {
+                        "type": "file",
+                        "name": rel,
+                        "hashes": [{"alg": "SHA-256", "content": info["sha256"]}],
+                    }
+                    for rel, info in sorted(entry["files"].items())
+                ],
             }
-            for dep in graph.dependencies.values()
+            for dep, entry in zip(deps, entries)
         ]
     }
     sbom_path = os.path.join(output_folder, "sbom.json")
@@ -45,21 +254,21 @@ def _generate_sbom(graph, output_folder):
         json.dump(sbom, f, indent=2)
     return sbom_path
 
-def _is_fips_enabled(graph):
+
+def _is_fips_enabled(deps):
     return any(
-        hasattr(dep.conanfile, "options") and 
-        dep.conanfile.options.get_safe("enable_fips")
-        for dep in graph.dependencies.values()
+        hasattr(dep, "options") and
+        dep.options.get_safe("enable_fips")
+        for dep in deps
     )
 
-def _deploy_fips_artifacts(graph, output_folder):
-    from conan.tools.files import copy
+
+def _deploy_fips_artifacts(deps, output_folder):
     fips_folder = os.path.join(output_folder, "fips")
     os.makedirs(fips_folder, exist_ok=True)
-    
-    for dep in graph.dependencies.values():
-        if dep.ref.name == "openssl":
-            copy(dep.conanfile, "fipsmodule.cnf",
-                 src=os.path.join(dep.package_folder, "ssl"),
-                 dst=fips_folder)
 
+    for dep in deps:
+        if dep.ref.name == "openssl":
+            src = Path(dep.package_folder) / "ssl" / "fipsmodule.cnf"
+            if src.exists():
+                shutil.copy2(src, fips_folder)
@@ -1,17 +1,199 @@
-def analyze_dependencies(graph):
-    """Analyzuje dependency graph"""
+"""
+Dependency graph analysis for the OpenSSL Conan commands.
+
+The resolved Conan graph is reduced to a compact, JSON-serialisable form
+that other commands can load instead of resolving the graph again. All
+analysis (conflicts, outdated recipes, FIPS nodes, critical build path)
+runs over that compact form in a single depth-first traversal.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+GRAPH_FORMAT_VERSION = 1
+
+# Binary states that mean the package has to be compiled locally
+BUILD_STATES = ("Build", "Missing")
+# Recipe states reported when a newer revision exists on a remote
+OUTDATED_STATES = ("Update available",)
+
+
+def _is_fips_node(conanfile):
+    options = getattr(conanfile, "options", None)
+    if options is None:
+        return False
+    try:
+        return bool(options.get_safe("enable_fips") or options.get_safe("fips"))
+    except Exception:
+        return False
+
+
+def compact_graph(deps_graph):
+    """Reduce a Conan ``DepsGraph`` to a plain dictionary"""
+    nodes = {}
+    ids = {}
+    for index, node in enumerate(deps_graph.nodes):
+        ids[id(node)] = str(getattr(node, "id", index))
+
+    for node in deps_graph.nodes:
+        ref = node.ref
+        nodes[ids[id(node)]] = {
+            "ref": str(ref) if ref else None,
+            "name": ref.name if ref else None,
+            "version": str(ref.version) if ref else None,
+            "context": getattr(node, "context", "host"),
+            "binary": getattr(node, "binary", None),
+            "recipe": getattr(node, "recipe", None),
+            "fips": _is_fips_node(node.conanfile),
+            "deps": [ids[id(edge.dst)] for edge in node.dependencies],
+        }
+
+    error = getattr(deps_graph, "error", None)
+    return {
+        "format": GRAPH_FORMAT_VERSION,
+        "root": ids[id(deps_graph.root)],
+        "nodes": nodes,
+        "error": str(error) if error else None,
+    }
+
+
+def analyze_graph(graph, build_costs=None, default_cost=1.0):
+    """Analyze a compact graph in one traversal
+
+    ``build_costs`` maps package names to an estimated build duration in
+    seconds (for example persisted timings of earlier builds). Nodes that
+    are available as binaries cost nothing.
+    """
+    build_costs = build_costs or {}
+    nodes = graph["nodes"]
+    root = graph["root"]
+
     results = {
-        "total_deps": len(graph.dependencies),
+        "total_deps": len(nodes) - 1,
+        "dependencies": [],
         "conflicts": [],
         "outdated": [],
-        "fips_enabled": []
+        "fips_enabled": [],
+        "to_build": [],
+        "critical_path": [],
+        "critical_path_cost": 0.0,
     }
-    
-    for dep in graph.dependencies.values():
-        # Detekce FIPS
-        if hasattr(dep.conanfile, "options") and \
-           dep.conanfile.options.get_safe("enable_fips"):
-            results["fips_enabled"].append(str(dep.ref))
-    
+    if graph.get("error"):
+        results["conflicts"].append(graph["error"])
+
+    seen_versions = {}
+    path_cost = {}
+    best_child = {}
+
+    # Iterative post-order DFS: visit children before computing a node's
+    # longest remaining build path, so each node is handled exactly once.
+    stack = [(root, False)]
+    visited = set()
+    while stack:
+        node_id, expanded = stack.pop()
+        node = nodes[node_id]
+        if not expanded:
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+            stack.append((node_id, True))
+            for child in node["deps"]:
+                if child not in visited:
+                    stack.append((child, False))
+            continue
+
+        cost = 0.0
+        if node_id != root:
+            ref, name = node["ref"], node["name"]
+            results["dependencies"].append(
+                {"name": name, "version": node["version"], "context": node["context"]}
+            )
+            key = (name, node["context"])
+            previous = seen_versions.setdefault(key, ref)
+            if previous != ref:
+                results["conflicts"].append(f"{previous} <-> {ref}")
+            if node["recipe"] in OUTDATED_STATES:
+                results["outdated"].append(ref)
+            if node["fips"]:
+                results["fips_enabled"].append(ref)
+            if node["binary"] in BUILD_STATES:
+                results["to_build"].append(ref)
+                cost = float(build_costs.get(name, default_cost))
+
+        longest, longest_child = 0.0, None
+        for child in node["deps"]:
+            if path_cost.get(child, 0.0) > longest:
+                longest, longest_child = path_cost[child], child
+        path_cost[node_id] = cost + longest
+        best_child[node_id] = longest_child
+
+    current = root if path_cost.get(root) else None
+    while current is not None:
+        if current != root and nodes[current]["binary"] in BUILD_STATES:
+            results["critical_path"].append(nodes[current]["ref"])
+        current = best_child.get(current)
+    results["critical_path_cost"] = path_cost.get(root, 0.0)
+
     return results
 
+
+def analyze_dependencies(graph):
+    """Analyzuje dependency graph"""
+    return analyze_graph(compact_graph(graph))
+
+
+def save_graph(graph, path):
+    """Write a compact graph as minified JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(graph, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp, path)
+    return path
+
+
+def load_graph(path):
+    """Load a compact graph written by :func:`save_graph`"""
+    with open(path, "r") as f:
+        graph = json.load(f)
+    if graph.get("format") != GRAPH_FORMAT_VERSION:
+        raise ValueError(f"Unsupported graph format in {path}: {graph.get('format')}")
+    return graph
+
+
+def graph_cache_key(*parts):
+    """Hash lockfile, profile and conanfile contents into a cache key"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            part = ""
+        if isinstance(part, (list, tuple)):
+            part = "\n".join(str(p) for p in part)
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class GraphCache:
+    """On-disk cache of resolved compact graphs"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return load_graph(path)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, graph):
+        return save_graph(graph, self._path(key))
@@ -16,18 +16,89 @@ import json
 from datetime import datetime, timezone
 from optparse import OptionParser
 from statistics import median
+from concurrent.futures import ThreadPoolExecutor
 import collections
 import csv
+import os
+import threading
+import time
 
 api_url = "https://api.github.com/repos/openssl/openssl"
 
+# Only these timeline fields are used, so only these are kept in the cache
+eventfields = ('event', 'actor', 'updated_at', 'sha', 'author', 'created_at', 'state', 'submitted_at')
+
 def convertdate(date):
     return datetime.strptime(date.replace('Z',"+0000"), "%Y-%m-%dT%H:%M:%S%z")
 
+# All requests share one session (keep-alive, pooled connections) and wait
+# out rate limits instead of failing.  With several worker threads hitting
+# the limit at once, each just sleeps until the reset time.
+
+def githubget(url, etag=None):
+    extra = {"If-None-Match": etag} if etag else {}
+    while True:
+        res = session.get(url, headers=extra)
+        if (res.status_code not in (403, 429)):
+            return res
+        if (res.headers.get('Retry-After')):
+            wait = int(res.headers['Retry-After'])
+        elif (res.headers.get('X-RateLimit-Remaining') == "0"):
+            wait = max(int(res.headers.get('X-RateLimit-Reset', 0)) - time.time(), 0) + 1
+        else:
+            return res
+        if (debug):
+            print("Rate limited, waiting", int(wait), "seconds")
+        time.sleep(wait)
+
+def slimevent(event):
+    slim = {k: event[k] for k in eventfields if k in event}
+    for k in ('actor', 'author'):
+        if isinstance(slim.get(k), dict):
+            slim[k] = {x: slim[k][x] for x in ('login', 'date') if x in slim[k]}
+    return slim
+
+# The cache remembers, per PR, the URL, ETag, next link and events of every
+# timeline page we read.  A repeat run revalidates each page with its ETag
+# (a 304 does not count against the rate limit), so edited or deleted events
+# on earlier pages are picked up too, and follows any new pages after them.
+
+def loadcache(filename):
+    try:
+        with open(filename) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+def savecache(filename, data):
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    tmp = filename + ".tmp"
+    with open(tmp, "w") as fp:
+        json.dump(data, fp)
+    os.replace(tmp, filename)
+
+# Only open PRs and their current head commits are kept, so the file does
+# not grow with every PR and push ever seen
+
+def prunecache(prs):
+    open_prs = {str(pr['number']) for pr in prs}
+    heads = set()
+    for number in list(timelinecache):
+        if number not in open_prs:
+            del timelinecache[number]
+            continue
+        shas = [event['sha'] for page in timelinecache[number].get('pages', [])
+                for event in page['events'] if event.get('event') == "committed" and 'sha' in event]
+        if shas:
+            heads.add(shas[-1])
+    for sha in list(statuscache):
+        if sha not in heads:
+            del statuscache[sha]
+
 def addcommenttopr(issue,comment):
     newcomment = {"body":comment}
     url = api_url + "/issues/" + str(issue) + "/comments"
-    res = requests.post(url, data=json.dumps(newcomment), headers=headers)
+    res = session.post(url, data=json.dumps(newcomment))
     if (res.status_code != 201):
         print("Error adding comment", res.status_code, res.content)
     return
@@ -37,11 +108,11 @@ def addcommenttopr(issue,comment):
 def closepr(issue,comment):
     newcomment = {"body":comment}
     url = api_url + "/issues/" + str(issue) + "/comments"
-    res = requests.post(url, data=json.dumps(newcomment), headers=headers)
+    res = session.post(url, data=json.dumps(newcomment))
     if (res.status_code != 201):
         print("Error adding comment", res.status_code, res.content)    
     url = api_url + "/issues/" + str(issue)
-    res = requests.patch(url, data=json.dumps({"state":"closed"}), headers=headers)
+    res = session.patch(url, data=json.dumps({"state":"closed"}))
     if (res.status_code != 200):
         print("Error closing pr", res.status_code, res.content)
     return
@@ -51,16 +122,53 @@ def closepr(issue,comment):
 stale = collections.defaultdict(list)
 now = datetime.now(timezone.utc)
 
-def parsepr(pr, days):
+def gettimeline(pr):
+    number = str(pr['number'])
     if (debug):
         print ("Getting timeline for ",pr['number'])
-    url = api_url + "/issues/" + str(pr['number']) + "/timeline?per_page=100&page=1"
-    res = requests.get(url, headers=headers)
-    repos = res.json()
-    while 'next' in res.links.keys():
-        res = requests.get(res.links['next']['url'], headers=headers)
-        repos.extend(res.json())
+    cached = {page['url']: page for page in timelinecache.get(number, {}).get('pages', [])}
+    url = api_url + "/issues/" + number + "/timeline?per_page=100&page=1"
+    pages = []
+
+    while url:
+        old = cached.get(url)
+        etag = old and old['etag']
+        if (old and old['next'] is None and len(old['events']) >= 100):
+            # a full last page may have gained a next link without changing itself
+            etag = None
+        res = githubget(url, etag)
+        if (res.status_code == 304):
+            page = old
+        else:
+            events = res.json()
+            if not isinstance(events, list):
+                return events
+            page = {'url': url, 'etag': res.headers.get('ETag'),
+                    'next': res.links.get('next', {}).get('url'),
+                    'events': [slimevent(event) for event in events]}
+        pages.append(page)
+        url = page['next']
+
+    with cachelock:
+        timelinecache[number] = {'pages': pages}
+    return [event for page in pages for event in page['events']]
+
+def getcistate(sha):
+    cached = statuscache.get(sha)
+    res = githubget(api_url + "/commits/" + sha + "/status", cached and cached['etag'])
+    if (res.status_code == 304):
+        return cached['state']
+    if (res.status_code != 200):
+        return None
+    state = res.json()['state']
+    with cachelock:
+        statuscache[sha] = {'etag': res.headers.get('ETag'), 'state': state}
+    return state
+
+# Returns None if the PR is not stale, otherwise (data, reason, sha) where a
+# reason of None means the next action depends on the CI state of sha
 
+def classifypr(pr, repos, days):
     comments = []
     commentsall = []
     readytomerge = 0
@@ -110,7 +218,7 @@ def parsepr(pr, days):
     if (dayssincelastupdate < days):
         if (debug):
             print("ignoring last event was",dayssincelastupdate,"days:",max(comments+commentsall))
-        return
+        return None
 
     labellist = []
     if 'labels' in pr:
@@ -124,10 +232,9 @@ def parsepr(pr, days):
     # do it here as we may wish, in the future, to still ping stale WIP items
     
     if ('title' in pr and 'WIP' in pr['title']):
-        return
+        return None
     
     data = {'pr':pr['number'],'days':dayssincelastupdate,'alldays':dayssincelastupdateall,'labels':labels}
-    stale["all"].append(data)
 
     if debug:
         print (data)
@@ -138,43 +245,51 @@ def parsepr(pr, days):
     # then we've time to get the CLA later, it's deferred.  
 
     if ('stalled: awaiting contributor response' in labels):
-        stale["waiting for reporter"].append(data)
-        return        
+        return (data, "waiting for reporter", sha)
     if ('hold: need omc' in labels or 'approval: omc' in labels):
-        stale["waiting for OMC"].append(data)
-        return
+        return (data, "waiting for OMC", sha)
     if ('hold: need otc' in labels or 'approval: otc' in labels):
-        stale["waiting for OTC"].append(data)
-        return
+        return (data, "waiting for OTC", sha)
     if ('hold: cla' in labels):
-        stale["cla required"].append(data)
-        return
+        return (data, "cla required", sha)
     if ('review pending' in labels):
-        stale["waiting for review"].append(data)
-        return
+        return (data, "waiting for review", sha)
     if ('reviewed:changes_requested' in labels):
-        stale["waiting for reporter"].append(data)
-        return
-
-    url = api_url + "/commits/" + sha + "/status"
-    res = requests.get(url, headers=headers)
-    if (res.status_code == 200):
-        ci = res.json()
-        if (ci['state'] != "success"): 
-            stale["failed CI"].append(data)
-            return
-
-    stale["all other"].append(data)    
-    return
-    
+        return (data, "waiting for reporter", sha)
+    return (data, None, sha)
+
+def parseprs(prs, days, jobs):
+    # Fetch concurrently, but classify in the original PR order so the
+    # results (and their order in each list) match a serial run
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        timelines = list(executor.map(gettimeline, prs))
+        results = []
+        for pr, repos in zip(prs, timelines):
+            if isinstance(repos, dict):
+                if (debug):
+                    print("Skipping", pr['number'], repos.get('message'))
+                continue
+            result = classifypr(pr, repos, days)
+            if (result):
+                results.append(result)
+        shas = [sha for (data, reason, sha) in results if reason is None]
+        cistates = dict(zip(shas, executor.map(getcistate, shas)))
+
+    for (data, reason, sha) in results:
+        stale["all"].append(data)
+        if (reason is None):
+            state = cistates[sha]
+            reason = "failed CI" if (state is not None and state != "success") else "all other"
+        stale[reason].append(data)
 
 def getpullrequests(days):
     url = api_url + "/pulls?per_page=100&page=1"  # defaults to open
-    res = requests.get(url, headers=headers)
+    res = githubget(url)
     repos = res.json()
     prs = []
     while 'next' in res.links.keys():
-        res = requests.get(res.links['next']['url'], headers=headers)
+        res = githubget(res.links['next']['url'])
         repos.extend(res.json())
 
     # In theory we can use the updated_at date here for filtering, but in practice
@@ -205,6 +320,10 @@ parser.add_option("-D","--closedays",help="number of days for something to be cl
 parser.add_option("-c","--commit",action="store_true",help="actually add comments to issues",dest="commit")
 parser.add_option("-o","--output",dest="output",help="write a csv file out")
 parser.add_option("-p","--prs",dest="prs",help="instead of looking at all open prs just look at these comma separated ones")
+parser.add_option("-j","--jobs",help="number of concurrent requests (default 8)",type=int,dest="jobs",default=8)
+parser.add_option("-C","--cache",dest="cache",help="timeline cache file (default ~/.cache/openssl-github-tools/stale.json)",
+                  default=os.path.expanduser("~/.cache/openssl-github-tools/stale.json"))
+parser.add_option("-n","--nocache",action="store_true",help="ignore and don't update the timeline cache",dest="nocache")
 
 (options, args) = parser.parse_args()
 if (options.token):
@@ -222,7 +341,14 @@ headers = {
     "Accept": "application/vnd.github.mockingbird-preview",
     "Authorization": git_token
 }
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=options.jobs))
 days = options.days or 31
+cache = {} if options.nocache else loadcache(options.cache)
+timelinecache = cache.setdefault('timeline', {})
+statuscache = cache.setdefault('status', {})
+cachelock = threading.Lock()
 if (options.output):
     outputfp = open(options.output,"a")
     outputcsv = csv.writer(outputfp)
@@ -241,8 +367,12 @@ if (not prs):
 if debug:
     print("Open PRs we need to check", len(prs))
 
-for pr in prs:
-    parsepr(pr, days)
+parseprs(prs, days, options.jobs)
+if (not options.nocache):
+    if (not options.prs):
+        # only a full run knows which PRs are still open
+        prunecache(prs)
+    savecache(options.cache, cache)
 
 if ("waiting for OMC" in stale):
     for item in stale["waiting for OMC"]:
@@ -0,0 +1,119 @@
+"""
+Script Converter Benchmark
+
+Compares the single-pass rule-table converter against the original
+multi-pass converter (one ``re.sub`` over the whole file per rule) on a
+corpus of shell and Perl scripts, by default the repository's release-tools.
+
+Usage (from the openssl-migration directory):
+    python -m core.converter_benchmark [CORPUS] [--repeat N] [--output DIR]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .script_converter import RULE_TABLES, ScriptConverter
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent.parent / "release-tools"
+
+
+def load_corpus(corpus_dir: Path) -> List[Tuple[Path, str, str]]:
+    """Collect (path, script type, content) for every shell and Perl script."""
+    corpus = []
+    for path in sorted(Path(corpus_dir).rglob('*')):
+        if not path.is_file():
+            continue
+        script_type = ScriptConverter.detect_script_type(path)
+        if script_type in RULE_TABLES:
+            corpus.append((path, script_type, path.read_text(encoding='utf-8', errors='ignore')))
+    return corpus
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(corpus: List[Tuple[Path, str, str]], repeat: int = 20) -> Dict[str, Any]:
+    """
+    Time both converters on the corpus.
+
+    Args:
+        corpus: Output of load_corpus
+        repeat: Runs per converter; the fastest run is reported
+
+    Returns:
+        Timings in milliseconds, the speedup, and corpus statistics
+    """
+    converter = ScriptConverter()
+
+    def multipass():
+        for _, script_type, content in corpus:
+            converter.convert_multipass(content, script_type)
+
+    def single_pass():
+        for _, script_type, content in corpus:
+            RULE_TABLES[script_type].rewrite(converter._strip_shebang(content))
+
+    multipass_s = _best_of(repeat, multipass)
+    single_pass_s = _best_of(repeat, single_pass)
+    return {
+        'files': len(corpus),
+        'bytes': sum(len(content) for _, _, content in corpus),
+        'repeat': repeat,
+        'multipass_ms': multipass_s * 1000,
+        'single_pass_ms': single_pass_s * 1000,
+        'speedup': multipass_s / single_pass_s if single_pass_s else float('inf'),
+    }
+
+
+def convert_corpus(corpus: List[Tuple[Path, str, str]], corpus_dir: Path, output_dir: Path) -> float:
+    """Stream-convert every corpus script into output_dir; returns seconds taken."""
+    converter = ScriptConverter()
+    start = time.perf_counter()
+    for path, script_type, _ in corpus:
+        target = output_dir / path.relative_to(corpus_dir).with_suffix('.py')
+        converter.convert_file(path, target, script_type)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the script converter")
+    parser.add_argument("corpus", nargs="?", type=Path, default=DEFAULT_CORPUS,
+                        help="Directory of shell/Perl scripts (default: release-tools)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per converter")
+    parser.add_argument("--output", type=Path, help="Also stream-convert the corpus into this directory")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"No shell or Perl scripts found in {args.corpus}", file=sys.stderr)
+        return 1
+
+    result = benchmark(corpus, args.repeat)
+    if args.output:
+        result['streamed_ms'] = convert_corpus(corpus, args.corpus, args.output) * 1000
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Corpus: {result['files']} scripts, {result['bytes']} bytes ({args.corpus})")
+        print(f"Multi-pass:  {result['multipass_ms']:.2f} ms")
+        print(f"Single-pass: {result['single_pass_ms']:.2f} ms ({result['speedup']:.1f}x)")
+        if 'streamed_ms' in result:
+            print(f"Streamed to {args.output}: {result['streamed_ms']:.2f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
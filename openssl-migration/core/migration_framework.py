@@ -9,10 +9,14 @@ import os
 import sys
 import json
 import shutil
+import hashlib
+import fnmatch
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import click
 import logging
@@ -24,6 +28,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Script extensions and the script type they are analyzed as
+SCRIPT_EXTENSIONS = {
+    '.sh': 'shell',
+    '.bash': 'shell',
+    '.pl': 'perl',
+    '.pm': 'perl',
+    '.py': 'python',
+}
+
+# Directory and file names never scanned (fnmatch patterns)
+DEFAULT_IGNORE_PATTERNS = [
+    '.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv', 'venv', '.tox',
+]
+
+ANALYSIS_CACHE_VERSION = 1
+
+# Below this many scripts to analyze, a process pool costs more than it saves
+PARALLEL_THRESHOLD = 32
+
 
 @dataclass
 class MigrationConfig:
@@ -38,6 +61,10 @@ class MigrationConfig:
     use_pathlib: bool = True
     use_subprocess: bool = True
     output_format: str = "modern"  # 'modern', 'compatible', 'minimal'
+    ignore_patterns: List[str] = field(default_factory=lambda: list(DEFAULT_IGNORE_PATTERNS))
+    jobs: Optional[int] = None  # worker count; None uses all CPUs
+    use_cache: bool = True
+    cache_file: Optional[Path] = None  # defaults to <target_dir>/.analysis_cache.json
 
 
 @dataclass
@@ -95,33 +122,163 @@ class MigrationFramework:
         
         logger.info(f"Analyzing repository: {repo_path}")
         
-        scripts = []
-        
-        # Find all script files
-        for script_type in self.config.script_types:
-            patterns = {
-                'shell': ['*.sh', '*.bash'],
-                'perl': ['*.pl', '*.pm'],
-                'python': ['*.py']
+        # One walk over the tree, dispatching files by extension
+        candidates = self._scan_repository(repo_path)
+        
+        cache = self._load_analysis_cache()
+        files, analyses = cache['files'], cache['analyses']
+        scripts: List[Optional[ScriptInfo]] = []
+        pending: List[Tuple[int, Path, str]] = []
+        
+        touched = False
+        for script_path, script_type, stat in candidates:
+            entry = files.get(str(script_path))
+            analysis = None
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                analysis = analyses.get(f"{entry['sha256']}:{script_type}")
+            elif analyses:
+                # Touched, renamed or copied: the content may still be known
+                digest = _hash_file(script_path)
+                analysis = analyses.get(f"{digest}:{script_type}") if digest else None
+                if analysis is not None:
+                    files[str(script_path)] = {
+                        'size': stat.st_size,
+                        'mtime_ns': stat.st_mtime_ns,
+                        'sha256': digest
+                    }
+                    touched = True
+            if analysis is not None:
+                scripts.append(ScriptInfo(
+                    name=script_path.name,
+                    path=script_path,
+                    script_type=script_type,
+                    size=stat.st_size,
+                    **analysis
+                ))
+            else:
+                pending.append((len(scripts), script_path, script_type))
+                scripts.append(None)
+        
+        logger.info(f"Analyzing {len(pending)} scripts ({len(candidates) - len(pending)} unchanged)")
+        
+        results = self._run_analysis([(path, script_type) for _, path, script_type in pending])
+        for (index, script_path, script_type), (script_info, digest) in zip(pending, results):
+            scripts[index] = script_info
+            if digest is None:
+                continue
+            stat = candidates[index][2]
+            files[str(script_path)] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest
             }
-            
-            for pattern in patterns.get(script_type, []):
-                for script_path in repo_path.rglob(pattern):
-                    if self._should_migrate_script(script_path):
-                        script_info = self._analyze_script(script_path, script_type)
-                        scripts.append(script_info)
+            analyses[f"{digest}:{script_type}"] = {
+                'lines': script_info.lines,
+                'dependencies': script_info.dependencies,
+                'functions': script_info.functions,
+                'description': script_info.description
+            }
+        
+        if pending or touched:
+            self._save_analysis_cache(cache)
         
         self.scripts = scripts
         logger.info(f"Found {len(scripts)} scripts to migrate")
         
         return scripts
     
-    def _should_migrate_script(self, script_path: Path) -> bool:
+    def _scan_repository(self, repo_path: Path) -> List[Tuple[Path, str, os.stat_result]]:
+        """
+        Walk the repository once with os.scandir and collect scripts to migrate.
+        
+        Args:
+            repo_path: Path to the repository to scan
+        
+        Returns:
+            (path, script type, stat) tuples, grouped in the configured script
+            type order and sorted by path within each type
+        """
+        type_order = {script_type: i for i, script_type in enumerate(self.config.script_types)}
+        ignore_patterns = self.config.ignore_patterns
+        found = []
+        stack = [str(repo_path)]
+        
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if any(fnmatch.fnmatch(entry.name, pattern) for pattern in ignore_patterns):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        script_type = SCRIPT_EXTENSIONS.get(os.path.splitext(entry.name)[1])
+                        if script_type not in type_order or not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                        script_path = Path(entry.path)
+                        if self._should_migrate_script(script_path, stat.st_size):
+                            found.append((script_path, script_type, stat))
+            except OSError as e:
+                logger.warning(f"Cannot scan {directory}: {e}")
+        
+        found.sort(key=lambda item: (type_order[item[1]], str(item[0])))
+        return found
+    
+    def _run_analysis(self, pending: List[Tuple[Path, str]]) -> List[Tuple[ScriptInfo, Optional[str]]]:
+        """Analyze scripts, across a process pool when there are enough of them."""
+        if len(pending) < PARALLEL_THRESHOLD or self.config.jobs == 1:
+            return [_analyze_file(path, script_type) for path, script_type in pending]
+        
+        workers = self.config.jobs or os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        paths = [path for path, _ in pending]
+        script_types = [script_type for _, script_type in pending]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_analyze_file, paths, script_types, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning(f"Process pool unavailable ({e}), analyzing serially")
+            return [_analyze_file(path, script_type) for path, script_type in pending]
+    
+    def _cache_path(self) -> Path:
+        return self.config.cache_file or self.config.target_dir / ".analysis_cache.json"
+    
+    def _load_analysis_cache(self) -> Dict[str, Any]:
+        """Load the content-hash analysis cache from previous runs."""
+        empty = {'version': ANALYSIS_CACHE_VERSION, 'files': {}, 'analyses': {}}
+        if not self.config.use_cache:
+            return empty
+        try:
+            with open(self._cache_path(), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if cache.get('version') != ANALYSIS_CACHE_VERSION:
+            return empty
+        return cache
+    
+    def _save_analysis_cache(self, cache: Dict[str, Any]) -> None:
+        """Atomically write the analysis cache."""
+        if not self.config.use_cache:
+            return
+        cache_path = self._cache_path()
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save analysis cache: {e}")
+
+    def _should_migrate_script(self, script_path: Path, size: Optional[int] = None) -> bool:
         """
         Determine if a script should be migrated.
         
         Args:
             script_path: Path to the script
+            size: File size if already known (avoids another stat call)
             
         Returns:
             True if script should be migrated
@@ -138,7 +295,9 @@ class MigrationFramework:
                 return False
         
         # Skip very small files (likely not substantial scripts)
-        if script_path.stat().st_size < 100:
+        if size is None:
+            size = script_path.stat().st_size
+        if size < 100:
             return False
         
         return True
@@ -154,43 +313,10 @@ class MigrationFramework:
         Returns:
             ScriptInfo object with script details
         """
-        try:
-            with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            functions = self._extract_functions(content, script_type)
-            dependencies = self._extract_dependencies(content, script_type)
-            description = self._extract_description(content, script_type)
-            
-            script_info = ScriptInfo(
-                name=script_path.name,
-                path=script_path,
-                script_type=script_type,
-                size=script_path.stat().st_size,
-                lines=len(lines),
-                dependencies=dependencies,
-                functions=functions,
-                description=description
-            )
-            
-            logger.debug(f"Analyzed script: {script_path.name}")
-            return script_info
-            
-        except Exception as e:
-            logger.error(f"Error analyzing script {script_path}: {e}")
-            return ScriptInfo(
-                name=script_path.name,
-                path=script_path,
-                script_type=script_type,
-                size=0,
-                lines=0,
-                dependencies=[],
-                functions=[],
-                description=f"Error analyzing: {e}"
-            )
-    
-    def _extract_functions(self, content: str, script_type: str) -> List[str]:
+        return _analyze_file(script_path, script_type)[0]
+    
+    @staticmethod
+    def _extract_functions(content: str, script_type: str) -> List[str]:
         """Extract function names from script content."""
         functions = []
         
@@ -214,7 +340,8 @@ class MigrationFramework:
         
         return functions
     
-    def _extract_dependencies(self, content: str, script_type: str) -> List[str]:
+    @staticmethod
+    def _extract_dependencies(content: str, script_type: str) -> List[str]:
         """Extract dependencies from script content."""
         dependencies = []
         
@@ -242,7 +369,8 @@ class MigrationFramework:
         
         return list(set(dependencies))  # Remove duplicates
     
-    def _extract_description(self, content: str, script_type: str) -> Optional[str]:
+    @staticmethod
+    def _extract_description(content: str, script_type: str) -> Optional[str]:
         """Extract description from script content."""
         lines = content.split('\n')
         
@@ -324,6 +452,12 @@ class MigrationFramework:
         Returns:
             True if migration was successful
         """
+        log_entry = self._migrate_script(script_info)
+        self.migration_log.append(log_entry)
+        return log_entry['status'] == 'completed'
+    
+    def _migrate_script(self, script_info: ScriptInfo) -> Dict[str, Any]:
+        """Convert and write one script; returns its migration log entry."""
         try:
             logger.info(f"Migrating script: {script_info.name}")
             
@@ -342,30 +476,25 @@ class MigrationFramework:
             script_info.migration_status = "completed"
             script_info.migration_notes = f"Migrated to {target_path}"
             
-            # Log migration
-            self.migration_log.append({
+            logger.info(f"Successfully migrated: {script_info.name}")
+            return {
                 'timestamp': datetime.now().isoformat(),
                 'script': script_info.name,
                 'status': 'completed',
                 'target_path': str(target_path)
-            })
-            
-            logger.info(f"Successfully migrated: {script_info.name}")
-            return True
+            }
             
         except Exception as e:
             logger.error(f"Failed to migrate {script_info.name}: {e}")
             script_info.migration_status = "failed"
             script_info.migration_notes = str(e)
             
-            self.migration_log.append({
+            return {
                 'timestamp': datetime.now().isoformat(),
                 'script': script_info.name,
                 'status': 'failed',
                 'error': str(e)
-            })
-            
-            return False
+            }
     
     def _get_target_path(self, script_info: ScriptInfo) -> Path:
         """Get the target path for a migrated script."""
@@ -529,16 +658,42 @@ def {func_name}():
         
         logger.info(f"Starting migration of {len(self.scripts)} scripts")
         
+        to_migrate = []
+        collisions = []
+        targets: Dict[Path, ScriptInfo] = {}
         for script_info in self.scripts:
-            if script_info.migration_status == "pending":
-                script_info.migration_status = "in_progress"
-                
-                if self.migrate_script(script_info):
-                    results['completed'] += 1
-                else:
-                    results['failed'] += 1
-            else:
+            if script_info.migration_status != "pending":
                 results['skipped'] += 1
+                continue
+            # Scripts sharing a target path would race for it: the first one in script order wins
+            target_path = self._get_target_path(script_info)
+            if target_path in targets:
+                error = f"Target {target_path} is also the target of {targets[target_path].path}"
+                logger.error(f"Failed to migrate {script_info.name}: {error}")
+                script_info.migration_status = "failed"
+                script_info.migration_notes = error
+                collisions.append({
+                    'timestamp': datetime.now().isoformat(),
+                    'script': script_info.name,
+                    'status': 'failed',
+                    'error': error
+                })
+                continue
+            targets[target_path] = script_info
+            script_info.migration_status = "in_progress"
+            to_migrate.append(script_info)
+        
+        # Generating and writing output is I/O bound, so threads suffice;
+        # log entries are kept in script order
+        with ThreadPoolExecutor(max_workers=self.config.jobs) as executor:
+            log_entries = list(executor.map(self._migrate_script, to_migrate))
+        
+        for log_entry in log_entries + collisions:
+            self.migration_log.append(log_entry)
+            if log_entry['status'] == 'completed':
+                results['completed'] += 1
+            else:
+                results['failed'] += 1
         
         logger.info(f"Migration completed: {results['completed']} successful, {results['failed']} failed")
         
@@ -594,3 +749,66 @@ def {func_name}():
         
         logger.info(f"Migration report saved to: {output_path}")
         return output_path
+
+
+def _hash_file(script_path: Path) -> Optional[str]:
+    """SHA-256 of a script's content, or None if it cannot be read."""
+    try:
+        with open(script_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _analyze_file(script_path: Path, script_type: str) -> Tuple[ScriptInfo, Optional[str]]:
+    """
+    Analyze a single script and extract information.
+    
+    Module-level so it can run in a process pool worker.
+    
+    Args:
+        script_path: Path to the script
+        script_type: Type of script ('shell', 'perl', 'python')
+    
+    Returns:
+        ScriptInfo object with script details, and the SHA-256 of the file
+        content (None if the script could not be read)
+    """
+    try:
+        with open(script_path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        # Same text as a text-mode read with universal newlines
+        content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+        
+        lines = content.split('\n')
+        functions = MigrationFramework._extract_functions(content, script_type)
+        dependencies = MigrationFramework._extract_dependencies(content, script_type)
+        description = MigrationFramework._extract_description(content, script_type)
+        
+        script_info = ScriptInfo(
+            name=script_path.name,
+            path=script_path,
+            script_type=script_type,
+            size=len(data),
+            lines=len(lines),
+            dependencies=dependencies,
+            functions=functions,
+            description=description
+        )
+        
+        logger.debug(f"Analyzed script: {script_path.name}")
+        return script_info, digest
+    
+    except Exception as e:
+        logger.error(f"Error analyzing script {script_path}: {e}")
+        return ScriptInfo(
+            name=script_path.name,
+            path=script_path,
+            script_type=script_type,
+            size=0,
+            lines=0,
+            dependencies=[],
+            functions=[],
+            description=f"Error analyzing: {e}"
+        ), None
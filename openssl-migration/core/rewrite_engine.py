@@ -0,0 +1,136 @@
+"""
+Single-pass Rewrite Engine
+
+Rewrites a script in one left-to-right scan using a precompiled rule table,
+instead of one ``re.sub`` pass over the whole file per rule.
+
+Every rule declares the literal token it starts with: a sigil such as ``$``,
+a keyword such as ``if``, or ``^`` for rules anchored at a line start. All
+triggers are combined into one tokenizer pattern, so the scan only stops at
+candidate tokens; the rules for that token are then matched in place and the
+first match is rewritten.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+LINE_START = '^'
+
+_TEMPLATE_GROUP = re.compile(r'\\(\d)')
+
+Replacement = Union[str, Callable[..., str]]
+
+
+class RewriteRule(NamedTuple):
+    """
+    A rewrite rule.
+    
+    ``trigger`` is the literal token (or tuple of tokens) a match starts
+    with; keyword triggers only match whole words. Rules with the
+    ``LINE_START`` trigger are tried at the start of every line where their
+    pattern matches. ``pattern`` is matched at the trigger position.
+    ``replacement`` is either a template where ``\\1``..``\\9`` refer to the
+    pattern's groups, or a callable receiving the groups as strings
+    (unmatched groups as ``''``) and returning the replacement text.
+    """
+    name: str
+    trigger: Union[str, Tuple[str, ...]]
+    pattern: str
+    replacement: Replacement
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Turn a ``\\1`` style template into a function of the groups."""
+    pieces = _TEMPLATE_GROUP.split(template)
+    if len(pieces) == 1:
+        return lambda *groups: template
+    
+    def expand(*groups: str) -> str:
+        out = []
+        for i, piece in enumerate(pieces):
+            out.append(groups[int(piece) - 1] if i % 2 else piece)
+        return ''.join(out)
+    
+    return expand
+
+
+_CompiledRule = Tuple[re.Pattern, Callable[..., str]]
+
+
+class RuleTable:
+    """
+    Ordered rewrite rules compiled for single-pass rewriting.
+    
+    Line-start rules take precedence; rules sharing a trigger are tried in
+    table order. Text between rewrites is copied through unchanged.
+    """
+    
+    def __init__(self, rules: Iterable[RewriteRule], flags: int = 0):
+        self.rules: List[RewriteRule] = list(rules)
+        self._by_token: Dict[str, List[_CompiledRule]] = {}
+        line_guards = []
+        for rule in self.rules:
+            handler = rule.replacement
+            if isinstance(handler, str):
+                handler = _compile_template(handler)
+            compiled = (re.compile(rule.pattern, flags), handler)
+            triggers = (rule.trigger,) if isinstance(rule.trigger, str) else rule.trigger
+            for trigger in triggers:
+                if trigger == LINE_START:
+                    line_guards.append(f'^(?={rule.pattern})')
+                    trigger = ''
+                self._by_token.setdefault(trigger, []).append(compiled)
+        
+        # Plain alternations without groups keep the tokenizer on the regex
+        # engine's fast path; the matched text selects the rules
+        tokens = sorted((t for t in self._by_token if t), key=len, reverse=True)
+        words = [t for t in tokens if re.fullmatch(r'\w+', t)]
+        parts = list(line_guards)
+        if words:
+            parts.append(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+        symbols = [t for t in tokens if t not in words and len(t) == 1]
+        if symbols:
+            parts.append('[' + ''.join(map(re.escape, symbols)) + ']')
+        for token in tokens:
+            if token not in words and token not in symbols:
+                tail = r'\b' if re.match(r'\w', token[-1]) else ''
+                parts.append(re.escape(token) + tail)
+        self.tokenizer = re.compile('|'.join(parts), flags)
+    
+    def rewrite(self, text: str) -> str:
+        """Rewrite text in one scan."""
+        out = []
+        copied = 0
+        position = 0
+        search = self.tokenizer.search
+        by_token = self._by_token
+        while True:
+            token = search(text, position)
+            if token is None:
+                break
+            start = token.start()
+            for regex, handler in by_token[token.group()]:
+                match = regex.match(text, start)
+                if match:
+                    break
+            else:
+                match = None
+            if match is None or match.end() == start:
+                position = max(token.end(), start + 1)
+                continue
+            out.append(text[copied:start])
+            out.append(handler(*[group or '' for group in match.groups()]))
+            copied = position = match.end()
+        if not out:
+            return text
+        out.append(text[copied:])
+        return ''.join(out)
+    
+    def rewrite_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Rewrite a stream of lines.
+        
+        Only valid for tables whose rules never match across a newline.
+        """
+        for line in lines:
+            yield self.rewrite(line)
@@ -12,8 +12,128 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 
+from .rewrite_engine import LINE_START, RewriteRule, RuleTable
+
 logger = logging.getLogger(__name__)
 
+# Perl modules with a different Python equivalent
+PERL_MODULE_MAPPING = {
+    'File::Path': 'pathlib',
+    'File::Copy': 'shutil',
+    'Getopt::Long': 'argparse',
+    'POSIX': 'os',
+    'Cwd': 'os',
+}
+
+SCRIPT_EXTENSIONS = {'.sh': 'shell', '.bash': 'shell', '.pl': 'perl', '.pm': 'perl'}
+
+SHEBANG = re.compile(r'#!.*\n')
+
+# Operands may still carry their sigil: $VAR, ${VAR} or VAR
+_SHELL_OPERAND = r'\$?\{?(\w+)\}?'
+_PERL_OPERAND = r'\$?(\w+)'
+
+
+def _shell_command_substitution(command: str) -> str:
+    command = SHELL_VARIABLES.rewrite(command)
+    return f'subprocess.check_output("{command}", shell=True, text=True).strip()'
+
+
+def _shell_conditional(condition: str) -> str:
+    return f'if {SHELL_CONDITIONS.rewrite(condition)}:'
+
+
+def _shell_for_loop(var: str, items: str) -> str:
+    return f'for {var} in {SHELL_VARIABLES.rewrite(items)}:'
+
+
+def _shell_echo(text: str) -> str:
+    return f'print("{SHELL_VARIABLES.rewrite(text)}")'
+
+
+def _perl_module(module: str) -> str:
+    python_module = PERL_MODULE_MAPPING.get(module, module.lower().replace('::', '.'))
+    return f'import {python_module}'
+
+
+def _perl_conditional(els: str, condition: str) -> str:
+    keyword = 'elif' if els else 'if'
+    return f'{keyword} {PERL_CONDITIONS.rewrite(condition)}:'
+
+
+def _perl_for_loop(condition: str) -> str:
+    return f'for {PERL_VARIABLES.rewrite(condition)}:'
+
+
+# Rule tables, compiled once. Each table rewrites a script in a single scan;
+# no rule matches across a newline, so scripts can also be streamed line by
+# line. Rules are RewriteRule(name, trigger token, pattern, replacement).
+
+_SHELL_VARIABLE_RULES = [
+    RewriteRule('braced_variable', '$', r'\$\{(\w+)\}', r'\1'),
+    RewriteRule('variable', '$', r'\$(\w+)', r'\1'),
+]
+
+SHELL_VARIABLES = RuleTable(_SHELL_VARIABLE_RULES)
+
+SHELL_CONDITIONS = RuleTable([
+    RewriteRule('is_file', '-f', rf'-f[ \t]+{_SHELL_OPERAND}', r'Path("\1").is_file()'),
+    RewriteRule('is_dir', '-d', rf'-d[ \t]+{_SHELL_OPERAND}', r'Path("\1").is_dir()'),
+    RewriteRule('exists', '-e', rf'-e[ \t]+{_SHELL_OPERAND}', r'Path("\1").exists()'),
+    RewriteRule('is_empty', '-z', rf'-z[ \t]+{_SHELL_OPERAND}', r'not \1'),
+    RewriteRule('not_empty', '-n', rf'-n[ \t]+{_SHELL_OPERAND}', r'\1'),
+] + _SHELL_VARIABLE_RULES)
+
+SHELL_RULES = RuleTable([
+    RewriteRule('function', LINE_START,
+                r'([ \t]*)(?:function[ \t]+)?(\w+)[ \t]*\([ \t]*\)[ \t]*\{', r'\1def \2():'),
+    RewriteRule('command_substitution', '$', r'\$\(([^()\n]*)\)', _shell_command_substitution),
+    RewriteRule('conditional', 'if', r'if[ \t]+\[([^\]\n]+)\]', _shell_conditional),
+    RewriteRule('for_loop', 'for', r'for[ \t]+(\w+)[ \t]+in[ \t]+([^;\n]+)', _shell_for_loop),
+    RewriteRule('echo_string', 'echo', r'echo[ \t]+"([^"\n]*)"', _shell_echo),
+    RewriteRule('echo_variable', 'echo', r'echo[ \t]+\$\{?(\w+)\}?', r'print(\1)'),
+    RewriteRule('cd', 'cd', rf'cd[ \t]+{_SHELL_OPERAND}', r'os.chdir("\1")'),
+    RewriteRule('pwd', 'pwd', r'pwd', 'os.getcwd()'),
+    RewriteRule('mkdir', 'mkdir', rf'mkdir[ \t]+{_SHELL_OPERAND}',
+                r'Path("\1").mkdir(parents=True, exist_ok=True)'),
+    RewriteRule('rm', 'rm', rf'rm[ \t]+{_SHELL_OPERAND}', r'Path("\1").unlink()'),
+    RewriteRule('cp', 'cp', rf'cp[ \t]+{_SHELL_OPERAND}[ \t]+{_SHELL_OPERAND}',
+                r'shutil.copy("\1", "\2")'),
+    RewriteRule('mv', 'mv', rf'mv[ \t]+{_SHELL_OPERAND}[ \t]+{_SHELL_OPERAND}',
+                r'shutil.move("\1", "\2")'),
+] + _SHELL_VARIABLE_RULES, re.MULTILINE)
+
+_PERL_VARIABLE_RULES = [
+    RewriteRule('variable', ('$', '@', '%'), r'[$@%](\w+)', r'\1'),
+]
+
+PERL_VARIABLES = RuleTable(_PERL_VARIABLE_RULES)
+
+PERL_CONDITIONS = RuleTable([
+    RewriteRule('is_file', '-f', rf'-f[ \t]+{_PERL_OPERAND}', r'Path("\1").is_file()'),
+    RewriteRule('is_dir', '-d', rf'-d[ \t]+{_PERL_OPERAND}', r'Path("\1").is_dir()'),
+    RewriteRule('exists', '-e', rf'-e[ \t]+{_PERL_OPERAND}', r'Path("\1").exists()'),
+] + _PERL_VARIABLE_RULES)
+
+PERL_RULES = RuleTable([
+    RewriteRule('open', 'open',
+                rf'open[ \t]*\([ \t]*{_PERL_OPERAND},[ \t]*["\']([^"\'\n]+)["\'][ \t]*\)',
+                r'\1 = open("\2", "r")'),
+    RewriteRule('close', 'close', rf'close[ \t]*\([ \t]*{_PERL_OPERAND}[ \t]*\)', r'\1.close()'),
+    RewriteRule('read', 'read',
+                rf'read[ \t]*\([ \t]*{_PERL_OPERAND},[ \t]*{_PERL_OPERAND},[ \t]*(\d+)[ \t]*\)',
+                r'\2 = \1.read(\3)'),
+    RewriteRule('write', 'write',
+                rf'write[ \t]*\([ \t]*{_PERL_OPERAND},[ \t]*{_PERL_OPERAND}[ \t]*\)', r'\1.write(\2)'),
+    RewriteRule('subroutine', 'sub', r'sub[ \t]+(\w+)', r'def \1():'),
+    RewriteRule('module', 'use', r'use[ \t]+([\w:]+)', _perl_module),
+    RewriteRule('conditional', ('if', 'elsif'), r'(els)?if[ \t]*\(([^)\n]+)\)', _perl_conditional),
+    RewriteRule('for_loop', 'for', r'for[ \t]*\([^;\n]*;[ \t]*([^;\n]+);[ \t]*[^)\n]*\)',
+                _perl_for_loop),
+] + _PERL_VARIABLE_RULES)
+
+RULE_TABLES = {'shell': SHELL_RULES, 'perl': PERL_RULES}
+
 
 class ScriptConverter:
     """
@@ -95,26 +215,7 @@ class ScriptConverter:
         """
         logger.info(f"Converting shell script: {script_name}")
         
-        # Remove shebang
-        content = re.sub(r'^#!/bin/(?:bash|sh).*\n', '', content)
-        
-        # Convert variables
-        content = self._convert_shell_variables(content)
-        
-        # Convert command substitution
-        content = self._convert_command_substitution(content)
-        
-        # Convert conditionals
-        content = self._convert_shell_conditionals(content)
-        
-        # Convert loops
-        content = self._convert_shell_loops(content)
-        
-        # Convert functions
-        content = self._convert_shell_functions(content)
-        
-        # Convert external commands
-        content = self._convert_external_commands(content)
+        content = SHELL_RULES.rewrite(self._strip_shebang(content))
         
         # Generate Python wrapper
         python_code = self._generate_python_wrapper(content, script_name, 'shell')
@@ -134,32 +235,101 @@ class ScriptConverter:
         """
         logger.info(f"Converting Perl script: {script_name}")
         
-        # Remove shebang
-        content = re.sub(r'^#!/usr/bin/perl.*\n', '', content)
-        
-        # Convert variables
-        content = self._convert_perl_variables(content)
-        
-        # Convert subroutines
-        content = self._convert_perl_subroutines(content)
-        
-        # Convert modules
-        content = self._convert_perl_modules(content)
-        
-        # Convert conditionals
-        content = self._convert_perl_conditionals(content)
-        
-        # Convert loops
-        content = self._convert_perl_loops(content)
-        
-        # Convert file operations
-        content = self._convert_perl_file_operations(content)
+        content = PERL_RULES.rewrite(self._strip_shebang(content))
         
         # Generate Python wrapper
         python_code = self._generate_python_wrapper(content, script_name, 'perl')
         
         return python_code
     
+    def convert_file(self, source: Path, target: Path, script_type: Optional[str] = None) -> Path:
+        """
+        Convert a script file, streaming it line by line.
+        
+        Args:
+            source: Shell or Perl script to convert
+            target: Path of the Python file to write
+            script_type: 'shell' or 'perl'; detected from the extension or
+                shebang when not given
+            
+        Returns:
+            The target path
+        """
+        source, target = Path(source), Path(target)
+        script_type = script_type or self.detect_script_type(source)
+        if script_type not in RULE_TABLES:
+            raise ValueError(f"Cannot convert {script_type} script: {source}")
+        
+        logger.info(f"Converting {script_type} script: {source.name}")
+        head, tail = self._wrapper_parts(source.name, script_type)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(source, 'r', encoding='utf-8', errors='ignore') as src, \
+                open(target, 'w', encoding='utf-8') as dst:
+            dst.write(head)
+            first = src.readline()
+            if not first.startswith('#!'):
+                dst.write(RULE_TABLES[script_type].rewrite(first))
+            dst.writelines(RULE_TABLES[script_type].rewrite_lines(src))
+            dst.write(tail)
+        
+        return target
+    
+    @staticmethod
+    def detect_script_type(path: Path) -> Optional[str]:
+        """Script type from the file extension, else from the shebang."""
+        path = Path(path)
+        script_type = SCRIPT_EXTENSIONS.get(path.suffix)
+        if script_type:
+            return script_type
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                shebang = f.readline()
+        except OSError:
+            return None
+        if not shebang.startswith('#!'):
+            return None
+        if 'perl' in shebang:
+            return 'perl'
+        if re.search(r'\b(?:ba|z|k)?sh\b', shebang):
+            return 'shell'
+        return None
+    
+    @staticmethod
+    def _strip_shebang(content: str) -> str:
+        match = SHEBANG.match(content)
+        return content[match.end():] if match else content
+    
+    def convert_multipass(self, content: str, script_type: str) -> str:
+        """
+        Convert with the original one-re.sub-per-rule pipeline.
+        
+        Kept as the reference implementation for the converter benchmark;
+        convert_shell_script and convert_perl_script use the rule tables.
+        
+        Args:
+            content: Script content
+            script_type: 'shell' or 'perl'
+            
+        Returns:
+            Converted code, without the Python wrapper
+        """
+        if script_type == 'shell':
+            content = re.sub(r'^#!/bin/(?:bash|sh).*\n', '', content)
+            for convert in (self._convert_shell_variables, self._convert_command_substitution,
+                            self._convert_shell_conditionals, self._convert_shell_loops,
+                            self._convert_shell_functions, self._convert_external_commands):
+                content = convert(content)
+        elif script_type == 'perl':
+            content = re.sub(r'^#!/usr/bin/perl.*\n', '', content)
+            for convert in (self._convert_perl_variables, self._convert_perl_subroutines,
+                            self._convert_perl_modules, self._convert_perl_conditionals,
+                            self._convert_perl_loops, self._convert_perl_file_operations):
+                content = convert(content)
+        else:
+            raise ValueError(f"Unsupported script type: {script_type}")
+        return content
+    
     def _convert_shell_variables(self, content: str) -> str:
         """Convert shell variables to Python variables."""
         # Convert $VAR to VAR
@@ -262,15 +432,7 @@ class ScriptConverter:
         def replace_module(match):
             module = match.group(1)
             # Convert Perl module names to Python equivalents
-            module_mapping = {
-                'File::Path': 'pathlib',
-                'File::Copy': 'shutil',
-                'Getopt::Long': 'argparse',
-                'POSIX': 'os',
-                'Cwd': 'os',
-            }
-            
-            python_module = module_mapping.get(module, module.lower().replace('::', '.'))
+            python_module = PERL_MODULE_MAPPING.get(module, module.lower().replace('::', '.'))
             return f'import {python_module}'
         
         content = re.sub(r'use\s+([\w:]+)', replace_module, content)
@@ -323,7 +485,12 @@ class ScriptConverter:
     
     def _generate_python_wrapper(self, content: str, script_name: str, script_type: str) -> str:
         """Generate Python wrapper code."""
-        wrapper = f'''"""
+        head, tail = self._wrapper_parts(script_name, script_type)
+        return head + content + tail
+    
+    def _wrapper_parts(self, script_name: str, script_type: str) -> Tuple[str, str]:
+        """Python wrapper code before and after the converted script body."""
+        head = f'''"""
 {script_name}
 
 Migrated from {script_type} script.
@@ -345,7 +512,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Migrated code from {script_type} script
-{content}
+'''
+        tail = f'''
 
 @click.command()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
@@ -379,7 +547,7 @@ def main(verbose: bool, dry_run: bool):
 if __name__ == '__main__':
     main()
 '''
-        return wrapper
+        return head, tail
     
     def analyze_script_complexity(self, content: str, script_type: str) -> Dict[str, Any]:
         """
@@ -3,8 +3,13 @@ OpenSSL Tools - Conan 2.x Python_requires & Reusable Workflows
 
 Central hub for OpenSSL Conan integration, providing python_requires, 
 custom commands, deployers, and reusable GitHub Actions workflows.
+
+Submodules are loaded on first attribute access, so ``import openssl_tools``
+stays cheap for CLI wrappers and hooks.
 """
 
+from ._lazy import lazy_exports
+
 __all__ = [
     "__version__",
     # Foundation modules
@@ -21,9 +26,7 @@ __all__ = [
 
 __version__ = "1.2.0"
 
-# Import key modules for easy access
-from . import foundation
-from . import security
-from . import automation
-from . import testing
-from . import statistics
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    submodules=["foundation", "security", "automation", "testing", "statistics"],
+)
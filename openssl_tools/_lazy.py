@@ -0,0 +1,44 @@
+"""
+Lazy attribute loading for openssl_tools packages (PEP 562).
+
+Package ``__init__`` modules declare their public names here instead of
+importing them eagerly, so importing a package (or the CLI) does not pull in
+requests, PyGithub, cryptography, yaml and friends until they are used.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str] = None,
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__``/``__dir__`` for a package
+
+    ``exports`` maps a public name to the relative module defining it
+    (``".optimizer"``), or to ``".module:attribute"`` when the name differs.
+    ``submodules`` lists subpackages exposed as attributes.
+    """
+    exports = dict(exports or {})
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str):
+        if name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        elif name in exports:
+            module_name, _, attribute = exports[name].partition(":")
+            module = importlib.import_module(module_name, package)
+            value = getattr(module, attribute or name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports) | submodules)
+
+    return __getattr__, __dir__
@@ -4,7 +4,7 @@ OpenSSL Tools Automation Module
 CI/CD automation and orchestration utilities.
 """
 
-from .conan_orchestrator import ConanOrchestrator, BuildConfig, BuildResult, BuildType, Platform
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     'ConanOrchestrator',
@@ -12,4 +12,12 @@ __all__ = [
     'BuildResult',
     'BuildType',
     'Platform'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConanOrchestrator": ".conan_orchestrator",
+    "BuildConfig": ".conan_orchestrator",
+    "BuildResult": ".conan_orchestrator",
+    "BuildType": ".conan_orchestrator",
+    "Platform": ".conan_orchestrator",
+})
@@ -6,13 +6,20 @@ OpenSSL development workflows, enabling AI-powered automation and analysis.
 
 Classes:
     GitHubWorkflowFixer: GitHub workflow analysis and fixing MCP server
+    FailureSignatureIndex: Persistent index of workflow failure signatures
     BuildServer: Build automation MCP server
     CIServer: CI/CD automation MCP server
     SecurityServer: Security analysis MCP server
 """
 
-from .workflow_fixer import GitHubWorkflowFixer
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "GitHubWorkflowFixer",
-]
\ No newline at end of file
+    "FailureSignatureIndex",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "GitHubWorkflowFixer": ".workflow_fixer",
+    "FailureSignatureIndex": ".failure_index",
+})
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Asynchronous build job execution for the OpenSSL build MCP server.
+
+Builds run as asyncio subprocesses behind a bounded concurrency limit, so
+long `conan create` or build-script runs never block the event loop and
+status, log and cache queries stay responsive while builds are running.
+"""
+
+import asyncio
+import hashlib
+import os
+import signal
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# Directories that never contribute to a component's source hash
+IGNORED_DIRS = {".git", "build", "__pycache__"}
+# Longest output line read from a build (compiler command lines can be very long)
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+@dataclass
+class BuildJob:
+    """A build or upload running (or finished) in the job manager"""
+    job_id: str
+    name: str
+    commands: List[List[str]]
+    cache_key: Optional[Tuple[str, ...]] = None
+    timeout: Optional[float] = None
+    status: str = "queued"  # queued, running, succeeded, failed, cancelled, timeout
+    returncode: Optional[int] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    log: Deque[str] = field(default_factory=deque)
+    log_offset: int = 0  # number of lines dropped from the front of `log`
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled", "timeout")
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "status": self.status,
+            "returncode": self.returncode,
+            "duration": self.duration,
+            "log_lines": self.log_offset + len(self.log),
+        }
+
+
+class BuildJobManager:
+    """Queue, run, stream and cancel build jobs"""
+
+    def __init__(self, max_concurrent: int = 2, max_log_lines: int = 5000,
+                 cwd: Optional[Path] = None, max_finished_jobs: int = 100):
+        self.max_concurrent = max_concurrent
+        self.max_log_lines = max_log_lines
+        self.max_finished_jobs = max_finished_jobs
+        self.cwd = Path(cwd) if cwd else None
+        self.jobs: Dict[str, BuildJob] = {}
+        self._results: Dict[Tuple[str, ...], str] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def source_hash(self, source_dir: Path) -> str:
+        """Content hash of a component source tree, computed off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _hash_tree, Path(source_dir))
+
+    def submit(self, name: str, commands: Sequence[Sequence[str]],
+               cache_key: Optional[Tuple[str, ...]] = None,
+               timeout: Optional[float] = None) -> BuildJob:
+        """Queue a job, or return the cached job for an identical build"""
+        if cache_key is not None:
+            cached_id = self._results.get(cache_key)
+            if cached_id is not None:
+                return self.jobs[cached_id]
+            for job in self.jobs.values():
+                if job.cache_key == cache_key and not job.done:
+                    return job
+
+        job = BuildJob(
+            job_id=uuid.uuid4().hex[:12],
+            name=name,
+            commands=[list(command) for command in commands],
+            cache_key=cache_key,
+            timeout=timeout,
+        )
+        self.jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.ensure_future(self._run(job))
+        return job
+
+    async def _run(self, job: BuildJob):
+        try:
+            async with self._limit():
+                job.status = "running"
+                job.started_at = time.time()
+                await asyncio.wait_for(self._run_commands(job), job.timeout)
+        except asyncio.TimeoutError:
+            job.status = "timeout"
+            self._append(job, f"Timed out after {job.timeout:.0f} seconds")
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            self._append(job, f"Error: {e}")
+        finally:
+            if job.status != "succeeded":
+                await self._kill(job)
+            job.finished_at = time.time()
+            self._processes.pop(job.job_id, None)
+            self._tasks.pop(job.job_id, None)
+            if job.status == "succeeded" and job.cache_key is not None:
+                self._results[job.cache_key] = job.job_id
+            self._evict_finished()
+
+    async def _run_commands(self, job: BuildJob):
+        for command in job.commands:
+            self._append(job, f"$ {' '.join(command)}")
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=self.cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=STREAM_LIMIT,
+                start_new_session=os.name == "posix",  # own process group, killed as a whole
+            )
+            self._processes[job.job_id] = process
+            async for raw in process.stdout:
+                self._append(job, raw.decode(errors="replace").rstrip("\n"))
+            job.returncode = await process.wait()
+            if job.returncode != 0:
+                job.status = "failed"
+                return
+        job.status = "succeeded"
+
+    def _append(self, job: BuildJob, line: str):
+        job.log.append(line)
+        if len(job.log) > self.max_log_lines:
+            job.log.popleft()
+            job.log_offset += 1
+
+    async def _kill(self, job: BuildJob):
+        """Kill the job's process with everything it spawned, and reap it"""
+        process = self._processes.get(job.job_id)
+        if process is None or process.returncode is not None:
+            return
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+    def _evict_finished(self):
+        """Forget the oldest finished jobs (and their cached results) beyond max_finished_jobs"""
+        finished = [job for job in self.jobs.values() if job.done]
+        for job in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self.jobs[job.job_id]
+            if job.cache_key is not None and self._results.get(job.cache_key) == job.job_id:
+                del self._results[job.cache_key]
+
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        return self.jobs.get(job_id)
+
+    def read_log(self, job_id: str, since: int = 0) -> Tuple[List[str], int]:
+        """Log lines after offset `since` and the offset to continue from"""
+        job = self.jobs[job_id]
+        start = max(since - job.log_offset, 0)
+        lines = list(job.log)[start:]
+        return lines, job.log_offset + len(job.log)
+
+    def cancel(self, job_id: str) -> bool:
+        task = self._tasks.get(job_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    async def wait(self, job_id: str) -> BuildJob:
+        job = self.jobs[job_id]  # may be evicted once finished
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+        return job
+
+
+def _hash_tree(root: Path) -> str:
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_DIRS)
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, root).encode())
+            digest.update(b"\0")
+            try:
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            except OSError:
+                continue
+    return digest.hexdigest()
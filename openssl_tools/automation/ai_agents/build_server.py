@@ -5,7 +5,6 @@ Integrates with existing working build system via MCP protocol
 """
 
 import asyncio
-import subprocess
 import os
 import sys
 import json
@@ -20,6 +19,11 @@ except ImportError:
     print("❌ MCP SDK not installed. Run: pip install mcp", file=sys.stderr)
     sys.exit(1)
 
+# Allow running this file directly as an MCP server script
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from openssl_tools.automation.ai_agents.build_jobs import BuildJobManager
+from openssl_tools.monitoring.build_tracking import get_build_store
+
 # Initialize MCP server
 server = Server("openssl-build")
 
@@ -27,6 +31,12 @@ server = Server("openssl-build")
 WORKSPACE_ROOT = Path(__file__).parent.parent.parent
 os.chdir(WORKSPACE_ROOT)
 
+# Builds run in the background; tools return job IDs immediately
+jobs = BuildJobManager(
+    max_concurrent=int(os.getenv("OPENSSL_BUILD_MAX_JOBS", "2")),
+    cwd=WORKSPACE_ROOT,
+)
+
 @server.list_tools()
 async def handle_list_tools():
     """List available tools for OpenSSL build operations"""
@@ -94,6 +104,43 @@ async def handle_list_tools():
                 "type": "object",
                 "properties": {}
             }
+        ),
+        Tool(
+            name="get_job_status",
+            description="Get the status of build jobs (all jobs if job_id is omitted)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string", "description": "Job ID returned by a build tool"}
+                }
+            }
+        ),
+        Tool(
+            name="get_job_log",
+            description="Get build log lines produced since a given offset",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"},
+                    "since": {
+                        "type": "integer",
+                        "default": 0,
+                        "description": "Offset returned by the previous call"
+                    }
+                },
+                "required": ["job_id"]
+            }
+        ),
+        Tool(
+            name="cancel_job",
+            description="Cancel a queued or running build job",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string"}
+                },
+                "required": ["job_id"]
+            }
         )
     ]
 
@@ -119,50 +166,49 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         elif name == "upload_to_registries":
             return await upload_to_registries()
             
+        elif name == "get_job_status":
+            return await get_job_status(arguments.get("job_id"))
+            
+        elif name == "get_job_log":
+            return await get_job_log(arguments["job_id"], arguments.get("since", 0))
+            
+        elif name == "cancel_job":
+            return await cancel_job(arguments["job_id"])
+            
         else:
             return [TextContent(type="text", text=f"❌ Unknown tool: {name}")]
             
     except Exception as e:
         return [TextContent(type="text", text=f"❌ Error executing {name}: {str(e)}")]
 
+def _job_submitted(job, title: str) -> list[TextContent]:
+    """Describe a queued job, or a cached result for an identical build"""
+    if job.done:
+        output = f"♻️  {title}: cached result from job {job.job_id} ({job.status})\n"
+    else:
+        output = f"🚀 {title}: job {job.job_id} {job.status}\n"
+        output += "   Use get_job_status / get_job_log to follow progress\n"
+    return [TextContent(type="text", text=output)]
+
 async def build_all_components(clean: bool = False) -> list[TextContent]:
-    """Execute the existing working build script"""
-    
-    output = "🔨 Building All OpenSSL Components\n"
-    output += "=" * 50 + "\n"
+    """Queue the existing working build script"""
+    commands = []
+    if clean:
+        commands.append(["conan", "remove", "openssl-*", "-f"])
+    commands.append(["./scripts/build/build-all-components.sh"])
     
-    try:
-        # Clean cache if requested
-        if clean:
-            output += "🧹 Cleaning Conan cache...\n"
-            clean_result = subprocess.run(
-                ["conan", "remove", "openssl-*", "-f"],
-                capture_output=True, text=True
-            )
-            output += f"Cache cleaned: {clean_result.returncode == 0}\n\n"
-        
-        # Execute existing working script
-        output += "🚀 Executing build-all-components.sh...\n"
-        result = subprocess.run(
-            ["./scripts/build/build-all-components.sh"],
-            capture_output=True, text=True, timeout=600  # 10 minute timeout
-        )
-        
-        if result.returncode == 0:
-            output += "✅ Build completed successfully!\n\n"
-            output += "📊 Build Output:\n"
-            output += result.stdout[-1000:]  # Last 1000 chars
-        else:
-            output += "❌ Build failed!\n\n"
-            output += "🔍 Error Output:\n"
-            output += result.stderr[-1000:]  # Last 1000 chars
-            
-    except subprocess.TimeoutExpired:
-        output += "⏰ Build timed out after 10 minutes\n"
-    except Exception as e:
-        output += f"💥 Unexpected error: {str(e)}\n"
-    
-    return [TextContent(type="text", text=output)]
+    job = jobs.submit("build_all_components", commands, timeout=600)  # 10 minute timeout
+    return _job_submitted(job, "Build all OpenSSL components")
+
+async def _conan_cache_path(component: str) -> str:
+    process = await asyncio.create_subprocess_exec(
+        "conan", "cache", "path", f"{component}/3.2.0",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return ""
+    return stdout.decode().strip()
 
 async def check_conan_cache() -> list[TextContent]:
     """Check Conan cache status for OpenSSL packages"""
@@ -171,136 +217,99 @@ async def check_conan_cache() -> list[TextContent]:
     output += "=" * 30 + "\n"
     
     components = ["openssl-crypto", "openssl-ssl", "openssl-tools"]
+    results = await asyncio.gather(
+        *(_conan_cache_path(component) for component in components),
+        return_exceptions=True
+    )
     
-    for component in components:
-        try:
-            # Check if package exists in cache
-            result = subprocess.run(
-                ["conan", "cache", "path", f"{component}/3.2.0"],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode == 0:
-                output += f"✅ {component}: Cached\n"
-                output += f"   Path: {result.stdout.strip()}\n"
-            else:
-                output += f"❌ {component}: Not in cache\n"
-                
-        except Exception as e:
-            output += f"⚠️  {component}: Error checking - {str(e)}\n"
+    for component, result in zip(components, results):
+        if isinstance(result, Exception):
+            output += f"⚠️  {component}: Error checking - {str(result)}\n"
+        elif result:
+            output += f"✅ {component}: Cached\n"
+            output += f"   Path: {result}\n"
+        else:
+            output += f"❌ {component}: Not in cache\n"
     
     return [TextContent(type="text", text=output)]
 
 async def get_build_status(limit: int) -> list[TextContent]:
-    """Get build status from PostgreSQL database"""
+    """Get build status from the shared build tracking database"""
     
     output = f"📊 Recent Build Status (Last {limit})\n"
     output += "=" * 40 + "\n"
     
     try:
-        # Use existing database connection via Docker
-        result = subprocess.run([
-            "docker", "exec", "openssl-build-db", "psql",
-            "-U", "openssl_admin", "-d", "openssl_builds",
-            "-c", f"""
-                SELECT 
-                    c.name as component,
-                    b.status,
-                    b.build_duration_seconds as duration,
-                    b.build_date
-                FROM builds b
-                JOIN components c ON b.component_id = c.id
-                ORDER BY b.build_date DESC
-                LIMIT {limit};
-            """
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            output += "Database connection: ✅\n\n"
-            output += result.stdout
-        else:
-            output += "❌ Database connection failed\n"
-            output += "💡 Make sure PostgreSQL container is running\n"
-            output += "   Command: docker-compose -f docker-compose.postgres.yml up -d\n"
+        store = get_build_store()
+        results = await store.recent_builds(limit)
+        output += f"Database connection: ✅ ({store.backend})\n\n"
+        for component, status, duration, date in results:
+            output += f"{component:<20} {status:<12} {duration}s  {date}\n"
             
     except Exception as e:
         output += f"💥 Database error: {str(e)}\n"
+        output += "💡 Set DATABASE_URL or POSTGRES_HOST, or use the local SQLite fallback\n"
     
     return [TextContent(type="text", text=output)]
 
 async def build_single_component(component: str, profile: str) -> list[TextContent]:
-    """Build a single OpenSSL component"""
+    """Queue a single OpenSSL component build
     
-    output = f"🔨 Building OpenSSL {component.title()} Component\n"
-    output += "=" * 50 + "\n"
+    Results are cached per (component, profile, source hash), so repeating
+    a build of unchanged sources returns the earlier job.
+    """
+    component_dir = f"openssl-{component}"
+    if not os.path.exists(component_dir):
+        return [TextContent(type="text", text=f"❌ Component directory {component_dir} not found")]
     
-    try:
-        component_dir = f"openssl-{component}"
-        if not os.path.exists(component_dir):
-            return [TextContent(type="text", text=f"❌ Component directory {component_dir} not found")]
-        
-        # Execute Conan build
-        cmd = [
-            "conan", "create", f"{component_dir}/",
-            "--profile:build=default", "--profile:host=default",
-            f"-s build_type={profile}",
-            "-o", "*:shared=True",
-            "--build=missing"
-        ]
-        
-        output += f"🚀 Executing: {' '.join(cmd)}\n\n"
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        
-        if result.returncode == 0:
-            output += f"✅ {component} build completed successfully!\n\n"
-            output += "📝 Build Summary:\n"
-            # Extract key information from stdout
-            lines = result.stdout.split('\n')
-            for line in lines[-20:]:  # Last 20 lines
-                if any(word in line.lower() for word in ['package', 'created', 'exported', 'success']):
-                    output += f"   {line}\n"
-        else:
-            output += f"❌ {component} build failed!\n\n"
-            output += "🔍 Error Details:\n"
-            output += result.stderr[-500:]  # Last 500 chars
-            
-    except subprocess.TimeoutExpired:
-        output += f"⏰ {component} build timed out after 5 minutes\n"
-    except Exception as e:
-        output += f"💥 Build error: {str(e)}\n"
-    
-    return [TextContent(type="text", text=output)]
+    cmd = [
+        "conan", "create", f"{component_dir}/",
+        "--profile:build=default", "--profile:host=default",
+        "-s", f"build_type={profile}",
+        "-o", "*:shared=True",
+        "--build=missing"
+    ]
+    source_hash = await jobs.source_hash(Path(component_dir))
+    job = jobs.submit(
+        f"build_{component}_{profile}", [cmd],
+        cache_key=(component, profile, source_hash),
+        timeout=300
+    )
+    return _job_submitted(job, f"Build OpenSSL {component.title()} ({profile})")
 
 async def upload_to_registries() -> list[TextContent]:
-    """Execute registry upload script"""
-    
-    output = "📤 Uploading to Registries\n"
-    output += "=" * 30 + "\n"
-    
-    try:
-        # Execute existing upload script
-        result = subprocess.run(
-            ["./scripts/upload/upload-to-registries.sh"],
-            capture_output=True, text=True, timeout=300
-        )
-        
-        if result.returncode == 0:
-            output += "✅ Upload completed successfully!\n\n"
-            output += "📋 Upload Summary:\n"
-            output += result.stdout[-800:]  # Last 800 chars
-        else:
-            output += "❌ Upload failed!\n\n"
-            output += "🔍 Error Details:\n"
-            output += result.stderr[-500:]
-            
-    except subprocess.TimeoutExpired:
-        output += "⏰ Upload timed out after 5 minutes\n"
-    except Exception as e:
-        output += f"💥 Upload error: {str(e)}\n"
+    """Queue the registry upload script"""
+    job = jobs.submit("upload_to_registries", [["./scripts/upload/upload-to-registries.sh"]],
+                      timeout=300)
+    return _job_submitted(job, "Upload to registries")
+
+async def get_job_status(job_id: str = None) -> list[TextContent]:
+    """Report one job, or all known jobs"""
+    if job_id:
+        job = jobs.get(job_id)
+        if job is None:
+            return [TextContent(type="text", text=f"❌ Unknown job: {job_id}")]
+        return [TextContent(type="text", text=json.dumps(job.to_dict(), indent=2))]
     
+    summary = [job.to_dict() for job in jobs.jobs.values()]
+    return [TextContent(type="text", text=json.dumps(summary, indent=2))]
+
+async def get_job_log(job_id: str, since: int = 0) -> list[TextContent]:
+    """Return new log lines of a job since the given offset"""
+    job = jobs.get(job_id)
+    if job is None:
+        return [TextContent(type="text", text=f"❌ Unknown job: {job_id}")]
+    lines, offset = jobs.read_log(job_id, since)
+    output = f"📝 {job.name} [{job.status}] lines {since}-{offset} (next since={offset})\n"
+    output += "\n".join(lines)
     return [TextContent(type="text", text=output)]
 
+async def cancel_job(job_id: str) -> list[TextContent]:
+    """Cancel a queued or running job"""
+    if jobs.cancel(job_id):
+        return [TextContent(type="text", text=f"🛑 Cancelling job {job_id}")]
+    return [TextContent(type="text", text=f"❌ Job {job_id} is not running")]
+
 async def main():
     """Main entry point for MCP server"""
     from mcp.server.models import InitializationOptions
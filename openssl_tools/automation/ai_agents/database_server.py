@@ -3,11 +3,10 @@
 
 import asyncio
 import json
-import os
 import sys
+from pathlib import Path
 from typing import Any, Sequence
 
-import psycopg2
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -20,16 +19,15 @@ from mcp.types import (
     TextContent
 )
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from openssl_tools.monitoring.build_tracking import get_build_store
+
 class DatabaseMCPServer:
     def __init__(self):
         self.server = Server("openssl-database")
-        self.db_config = {
-            'host': os.getenv('POSTGRES_HOST', 'localhost'),
-            'port': os.getenv('POSTGRES_PORT', 5432),
-            'database': os.getenv('POSTGRES_DB', 'openssl_builds'),
-            'user': os.getenv('POSTGRES_USER', 'openssl_admin'),
-            'password': os.getenv('POSTGRES_PASSWORD', 'openssl_secure_pass')
-        }
+        # Shared connection pool (PostgreSQL from DATABASE_URL/POSTGRES_*,
+        # SQLite fallback when no server is configured or reachable)
+        self.store = get_build_store()
         self.setup_handlers()
     
     def setup_handlers(self):
@@ -86,16 +84,7 @@ class DatabaseMCPServer:
     
     async def get_build_status(self, limit: int) -> list[TextContent]:
         try:
-            with psycopg2.connect(**self.db_config) as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT c.name, b.status, b.build_duration_seconds, b.build_date
-                        FROM builds b
-                        JOIN components c ON b.component_id = c.id
-                        ORDER BY b.build_date DESC
-                        LIMIT %s
-                    """, (limit,))
-                    results = cur.fetchall()
+            results = await self.store.recent_builds(limit)
                     
             status_text = "Recent Build Status:\n"
             for name, status, duration, date in results:
@@ -107,17 +96,7 @@ class DatabaseMCPServer:
     
     async def get_component_history(self, component: str, limit: int) -> list[TextContent]:
         try:
-            with psycopg2.connect(**self.db_config) as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT b.status, b.build_duration_seconds, b.build_date, b.platform, b.profile
-                        FROM builds b
-                        JOIN components c ON b.component_id = c.id
-                        WHERE c.name = %s
-                        ORDER BY b.build_date DESC
-                        LIMIT %s
-                    """, (component, limit))
-                    results = cur.fetchall()
+            results = await self.store.component_history(component, limit)
                     
             history_text = f"Build History for {component}:\n"
             for status, duration, date, platform, profile in results:
@@ -129,24 +108,14 @@ class DatabaseMCPServer:
     
     async def get_build_metrics(self, days: int) -> list[TextContent]:
         try:
-            with psycopg2.connect(**self.db_config) as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT 
-                            COUNT(*) as total_builds,
-                            COUNT(CASE WHEN status = 'completed' THEN 1 END) as successful,
-                            AVG(build_duration_seconds) as avg_duration
-                        FROM builds
-                        WHERE build_date >= NOW() - INTERVAL '%s days'
-                    """, (days,))
-                    total, successful, avg_duration = cur.fetchone()
+            total, successful, avg_duration = await self.store.build_metrics(days)
                     
             success_rate = (successful / total * 100) if total > 0 else 0
             metrics_text = f"Build Metrics (Last {days} days):\n"
             metrics_text += f"• Total builds: {total}\n"
             metrics_text += f"• Successful: {successful}\n"
             metrics_text += f"• Success rate: {success_rate:.1f}%\n"
-            metrics_text += f"• Average duration: {avg_duration:.1f}s\n"
+            metrics_text += f"• Average duration: {avg_duration or 0:.1f}s\n"
                 
             return [TextContent(type="text", text=metrics_text)]
         except Exception as e:
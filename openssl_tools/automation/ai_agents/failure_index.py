@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Workflow Failure Signature Index
+
+Persistent index of the failure lines seen in GitHub workflow logs. Each
+error line is normalized - timestamps, paths, hashes, ids and numbers are
+stripped - and hashed into a fingerprint, so the same failure in different
+runs maps to the same signature. Signatures are classified into issue types
+once, when first seen, and can be linked to known fixes. A run's log is
+downloaded and indexed once; afterwards classifying a log costs one pass
+over its lines plus indexed lookups, and "seen before" queries across all
+past runs are single SQLite lookups.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+# Issue type -> patterns, matched against a signature's sample line
+ISSUE_PATTERNS = {
+    "dependency_issues": [r"npm.*ENOTFOUND", r"pip.*ERROR", r"yarn.*error"],
+    "timeout_issues": [r"timeout", r"timed out", r"deadline exceeded"],
+    "permission_issues": [r"permission denied", r"access denied", r"forbidden"],
+    "environment_issues": [r"command not found", r"no such file", r"PATH"],
+}
+_ISSUE_REGEXES = {issue: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+                  for issue, patterns in ISSUE_PATTERNS.items()}
+
+# Lines worth fingerprinting: generic failure words, plus every line an issue pattern classifies
+FAILURE_WORDS = [
+    r"error", r"fail", r"fatal", r"exception", r"traceback", r"denied", r"forbidden", r"not found",
+    r"segmentation fault", r"abort", r"##\[error\]",
+]
+FAILURE_LINE = re.compile(
+    "|".join(FAILURE_WORDS + [pattern for patterns in ISSUE_PATTERNS.values() for pattern in patterns]),
+    re.IGNORECASE,
+)
+
+_NORMALIZERS = [
+    (re.compile(r"\x1b\[[0-9;]*[A-Za-z]"), ""),                                  # ANSI colors
+    (re.compile(r"^\ufeff?\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?Z?\s*"), ""),    # runner line prefix
+    (re.compile(r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(\.\d+)?(Z|[+-]\d\d:?\d\d)?"), "<time>"),
+    (re.compile(r"\b\d\d:\d\d:\d\d(\.\d+)?\b"), "<time>"),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<id>"),
+    (re.compile(r"https?://\S+"), "<url>"),
+    (re.compile(r"(?:[A-Za-z]:)?(?:[\\/][\w.@+-]+){2,}[\\/]?"), "<path>"),
+    (re.compile(r"\b(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{7,}\b", re.IGNORECASE), "<hash>"),
+    (re.compile(r"\b\d+(\.\d+)*\b"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    fingerprint TEXT PRIMARY KEY,
+    sample TEXT NOT NULL,
+    issue_type TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    repo TEXT,
+    workflow TEXT,
+    conclusion TEXT,
+    created_at TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    fingerprint TEXT NOT NULL REFERENCES signatures(fingerprint),
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    PRIMARY KEY (fingerprint, run_id)
+);
+CREATE INDEX IF NOT EXISTS occurrences_run ON occurrences (run_id);
+CREATE TABLE IF NOT EXISTS fixes (
+    fingerprint TEXT PRIMARY KEY REFERENCES signatures(fingerprint),
+    description TEXT NOT NULL,
+    added_at REAL NOT NULL
+);
+"""
+
+
+def normalize_line(line: str) -> str:
+    """Strip the run-specific parts (timestamps, paths, hashes, ids, numbers) of a log line"""
+    for pattern, replacement in _NORMALIZERS:
+        line = pattern.sub(replacement, line)
+    return line.strip().lower()
+
+
+def fingerprint(line: str) -> str:
+    """Fingerprint of a log line, equal for the same failure in different runs"""
+    return hashlib.sha1(normalize_line(line).encode("utf-8")).hexdigest()[:16]
+
+
+def failure_signatures(log_text: str) -> Dict[str, str]:
+    """Fingerprint -> first raw line, for every failure line of a log (one pass)"""
+    signatures: Dict[str, str] = {}
+    for line in log_text.splitlines():
+        if FAILURE_LINE.search(line):
+            normalized = normalize_line(line)
+            if normalized:
+                key = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+                signatures.setdefault(key, line.strip())
+    return signatures
+
+
+def classify_line(line: str) -> Optional[str]:
+    """Issue type of a failure line, per ISSUE_PATTERNS"""
+    for issue_type, regexes in _ISSUE_REGEXES.items():
+        if any(regex.search(line) for regex in regexes):
+            return issue_type
+    return None
+
+
+class FailureSignatureIndex:
+    """SQLite-backed index of workflow failure signatures, runs and known fixes"""
+
+    def __init__(self, db_path: Union[str, Path] = ":memory:"):
+        """
+        :param db_path: SQLite database file; ":memory:" keeps the index for this process only
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def has_run(self, run_id: int) -> bool:
+        """Whether the log of run_id has already been indexed"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone() is not None
+
+    def add_run(self, run_id: int, log_text: str, repo: Optional[str] = None, workflow: Optional[str] = None,
+                conclusion: Optional[str] = None, created_at: Optional[str] = None) -> List[str]:
+        """
+        Index the failure lines of one run's log (again, if it was indexed before)
+        :return: Fingerprints found in the log
+        """
+        signatures = failure_signatures(log_text)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, repo, workflow, conclusion, created_at, now)
+            )
+            previous = {key for (key,) in self._conn.execute(
+                "SELECT fingerprint FROM occurrences WHERE run_id = ?", (run_id,))}
+            self._conn.executemany(
+                """INSERT INTO signatures (fingerprint, sample, issue_type, first_seen, last_seen)
+                   VALUES (?, ?, ?, ?, ?) ON CONFLICT (fingerprint) DO UPDATE SET last_seen = excluded.last_seen""",
+                [(key, line, classify_line(line), now, now) for key, line in signatures.items()]
+            )
+            new = [key for key in signatures if key not in previous]
+            self._conn.executemany("INSERT INTO occurrences VALUES (?, ?)", [(key, run_id) for key in new])
+            self._conn.executemany(
+                "UPDATE signatures SET occurrences = occurrences + 1 WHERE fingerprint = ?", [(key,) for key in new]
+            )
+        return list(signatures)
+
+    def add_fix(self, key: str, description: str) -> None:
+        """Record a known fix for a signature (fingerprint or raw log line)"""
+        key = self._key(key)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO fixes VALUES (?, ?, ?)", (key, description, time.time()))
+
+    def seen_before(self, key: str) -> Optional[Dict]:
+        """
+        History of a failure
+        :param key: Fingerprint, or a raw log line to fingerprint
+        :return: Sample line, issue type, known fix, run count, first/last seen and recent runs; None if never seen
+        """
+        key = self._key(key)
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT s.sample, s.issue_type, s.occurrences, s.first_seen, s.last_seen, f.description
+                   FROM signatures s LEFT JOIN fixes f ON f.fingerprint = s.fingerprint
+                   WHERE s.fingerprint = ?""",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            recent = [run_id for (run_id,) in self._conn.execute(
+                "SELECT run_id FROM occurrences WHERE fingerprint = ? ORDER BY run_id DESC LIMIT 10", (key,))]
+        sample, issue_type, occurrences, first_seen, last_seen, fix = row
+        return {"fingerprint": key, "sample": sample, "issue_type": issue_type, "fix": fix,
+                "runs": occurrences, "first_seen": first_seen, "last_seen": last_seen, "recent_runs": recent}
+
+    def classify(self, log_text: str) -> Dict[str, List[Dict]]:
+        """
+        Classify a log against the index without recording it
+        :return: {"known": [...seen_before() entries], "new": [{"fingerprint", "sample", "issue_type"}]}
+        """
+        signatures = failure_signatures(log_text)
+        known = {}
+        keys = list(signatures)
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                known.update((row[0], row) for row in self._conn.execute(
+                    f"""SELECT s.fingerprint, s.sample, s.issue_type, s.occurrences, s.first_seen, s.last_seen,
+                               f.description
+                        FROM signatures s LEFT JOIN fixes f ON f.fingerprint = s.fingerprint
+                        WHERE s.fingerprint IN ({','.join('?' * len(chunk))})""",
+                    chunk
+                ))
+        result = {"known": [], "new": []}
+        for key, line in signatures.items():
+            if key in known:
+                _, sample, issue_type, occurrences, first_seen, last_seen, fix = known[key]
+                result["known"].append({"fingerprint": key, "sample": sample, "issue_type": issue_type,
+                                        "fix": fix, "runs": occurrences, "first_seen": first_seen,
+                                        "last_seen": last_seen})
+            else:
+                result["new"].append({"fingerprint": key, "sample": line, "issue_type": classify_line(line)})
+        return result
+
+    def issue_types(self, run_ids: Iterable[int]) -> Set[str]:
+        """Issue types of the failures indexed for the given runs"""
+        run_ids = list(run_ids)
+        if not run_ids:
+            return set()
+        with self._lock:
+            return {issue for (issue,) in self._conn.execute(
+                f"""SELECT DISTINCT s.issue_type FROM occurrences o JOIN signatures s ON s.fingerprint = o.fingerprint
+                    WHERE o.run_id IN ({','.join('?' * len(run_ids))}) AND s.issue_type IS NOT NULL""",
+                run_ids
+            )}
+
+    def recurring(self, run_ids: Iterable[int], limit: int = 10) -> List[Dict]:
+        """Signatures of the given runs that also occurred in earlier runs, most frequent first"""
+        run_ids = list(run_ids)
+        if not run_ids:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT DISTINCT s.fingerprint, s.sample, s.issue_type, s.occurrences, f.description
+                    FROM occurrences o JOIN signatures s ON s.fingerprint = o.fingerprint
+                    LEFT JOIN fixes f ON f.fingerprint = s.fingerprint
+                    WHERE o.run_id IN ({','.join('?' * len(run_ids))}) AND s.occurrences > 1
+                    ORDER BY s.occurrences DESC, s.fingerprint LIMIT ?""",
+                run_ids + [limit]
+            ).fetchall()
+        return [{"fingerprint": key, "sample": sample, "issue_type": issue_type, "runs": occurrences, "fix": fix}
+                for key, sample, issue_type, occurrences, fix in rows]
+
+    def run_signatures(self, run_ids: Iterable[int]) -> Dict[str, Optional[str]]:
+        """Fingerprint -> issue type, for every signature indexed for the given runs"""
+        run_ids = list(run_ids)
+        if not run_ids:
+            return {}
+        with self._lock:
+            return dict(self._conn.execute(
+                f"""SELECT DISTINCT s.fingerprint, s.issue_type FROM occurrences o
+                    JOIN signatures s ON s.fingerprint = o.fingerprint
+                    WHERE o.run_id IN ({','.join('?' * len(run_ids))})""",
+                run_ids
+            ))
+
+    def run_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    @staticmethod
+    def _key(key: str) -> str:
+        return key if re.fullmatch(r"[0-9a-f]{16}", key) else fingerprint(key)
@@ -24,7 +24,7 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from urllib.parse import urlparse
 import hashlib
 import shutil
@@ -38,6 +38,8 @@ from jinja2 import Template, Environment, select_autoescape
 from pydantic import BaseModel, ValidationError
 import tenacity
 
+from openssl_tools.automation.ai_agents.failure_index import FailureSignatureIndex, ISSUE_PATTERNS
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +51,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Failure signatures of every analysed run, shared across invocations
+DEFAULT_FAILURE_INDEX = Path(os.environ.get(
+    "WORKFLOW_FAILURE_INDEX", Path.home() / ".cache" / "openssl-tools" / "workflow_failures.db"
+))
+
 # Configuration and data models
 @dataclass
 class WorkflowRun:
@@ -79,6 +86,8 @@ class WorkflowFix:
     diff: str
     risk_level: str  # low, medium, high
     backup_created: bool = False
+    issue_type: Optional[str] = None  # ISSUE_PATTERNS key the fix addresses
+    signatures: List[str] = field(default_factory=list)  # failure fingerprints it is recorded against
 
 @dataclass
 class AnalysisResult:
@@ -87,11 +96,13 @@ class AnalysisResult:
     common_issues: List[str]
     suggested_fixes: List[WorkflowFix]
     report: str
+    recurring_failures: List[Dict] = field(default_factory=list)
 
 class GitHubWorkflowFixer:
     """Main class for GitHub workflow analysis and fixing"""
 
-    def __init__(self, repo: str, token: Optional[str] = None):
+    def __init__(self, repo: str, token: Optional[str] = None,
+                 failure_index: Optional[FailureSignatureIndex] = None):
         self.repo = repo
         self.token = token or os.environ.get("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
@@ -115,11 +126,16 @@ class GitHubWorkflowFixer:
             limits=httpx.Limits(max_connections=10)
         )
 
+        self._owns_index = failure_index is None
+        self.failure_index = failure_index or FailureSignatureIndex(DEFAULT_FAILURE_INDEX)
+
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.client.aclose()
+        if self._owns_index:
+            self.failure_index.close()
 
     @tenacity.retry(
         wait=tenacity.wait_exponential(multiplier=1, min=2, max=10),
@@ -220,39 +236,37 @@ class GitHubWorkflowFixer:
                 report="No failed workflows found."
             )
 
-        # Analyze patterns in failures
-        common_issues = []
-        issue_patterns = {
-            "dependency_issues": [r"npm.*ENOTFOUND", r"pip.*ERROR", r"yarn.*error"],
-            "timeout_issues": [r"timeout", r"timed out", r"deadline exceeded"],
-            "permission_issues": [r"permission denied", r"access denied", r"forbidden"],
-            "environment_issues": [r"command not found", r"no such file", r"PATH"]
-        }
-
-        # Collect logs from failed runs for analysis
-        all_logs = ""
-        for run in failed_runs[:5]:  # Limit to avoid rate limits
+        # Index the logs of runs not seen before; indexed runs are never downloaded again
+        new_runs = [run for run in failed_runs if not self.failure_index.has_run(run.id)]
+        for run in new_runs[:5]:  # Limit to avoid rate limits
             logs = await self.get_workflow_logs(run.id)
-            all_logs += logs
-
-        # Pattern matching
-        for issue_type, patterns in issue_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, all_logs, re.IGNORECASE):
-                    common_issues.append(issue_type.replace('_', ' ').title())
-                    break
-
-        # Generate suggested fixes
-        suggested_fixes = await self._generate_fixes(failed_runs, common_issues, all_logs)
+            if logs:
+                self.failure_index.add_run(run.id, logs, repo=self.repo, workflow=run.workflow_name,
+                                           conclusion=run.conclusion, created_at=run.created_at)
+
+        # Issue types were classified once per failure signature, when it was first indexed
+        run_ids = [run.id for run in failed_runs]
+        issue_types = self.failure_index.issue_types(run_ids)
+        common_issues = [issue_type.replace('_', ' ').title() for issue_type in ISSUE_PATTERNS
+                         if issue_type in issue_types]
+        recurring_failures = self.failure_index.recurring(run_ids)
+
+        # Generate suggested fixes and record them against the runs' failure signatures
+        suggested_fixes = await self._generate_fixes(failed_runs, common_issues, "")
+        signatures = self.failure_index.run_signatures(run_ids)
+        for fix in suggested_fixes:
+            fix.signatures = [key for key, issue_type in signatures.items() if issue_type == fix.issue_type]
+            self._record_fix(fix, fix.description)
 
         # Create analysis report
-        report = self._create_analysis_report(failed_runs, common_issues, suggested_fixes)
+        report = self._create_analysis_report(failed_runs, common_issues, suggested_fixes, recurring_failures)
 
         return AnalysisResult(
             failed_runs=failed_runs,
             common_issues=common_issues,
             suggested_fixes=suggested_fixes,
-            report=report
+            report=report,
+            recurring_failures=recurring_failures
         )
 
     async def _generate_fixes(self, failed_runs: List[WorkflowRun], 
@@ -265,6 +279,7 @@ class GitHubWorkflowFixer:
             fixes.append(WorkflowFix(
                 file_path=".github/workflows/ci.yml",
                 description="Add dependency caching and retry logic",
+                issue_type="dependency_issues",
                 diff=self._generate_dependency_fix_diff(),
                 risk_level="low"
             ))
@@ -273,6 +288,7 @@ class GitHubWorkflowFixer:
             fixes.append(WorkflowFix(
                 file_path=".github/workflows/ci.yml",
                 description="Increase timeout values and add timeout handling",
+                issue_type="timeout_issues",
                 diff=self._generate_timeout_fix_diff(),
                 risk_level="low"
             ))
@@ -281,6 +297,7 @@ class GitHubWorkflowFixer:
             fixes.append(WorkflowFix(
                 file_path=".github/workflows/ci.yml",
                 description="Fix environment setup and PATH issues",
+                issue_type="environment_issues",
                 diff=self._generate_environment_fix_diff(),
                 risk_level="medium"
             ))
@@ -337,7 +354,8 @@ class GitHubWorkflowFixer:
 
     def _create_analysis_report(self, failed_runs: List[WorkflowRun], 
                                common_issues: List[str], 
-                               fixes: List[WorkflowFix]) -> str:
+                               fixes: List[WorkflowFix],
+                               recurring_failures: Optional[List[Dict]] = None) -> str:
         """Generate a comprehensive analysis report"""
 
         report_template = Template("""
@@ -369,6 +387,14 @@ Found {{ failed_count }} failed workflow runs requiring attention.
 - {{ issue }}
 {% endfor %}
 
+{% if recurring_failures %}
+### Recurring Failures
+
+{% for failure in recurring_failures %}
+- `{{ failure.sample }}` - seen in {{ failure.runs }} runs{% if failure.fix %}; known fix: {{ failure.fix }}{% endif %}
+{% endfor %}
+{% endif %}
+
 ### Recommended Fixes
 
 {% for fix in fixes %}
@@ -402,9 +428,15 @@ No failed workflows found. All workflows are passing!
             failed_runs=failed_runs,
             failed_count=len(failed_runs),
             common_issues=common_issues,
-            fixes=fixes
+            fixes=fixes,
+            recurring_failures=recurring_failures or []
         )
 
+    def _record_fix(self, fix: WorkflowFix, description: str) -> None:
+        """Record a fix as the known fix of the failure signatures it addresses"""
+        for key in fix.signatures:
+            self.failure_index.add_fix(key, description)
+
     async def apply_fix(self, fix: WorkflowFix, dry_run: bool = True) -> Dict[str, Any]:
         """Apply a workflow fix to the repository"""
         if dry_run:
@@ -420,6 +452,7 @@ No failed workflows found. All workflows are passing!
         # 2. Apply the diff
         # 3. Create a pull request
         # This is a simplified implementation
+        self._record_fix(fix, f"{fix.description} (applied to {fix.file_path})")
 
         return {
             "action": "applied",
@@ -649,6 +682,37 @@ async def rerun_failed_workflows(
     except Exception as e:
         return f"Failed to rerun workflows: {e}"
 
+@mcp.tool()
+async def failure_seen_before(log_line: str) -> str:
+    """
+    Look up a failure log line in the index of previously analysed workflow runs.
+
+    Args:
+        log_line: Failure line from a workflow log, or its fingerprint
+
+    Returns:
+        Where and how often the failure occurred before, with its known fix
+    """
+    index = FailureSignatureIndex(DEFAULT_FAILURE_INDEX)
+    try:
+        history = index.seen_before(log_line)
+    finally:
+        index.close()
+
+    if history is None:
+        return "Not seen before in any indexed workflow run."
+
+    output = f"## Seen in {history['runs']} workflow runs\n\n"
+    output += f"**Fingerprint:** {history['fingerprint']}\n"
+    output += f"**Sample:** `{history['sample']}`\n"
+    output += f"**Issue Type:** {history['issue_type'] or 'unclassified'}\n"
+    output += f"**First Seen:** {datetime.fromtimestamp(history['first_seen'], timezone.utc):%Y-%m-%d %H:%M UTC}\n"
+    output += f"**Last Seen:** {datetime.fromtimestamp(history['last_seen'], timezone.utc):%Y-%m-%d %H:%M UTC}\n"
+    output += f"**Recent Runs:** {', '.join(str(run_id) for run_id in history['recent_runs'])}\n"
+    if history['fix']:
+        output += f"**Known Fix:** {history['fix']}\n"
+    return output
+
 @mcp.resource("workflow://status/{repository}")
 async def workflow_status_resource(repository: str) -> str:
     """
@@ -5,10 +5,11 @@ Based on ngapy-dev patterns with enhanced error handling and monitoring
 """
 
 import os
+import re
 import sys
-import subprocess
 import platform
 import shutil
+import fnmatch
 import time
 import json
 import logging
@@ -16,9 +17,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import argparse
 import yaml
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 
+from openssl_tools.util.process_runner import run_process
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +30,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common OpenSSL build artifacts
+ARTIFACT_PATTERNS = [
+    "libssl.*",
+    "libcrypto.*",
+    "openssl",
+    "*.so*",
+    "*.dylib",
+    "*.dll",
+    "*.a"
+]
+
+# Configuration copied from the main Conan home into each campaign build's private home
+CONAN_HOME_CONFIG = [
+    "global.conf",
+    "remotes.json",
+    "settings.yml",
+    "settings_user.yml",
+    ".conan.db",
+    "profiles",
+    "extensions"
+]
+
 class BuildType(Enum):
     """Build type enumeration"""
     DEBUG = "Debug"
@@ -61,6 +87,17 @@ class BuildResult:
     artifacts: List[Path] = None
     metrics: Dict[str, Any] = None
 
+@dataclass
+class CampaignResult:
+    """Multi-profile build campaign result data class"""
+    success: bool
+    duration: float
+    cpu_budget: int
+    shared_dependencies: List[str] = field(default_factory=list)
+    shared_build_duration: float = 0.0
+    results: Dict[str, BuildResult] = field(default_factory=dict)
+    error: Optional[str] = None
+
 class ConanOrchestrator:
     """Advanced Conan orchestrator with CI/CD automation - pattern from ngapy-dev"""
     
@@ -71,6 +108,7 @@ class ConanOrchestrator:
         self.cache_dir = self.conan_dir / "cache"
         self.artifacts_dir = self.conan_dir / "artifacts"
         self.config_file = self.conan_dir / "ci-config.yml"
+        self.command_log = self.conan_dir / "logs" / "conan-commands.log"
         
         # Initialize directories
         self._initialize_directories()
@@ -209,37 +247,42 @@ tools.cmake.cmaketoolchain:jobs={self.config['build']['jobs']}
         return profile_path
     
     def _run_conan_command(self, command: List[str], cwd: Optional[Path] = None, 
-                          capture_output: bool = False) -> Tuple[bool, str, str]:
-        """Run Conan command with error handling"""
+                          capture_output: bool = False,
+                          log_file: Optional[Path] = None,
+                          conan_home: Optional[Path] = None) -> Tuple[bool, str, str]:
+        """Run Conan command with error handling (against conan_home instead of the default home if given)"""
         full_command = ["conan"] + command
+        env = {**os.environ, "CONAN_HOME": str(conan_home)} if conan_home else None
         
         logger.info(f"🔧 Running: {' '.join(full_command)}")
         
+        # Output is streamed to the console and the command log while the
+        # command runs; only the tail of stderr is kept unless capturing.
+        # Captured stdout (e.g. --format=json) goes to the command log only
         try:
-            if capture_output:
-                result = subprocess.run(
-                    full_command,
-                    cwd=cwd or self.project_root,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                return True, result.stdout, result.stderr
-            else:
-                result = subprocess.run(
-                    full_command,
-                    cwd=cwd or self.project_root,
-                    check=True
-                )
-                return True, "", ""
-                
-        except subprocess.CalledProcessError as e:
-            error_msg = f"Command failed with return code {e.returncode}"
-            if capture_output:
-                error_msg += f"\nSTDOUT: {e.stdout}\nSTDERR: {e.stderr}"
-            
-            logger.error(f"❌ {error_msg}")
-            return False, e.stdout if capture_output else "", e.stderr if capture_output else str(e)
+            result = run_process(
+                full_command,
+                cwd=cwd or self.project_root,
+                env=env,
+                echo_stdout=not capture_output,
+                log_file=log_file or self.command_log,
+                keep_stdout=capture_output
+            )
+        except OSError as e:
+            logger.error(f"❌ Command failed to start: {e}")
+            return False, "", str(e)
+        
+        stdout = "\n".join(result.stdout)
+        stderr = "\n".join(result.stderr_tail)
+        if result.returncode == 0:
+            return True, stdout, stderr if capture_output else ""
+        
+        error_msg = f"Command failed with return code {result.returncode}"
+        if result.error_report:
+            error_msg += f"\n{result.error_report}"
+        
+        logger.error(f"❌ {error_msg}")
+        return False, stdout, stderr
     
     def setup_conan_remote(self) -> bool:
         """Set up Conan remote - pattern from ngapy-dev artifactory_functions.py"""
@@ -313,16 +356,23 @@ tools.cmake.cmaketoolchain:jobs={self.config['build']['jobs']}
                 error=f"Profile not found: {profile_path}"
             )
         
-        # Build command
-        build_cmd = ["create", ".", "--profile", str(profile_path)]
+        # Build command; the dependency graph is printed as JSON on stdout,
+        # while the build log streams on stderr
+        build_cmd = ["create", ".", "--profile", str(profile_path), "--format=json"]
         
         if test:
             build_cmd.append("--test")
         
-        # Run build
-        success, stdout, stderr = self._run_conan_command(build_cmd, capture_output=True)
+        return self._run_build(profile_name, build_cmd, start_time)
+    
+    def _run_build(self, profile_name: str, build_cmd: List[str], start_time: float,
+                   log_file: Optional[Path] = None, conan_home: Optional[Path] = None) -> BuildResult:
+        """Run a --format=json build command and collect its metrics and artifacts"""
+        success, stdout, stderr = self._run_conan_command(build_cmd, capture_output=True, log_file=log_file,
+                                                          conan_home=conan_home)
         
         duration = time.time() - start_time
+        graph = self._parse_graph_json(stdout)
         
         # Collect build metrics
         metrics = {
@@ -331,11 +381,14 @@ tools.cmake.cmaketoolchain:jobs={self.config['build']['jobs']}
             "platform": self.current_platform.value,
             "timestamp": time.time()
         }
+        metrics.update(self._graph_metrics(graph))
         
         # Collect artifacts
         artifacts = []
         if success:
-            artifacts = self._collect_build_artifacts()
+            artifacts = self._collect_build_artifacts(self._package_folders(graph))
+            metrics["artifact_count"] = len(artifacts)
+            metrics["artifact_bytes"] = sum(artifact.stat().st_size for artifact in artifacts)
         
         result = BuildResult(
             success=success,
@@ -353,27 +406,274 @@ tools.cmake.cmaketoolchain:jobs={self.config['build']['jobs']}
         
         return result
     
-    def _collect_build_artifacts(self) -> List[Path]:
-        """Collect build artifacts"""
-        artifacts = []
+    def _graph_info(self, profile_name: str) -> Dict[str, Any]:
+        """Dependency graph of the project for a profile, without building anything"""
+        profile_path = self.profiles_dir / f"{profile_name}.profile"
+        success, stdout, _ = self._run_conan_command(
+            ["graph", "info", ".", "--profile", str(profile_path), "--format=json"],
+            capture_output=True
+        )
+        return self._parse_graph_json(stdout) if success else {}
+    
+    def _prepare_conan_home(self, conan_home: Path, main_home: Optional[Path],
+                            shared_archive: Optional[Path], log_file: Path) -> Tuple[bool, str]:
+        """Seed a private Conan home with the main home's configuration, the shared binaries and the recipe"""
+        conan_home.mkdir(parents=True, exist_ok=True)
+        if main_home:
+            for name in CONAN_HOME_CONFIG:
+                source = main_home / name
+                if source.is_dir():
+                    shutil.copytree(source, conan_home / name, dirs_exist_ok=True)
+                elif source.is_file():
+                    shutil.copy2(source, conan_home / name)
+        
+        if shared_archive:
+            success, _, stderr = self._run_conan_command(["cache", "restore", str(shared_archive)],
+                                                         log_file=log_file, conan_home=conan_home)
+            if not success:
+                return False, stderr or "Failed to restore shared dependencies"
+        success, _, stderr = self._run_conan_command(["export", "."], log_file=log_file, conan_home=conan_home)
+        return success, stderr
+    
+    def _save_shared_binaries(self, shared: List[Dict[str, Any]], profile_name: str, cpu_budget: int,
+                              campaign_dir: Path) -> Tuple[bool, Optional[Path], str]:
+        """
+        Install the shared dependencies once in the main cache, building the missing
+        ones with the whole CPU budget, and pack them with `conan cache save`
+        :return: Success, archive to restore into the per-profile homes, error
+        """
+        to_build = [node["ref"] for node in shared if node.get("binary") in ("Missing", "Build")]
+        if to_build:
+            logger.info(f"🔨 Building {len(to_build)} shared dependencies once")
+        command = ["install", "--profile", str(self.profiles_dir / f"{profile_name}.profile"),
+                   "--build=missing", "-c", f"tools.build:jobs={cpu_budget}", "--format=json"]
+        for node in shared:
+            command += ["--requires", node["ref"]]
+        success, stdout, stderr = self._run_conan_command(command, capture_output=True)
+        if not success:
+            return False, None, stderr or "Failed to build shared dependencies"
+        
+        campaign_dir.mkdir(parents=True, exist_ok=True)
+        graph_file = campaign_dir / "shared-graph.json"
+        graph_file.write_text(stdout)
+        success, stdout, stderr = self._run_conan_command(
+            ["list", "--graph", str(graph_file), "--graph-recipes=*", "--graph-binaries=*", "--format=json"],
+            capture_output=True
+        )
+        if not success:
+            return False, None, stderr or "Failed to list shared dependencies"
         
-        # Look for common OpenSSL artifacts
-        artifact_patterns = [
-            "libssl.*",
-            "libcrypto.*",
-            "openssl",
-            "*.so*",
-            "*.dylib",
-            "*.dll",
-            "*.a"
-        ]
+        package_list = campaign_dir / "shared-pkglist.json"
+        package_list.write_text(stdout)
+        archive = campaign_dir / "shared.tgz"
+        success, _, stderr = self._run_conan_command(
+            ["cache", "save", "--list", str(package_list), "--file", str(archive)]
+        )
+        return success, archive if success else None, stderr
+    
+    @staticmethod
+    def _shared_dependencies(graphs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Dependency nodes with the same reference and package id in every graph"""
+        def binaries(graph):
+            return {(node.get("ref"), node.get("package_id")): node
+                    for node_id, node in graph.items() if node_id != "0" and node.get("ref")}
+        
+        shared = binaries(graphs[0])
+        for graph in graphs[1:]:
+            keys = binaries(graph).keys()
+            shared = {key: node for key, node in shared.items() if key in keys}
+        return [shared[key] for key in sorted(shared)]
+    
+    def build_campaign(self, profile_names: List[str], cpu_budget: Optional[int] = None,
+                       max_parallel: Optional[int] = None) -> CampaignResult:
+        """
+        Build the package for several profiles
+        
+        The dependency graphs of all profiles are resolved first. Dependencies
+        whose binary is identical in every profile are built once, in the
+        main cache, with the whole CPU budget, and saved to an archive. The
+        per-profile packages are then built in parallel with an equal share
+        of the CPU budget, each in its own Conan home below
+        artifacts/campaign/<profile>/conan_home (restored from that archive,
+        so build folders and cache writes are isolated) with its own output
+        folder and log.
+        """
+        logger.info(f"🚀 Starting build campaign for {len(profile_names)} profile(s): {', '.join(profile_names)}")
+        start_time = time.time()
+        cpu_budget = max(1, cpu_budget or os.cpu_count() or 1)
+        campaign = CampaignResult(success=False, duration=0, cpu_budget=cpu_budget)
+        
+        missing = [name for name in profile_names if not (self.profiles_dir / f"{name}.profile").exists()]
+        if not profile_names or missing:
+            campaign.error = f"Profiles not found: {', '.join(missing)}" if missing else "No profiles given"
+            logger.error(f"❌ {campaign.error}")
+            return campaign
+        
+        # Resolve every profile's graph (read-only, so in parallel)
+        with ThreadPoolExecutor(max_workers=min(len(profile_names), cpu_budget)) as executor:
+            graphs = dict(zip(profile_names, executor.map(self._graph_info, profile_names)))
+        unresolved = [name for name, graph in graphs.items() if not graph]
+        if unresolved:
+            campaign.error = f"Could not resolve dependency graph for: {', '.join(unresolved)}"
+            logger.error(f"❌ {campaign.error}")
+            return campaign
+        
+        reference = (graphs[profile_names[0]]["0"].get("ref") or "").split("#")[0]
+        if not reference or reference == "conanfile":
+            campaign.error = "Recipe does not define a name and version"
+            logger.error(f"❌ {campaign.error}")
+            return campaign
+        
+        shared = self._shared_dependencies(list(graphs.values()))
+        campaign.shared_dependencies = [node["ref"] for node in shared]
+        logger.info(f"🔗 {len(shared)} dependencies shared by all profiles")
+        
+        # Build the shared binaries once, in the main cache
+        campaign_dir = self.artifacts_dir / "campaign"
+        shared_start = time.time()
+        shared_archive = None
+        if shared:
+            success, shared_archive, stderr = self._save_shared_binaries(
+                shared, profile_names[0], cpu_budget, campaign_dir)
+            if not success:
+                campaign.error = stderr or "Failed to prepare shared dependencies"
+                campaign.shared_build_duration = time.time() - shared_start
+                campaign.duration = time.time() - start_time
+                logger.error(f"❌ {campaign.error}")
+                return campaign
+        campaign.shared_build_duration = time.time() - shared_start
+        
+        success, stdout, _ = self._run_conan_command(["config", "home"], capture_output=True)
+        main_home = Path(stdout.strip().splitlines()[-1]) if success and stdout.strip() else None
+        
+        # Build the profile-specific packages in parallel within the CPU budget.
+        # Conan does not support concurrent writes to one cache, so every build
+        # runs in its own Conan home (and therefore its own build folders),
+        # seeded with the shared binaries
+        workers = max(1, min(len(profile_names), max_parallel or cpu_budget, cpu_budget))
+        jobs = max(1, cpu_budget // workers)
+        
+        def build_profile(profile_name: str) -> BuildResult:
+            logger.info(f"🔨 Building package with profile: {profile_name}")
+            start = time.time()
+            output_folder = campaign_dir / profile_name
+            output_folder.mkdir(parents=True, exist_ok=True)
+            log_file = output_folder / "conan-commands.log"
+            conan_home = output_folder / "conan_home"
+            ready, error = self._prepare_conan_home(conan_home, main_home, shared_archive, log_file)
+            if not ready:
+                logger.error(f"❌ Could not prepare Conan home for {profile_name}")
+                return BuildResult(success=False, duration=time.time() - start, output="",
+                                   error=error or "Failed to prepare Conan home", artifacts=[],
+                                   metrics={"profile": profile_name})
+            
+            build_cmd = ["install", "--requires", reference,
+                         "--profile", str(self.profiles_dir / f"{profile_name}.profile"),
+                         "--build=missing", "-c", f"tools.build:jobs={jobs}",
+                         "--output-folder", str(output_folder), "--format=json"]
+            result = self._run_build(profile_name, build_cmd, start, log_file=log_file, conan_home=conan_home)
+            shared_refs = set(campaign.shared_dependencies)
+            dependency_count = result.metrics.get("dependency_count", 0)
+            result.metrics["jobs"] = jobs
+            result.metrics["conan_home"] = str(conan_home)
+            result.metrics["shared_dependencies"] = len(shared_refs)
+            result.metrics["cache_reuse"] = (
+                result.metrics.get("packages_from_cache", 0) / dependency_count if dependency_count else 0
+            )
+            return result
         
-        for pattern in artifact_patterns:
-            for artifact in self.project_root.glob(f"**/{pattern}"):
-                if artifact.is_file():
-                    artifacts.append(artifact)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="campaign") as executor:
+            campaign.results = dict(zip(profile_names, executor.map(build_profile, profile_names)))
         
-        logger.info(f"📦 Collected {len(artifacts)} build artifacts")
+        campaign.duration = time.time() - start_time
+        campaign.success = all(result.success for result in campaign.results.values())
+        if campaign.success:
+            logger.info(f"✅ Campaign finished in {campaign.duration:.2f}s")
+        else:
+            failed = [name for name, result in campaign.results.items() if not result.success]
+            campaign.error = f"Builds failed for: {', '.join(failed)}"
+            logger.error(f"❌ {campaign.error}")
+        return campaign
+    
+    @staticmethod
+    def _parse_graph_json(output: str) -> Dict[str, Any]:
+        """Nodes of the graph printed by `conan create --format=json` (empty if unparsable)"""
+        try:
+            data = json.loads(output or "{}")
+        except ValueError:
+            logger.warning("⚠️ Could not parse Conan graph output")
+            return {}
+        nodes = data.get("graph", {}).get("nodes", {}) if isinstance(data, dict) else {}
+        return nodes if isinstance(nodes, dict) else {}
+    
+    @staticmethod
+    def _created_nodes(graph: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Graph nodes of the package being created, plus anything built from source"""
+        root = graph.get("0", {})
+        created_ids = {node_id for node_id, edge in root.get("dependencies", {}).items()
+                       if not isinstance(edge, dict) or edge.get("direct", True)}
+        return [node for node_id, node in graph.items()
+                if node_id != "0" and (node_id in created_ids or node.get("binary") == "Build")]
+    
+    def _graph_metrics(self, graph: Dict[str, Any]) -> Dict[str, Any]:
+        """Package identity and binary sources, from the same graph as the artifacts"""
+        if not graph:
+            return {}
+        binaries: Dict[str, int] = {}
+        for node_id, node in graph.items():
+            if node_id != "0":
+                status = node.get("binary") or "Unknown"
+                binaries[status] = binaries.get(status, 0) + 1
+        
+        metrics = {
+            "dependency_count": len(graph) - 1,
+            "binaries": binaries,
+            "packages_built": binaries.get("Build", 0),
+            "packages_from_cache": binaries.get("Cache", 0) + binaries.get("Download", 0)
+        }
+        created = self._created_nodes(graph)
+        if created:
+            package = created[0]
+            metrics["package"] = {
+                "ref": package.get("ref"),
+                "recipe_revision": package.get("rrev"),
+                "package_id": package.get("package_id"),
+                "package_revision": package.get("prev"),
+                "binary": package.get("binary")
+            }
+        return metrics
+    
+    def _package_folders(self, graph: Dict[str, Any]) -> List[Path]:
+        """Unique package folders of the created (and freshly built) packages"""
+        folders = []
+        for node in self._created_nodes(graph):
+            folder = node.get("package_folder")
+            if folder and Path(folder) not in folders:
+                folders.append(Path(folder))
+        return folders
+    
+    def _collect_build_artifacts(self, package_folders: Optional[List[Path]] = None) -> List[Path]:
+        """Collect build artifacts from the package folders in one walk, each file once"""
+        artifacts = []
+        
+        # Look for common OpenSSL artifacts
+        artifact_pattern = re.compile("|".join(fnmatch.translate(pattern) for pattern in ARTIFACT_PATTERNS))
+        
+        # Without structured Conan output, fall back to the project tree
+        roots = package_folders or [self.project_root]
+        seen = set()
+        for root in roots:
+            for directory, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if not artifact_pattern.match(filename):
+                        continue
+                    artifact = Path(directory) / filename
+                    key = os.path.realpath(artifact)
+                    if key not in seen and artifact.is_file():
+                        seen.add(key)
+                        artifacts.append(artifact)
+        
+        logger.info(f"📦 Collected {len(artifacts)} build artifacts from {len(roots)} folder(s)")
         return artifacts
     
     def run_tests(self, test_type: str = "unit") -> bool:
@@ -499,16 +799,58 @@ tools.cmake.cmaketoolchain:jobs={self.config['build']['jobs']}
         
         logger.info(f"📊 Build report generated: {report_path}")
         return report_path
+    
+    def generate_campaign_report(self, campaign: CampaignResult) -> Path:
+        """Generate build campaign report with per-profile duration and cache reuse"""
+        logger.info("📊 Generating campaign report...")
+        
+        report_data = {
+            "timestamp": time.time(),
+            "platform": self.current_platform.value,
+            "success": campaign.success,
+            "duration": campaign.duration,
+            "cpu_budget": campaign.cpu_budget,
+            "error": campaign.error,
+            "shared_dependencies": campaign.shared_dependencies,
+            "shared_build_duration": campaign.shared_build_duration,
+            "profiles": {}
+        }
+        
+        for profile_name, result in campaign.results.items():
+            metrics = result.metrics or {}
+            report_data["profiles"][profile_name] = {
+                "success": result.success,
+                "duration": result.duration,
+                "error": result.error,
+                "jobs": metrics.get("jobs"),
+                "packages_built": metrics.get("packages_built", 0),
+                "packages_from_cache": metrics.get("packages_from_cache", 0),
+                "cache_reuse": metrics.get("cache_reuse", 0),
+                "artifacts_count": len(result.artifacts) if result.artifacts else 0,
+                "metrics": metrics
+            }
+        
+        report_path = self.artifacts_dir / f"campaign_report_{int(time.time())}.json"
+        
+        with open(report_path, 'w') as f:
+            json.dump(report_data, f, indent=2)
+        
+        logger.info(f"📊 Campaign report generated: {report_path}")
+        return report_path
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Conan Orchestrator for OpenSSL CI/CD")
     parser.add_argument("--project-root", type=Path, default=Path.cwd(),
                        help="Project root directory")
-    parser.add_argument("--profile", "-p", required=True,
+    parser.add_argument("--profile", "-p",
                        help="Conan profile to use")
+    parser.add_argument("--profiles",
+                       help="Comma-separated profiles for the campaign action (default: platform profiles)")
+    parser.add_argument("--cpu-budget", type=int,
+                       help="Total CPU cores for the campaign action (default: CPU count)")
     parser.add_argument("--action", "-a", required=True,
-                       choices=["setup", "install", "build", "test", "upload", "clean"],
+                       choices=["setup", "install", "build", "campaign", "test", "upload", "clean"],
                        help="Action to perform")
     parser.add_argument("--test", "-t", action="store_true",
                        help="Run tests after build")
@@ -521,6 +863,9 @@ def main():
     
     args = parser.parse_args()
     
+    if args.action in ("install", "build") and not args.profile:
+        parser.error(f"--profile is required for the {args.action} action")
+    
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
@@ -543,6 +888,12 @@ def main():
             if args.test and success:
                 success = orchestrator.run_tests("unit")
                 
+        elif args.action == "campaign":
+            profiles = args.profiles.split(",") if args.profiles else orchestrator._get_available_profiles()
+            campaign = orchestrator.build_campaign(profiles, cpu_budget=args.cpu_budget)
+            orchestrator.generate_campaign_report(campaign)
+            success = campaign.success
+            
         elif args.action == "test":
             success = orchestrator.run_tests("unit")
             
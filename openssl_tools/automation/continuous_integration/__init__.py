@@ -7,15 +7,22 @@ testing, and validation for OpenSSL development workflows.
 Classes:
     ConanAutomation: Conan-specific CI/CD automation
     DeploymentManager: Deployment automation and management
+    HealthCheckEngine: Concurrent deployment health probing
     OpenSSLTestHarness: Testing framework and test execution
 """
 
-from .automation import ConanAutomation
-from .deployment import DeploymentManager
-from .testing import OpenSSLTestHarness
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "ConanAutomation",
     "DeploymentManager",
+    "HealthCheckEngine",
     "OpenSSLTestHarness",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConanAutomation": ".automation",
+    "DeploymentManager": ".deployment",
+    "HealthCheckEngine": ".health_probe",
+    "OpenSSLTestHarness": ".testing",
+})
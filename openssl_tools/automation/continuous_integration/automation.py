@@ -22,6 +22,8 @@ import yaml
 from conan import ConanFile
 from conan.tools.files import load, save
 
+from openssl_tools.util.process_runner import STDERR, run_process
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -135,28 +137,22 @@ class ConanAutomation:
         
         log.info(f"Executing: {' '.join(full_command)}")
         
+        def log_line(stream, line):
+            if not line.startswith('WARN'):
+                (log.error if stream == STDERR else log.info)(line)
+        
         try:
-            result = subprocess.run(
+            # Lines are logged as Conan prints them; only stdout is kept for parsing
+            result = run_process(
                 full_command,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=False
+                echo_stdout=False,
+                echo_stderr=False,
+                log_file=self.config.get('monitoring', {}).get('command_log'),
+                keep_stdout=True,
+                on_line=log_line
             )
-            
-            output_lines = result.stdout.splitlines() if result.stdout else []
-            error_lines = result.stderr.splitlines() if result.stderr else []
-            
-            # Log output
-            for line in output_lines:
-                if not line.startswith('WARN'):
-                    log.info(line)
-                    
-            for line in error_lines:
-                if not line.startswith('WARN'):
-                    log.error(line)
-                    
-            return result.returncode, output_lines
+            return result.returncode, result.stdout
             
         except Exception as e:
             log.error(f"Failed to execute Conan command: {e}")
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Concurrent Deployment Health Probing
+
+Runs every configured health check at the same time on one event loop,
+optionally probing each check several times, and aggregates the probe
+latencies into percentiles. Every probe is bounded by its check's timeout.
+HTTP probes - including Conan checks against a remote's REST API - share a
+pooled requests session, so repeated probes reuse their connections;
+command probes run as asyncio subprocesses that are killed on timeout.
+Conan REST probes authenticate with the check's token or the remote's
+CONAN_LOGIN_USERNAME_<REMOTE>/CONAN_PASSWORD_<REMOTE> credentials, and
+fall back to `conan list` when the remote still refuses them.
+"""
+
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_TIMEOUT = 30
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def conan_latest_url(remote_url: str, package_ref: str) -> str:
+    """Conan v2 REST endpoint answering with the latest recipe revision of package_ref"""
+    name_version, _, user_channel = package_ref.partition("@")
+    name, version = name_version.split("/", 1)
+    user, channel = user_channel.split("/", 1) if user_channel else ("_", "_")
+    return f"{remote_url.rstrip('/')}/v2/conans/{name}/{version}/{user}/{channel}/latest"
+
+
+def conan_remote_auth(remote: str, token: Optional[str] = None) -> Dict:
+    """
+    requests arguments authenticating against a Conan remote, like the Conan client does
+    :param token: Bearer token (takes precedence over username/password)
+    :return: {"headers": ...} or {"auth": (username, password)}; {} without credentials
+    """
+    if token:
+        return {"headers": {"Authorization": f"Bearer {token}"}}
+    suffix = remote.replace("-", "_").upper()
+    username = os.environ.get(f"CONAN_LOGIN_USERNAME_{suffix}") or os.environ.get("CONAN_LOGIN_USERNAME")
+    password = os.environ.get(f"CONAN_PASSWORD_{suffix}") or os.environ.get("CONAN_PASSWORD")
+    return {"auth": (username, password)} if username and password else {}
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one probe of a health check"""
+    success: bool
+    latency: float
+    error: Optional[str] = None
+
+
+@dataclass
+class CheckReport:
+    """Aggregated probes of one health check"""
+    name: str
+    type: str
+    probes: List[ProbeResult] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return bool(self.probes) and all(probe.success for probe in self.probes)
+
+    @property
+    def failures(self) -> int:
+        return sum(1 for probe in self.probes if not probe.success)
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        ordered = sorted(probe.latency for probe in self.probes)
+        return {f"p{pct}": _percentile(ordered, pct) for pct in PERCENTILES}
+
+    def to_dict(self) -> Dict:
+        errors = [probe.error for probe in self.probes if probe.error]
+        return {
+            "name": self.name,
+            "type": self.type,
+            "passed": self.passed,
+            "probes": len(self.probes),
+            "failures": self.failures,
+            "latency": self.latency_percentiles(),
+            "last_error": errors[-1] if errors else None
+        }
+
+
+class HealthCheckEngine:
+    """Run health checks concurrently with per-check timeouts and a pooled HTTP session"""
+
+    def __init__(self, session: Optional[requests.Session] = None, pool_size: int = 16,
+                 remote_urls: Optional[Dict[str, str]] = None):
+        """
+        :param session: HTTP session to probe with (default: a pooled session owned by the engine)
+        :param pool_size: Connections kept per host, and threads issuing HTTP requests
+        :param remote_urls: Conan remote name -> URL, for Conan checks that do not set their own url
+        """
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.remote_urls = remote_urls or {}
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="health-http")
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def run(self, checks: List[Dict], probes: int = 1) -> List[CheckReport]:
+        """
+        Run all checks concurrently
+        :param checks: Health check configurations (type, name and type-specific keys;
+            optional timeout, probes and interval between probes)
+        :param probes: Default number of probes per check
+        :return: One CheckReport per check, in configuration order
+        """
+        return list(await asyncio.gather(*(self._run_check(check, probes) for check in checks)))
+
+    def run_sync(self, checks: List[Dict], probes: int = 1) -> List[CheckReport]:
+        """Blocking wrapper around run()"""
+        return asyncio.run(self.run(checks, probes))
+
+    async def _run_check(self, check: Dict, default_probes: int) -> CheckReport:
+        report = CheckReport(check.get("name", "unnamed"), check.get("type", "unknown"))
+        timeout = check.get("timeout", DEFAULT_TIMEOUT)
+        for attempt in range(max(1, check.get("probes", default_probes))):
+            if attempt and check.get("interval"):
+                await asyncio.sleep(check["interval"])
+            report.probes.append(await self._probe(check, timeout))
+        return report
+
+    async def _probe(self, check: Dict, timeout: float) -> ProbeResult:
+        start = time.monotonic()
+        try:
+            error = await asyncio.wait_for(self._dispatch(check, timeout), timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {timeout}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return ProbeResult(error is None, time.monotonic() - start, error)
+
+    async def _dispatch(self, check: Dict, timeout: float) -> Optional[str]:
+        """Run one probe; returns None on success, otherwise the failure reason"""
+        check_type = check.get("type")
+        if check_type == "http":
+            return await self._http_probe(check["url"], check.get("expected_status", 200), timeout)
+        if check_type == "conan":
+            return await self._conan_probe(check, timeout)
+        if check_type == "command":
+            return await self._command_probe(check)
+        return f"unknown health check type: {check_type}"
+
+    async def _http_status(self, url: str, timeout: float, **kwargs) -> int:
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executor, lambda: self.session.get(url, timeout=timeout, **kwargs)
+        )
+        with response:
+            return response.status_code
+
+    async def _http_probe(self, url: str, expected_status: int, timeout: float) -> Optional[str]:
+        status = await self._http_status(url, timeout)
+        if status != expected_status:
+            return f"status {status}, expected {expected_status}"
+        return None
+
+    async def _conan_probe(self, check: Dict, timeout: float) -> Optional[str]:
+        package_ref = check.get("package_reference")
+        remote = check.get("remote", "conancenter")
+        remote_url = check.get("url") or self.remote_urls.get(remote)
+        if remote_url:
+            status = await self._http_status(conan_latest_url(remote_url, package_ref), timeout,
+                                             **conan_remote_auth(remote, check.get("token")))
+            if status == 200:
+                return None
+            if status not in (401, 403):
+                return f"{package_ref} not found (status {status}, expected 200)"
+            # Not authorized: the Conan client may hold credentials for the remote
+
+        # No remote URL to query directly (or no access to it): ask the Conan client
+        process = await asyncio.create_subprocess_exec(
+            "conan", "list", package_ref, "--remote", remote,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await self._communicate(process)
+        if process.returncode != 0:
+            return stderr.decode(errors="replace").strip() or f"exit code {process.returncode}"
+        return None if package_ref in stdout.decode(errors="replace") else f"{package_ref} not found"
+
+    async def _command_probe(self, check: Dict) -> Optional[str]:
+        command = check.get("command")
+        process = await asyncio.create_subprocess_exec(
+            *command.split(), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await self._communicate(process)
+        if process.returncode != 0:
+            return f"exit code {process.returncode}"
+        expected_output = check.get("expected_output")
+        if expected_output and expected_output not in stdout.decode(errors="replace"):
+            return f"output does not contain {expected_output!r}"
+        return None
+
+    @staticmethod
+    async def _communicate(process):
+        try:
+            return await process.communicate()
+        except asyncio.CancelledError:  # timed out
+            process.kill()
+            await process.wait()
+            raise
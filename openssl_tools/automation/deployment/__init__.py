@@ -6,22 +6,28 @@ including multi-registry uploads, package uploads, and environment setup.
 
 Classes:
     MultiRegistryUploader: Handles uploads to multiple registries
+    UploadPipeline: Concurrent (component x registry) uploads with retries
     PackageUploader: Manages package uploads
     CISetup: Sets up CI/CD environments
     PythonEnvSetup: Sets up Python environments
     GitHubPackagesSetup: Configures GitHub Packages
 """
 
-from .multi_registry import MultiRegistryUploader
-# from .package_upload import PackageUploader  # No class defined in this file
-from .ci_setup import CIEnvironmentSetup
-from .python_env_setup import ConanPythonEnvironmentSetup
-from .github_packages_setup import GitHubPackagesConanSetup
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "MultiRegistryUploader",
+    "UploadPipeline",
     # "PackageUploader",  # No class defined
     "CIEnvironmentSetup",
     "ConanPythonEnvironmentSetup",
     "GitHubPackagesConanSetup",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MultiRegistryUploader": ".multi_registry",
+    "UploadPipeline": ".upload_pipeline",
+    "CIEnvironmentSetup": ".ci_setup",
+    "ConanPythonEnvironmentSetup": ".python_env_setup",
+    "GitHubPackagesConanSetup": ".github_packages_setup",
+})
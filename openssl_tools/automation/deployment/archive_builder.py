@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Reproducible Package Archive Builder
+
+Builds zip or zstd-compressed tar archives of a package folder that are
+byte-for-byte identical for identical contents: entries are sorted by path,
+timestamps are fixed (SOURCE_DATE_EPOCH, or 1980-01-01), permissions are
+normalized to 0644/0755 and owners cleared. Zip members are deflated in
+parallel by a worker pool and written in order by a minimal zip writer;
+tar.zst archives use zstd's own worker threads. The archive is written in
+a single pass to a path or any writable stream (e.g. an upload), and its
+SHA-256 digest is computed while writing.
+"""
+
+import hashlib
+import io
+import os
+import stat
+import struct
+import tarfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # tar.zst archives unavailable
+    zstandard = None
+
+FORMATS = ("zip", "tar.zst")
+DEFAULT_EPOCH = 315532800  # 1980-01-01T00:00:00Z, the earliest zip timestamp
+CHUNK_SIZE = 1024 * 1024
+ZIP64_LIMIT = 0xFFFFFFFF  # sizes/offsets from here on need zip64 extra fields
+ZIP64_COUNT_LIMIT = 0xFFFF
+_ZIP64_MARKER = 0xFFFFFFFF
+ZIP_UTF8_FLAG = 0x0800
+
+
+@dataclass
+class ArchiveResult:
+    """A built archive and its release digest"""
+    path: Optional[Path]
+    format: str
+    sha256: str
+    size: int
+    entries: int
+
+
+class _DigestWriter(io.RawIOBase):
+    """Write-through stream that hashes and counts everything written"""
+
+    def __init__(self, target: BinaryIO):
+        self.target = target
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.target.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+def _source_epoch(mtime: Optional[int]) -> int:
+    if mtime is None:
+        mtime = int(os.environ.get("SOURCE_DATE_EPOCH", DEFAULT_EPOCH))
+    return max(mtime, DEFAULT_EPOCH)
+
+
+def collect_entries(root: Path) -> List[Tuple[str, Path, int]]:
+    """(archive name, path, normalized mode) of every file below root, sorted by name"""
+    entries = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in filenames:
+            path = Path(directory) / filename
+            if not path.is_file():
+                continue
+            executable = path.stat().st_mode & stat.S_IXUSR
+            entries.append((path.relative_to(root).as_posix(), path, 0o755 if executable else 0o644))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _deflate_file(path: Path, level: int) -> Tuple[int, int, List[bytes]]:
+    """Raw-deflate a file; returns (crc32, uncompressed size, compressed chunks)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = 0
+    size = 0
+    chunks = []
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            chunks.append(compressor.compress(block))
+    chunks.append(compressor.flush())
+    return crc, size, chunks
+
+
+def _bounded_map(executor, fn, items, window):
+    """executor.map that keeps at most `window` results in flight (bounds memory)"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _dos_datetime(epoch: int) -> Tuple[int, int]:
+    t = time.gmtime(epoch)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+def _write_zip(out: BinaryIO, entries, epoch: int, level: int, jobs: int) -> None:
+    dos_time, dos_date = _dos_datetime(epoch)
+    central = []
+    offset = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        compressed = _bounded_map(executor, lambda entry: _deflate_file(entry[1], level), entries, jobs * 2)
+        for (name, path, mode), (crc, size, chunks) in zip(entries, compressed):
+            name_bytes = name.encode("utf-8")
+            compressed_size = sum(len(chunk) for chunk in chunks)
+            method = 8  # deflated
+            if compressed_size >= size:  # incompressible: store as-is
+                method, compressed_size, chunks = 0, size, None
+
+            zip64 = size >= ZIP64_LIMIT or compressed_size >= ZIP64_LIMIT
+            extra = struct.pack("<HHQQ", 0x0001, 16, size, compressed_size) if zip64 else b""
+            version = 45 if zip64 else 20
+            out.write(struct.pack(
+                "<IHHHHHIIIHH", 0x04034B50, version, ZIP_UTF8_FLAG, method, dos_time, dos_date, crc,
+                _ZIP64_MARKER if zip64 else compressed_size, _ZIP64_MARKER if zip64 else size,
+                len(name_bytes), len(extra)
+            ))
+            out.write(name_bytes)
+            out.write(extra)
+            if chunks is None:
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        out.write(block)
+            else:
+                for chunk in chunks:
+                    out.write(chunk)
+
+            central.append((name_bytes, method, crc, size, compressed_size, mode, offset))
+            offset += 30 + len(name_bytes) + len(extra) + compressed_size
+
+    central_offset = offset
+    for name_bytes, method, crc, size, compressed_size, mode, local_offset in central:
+        zip64_fields = [value for value in (size, compressed_size, local_offset) if value >= ZIP64_LIMIT]
+        extra = struct.pack(f"<HH{len(zip64_fields)}Q", 0x0001, 8 * len(zip64_fields), *zip64_fields) \
+            if zip64_fields else b""
+        version = 45 if zip64_fields else 20
+        record = struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50, (3 << 8) | version, version, ZIP_UTF8_FLAG, method,
+            dos_time, dos_date, crc,
+            _ZIP64_MARKER if compressed_size >= ZIP64_LIMIT else compressed_size,
+            _ZIP64_MARKER if size >= ZIP64_LIMIT else size,
+            len(name_bytes), len(extra), 0, 0, 0,
+            (stat.S_IFREG | mode) << 16, _ZIP64_MARKER if local_offset >= ZIP64_LIMIT else local_offset
+        )
+        out.write(record + name_bytes + extra)
+        offset += len(record) + len(name_bytes) + len(extra)
+
+    count = len(central)
+    central_size = offset - central_offset
+    zip64_end = count >= ZIP64_COUNT_LIMIT or central_offset >= ZIP64_LIMIT or central_size >= ZIP64_LIMIT
+    if zip64_end:
+        out.write(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, (3 << 8) | 45, 45, 0, 0,
+                              count, count, central_size, central_offset))
+        out.write(struct.pack("<IIQI", 0x07064B50, 0, offset, 1))
+    out.write(struct.pack(
+        "<IHHHHIIH", 0x06054B50, 0, 0, 0xFFFF if zip64_end else count, 0xFFFF if zip64_end else count,
+        _ZIP64_MARKER if zip64_end else central_size, _ZIP64_MARKER if zip64_end else central_offset, 0
+    ))
+
+
+def _write_tar_zst(out: BinaryIO, entries, epoch: int, level: int, jobs: int) -> None:
+    if zstandard is None:
+        raise RuntimeError("tar.zst archives need the zstandard package: pip install zstandard")
+    # zstd's multi-threaded output does not depend on the number of workers
+    compressor = zstandard.ZstdCompressor(level=level, threads=jobs)
+    with compressor.stream_writer(out, closefd=False) as compressed:
+        with tarfile.open(fileobj=compressed, mode="w|", format=tarfile.GNU_FORMAT) as tar:
+            for name, path, mode in entries:
+                info = tarfile.TarInfo(name)
+                info.size = path.stat().st_size
+                info.mtime = epoch
+                info.mode = mode
+                info.uid = info.gid = 0
+                info.uname = info.gname = ""
+                with open(path, "rb") as f:
+                    tar.addfile(info, f)
+
+
+def build_archive(root: Union[str, Path], target: Union[str, Path, BinaryIO], fmt: str = "zip",
+                  jobs: Optional[int] = None, level: Optional[int] = None,
+                  mtime: Optional[int] = None) -> ArchiveResult:
+    """
+    Build a reproducible archive of root in one pass
+    :param root: Folder to archive
+    :param target: Output path, or a writable binary stream (e.g. an upload body)
+    :param fmt: "zip" or "tar.zst"
+    :param jobs: Compression workers (default: CPU count)
+    :param level: Compression level (default: 9 for zip, 19 for zstd)
+    :param mtime: Timestamp for all entries (default: SOURCE_DATE_EPOCH or 1980-01-01)
+    :return: ArchiveResult with the SHA-256 of the archive bytes
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported archive format {fmt!r}, expected one of {FORMATS}")
+    jobs = jobs or os.cpu_count() or 1
+    epoch = _source_epoch(mtime)
+    entries = collect_entries(Path(root))
+
+    path = None
+    if isinstance(target, (str, Path)):
+        path = Path(target)
+        stream = open(path, "wb")
+    else:
+        stream = target
+    try:
+        writer = _DigestWriter(stream)
+        if fmt == "zip":
+            _write_zip(writer, entries, epoch, 9 if level is None else level, jobs)
+        else:
+            _write_tar_zst(writer, entries, epoch, 19 if level is None else level, jobs)
+    finally:
+        if path is not None:
+            stream.close()
+
+    return ArchiveResult(path, fmt, writer.digest.hexdigest(), writer.size, len(entries))
@@ -8,18 +8,37 @@ import os
 import sys
 import subprocess
 import json
-import time
 from datetime import datetime
 from pathlib import Path
 
+from openssl_tools.automation.deployment.upload_pipeline import (
+    ConanRevisionIndex,
+    UploadPipeline,
+    conan_package_bytes,
+    upload_stats_entries,
+)
+
+# Concurrent uploads per registry
+REGISTRY_LIMITS = {"artifactory": 4, "github_packages": 2}
+
 class MultiRegistryUploader:
-    def __init__(self):
+    def __init__(self, registry_limits=None, retries=3, backoff=2.0):
         self.components = ["openssl-crypto", "openssl-ssl", "openssl-tools"]
         self.version = "3.2.0"
         self.upload_stats = {
             "started_at": datetime.now().isoformat(),
             "uploads": []
         }
+        self.revision_index = ConanRevisionIndex()
+        self.pipeline = UploadPipeline(
+            self._upload,
+            exists_fn=self._existing,
+            size_fn=self._package_bytes,
+            registry_limits=registry_limits or REGISTRY_LIMITS,
+            retries=retries,
+            backoff=backoff,
+            log=self.log
+        )
     
     def log(self, message, level="INFO"):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -69,49 +88,51 @@ class MultiRegistryUploader:
         self.log("📦 GitHub Packages setup (placeholder)")
         return True
     
-    def upload_component_to_artifactory(self, component):
-        """Upload single component to Artifactory"""
-        start_time = time.time()
-        
-        try:
-            result = self.run_command([
+    def _package_bytes(self, component):
+        """Local package size, for throughput stats"""
+        return conan_package_bytes(f"{component}/{self.version}")
+    
+    def _upload(self, component, registry):
+        """Upload one component to one registry; raises on failure"""
+        if registry == "artifactory":
+            self.run_command([
                 "conan", "upload", f"{component}/{self.version}",
                 "-r=artifactory", "--confirm"
             ])
-            
-            duration = time.time() - start_time
-            self.upload_stats["uploads"].append({
-                "component": component,
-                "registry": "artifactory",
-                "status": "success",
-                "duration": duration,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            self.log(f"✅ {component} uploaded to Artifactory ({duration:.1f}s)")
-            return True
-            
-        except subprocess.CalledProcessError:
-            self.upload_stats["uploads"].append({
-                "component": component,
-                "registry": "artifactory", 
-                "status": "failed",
-                "timestamp": datetime.now().isoformat()
-            })
-            self.log(f"❌ {component} upload to Artifactory failed", "ERROR")
-            return False
+            return
+        
+        self.log(f"📦 {component} → GitHub Packages (placeholder)")
+    
+    def _existing(self, registry, components):
+        """Components whose recipe revision the registry already holds (one query)"""
+        if registry != "artifactory":
+            return set()
+        references = {f"{component}/{self.version}": component for component in components}
+        present = self.revision_index.present(registry, list(references))
+        return {references[reference] for reference in present}
+    
+    def _record(self, results):
+        """Log results and append them to upload_stats"""
+        for result in results:
+            if result.registry == "github_packages" and result.status == "success":
+                result.status = "placeholder"
+            if result.status == "success":
+                throughput = ""
+                if result.throughput_bytes_per_s:
+                    throughput = f", {result.throughput_bytes_per_s / 1024 / 1024:.1f} MiB/s"
+                self.log(f"✅ {result.component} uploaded to {result.registry} ({result.duration:.1f}s{throughput})")
+            elif result.status == "failed":
+                self.log(f"❌ {result.component} upload to {result.registry} failed: {result.error}", "ERROR")
+        self.upload_stats["uploads"].extend(upload_stats_entries(results))
+        return all(result.status != "failed" for result in results)
+    
+    def upload_component_to_artifactory(self, component):
+        """Upload single component to Artifactory"""
+        return self._record(self.pipeline.run([component], ["artifactory"]))
     
     def upload_component_to_github(self, component):
         """Upload single component to GitHub Packages"""
-        self.log(f"📦 {component} → GitHub Packages (placeholder)")
-        
-        self.upload_stats["uploads"].append({
-            "component": component,
-            "registry": "github_packages",
-            "status": "placeholder",
-            "timestamp": datetime.now().isoformat()
-        })
-        return True
+        return self._record(self.pipeline.run([component], ["github_packages"]))
     
     def upload_all_components(self):
         """Upload all components to all configured registries"""
@@ -124,19 +145,18 @@ class MultiRegistryUploader:
             self.log("No registries available for upload", "ERROR")
             return False
         
-        success_count = 0
-        total_uploads = 0
-        
-        for component in self.components:
-            if artifactory_available:
-                total_uploads += 1
-                if self.upload_component_to_artifactory(component):
-                    success_count += 1
-            
-            if github_available:
-                total_uploads += 1
-                if self.upload_component_to_github(component):
-                    success_count += 1
+        registries = []
+        if artifactory_available:
+            registries.append("artifactory")
+        if github_available:
+            registries.append("github_packages")
+        
+        # All (component x registry) uploads run concurrently, limited per registry
+        results = self.pipeline.run(self.components, registries)
+        self._record(results)
+        
+        total_uploads = len(results)
+        success_count = sum(1 for result in results if result.status != "failed")
         
         success_rate = (success_count / total_uploads * 100) if total_uploads > 0 else 0
         self.log(f"📊 Upload Summary: {success_count}/{total_uploads} successful ({success_rate:.1f}%)")
@@ -9,12 +9,13 @@ import argparse
 import subprocess
 import sys
 import tempfile
-import zipfile
 from pathlib import Path
 import json
 import requests
 from datetime import datetime
 
+from openssl_tools.automation.deployment.archive_builder import FORMATS, build_archive
+
 def get_package_info():
     """Get package information from Conan cache"""
     try:
@@ -54,29 +55,27 @@ def get_package_info():
         print(f"❌ Failed to get package info: {e}")
         return None
 
-def create_package_archive(package_info, output_dir):
-    """Create a zip archive of the Conan package"""
+def create_package_archive(package_info, output_dir, archive_format="zip", jobs=None):
+    """
+    Create a reproducible archive of the Conan package
+    
+    Identical package contents always give a byte-identical archive, so the
+    returned SHA-256 digest identifies the release asset.
+    """
     try:
-        # Get package folder path
         package_folder = Path(package_info["package_folder"])
+        archive_path = output_dir / f"openssl-tools-{package_info['version']}.{archive_format}"
         
-        # Create zip file
-        zip_path = output_dir / f"openssl-tools-{package_info['version']}.zip"
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in package_folder.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(package_folder)
-                    zipf.write(file_path, arcname)
+        archive = build_archive(package_folder, archive_path, archive_format, jobs=jobs)
         
-        print(f"✅ Created package archive: {zip_path}")
-        return zip_path
+        print(f"✅ Created package archive: {archive_path} ({archive.entries} files, sha256 {archive.sha256})")
+        return archive
         
     except Exception as e:
         print(f"❌ Failed to create package archive: {e}")
         return None
 
-def create_github_release(owner, repo, version, token, zip_path):
+def create_github_release(owner, repo, version, token, zip_path, sha256=None):
     """Create a GitHub release with the package as an asset"""
     try:
         # GitHub API URL
@@ -96,6 +95,7 @@ def create_github_release(owner, repo, version, token, zip_path):
                    f"- Review and release management tools\n"
                    f"- Statistics and analysis tools\n"
                    f"- GitHub integration tools\n\n"
+                   + (f"SHA-256 ({zip_path.name}): `{sha256}`\n\n" if sha256 else "") +
                    f"Generated on: {datetime.now().isoformat()}",
             "draft": False,
             "prerelease": version.endswith(('dev', 'alpha', 'beta', 'rc'))
@@ -118,19 +118,18 @@ def create_github_release(owner, repo, version, token, zip_path):
             # Upload package as asset
             upload_url = release_info['upload_url'].replace('{?name,label}', '')
             
-            with open(zip_path, 'rb') as f:
-                asset_data = f.read()
-            
             asset_headers = {
                 "Authorization": f"token {token}",
-                "Content-Type": "application/zip"
+                "Content-Type": "application/zip" if zip_path.suffix == ".zip" else "application/zstd"
             }
             
-            asset_response = requests.post(
-                f"{upload_url}?name={zip_path.name}",
-                data=asset_data,
-                headers=asset_headers
-            )
+            # Streamed from disk; GitHub needs the Content-Length up front
+            with open(zip_path, 'rb') as f:
+                asset_response = requests.post(
+                    f"{upload_url}?name={zip_path.name}",
+                    data=f,
+                    headers=asset_headers
+                )
             
             if asset_response.status_code == 201:
                 print(f"✅ Uploaded package asset: {zip_path.name}")
@@ -153,6 +152,8 @@ def main():
     parser.add_argument("--github-repo", required=True, help="GitHub repository name")
     parser.add_argument("--github-token", help="GitHub Personal Access Token")
     parser.add_argument("--version", help="Package version (auto-detected if not provided)")
+    parser.add_argument("--format", choices=FORMATS, default="zip", help="Archive format")
+    parser.add_argument("--jobs", type=int, help="Compression workers (default: CPU count)")
     
     args = parser.parse_args()
     
@@ -180,8 +181,8 @@ def main():
         temp_path = Path(temp_dir)
         
         # Create package archive
-        zip_path = create_package_archive(package_info, temp_path)
-        if not zip_path:
+        archive = create_package_archive(package_info, temp_path, args.format, args.jobs)
+        if not archive:
             return 1
         
         # Create GitHub release
@@ -190,7 +191,8 @@ def main():
             args.github_repo, 
             version, 
             args.github_token, 
-            zip_path
+            archive.path,
+            archive.sha256
         )
         
         if success:
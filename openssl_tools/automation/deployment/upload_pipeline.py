@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Concurrent Multi-Registry Upload Pipeline
+
+Fans (reference x registry) uploads out over one worker pool per registry,
+so every registry gets its own concurrency limit and a slow registry never
+holds up the others. Failed uploads are retried with exponential backoff.
+Before uploading, each registry is asked once - in a single batched query -
+which references it already holds with every local recipe and package
+revision; those are skipped. Every upload records its duration, size and throughput.
+
+The first upload of each reference runs alone: `conan upload` compresses the
+package archives into the shared local cache when they are missing, and
+concurrent uploads of the same reference would race on those files. Once one
+upload has succeeded the archives exist, and the other registries fan out.
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+# upload_fn(reference, registry); raises on failure
+UploadFn = Callable[[str, str], None]
+# size_fn(reference) -> bytes an upload of reference transfers (None if unknown)
+SizeFn = Callable[[str], Optional[int]]
+# exists_fn(registry, references) -> references already present on the registry
+ExistsFn = Callable[[str, List[str]], Set[str]]
+
+
+@dataclass
+class UploadResult:
+    """Outcome of one (reference, registry) upload"""
+    component: str
+    registry: str
+    status: str  # success, skipped or failed
+    attempts: int = 0
+    duration: float = 0.0
+    bytes: Optional[int] = None
+    throughput_bytes_per_s: Optional[float] = None
+    error: Optional[str] = None
+    timestamp: str = ""
+
+
+class UploadPipeline:
+    """Upload references to registries concurrently, with per-registry limits"""
+
+    def __init__(self, upload_fn: UploadFn, exists_fn: Optional[ExistsFn] = None,
+                 size_fn: Optional[SizeFn] = None, registry_limits: Optional[Dict[str, int]] = None,
+                 default_limit: int = 2, retries: int = 3, backoff: float = 1.0, max_backoff: float = 30.0,
+                 log: Callable[..., None] = print, sleep: Callable[[float], None] = time.sleep):
+        """
+        :param upload_fn: Uploads one reference to one registry
+        :param exists_fn: Batched existence query, called once per registry
+        :param size_fn: Upload size of a reference, for throughput statistics
+        :param registry_limits: Maximum concurrent uploads per registry
+        :param default_limit: Limit for registries not in registry_limits
+        :param retries: Attempts per upload
+        :param backoff: Delay before the first retry, doubled on every further retry
+        :param max_backoff: Upper bound for the retry delay
+        :param log: Logger taking (message, level="INFO")
+        :param sleep: Sleep function (replaceable in tests)
+        """
+        self.upload_fn = upload_fn
+        self.exists_fn = exists_fn
+        self.size_fn = size_fn
+        self._sizes: Dict[str, Optional[int]] = {}
+        self._sizes_lock = threading.Lock()
+        # Per reference: held by its first upload until one succeeds
+        self._first_upload: Dict[str, threading.Lock] = {}
+        self._uploaded: Set[str] = set()
+        self.registry_limits = registry_limits or {}
+        self.default_limit = default_limit
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.log = log
+        self.sleep = sleep
+
+    def _existing(self, registry: str, references: List[str]) -> Set[str]:
+        if self.exists_fn is None:
+            return set()
+        try:
+            return set(self.exists_fn(registry, references))
+        except Exception as e:
+            self.log(f"Existence query on {registry} failed ({e}), uploading everything", "WARN")
+            return set()
+
+    def _size(self, reference: str) -> Optional[int]:
+        if self.size_fn is None:
+            return None
+        with self._sizes_lock:
+            if reference not in self._sizes:
+                try:
+                    self._sizes[reference] = self.size_fn(reference)
+                except Exception:
+                    self._sizes[reference] = None
+            return self._sizes[reference]
+
+    def _upload(self, reference: str, registry: str) -> UploadResult:
+        with self._sizes_lock:
+            lock = self._first_upload.setdefault(reference, threading.Lock())
+        with lock:
+            if reference not in self._uploaded:
+                result = self._attempt(reference, registry)
+                if result.status == "success":
+                    self._uploaded.add(reference)
+                return result
+        return self._attempt(reference, registry)
+
+    def _attempt(self, reference: str, registry: str) -> UploadResult:
+        size = self._size(reference)
+        start = time.monotonic()
+        error = None
+        for attempt in range(1, self.retries + 1):
+            try:
+                self.upload_fn(reference, registry)
+                duration = time.monotonic() - start
+                result = UploadResult(reference, registry, "success", attempt, duration, size,
+                                      timestamp=datetime.now().isoformat())
+                if size is not None and duration > 0:
+                    result.throughput_bytes_per_s = size / duration
+                return result
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if attempt < self.retries:
+                    delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+                    self.log(f"{reference} → {registry} failed (attempt {attempt}/{self.retries}), "
+                             f"retrying in {delay:.1f}s: {error}", "WARN")
+                    self.sleep(delay)
+        return UploadResult(reference, registry, "failed", self.retries, time.monotonic() - start,
+                            error=error, timestamp=datetime.now().isoformat())
+
+    def run(self, references: Iterable[str], registries: Iterable[str]) -> List[UploadResult]:
+        """
+        Upload every reference to every registry
+        :return: One UploadResult per (reference, registry), in reference then registry order
+        """
+        references = list(references)
+        registries = list(registries)
+        if not references or not registries:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(registries)) as executor:
+            existing = dict(zip(registries, executor.map(
+                lambda registry: self._existing(registry, references), registries)))
+
+        pools = {
+            registry: ThreadPoolExecutor(max_workers=max(1, self.registry_limits.get(registry, self.default_limit)),
+                                         thread_name_prefix=f"upload-{registry}")
+            for registry in registries
+        }
+        try:
+            futures = {}
+            for reference in references:
+                for registry in registries:
+                    if reference in existing[registry]:
+                        continue
+                    futures[(reference, registry)] = pools[registry].submit(self._upload, reference, registry)
+
+            results = []
+            for reference in references:
+                for registry in registries:
+                    future = futures.get((reference, registry))
+                    if future is None:
+                        self.log(f"⏭️ {reference} already on {registry}, skipping")
+                        results.append(UploadResult(reference, registry, "skipped",
+                                                    timestamp=datetime.now().isoformat()))
+                    else:
+                        results.append(future.result())
+            return results
+        finally:
+            for pool in pools.values():
+                pool.shutdown()
+
+
+def upload_stats_entries(results: List[UploadResult]) -> List[Dict]:
+    """UploadResults as upload_stats["uploads"] entries"""
+    return [{key: value for key, value in asdict(result).items() if value is not None}
+            for result in results]
+
+
+def _list_pattern(references: List[str]) -> str:
+    """One `conan list` pattern covering all references and their package revisions (filtered afterwards)"""
+    prefix = os.path.commonprefix(references)
+    if len(references) == 1:
+        return f"{prefix}#*:*#*"
+    return f"{prefix}*#*:*#*" if "/" in prefix else f"{prefix}*/*#*:*#*"
+
+
+def conan_package_revisions(references: List[str], remote: Optional[str] = None) -> Dict[str, Set[str]]:
+    """
+    Recipe and package revisions of references, from one `conan list` call
+    :param references: name/version[@user/channel] references
+    :param remote: Remote to query; the local cache when None
+    :return: Reference -> set of "rrev" and "rrev:package_id#prev" entries (references not found are absent)
+    """
+    command = ["conan", "list", _list_pattern(references), "--format=json"]
+    if remote:
+        command += ["-r", remote]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    data = json.loads(result.stdout or "{}")
+
+    wanted = set(references)
+    revisions: Dict[str, Set[str]] = {}
+    for listing in data.values():
+        if not isinstance(listing, dict):
+            continue
+        for reference, info in listing.items():
+            if reference not in wanted or not isinstance(info, dict):
+                continue
+            entries = revisions.setdefault(reference, set())
+            for rrev, recipe in info.get("revisions", {}).items():
+                entries.add(rrev)
+                for package_id, package in (recipe or {}).get("packages", {}).items():
+                    entries.update(f"{rrev}:{package_id}#{prev}"
+                                   for prev in (package or {}).get("revisions", {}))
+    return revisions
+
+
+class ConanRevisionIndex:
+    """Batched check of which local recipe and package revisions a remote already holds"""
+
+    def __init__(self):
+        self._local: Optional[Dict[str, Set[str]]] = None
+        self._lock = threading.Lock()
+
+    def _local_revisions(self, references: List[str]) -> Dict[str, Set[str]]:
+        with self._lock:
+            if self._local is None:
+                self._local = conan_package_revisions(references)
+            return self._local
+
+    def present(self, remote: str, references: List[str]) -> Set[str]:
+        """
+        References whose local recipe revisions and every local package revision
+        (rrev:package_id#prev) already exist on remote; new binaries of an
+        existing recipe revision still need an upload
+        """
+        local = self._local_revisions(references)
+        remote_revisions = conan_package_revisions(references, remote)
+        return {
+            reference for reference in references
+            if local.get(reference) and local[reference] <= remote_revisions.get(reference, set())
+        }
+
+
+def conan_package_bytes(reference: str) -> Optional[int]:
+    """Size of a reference's recipe and binary package folders in the local Conan cache"""
+    def folder_size(path: str) -> int:
+        return sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, files in os.walk(path) for name in files)
+
+    try:
+        total = folder_size(subprocess.run(["conan", "cache", "path", reference],
+                                           capture_output=True, text=True, check=True).stdout.strip())
+        listing = subprocess.run(["conan", "list", f"{reference}:*", "--format=json"],
+                                 capture_output=True, text=True, check=True)
+        for info in json.loads(listing.stdout or "{}").get("Local Cache", {}).get(reference, {}) \
+                .get("revisions", {}).values():
+            for package_id in info.get("packages", {}):
+                total += folder_size(subprocess.run(["conan", "cache", "path", f"{reference}:{package_id}"],
+                                                    capture_output=True, text=True, check=True).stdout.strip())
+        return total
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
@@ -9,19 +9,26 @@ Classes:
     WorkflowMonitor: Workflow monitoring and status tracking
     WorkflowRecovery: Automated workflow recovery and retry logic
     WorkflowHealthChecker: Workflow health analysis and recommendations
+    WorkflowRunStore: Local time series of workflow runs with daily rollups
     UnifiedWorkflowManager: Unified interface combining legacy tools with MCP capabilities
 """
 
-from .manager import WorkflowManager
-from .monitor import WorkflowMonitor
-from .recovery import WorkflowRecovery
-from .health_check import WorkflowHealthChecker
-from .unified import UnifiedWorkflowManager
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "WorkflowManager",
     "WorkflowMonitor", 
     "WorkflowRecovery",
     "WorkflowHealthChecker",
+    "WorkflowRunStore",
     "UnifiedWorkflowManager",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "WorkflowManager": ".manager",
+    "WorkflowMonitor": ".monitor",
+    "WorkflowRecovery": ".recovery",
+    "WorkflowHealthChecker": ".health_check",
+    "WorkflowRunStore": ".run_store",
+    "UnifiedWorkflowManager": ".unified",
+})
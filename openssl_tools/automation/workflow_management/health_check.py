@@ -9,13 +9,19 @@ import sys
 import json
 import time
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import yaml
 
+from openssl_tools.automation.workflow_management.run_store import WorkflowRunStore
+
+# Local run history, one database per repository
+RUN_STORE_DIR = Path(os.getenv('WORKFLOW_RUN_STORE_DIR', Path.home() / '.cache' / 'openssl-tools' / 'workflow-runs'))
+RUNS_PER_PAGE = 100
+
 class WorkflowHealthChecker:
-    def __init__(self, repo_owner: str, repo_name: str, token: str = None):
+    def __init__(self, repo_owner: str, repo_name: str, token: str = None, store: WorkflowRunStore = None):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.token = token or os.getenv('GITHUB_TOKEN')
@@ -25,108 +31,111 @@ class WorkflowHealthChecker:
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'OpenSSL-Tools-Health-Checker'
         }
+        self.store = store or WorkflowRunStore(RUN_STORE_DIR / f"{repo_owner}_{repo_name}.db")
     
-    def get_workflow_runs(self, workflow_id: str = None, limit: int = 100) -> List[Dict]:
-        """Get recent workflow runs"""
-        url = f"{self.base_url}/actions/runs"
-        params = {'per_page': limit}
-        
+    def _fetch(self, url: str, params: Dict = None) -> Dict:
+        """GET a GitHub API resource; raises requests.RequestException on failure"""
+        response = requests.get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
+    
+    def _fetch_workflow_runs(self, workflow_id: str = None, limit: int = 100, page: int = 1) -> List[Dict]:
+        params = {'per_page': limit, 'page': page}
         if workflow_id:
             params['workflow_id'] = workflow_id
-            
+        return self._fetch(f"{self.base_url}/actions/runs", params).get('workflow_runs', [])
+    
+    def _fetch_workflow_jobs(self, run_id: int) -> List[Dict]:
+        return self._fetch(f"{self.base_url}/actions/runs/{run_id}/jobs").get('jobs', [])
+    
+    def get_workflow_runs(self, workflow_id: str = None, limit: int = 100, page: int = 1) -> List[Dict]:
+        """Get recent workflow runs, newest first"""
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get('workflow_runs', [])
+            return self._fetch_workflow_runs(workflow_id, limit, page)
         except requests.RequestException as e:
             print(f"Error fetching workflow runs: {e}")
             return []
     
+    def get_workflow_run(self, run_id: int) -> Optional[Dict]:
+        """Get a single workflow run"""
+        try:
+            return self._fetch(f"{self.base_url}/actions/runs/{run_id}")
+        except requests.RequestException as e:
+            print(f"Error fetching workflow run {run_id}: {e}")
+            return None
+    
     def get_workflow_jobs(self, run_id: int) -> List[Dict]:
         """Get jobs for a specific workflow run"""
-        url = f"{self.base_url}/actions/runs/{run_id}/jobs"
-        
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json().get('jobs', [])
+            return self._fetch_workflow_jobs(run_id)
         except requests.RequestException as e:
             print(f"Error fetching jobs for run {run_id}: {e}")
             return []
     
-    def analyze_workflow_health(self, days_back: int = 30) -> Dict:
-        """Analyze overall workflow health"""
-        cutoff_date = datetime.now() - timedelta(days=days_back)
-        
-        # Get all workflow runs
-        runs = self.get_workflow_runs(limit=200)
-        recent_runs = []
-        for run in runs:
-            run_time = datetime.fromisoformat(run['created_at'].replace('Z', '+00:00'))
-            cutoff_time_aware = cutoff_date.replace(tzinfo=run_time.tzinfo)
-            if run_time > cutoff_time_aware:
-                recent_runs.append(run)
-        
-        health_metrics = {
-            'total_runs': len(recent_runs),
-            'successful_runs': 0,
-            'failed_runs': 0,
-            'cancelled_runs': 0,
-            'in_progress_runs': 0,
-            'success_rate': 0.0,
-            'average_duration': 0.0,
-            'failure_patterns': {},
-            'performance_issues': [],
-            'recommendations': []
-        }
-        
-        total_duration = 0
-        completed_runs = 0
+    def sync_runs(self, days_back: int = 30) -> int:
+        """
+        Fetch the runs not yet in the local store and the jobs of failed runs.
+        
+        The listing is recorded only once pagination finished cleanly: a partial
+        listing would advance the last seen run ID past runs not fetched yet.
+        """
+        cutoff = time.time() - days_back * 86400
+        last_run_id = self.store.last_run_id()
+        synced_since = self.store.synced_since()
+        # Runs below the last seen ID are only needed to extend the window further back
+        backfill = synced_since is None or cutoff < synced_since
+        
+        fetched = []
+        page = 1
+        try:
+            while True:
+                runs = self._fetch_workflow_runs(limit=RUNS_PER_PAGE, page=page)
+                done = len(runs) < RUNS_PER_PAGE
+                for run in runs:
+                    created_at = datetime.fromisoformat(run['created_at'].replace('Z', '+00:00')).timestamp()
+                    if created_at < cutoff or (run['id'] <= last_run_id and not backfill):
+                        done = True
+                        break
+                    fetched.append(run)
+                if done:
+                    break
+                page += 1
+        except requests.RequestException as e:
+            print(f"Error fetching workflow runs, keeping the previous sync state: {e}")
+            return 0
+        
+        # Runs still queued or in progress at the last sync
+        known = {run['id'] for run in fetched}
+        for run_id in self.store.pending_run_ids():
+            if run_id not in known:
+                run = self.get_workflow_run(run_id)
+                if run:
+                    fetched.append(run)
+        
+        self.store.record_runs(fetched)
+        self.store.mark_synced(cutoff)
+        
+        # Jobs of failed runs; a run whose jobs could not be fetched is retried next sync
+        for run_id in self.store.failed_runs_without_jobs(cutoff):
+            try:
+                self.store.record_jobs(run_id, self._fetch_workflow_jobs(run_id))
+            except requests.RequestException as e:
+                print(f"Error fetching jobs for run {run_id}: {e}")
+        return len(fetched)
+    
+    def analyze_workflow_health(self, days_back: int = 30, sync: bool = True) -> Dict:
+        """Analyze overall workflow health from the local run store"""
+        if sync:
+            self.sync_runs(days_back)
         
-        for run in recent_runs:
-            status = run['status']
-            conclusion = run.get('conclusion')
-            
-            if status == 'completed':
-                completed_runs += 1
-                if conclusion == 'success':
-                    health_metrics['successful_runs'] += 1
-                elif conclusion == 'failure':
-                    health_metrics['failed_runs'] += 1
-                    self._analyze_failure_pattern(run, health_metrics)
-                elif conclusion == 'cancelled':
-                    health_metrics['cancelled_runs'] += 1
-                
-                # Calculate duration
-                if run.get('run_started_at') and run.get('updated_at'):
-                    start = datetime.fromisoformat(run['run_started_at'].replace('Z', '+00:00'))
-                    end = datetime.fromisoformat(run['updated_at'].replace('Z', '+00:00'))
-                    duration = (end - start).total_seconds()
-                    total_duration += duration
-            elif status in ['queued', 'in_progress']:
-                health_metrics['in_progress_runs'] += 1
-        
-        # Calculate metrics
-        if completed_runs > 0:
-            health_metrics['success_rate'] = (health_metrics['successful_runs'] / completed_runs) * 100
-            health_metrics['average_duration'] = total_duration / completed_runs
+        health_metrics = self.store.health_metrics(time.time() - days_back * 86400)
+        health_metrics['performance_issues'] = []
         
         # Generate recommendations
         health_metrics['recommendations'] = self._generate_recommendations(health_metrics)
         
         return health_metrics
     
-    def _analyze_failure_pattern(self, run: Dict, health_metrics: Dict):
-        """Analyze failure patterns in a workflow run"""
-        jobs = self.get_workflow_jobs(run['id'])
-        
-        for job in jobs:
-            if job['conclusion'] == 'failure':
-                job_name = job['name']
-                if job_name not in health_metrics['failure_patterns']:
-                    health_metrics['failure_patterns'][job_name] = 0
-                health_metrics['failure_patterns'][job_name] += 1
-    
     def _generate_recommendations(self, metrics: Dict) -> List[str]:
         """Generate recommendations based on health metrics"""
         recommendations = []
@@ -241,11 +250,23 @@ Period: Last {days_back} days
 - **In Progress**: {health_metrics['in_progress_runs']}
 - **Success Rate**: {health_metrics['success_rate']:.1f}%
 - **Average Duration**: {health_metrics['average_duration']/60:.1f} minutes
+- **Duration p50 / p95**: {health_metrics['p50_duration']/60:.1f} / {health_metrics['p95_duration']/60:.1f} minutes
+- **Average Queue Time**: {health_metrics['average_queue_time']:.0f} seconds
 
-## 🔍 Failure Patterns
+## 📈 Workflows
 
 """
         
+        if health_metrics['workflows']:
+            report += "| Workflow | Runs | Success Rate | p50 | p95 |\n|---|---|---|---|---|\n"
+            for name, workflow in sorted(health_metrics['workflows'].items()):
+                report += (f"| {name} | {workflow['runs']} | {workflow['success_rate']:.1f}% "
+                           f"| {workflow['p50_duration']/60:.1f} min | {workflow['p95_duration']/60:.1f} min |\n")
+        else:
+            report += "No workflow runs recorded.\n"
+        
+        report += "\n## 🔍 Failure Patterns\n\n"
+        
         if health_metrics['failure_patterns']:
             for job_name, count in sorted(health_metrics['failure_patterns'].items(), 
                                         key=lambda x: x[1], reverse=True):
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Workflow run time-series store.
+
+GitHub Actions run and job records are kept in a local SQLite database and
+synced incrementally: only runs newer than the last seen run ID are fetched,
+plus the runs that were still queued or in progress at the previous sync.
+Every recorded run updates a daily per-workflow rollup (run counts by
+conclusion, p50/p95 duration, p50/p95 queue time) for the days it touches,
+so health metrics over long look-back windows are answered from the rollup
+table and indexed range queries instead of refetching runs from the API.
+"""
+
+import math
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+PERCENTILES = (50, 95)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    workflow TEXT NOT NULL,
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    conclusion TEXT,
+    created_at REAL NOT NULL,
+    duration REAL,
+    queue_time REAL
+);
+CREATE INDEX IF NOT EXISTS runs_day ON runs (day, workflow);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    conclusion TEXT,
+    duration REAL,
+    queue_time REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_run ON jobs (run_id);
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    day TEXT NOT NULL,
+    workflow TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    successful INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    cancelled INTEGER NOT NULL,
+    in_progress INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    total_queue_time REAL NOT NULL,
+    duration_p50 REAL,
+    duration_p95 REAL,
+    queue_p50 REAL,
+    queue_p95 REAL,
+    PRIMARY KEY (day, workflow)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds of a GitHub ISO 8601 timestamp"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+def _elapsed(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    return max(0.0, end - start)
+
+
+def day_of(timestamp: float) -> str:
+    """UTC day (YYYY-MM-DD) of an epoch timestamp"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')
+
+
+def _percentile(ordered: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class WorkflowRunStore:
+    """SQLite-backed time series of workflow runs and jobs with daily rollups"""
+
+    def __init__(self, db_path: Union[str, Path] = ':memory:'):
+        """
+        Open (and create if needed) the run database.
+
+        Args:
+            db_path: SQLite database file; ``:memory:`` keeps runs for this
+                process only
+        """
+        if db_path != ':memory:':
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _state(self, key: str) -> Optional[float]:
+        row = self._conn.execute('SELECT value FROM sync_state WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def last_run_id(self) -> int:
+        """Highest run ID recorded so far (0 when empty)"""
+        with self._lock:
+            return int(self._state('last_run_id') or 0)
+
+    def synced_since(self) -> Optional[float]:
+        """Oldest creation time covered by the syncs so far, None before the first sync"""
+        with self._lock:
+            return self._state('synced_since')
+
+    def mark_synced(self, since: float) -> None:
+        """Record that every run created after ``since`` has been fetched"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO sync_state VALUES ('synced_since', ?)
+                   ON CONFLICT (key) DO UPDATE SET value = MIN(value, excluded.value)""",
+                (since,)
+            )
+
+    def pending_run_ids(self) -> List[int]:
+        """Runs that were queued or in progress when last recorded"""
+        with self._lock:
+            return [run_id for (run_id,) in self._conn.execute(
+                "SELECT run_id FROM runs WHERE status != 'completed' ORDER BY run_id"
+            )]
+
+    def failed_runs_without_jobs(self, since: float) -> List[int]:
+        """Failed runs from the day of ``since`` onwards that have no jobs recorded"""
+        with self._lock:
+            return [run_id for (run_id,) in self._conn.execute(
+                """SELECT run_id FROM runs r WHERE day >= ? AND conclusion = 'failure'
+                   AND NOT EXISTS (SELECT 1 FROM jobs j WHERE j.run_id = r.run_id) ORDER BY run_id""",
+                (day_of(since),)
+            )]
+
+    def record_runs(self, runs: Iterable[Dict]) -> int:
+        """
+        Insert or update runs as returned by the GitHub API and refresh the
+        rollups of the days and workflows they belong to.
+
+        Returns:
+            Number of runs recorded
+        """
+        rows = []
+        for run in runs:
+            created_at = _timestamp(run['created_at'])
+            started_at = _timestamp(run.get('run_started_at'))
+            completed = run['status'] == 'completed'
+            rows.append((
+                run['id'],
+                run.get('name') or str(run.get('workflow_id', 'unknown')),
+                day_of(created_at),
+                run['status'],
+                run.get('conclusion'),
+                created_at,
+                _elapsed(started_at, _timestamp(run.get('updated_at'))) if completed else None,
+                _elapsed(created_at, started_at)
+            ))
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            ids = [row[0] for row in rows]
+            dirty: Set[Tuple[str, str]] = {(row[2], row[1]) for row in rows}
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                dirty.update(self._conn.execute(
+                    f"SELECT day, workflow FROM runs WHERE run_id IN ({','.join('?' * len(chunk))})", chunk
+                ))
+            self._conn.executemany('INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self._conn.execute(
+                """INSERT INTO sync_state VALUES ('last_run_id', ?)
+                   ON CONFLICT (key) DO UPDATE SET value = MAX(value, excluded.value)""",
+                (max(ids),)
+            )
+            for day, workflow in dirty:
+                self._rollup(day, workflow)
+        return len(rows)
+
+    def record_jobs(self, run_id: int, jobs: Iterable[Dict]) -> int:
+        """Insert or update the jobs of one run; returns the number recorded"""
+        rows = []
+        for job in jobs:
+            created_at = _timestamp(job.get('created_at'))
+            started_at = _timestamp(job.get('started_at'))
+            rows.append((
+                job['id'], run_id, job['name'], job['status'], job.get('conclusion'),
+                _elapsed(started_at, _timestamp(job.get('completed_at'))),
+                _elapsed(created_at, started_at)
+            ))
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def _rollup(self, day: str, workflow: str) -> None:
+        """Recompute one day of one workflow (caller holds the lock and transaction)"""
+        rows = self._conn.execute(
+            'SELECT status, conclusion, duration, queue_time FROM runs WHERE day = ? AND workflow = ?',
+            (day, workflow)
+        ).fetchall()
+        if not rows:
+            self._conn.execute('DELETE FROM daily_rollups WHERE day = ? AND workflow = ?', (day, workflow))
+            return
+        completed = [row for row in rows if row[0] == 'completed']
+        durations = sorted(row[2] for row in completed if row[2] is not None)
+        queue_times = sorted(row[3] for row in rows if row[3] is not None)
+        self._conn.execute(
+            'INSERT OR REPLACE INTO daily_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                day, workflow, len(rows), len(completed),
+                sum(1 for row in completed if row[1] == 'success'),
+                sum(1 for row in completed if row[1] == 'failure'),
+                sum(1 for row in completed if row[1] == 'cancelled'),
+                sum(1 for row in rows if row[0] in ('queued', 'in_progress')),
+                sum(durations), sum(queue_times),
+                *(_percentile(durations, pct) for pct in PERCENTILES),
+                *(_percentile(queue_times, pct) for pct in PERCENTILES),
+            )
+        )
+
+    def daily_rollups(self, since: float, workflow: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Daily per-workflow rollups from the day of ``since`` onwards, oldest first.
+
+        Each entry has day, workflow, the run counts, success_rate (percent of
+        completed runs), duration_p50/p95 and queue_p50/p95 in seconds.
+        """
+        query = 'SELECT * FROM daily_rollups WHERE day >= ?'
+        params: List[Any] = [day_of(since)]
+        if workflow:
+            query += ' AND workflow = ?'
+            params.append(workflow)
+        with self._lock:
+            cursor = self._conn.execute(query + ' ORDER BY day, workflow', params)
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor]
+        for row in rows:
+            row['success_rate'] = row['successful'] / row['completed'] * 100 if row['completed'] else 0.0
+        return rows
+
+    def health_metrics(self, since: float) -> Dict[str, Any]:
+        """
+        Health metrics of the runs created from the day of ``since`` onwards.
+
+        Returns:
+            Run counts by outcome, success_rate (percent), average, p50 and
+            p95 duration, average queue time, failing job counts in
+            ``failure_patterns`` and per-workflow totals in ``workflows``
+        """
+        first_day = day_of(since)
+        with self._lock:
+            totals = self._conn.execute(
+                """SELECT COALESCE(SUM(runs), 0), COALESCE(SUM(completed), 0), COALESCE(SUM(successful), 0),
+                          COALESCE(SUM(failed), 0), COALESCE(SUM(cancelled), 0), COALESCE(SUM(in_progress), 0),
+                          COALESCE(SUM(total_duration), 0), COALESCE(SUM(total_queue_time), 0)
+                   FROM daily_rollups WHERE day >= ?""",
+                (first_day,)
+            ).fetchone()
+            per_workflow = self._conn.execute(
+                """SELECT workflow, SUM(runs), SUM(completed), SUM(successful), SUM(failed), SUM(total_duration)
+                   FROM daily_rollups WHERE day >= ? GROUP BY workflow ORDER BY workflow""",
+                (first_day,)
+            ).fetchall()
+            durations: Dict[str, List[float]] = {}
+            for workflow, duration in self._conn.execute(
+                """SELECT workflow, duration FROM runs
+                   WHERE day >= ? AND duration IS NOT NULL ORDER BY duration""",
+                (first_day,)
+            ):
+                durations.setdefault(workflow, []).append(duration)
+            failure_patterns = dict(self._conn.execute(
+                """SELECT j.name, COUNT(*) FROM jobs j JOIN runs r ON r.run_id = j.run_id
+                   WHERE r.day >= ? AND j.conclusion = 'failure' GROUP BY j.name""",
+                (first_day,)
+            ).fetchall())
+
+        runs, completed, successful, failed, cancelled, in_progress, total_duration, total_queue = totals
+        all_durations = sorted(d for values in durations.values() for d in values)
+        return {
+            'total_runs': runs,
+            'successful_runs': successful,
+            'failed_runs': failed,
+            'cancelled_runs': cancelled,
+            'in_progress_runs': in_progress,
+            'success_rate': successful / completed * 100 if completed else 0.0,
+            'average_duration': total_duration / completed if completed else 0.0,
+            **{f'p{pct}_duration': _percentile(all_durations, pct) or 0.0 for pct in PERCENTILES},
+            'average_queue_time': total_queue / runs if runs else 0.0,
+            'failure_patterns': failure_patterns,
+            'workflows': {
+                workflow: {
+                    'runs': wf_runs,
+                    'failed_runs': wf_failed,
+                    'success_rate': wf_successful / wf_completed * 100 if wf_completed else 0.0,
+                    'average_duration': wf_duration / wf_completed if wf_completed else 0.0,
+                    **{f'p{pct}_duration': _percentile(durations.get(workflow, []), pct) or 0.0
+                       for pct in PERCENTILES},
+                }
+                for workflow, wf_runs, wf_completed, wf_successful, wf_failed, wf_duration in per_workflow
+            },
+        }
+
+    def run_count(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
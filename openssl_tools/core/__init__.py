@@ -3,6 +3,11 @@ OpenSSL Tools Core Module
 Core functionality for OpenSSL development tools
 """
 
-from .artifactory_handler import ArtifactoryHandler
+from openssl_tools._lazy import lazy_exports
 
-__all__ = ['ArtifactoryHandler']
\ No newline at end of file
+__all__ = ['ArtifactoryDownloader', 'ArtifactoryHandler']
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ArtifactoryDownloader": ".artifactory_download",
+    "ArtifactoryHandler": ".artifactory_handler",
+})
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+OpenSSL Tools Artifactory Tree Download
+
+Downloads a whole Artifactory folder: the tree and its checksums are listed
+with a single storage API request, files are fetched over a pooled session
+by a worker pool and streamed to disk in chunks, every file is verified
+against the checksum Artifactory reports, files already present with a
+matching checksum are skipped, and interrupted downloads resume from their
+partial file with an HTTP Range request. Failed files are retried with
+exponential backoff; listed paths resolving outside the target folder are
+refused.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger('__main__.' + __name__)
+
+CHUNK_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = '.part'
+
+
+class ChecksumMismatchError(Exception):
+    """Downloaded content does not match the checksum Artifactory reports"""
+
+
+@dataclass
+class RemoteFile:
+    """A file in an Artifactory folder listing"""
+    path: str  # relative to the listed folder, '/'-separated
+    size: int
+    sha256: Optional[str] = None
+    sha1: Optional[str] = None
+
+    @property
+    def checksum(self) -> Tuple[str, Optional[str]]:
+        """Strongest available checksum as (algorithm, hex digest)"""
+        if self.sha256:
+            return 'sha256', self.sha256
+        return 'sha1', self.sha1
+
+
+@dataclass
+class DownloadReport:
+    """Outcome of a tree download"""
+    downloaded: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    bytes_downloaded: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+def file_digest(path, algorithm: str) -> str:
+    """Hex digest of a local file, read in chunks"""
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactoryDownloader:
+    def __init__(self, root: str, auth=None, jobs: int = 8, chunk_size: int = CHUNK_SIZE,
+                 retries: int = 3, timeout: float = 60, session: Optional[requests.Session] = None,
+                 backoff: float = 1.0, max_backoff: float = 30.0, sleep: Callable[[float], None] = time.sleep):
+        """
+        :param root: Artifactory root URL, e.g. https://host/artifactory
+        :param auth: (user, password) tuple or any requests auth object
+        :param jobs: Number of concurrent downloads
+        :param chunk_size: Bytes per streamed chunk
+        :param retries: Attempts per file before it is reported as failed
+        :param timeout: Connect/read timeout in seconds
+        :param session: Session to use instead of a new pooled one
+        :param backoff: Delay before the first retry, doubled on every further retry
+        :param max_backoff: Upper bound for the retry delay
+        :param sleep: Sleep function (replaceable in tests)
+        """
+        self.root = root.rstrip('/')
+        self.jobs = jobs
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sleep = sleep
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=jobs)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if auth is not None:
+            self.session.auth = auth
+
+    def list_tree(self, repository_path: str) -> List[RemoteFile]:
+        """
+        List every file below repository_path with one storage API request
+        :param repository_path: '<repo>/<folder>' to list
+        :return: Files with their sizes and checksums
+        """
+        url = f'{self.root}/api/storage/{repository_path.strip("/")}'
+        response = self.session.get(url, params='list&deep=1&listFolders=0', timeout=self.timeout)
+        response.raise_for_status()
+        files = []
+        for entry in response.json().get('files', []):
+            if entry.get('folder'):
+                continue
+            files.append(RemoteFile(
+                path=entry['uri'].lstrip('/'),
+                size=int(entry.get('size', 0)),
+                sha256=entry.get('sha2'),
+                sha1=entry.get('sha1'),
+            ))
+        return files
+
+    def download_tree(self, repository_path: str, target) -> DownloadReport:
+        """
+        Download all files in folder and its subdirectories
+        :param repository_path: Artifactory path to get data from
+        :param target: Target directory to store files to
+        :return: DownloadReport
+        """
+        target = Path(target).resolve()
+        files = self.list_tree(repository_path)
+        log.info(f'Artifactory - {len(files)} files in {repository_path}')
+        report = DownloadReport()
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = executor.map(lambda f: self._download_file(repository_path, f, target), files)
+            for remote, (status, detail) in zip(files, results):
+                if status == 'downloaded':
+                    report.downloaded.append(remote.path)
+                    report.bytes_downloaded += detail
+                elif status == 'skipped':
+                    report.skipped.append(remote.path)
+                else:
+                    report.failed.append((remote.path, detail))
+                    log.error(f'Artifactory - Failed to download {remote.path}: {detail}')
+
+        log.info(f'Artifactory - downloaded {len(report.downloaded)}, skipped {len(report.skipped)}, '
+                 f'failed {len(report.failed)} ({report.bytes_downloaded} bytes)')
+        return report
+
+    def _download_file(self, repository_path: str, remote: RemoteFile, target: Path):
+        # The listing comes from the server: never write outside the target folder
+        destination = target.joinpath(*remote.path.split('/')).resolve()
+        try:
+            inside = bool(destination.relative_to(target).parts)  # not target itself
+        except ValueError:
+            inside = False
+        if not inside:
+            return 'failed', f'path outside the target folder: {remote.path}'
+        algorithm, expected = remote.checksum
+
+        if destination.is_file() and destination.stat().st_size == remote.size:
+            if expected is None or file_digest(destination, algorithm) == expected:
+                return 'skipped', 0
+
+        url = f'{self.root}/{repository_path.strip("/")}/{remote.path}'
+        error = None
+        for attempt in range(1, self.retries + 1):
+            try:
+                return 'downloaded', self._fetch(url, destination, algorithm, expected)
+            except (requests.RequestException, OSError, ChecksumMismatchError) as e:
+                error = e
+                if attempt < self.retries:
+                    delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+                    log.debug(f'Artifactory - retrying {remote.path} in {delay:.1f}s: {e}')
+                    self.sleep(delay)
+        return 'failed', str(error)
+
+    def _fetch(self, url: str, destination: Path, algorithm: str, expected: Optional[str]) -> int:
+        """Stream url into destination, resuming a partial download; returns bytes fetched"""
+        partial = destination.with_name(destination.name + PARTIAL_SUFFIX)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.new(algorithm)
+
+        offset = partial.stat().st_size if partial.exists() else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416:  # partial file is already complete (or stale)
+                partial.unlink()
+                raise ChecksumMismatchError(f'{url}: stale partial download discarded')
+            response.raise_for_status()
+            if response.status_code == 206:
+                with open(partial, 'rb') as f:
+                    for chunk in iter(lambda: f.read(self.chunk_size), b''):
+                        digest.update(chunk)
+                mode = 'ab'
+            else:
+                mode = 'wb'
+
+            fetched = 0
+            with open(partial, mode) as out:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    out.write(chunk)
+                    digest.update(chunk)
+                    fetched += len(chunk)
+
+        if expected is not None and digest.hexdigest() != expected:
+            partial.unlink()
+            raise ChecksumMismatchError(f'{url}: expected {algorithm} {expected}, got {digest.hexdigest()}')
+        os.replace(partial, destination)
+        return fetched
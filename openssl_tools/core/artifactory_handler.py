@@ -5,8 +5,7 @@ Based on openssl-tools patterns for package repository management
 """
 
 import logging
-import os
-from pathlib import Path
+import shutil
 
 try:
     import artifactory
@@ -16,6 +15,7 @@ except ImportError:
     ARTIFACTORY_AVAILABLE = False
     ArtifactoryPath = None
 
+from openssl_tools.core.artifactory_download import ArtifactoryDownloader, DownloadReport
 from openssl_tools.util.copy_tools import ensure_target_exists
 
 log = logging.getLogger('__main__.' + __name__)
@@ -43,24 +43,20 @@ class ArtifactoryHandler:
         """
         return self._jfrog_authentication(repository_path)
 
-    def get_all_in_path(self, repository_path, target):
+    def get_all_in_path(self, repository_path, target, jobs=8) -> DownloadReport:
         """
         Download all files in folder and its subdirectories
         :param repository_path: Artifactory path to get data from
-        :param target: Target location to store files to
-        :return: None
+        :param target: Target directory to store files to
+        :param jobs: Number of concurrent downloads
+        :return: DownloadReport with downloaded, skipped and failed files
         """
-        self.original_path = repository_path
-        self.__get_all_in_path(repository_path, target)
-
-    def __get_all_in_path(self, repository_path, target):
-        connector = self.connect_to_artifactory(repository_path)
-        for p in connector:
-            if p.is_dir():
-                self.__get_all_in_path(p, target)
-            else:
-                subfolders = str(p.parent).replace(str(self.original_path), "")[1:]
-                self.store_single_file(p, os.path.join(target, subfolders))
+        downloader = ArtifactoryDownloader(
+            self.config.artifactory.root,
+            auth=(self.config.artifactory.user, self.config.artifactory.password),
+            jobs=jobs
+        )
+        return downloader.download_tree(str(repository_path), target)
 
     @staticmethod
     def artifactory_walk(repository_path, topdown=True):
@@ -80,4 +76,5 @@ class ArtifactoryHandler:
         log.debug(f'Artifactory - Storing file: {p} to {target}, metadata: {p.stat()}')
         with p.open() as fd:
             with open(target, "wb") as out:
-                return out.write(fd.read()) > 0
\ No newline at end of file
+                shutil.copyfileobj(fd, out, 1024 * 1024)
+                return out.tell() > 0
@@ -9,8 +9,7 @@ Submodules:
     package_management: Conan package management and orchestration
 """
 
-from .build_system import BuildCacheManager, BuildOptimizer
-from .package_management import ConanRemoteManager, ConanOrchestrator
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "BuildCacheManager",
@@ -18,3 +17,10 @@ __all__ = [
     "ConanRemoteManager",
     "ConanOrchestrator",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BuildCacheManager": ".build_system",
+    "BuildOptimizer": ".build_system",
+    "ConanRemoteManager": ".package_management",
+    "ConanOrchestrator": ".package_management",
+})
@@ -11,13 +11,18 @@ Classes:
     PerformanceAnalyzer: Build performance analysis and benchmarking
 """
 
-from .optimizer import BuildCacheManager, BuildOptimizer
-from .matrix_generator import BuildMatrixGenerator
-from .performance import PerformanceAnalyzer
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "BuildCacheManager",
     "BuildOptimizer",
     "BuildMatrixGenerator", 
     "PerformanceAnalyzer",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BuildCacheManager": ".optimizer",
+    "BuildOptimizer": ".optimizer",
+    "BuildMatrixGenerator": ".matrix_generator",
+    "PerformanceAnalyzer": ".performance",
+})
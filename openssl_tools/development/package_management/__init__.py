@@ -8,14 +8,21 @@ Classes:
     ConanRemoteManager: Conan remote configuration and management
     ConanOrchestrator: Conan build orchestration and coordination
     DependencyManager: Dependency management and resolution
+    RemoteMetadataIndex: In-process index of a Conan remote's recipes and revisions
 """
 
-from .remote_manager import ConanRemoteManager
-from .orchestrator import ConanOrchestrator
-from .dependency_manager import DependencyManager
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "ConanRemoteManager",
     "ConanOrchestrator",
     "DependencyManager",
-]
\ No newline at end of file
+    "RemoteMetadataIndex",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConanRemoteManager": ".remote_manager",
+    "ConanOrchestrator": ".orchestrator",
+    "DependencyManager": ".dependency_manager",
+    "RemoteMetadataIndex": ".remote_index",
+})
@@ -12,11 +12,23 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from openssl_tools.automation.deployment.upload_pipeline import (
+    ConanRevisionIndex,
+    UploadPipeline,
+    conan_package_bytes,
+)
+from openssl_tools.development.package_management.remote_index import RemoteMetadataIndex
+
 
 class PackageRegistryManager:
     """Manages package uploads to multiple registries."""
     
-    def __init__(self, conan_home: Optional[Path] = None):
+    def __init__(self, conan_home: Optional[Path] = None, index_max_age: Optional[float] = 300.0):
+        """
+        Args:
+            conan_home: Conan home directory (default: CONAN_USER_HOME or ~/.conan2)
+            index_max_age: Seconds before registry metadata indexes are refreshed
+        """
         self.conan_home = conan_home or Path(os.environ.get('CONAN_USER_HOME', Path.home() / '.conan2'))
         self.registries = {
             'artifactory': {
@@ -38,9 +50,15 @@ class PackageRegistryManager:
                 'repo': 'conancenter'
             }
         }
+        self._configured = set()
+        self.upload_stats = []
+        self.index_max_age = index_max_age
+        self._indexes: Dict[Optional[str], RemoteMetadataIndex] = {}
     
     def configure_registry(self, registry_name: str) -> bool:
-        """Configure a specific registry."""
+        """Configure a specific registry (once per manager)."""
+        if registry_name in self._configured:
+            return True
         if registry_name not in self.registries:
             print(f"[ERROR] Unknown registry: {registry_name}")
             return False
@@ -67,6 +85,7 @@ class PackageRegistryManager:
             subprocess.run(cmd, check=True, capture_output=True)
             
             print(f"[OK] Configured {registry_name} registry")
+            self._configured.add(registry_name)
             return True
             
         except subprocess.CalledProcessError as e:
@@ -93,44 +112,58 @@ class PackageRegistryManager:
             return False
     
     def upload_to_all_registries(self, package_ref: str, 
-                                registries: List[str] = None) -> Dict[str, bool]:
-        """Upload a package to multiple registries."""
+                                registries: List[str] = None,
+                                max_parallel: int = 2, retries: int = 3) -> Dict[str, bool]:
+        """
+        Upload a package to multiple registries concurrently.
+        
+        Registries are configured once (Conan's remote configuration is not
+        safe to modify concurrently), then uploads run in parallel with
+        retries. The first upload runs alone, since it creates the package
+        archives in the local cache; the other registries follow in parallel.
+        Registries that already hold the local recipe revision are skipped.
+        """
         if registries is None:
             registries = list(self.registries.keys())
         
         results = {}
-        
+        ready = []
         for registry_name in registries:
-            print(f"[UPLOAD] Uploading to {registry_name}...")
-            
-            # Configure registry first
-            if not self.configure_registry(registry_name):
+            if self.configure_registry(registry_name):
+                ready.append(registry_name)
+            else:
                 results[registry_name] = False
-                continue
-            
-            # Upload package
-            results[registry_name] = self.upload_package(package_ref, registry_name, force=True)
         
-        return results
+        def upload(reference, registry_name):
+            print(f"[UPLOAD] Uploading to {registry_name}...")
+            if not self.upload_package(reference, registry_name, force=True):
+                raise RuntimeError(f"upload of {reference} to {registry_name} failed")
+        
+        pipeline = UploadPipeline(
+            upload,
+            exists_fn=ConanRevisionIndex().present,
+            size_fn=conan_package_bytes,
+            default_limit=max_parallel,
+            retries=retries,
+            log=lambda message, level="INFO": print(f"[{level}] {message}")
+        )
+        self.upload_stats = pipeline.run([package_ref], ready)
+        for result in self.upload_stats:
+            results[result.registry] = result.status != "failed"
+            if result.status == "success" and result.registry in self._indexes:
+                self._indexes[result.registry].invalidate()
+        
+        return {registry_name: results[registry_name] for registry_name in registries}
     
     def list_packages(self, registry_name: str = None) -> List[str]:
-        """List packages in a registry."""
+        """List packages in a registry (the local cache by default), from its metadata index."""
+        if registry_name not in self._indexes:
+            self._indexes[registry_name] = RemoteMetadataIndex(registry_name, self.index_max_age)
+        
         try:
-            if registry_name:
-                cmd = ['conan', 'list', '*', '-r', registry_name]
-            else:
-                cmd = ['conan', 'list', '*']
+            return self._indexes[registry_name].references()
             
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            
-            packages = []
-            for line in result.stdout.split('\n'):
-                if line.strip() and not line.startswith('Local Cache'):
-                    packages.append(line.strip())
-            
-            return packages
-            
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, RuntimeError, ValueError) as e:
             print(f"[ERROR] Failed to list packages: {e}")
             return []
     
@@ -190,12 +223,14 @@ def main():
                        help="List packages in registries")
     parser.add_argument("--generate-instructions", action="store_true",
                        help="Generate installation instructions")
+    parser.add_argument("--index-max-age", type=float, default=300.0,
+                       help="Seconds before registry metadata indexes are refreshed")
     
     args = parser.parse_args()
     
     # Initialize manager
     conan_home = Path(args.conan_home) if args.conan_home else None
-    manager = PackageRegistryManager(conan_home)
+    manager = PackageRegistryManager(conan_home, index_max_age=args.index_max_age)
     
     if args.list_packages:
         print("[INFO] Listing packages in registries...")
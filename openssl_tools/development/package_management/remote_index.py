@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+OpenSSL Tools - Conan Remote Metadata Index
+In-process index of the recipes and revisions held by a Conan remote.
+
+The index is populated with a single ``conan list "*#*" --format=json`` for the
+whole remote and refreshed incrementally: a refresh lists only the latest
+revision of every recipe (``"*#latest"``) and merges the recipes whose latest
+revision timestamp changed, dropping recipes that disappeared. Search, info and
+latest-version queries are then answered from in-memory dictionaries without
+spawning a process, refreshing first only when the index is older than the
+configured staleness. The index can be persisted to a JSON file so that the
+next process starts from it and only needs an incremental refresh.
+"""
+
+import fnmatch
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# runner(args) -> stdout of `conan <args>`; raises on failure
+ConanRunner = Callable[[List[str]], str]
+
+
+def _run_conan(args: List[str]) -> str:
+    return subprocess.run(["conan"] + args, capture_output=True, text=True, check=True).stdout
+
+
+def split_reference(ref: str) -> Dict[str, Optional[str]]:
+    """Split name/version[@user/channel] into its parts."""
+    name_version, _, user_channel = ref.partition("@")
+    name, _, version = name_version.partition("/")
+    user, _, channel = user_channel.partition("/")
+    return {"name": name, "version": version or None, "user": user or None, "channel": channel or None}
+
+
+def version_key(version: Optional[str]) -> Tuple:
+    """Sort key ordering versions numerically component by component (1.10 > 1.9)."""
+    parts = re.split(r"[.\-+_]", version or "")
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in parts)
+
+
+@lru_cache(maxsize=256)
+def _pattern(query: str):
+    return re.compile(fnmatch.translate(query))
+
+
+class RemoteMetadataIndex:
+    """Recipe and revision metadata of one Conan remote, queryable in-process."""
+
+    def __init__(self, remote: Optional[str] = None, max_age: Optional[float] = 300.0,
+                 cache_path: Optional[Union[str, Path]] = None, runner: Optional[ConanRunner] = None):
+        """
+        Args:
+            remote: Remote name; None indexes the local cache
+            max_age: Seconds before queries refresh the index; 0 always refreshes,
+                None never refreshes automatically
+            cache_path: JSON file the index is loaded from and saved to
+            runner: Runs ``conan <args>`` and returns its stdout (replaceable in tests)
+        """
+        self.remote = remote
+        self.max_age = max_age
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.runner = runner or _run_conan
+        self.updated_at: Optional[float] = None
+        self._lock = threading.Lock()
+        # ref -> {revision: timestamp}
+        self._recipes: Dict[str, Dict[str, float]] = {}
+        # name -> refs, newest version first
+        self._by_name: Dict[str, List[str]] = {}
+        self._load()
+
+    def _list(self, pattern: str) -> Dict[str, Dict[str, float]]:
+        args = ["list", pattern, "--format=json"]
+        if self.remote:
+            args += ["-r", self.remote]
+        data = json.loads(self.runner(args) or "{}")
+
+        recipes = {}
+        for origin, listing in data.items():
+            if not isinstance(listing, dict):
+                continue
+            if "error" in listing:
+                raise RuntimeError(f"conan list on {origin} failed: {listing['error']}")
+            for ref, info in listing.items():
+                revisions = info.get("revisions", {}) if isinstance(info, dict) else {}
+                recipes[ref] = {revision: details.get("timestamp", 0)
+                                for revision, details in revisions.items()}
+        return recipes
+
+    def _rebuild(self, recipes: Dict[str, Dict[str, float]]) -> None:
+        by_name: Dict[str, List[str]] = {}
+        for ref in recipes:
+            by_name.setdefault(split_reference(ref)["name"], []).append(ref)
+        for refs in by_name.values():
+            refs.sort(key=lambda ref: version_key(split_reference(ref)["version"]), reverse=True)
+        # Readers only ever see complete snapshots
+        self._recipes, self._by_name = recipes, by_name
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Bring the index up to date with the remote.
+
+        Args:
+            full: List every revision of every recipe instead of merging the latest ones
+
+        Returns:
+            Number of recipes added or changed
+        """
+        with self._lock:
+            if full or self.updated_at is None:
+                recipes = self._list("*#*")
+                changed = sum(1 for ref, revisions in recipes.items() if self._recipes.get(ref) != revisions)
+            else:
+                recipes = {}
+                changed = 0
+                for ref, latest in self._list("*#latest").items():
+                    known = dict(self._recipes.get(ref, {}))
+                    if max(latest.values(), default=0) > max(known.values(), default=0) or not known:
+                        known.update(latest)
+                        changed += 1
+                    recipes[ref] = known
+            self._rebuild(recipes)
+            self.updated_at = time.time()
+            self._save()
+        logger.info(f"Indexed {len(recipes)} recipes from {self.remote or 'the local cache'} ({changed} changed)")
+        return changed
+
+    def invalidate(self) -> None:
+        """Refresh (incrementally) on the next query, e.g. after uploading to the remote."""
+        with self._lock:
+            if self.updated_at is not None:
+                self.updated_at = 0.0  # persisted too, so the next process refreshes as well
+                self._save()
+
+    def _ensure_fresh(self) -> None:
+        if not self.updated_at or (self.max_age is not None and time.time() - self.updated_at >= self.max_age):
+            self.refresh()
+
+    def _load(self) -> None:
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index {self.cache_path}: {e}")
+            return
+        if data.get("remote") == self.remote:
+            self._rebuild(data.get("recipes", {}))
+            self.updated_at = data.get("updated_at")
+
+    def _save(self) -> None:
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.cache_path.with_suffix(".tmp")
+        temp.write_text(json.dumps({"remote": self.remote, "updated_at": self.updated_at,
+                                    "recipes": self._recipes}))
+        temp.replace(self.cache_path)
+
+    def references(self) -> List[str]:
+        """All indexed recipe references, sorted."""
+        self._ensure_fresh()
+        return sorted(self._recipes)
+
+    def search(self, query: str = "*") -> List[Dict]:
+        """
+        Recipes matching a name/version[@user/channel] pattern.
+
+        Returns:
+            Dicts with name, version, user, channel, revision and timestamp of the latest revision
+        """
+        self._ensure_fresh()
+        name = query.split("/", 1)[0]
+        if any(char in name for char in "*?["):
+            candidates = self._recipes.keys()
+        else:
+            candidates = self._by_name.get(name, [])
+        if query != name:
+            pattern = _pattern(query)
+            candidates = [ref for ref in candidates if pattern.match(ref)]
+        return [self._describe(ref) for ref in sorted(candidates)]
+
+    def info(self, package_ref: str) -> Optional[Dict]:
+        """Metadata of one recipe reference (an optional #revision selects that revision)."""
+        self._ensure_fresh()
+        ref, _, revision = package_ref.partition("#")
+        if ref not in self._recipes:
+            return None
+        if revision and revision not in self._recipes[ref]:
+            return None
+        return self._describe(ref, revision or None)
+
+    def latest_version(self, name: str) -> Optional[str]:
+        """Highest version of a recipe name, or None if the remote has none."""
+        self._ensure_fresh()
+        refs = self._by_name.get(name)
+        return split_reference(refs[0])["version"] if refs else None
+
+    def _describe(self, ref: str, revision: Optional[str] = None) -> Dict:
+        revisions = self._recipes[ref]
+        if revision is None and revisions:
+            revision = max(revisions, key=revisions.get)
+        return {
+            **split_reference(ref),
+            "reference": ref,
+            "revision": revision,
+            "timestamp": revisions.get(revision) if revision else None,
+            "revisions": len(revisions),
+        }
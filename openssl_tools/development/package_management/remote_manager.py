@@ -13,6 +13,8 @@ from pathlib import Path
 import requests
 from urllib.parse import urlparse
 
+from openssl_tools.development.package_management.remote_index import RemoteMetadataIndex
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,12 +26,24 @@ logger = logging.getLogger(__name__)
 class ConanRemoteManager:
     """Manages Conan remotes and package operations."""
     
-    def __init__(self, github_token: Optional[str] = None, username: Optional[str] = None):
+    def __init__(self, github_token: Optional[str] = None, username: Optional[str] = None,
+                 index_max_age: Optional[float] = 300.0, index_dir: Optional[Path] = None):
+        """
+        Args:
+            github_token: GitHub token (default: GITHUB_TOKEN)
+            username: GitHub username (default: GITHUB_USERNAME)
+            index_max_age: Seconds before remote metadata indexes are refreshed
+            index_dir: Directory the remote metadata indexes are persisted in
+                (default: in memory only)
+        """
         self.github_packages_url = "https://maven.pkg.github.com/sparesparrow/openssl"
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         self.username = username or os.getenv("GITHUB_USERNAME", "sparesparrow")
         self.remote_name = "github-packages"
         self.config_file = Path.home() / ".conan" / "conan.conf"
+        self.index_max_age = index_max_age
+        self.index_dir = index_dir
+        self._indexes: Dict[str, RemoteMetadataIndex] = {}
         
     def setup_github_packages_remote(self, force: bool = False) -> bool:
         """
@@ -167,6 +181,11 @@ class ConanRemoteManager:
             logger.error(f"Failed to upload packages: {e}")
             return False
             
+        finally:
+            # Earlier patterns may have been uploaded even if a later one failed
+            if remote in self._indexes:
+                self._indexes[remote].invalidate()
+            
     def download_packages(self, patterns: List[str], 
                          remote: str = None) -> bool:
         """
@@ -198,46 +217,60 @@ class ConanRemoteManager:
             logger.error(f"Failed to download packages: {e}")
             return False
             
+    def remote_index(self, remote: str = None) -> RemoteMetadataIndex:
+        """
+        Metadata index of a remote, shared by all queries of this manager.
+        
+        Args:
+            remote: Remote name (default: github-packages)
+            
+        Returns:
+            RemoteMetadataIndex, populated on its first query
+        """
+        if remote is None:
+            remote = self.remote_name
+            
+        if remote not in self._indexes:
+            cache_path = self.index_dir / f"{remote}.json" if self.index_dir else None
+            self._indexes[remote] = RemoteMetadataIndex(remote, self.index_max_age, cache_path)
+        return self._indexes[remote]
+            
     def search_packages(self, query: str, remote: str = None) -> List[Dict]:
         """
         Search for packages in the specified remote.
         
         Args:
-            query: Search query
+            query: Search query (name or name/version[@user/channel] pattern)
             remote: Remote name to search in (default: github-packages)
             
         Returns:
             List of package information dictionaries
         """
-        if remote is None:
-            remote = self.remote_name
-            
         try:
-            result = subprocess.run([
-                "conan", "search", query, "-r", remote
-            ], capture_output=True, text=True, check=True)
+            return self.remote_index(remote).search(query)
             
-            packages = []
-            lines = result.stdout.strip().split('\n')
-            
-            for line in lines:
-                if line.strip() and not line.startswith('Existing'):
-                    # Parse package information
-                    parts = line.split('/')
-                    if len(parts) >= 2:
-                        packages.append({
-                            'name': parts[0],
-                            'version': parts[1] if len(parts) > 1 else None,
-                            'user': parts[2] if len(parts) > 2 else None,
-                            'channel': parts[3] if len(parts) > 3 else None
-                        })
-                        
-            return packages
-            
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, RuntimeError, ValueError) as e:
             logger.error(f"Failed to search packages: {e}")
             return []
             
+    def latest_version(self, name: str, remote: str = None) -> Optional[str]:
+        """
+        Get the latest version of a package in the specified remote.
+        
+        Args:
+            name: Package name
+            remote: Remote name (default: github-packages)
+            
+        Returns:
+            Highest version, or None if not found
+        """
+        try:
+            return self.remote_index(remote).latest_version(name)
+            
+        except (subprocess.CalledProcessError, RuntimeError, ValueError) as e:
+            logger.error(f"Failed to get latest version: {e}")
+            return None
+            
     def create_package(self, recipe_path: Path, 
                       name: str, version: str, 
                       user: str = None, channel: str = None) -> bool:
@@ -310,31 +343,21 @@ class ConanRemoteManager:
             logger.error(f"Failed to install package: {e}")
             return False
             
-    def get_package_info(self, package_ref: str) -> Optional[Dict]:
+    def get_package_info(self, package_ref: str, remote: str = None) -> Optional[Dict]:
         """
         Get information about a package.
         
         Args:
-            package_ref: Package reference
+            package_ref: Package reference, optionally with #revision
+            remote: Remote name (default: github-packages)
             
         Returns:
             Dictionary with package information or None if not found
         """
         try:
-            result = subprocess.run([
-                "conan", "inspect", package_ref
-            ], capture_output=True, text=True, check=True)
-            
-            # Parse the output to extract package information
-            info = {}
-            for line in result.stdout.strip().split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    info[key.strip()] = value.strip()
-                    
-            return info
+            return self.remote_index(remote).info(package_ref)
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, RuntimeError, ValueError) as e:
             logger.error(f"Failed to get package info: {e}")
             return None
             
@@ -419,6 +442,11 @@ def main():
     parser.add_argument("--upload", nargs="+", help="Upload packages (patterns)")
     parser.add_argument("--download", nargs="+", help="Download packages (patterns)")
     parser.add_argument("--search", help="Search for packages")
+    parser.add_argument("--info", help="Show package information")
+    parser.add_argument("--latest", help="Show the latest version of a package")
+    parser.add_argument("--index-dir", type=Path, help="Directory to persist remote metadata indexes in")
+    parser.add_argument("--index-max-age", type=float, default=300.0,
+                        help="Seconds before remote metadata indexes are refreshed")
     parser.add_argument("--test", action="store_true", help="Test connection")
     parser.add_argument("--setup-ssh", action="store_true", help="Set up SSH authentication")
     parser.add_argument("--remote", default="github-packages", help="Remote name")
@@ -427,7 +455,9 @@ def main():
     
     manager = ConanRemoteManager(
         github_token=args.token,
-        username=args.username
+        username=args.username,
+        index_max_age=args.index_max_age,
+        index_dir=args.index_dir
     )
     
     if args.setup:
@@ -463,6 +493,22 @@ def main():
         else:
             print("No packages found")
             
+    if args.info:
+        info = manager.get_package_info(args.info, args.remote)
+        if info:
+            print(json.dumps(info, indent=2))
+        else:
+            print(f"Package not found: {args.info}")
+            sys.exit(1)
+            
+    if args.latest:
+        version = manager.latest_version(args.latest, args.remote)
+        if version:
+            print(f"{args.latest}/{version}")
+        else:
+            print(f"Package not found: {args.latest}")
+            sys.exit(1)
+            
     if args.setup_ssh:
         success = manager.setup_ssh_authentication()
         if not success:
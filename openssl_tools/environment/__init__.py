@@ -4,6 +4,11 @@ OpenSSL Tools Environment Setup Module
 Provides unified environment setup functionality with CLI entry points.
 """
 
-from .setup import main, setup_environment
+from openssl_tools._lazy import lazy_exports
 
 __all__ = ['main', 'setup_environment']
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "main": ".setup",
+    "setup_environment": ".setup",
+})
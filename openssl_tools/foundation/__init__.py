@@ -4,12 +4,18 @@ OpenSSL Tools Foundation Module
 Core foundation utilities for OpenSSL Conan ecosystem.
 """
 
-from .version_manager import get_openssl_version, parse_openssl_version
-from .profile_deployer import deploy_openssl_profiles, list_openssl_profiles
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     'get_openssl_version',
     'parse_openssl_version', 
     'deploy_openssl_profiles',
     'list_openssl_profiles'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "get_openssl_version": ".version_manager",
+    "parse_openssl_version": ".version_manager",
+    "deploy_openssl_profiles": ".profile_deployer",
+    "list_openssl_profiles": ".profile_deployer",
+})
@@ -8,8 +8,12 @@ Classes:
     MainCLI: Main command-line interface
 """
 
-from .main import main as MainCLI
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "MainCLI",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "MainCLI": ".main:main",
+})
@@ -14,10 +14,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from openssl_tools.automation.workflow_management import WorkflowManager, UnifiedWorkflowManager
-from openssl_tools.development.build_system import BuildCacheManager, BuildOptimizer
-from openssl_tools.development.package_management import ConanRemoteManager, ConanOrchestrator
-# from openssl_tools.foundation.utilities import validate_mcp_config
+from openssl_tools import __version__
+
+# Command handlers import their implementation modules on dispatch, keeping
+# `--version`, `--help` and argument errors free of heavy dependencies.
 
 
 def main():
@@ -37,7 +37,7 @@ Examples:
     parser.add_argument(
         "--version", 
         action="version", 
-        version="OpenSSL Tools 1.2.0"
+        version=f"OpenSSL Tools {__version__}"
     )
     
     subparsers = parser.add_subparsers(
@@ -182,9 +182,11 @@ Examples:
 
 def handle_workflow_command(args):
     """Handle workflow management commands."""
+    from openssl_tools.automation.workflow_management.manager import WorkflowManager
     if args.workflow_action == "analyze":
         if args.unified:
             import asyncio
+            from openssl_tools.automation.workflow_management.unified import UnifiedWorkflowManager
             manager = UnifiedWorkflowManager(args.repo)
             result = asyncio.run(manager.analyze_workflows(args.limit))
             print(result)
@@ -203,6 +205,7 @@ def handle_workflow_command(args):
 def handle_build_command(args):
     """Handle build optimization commands."""
     if args.build_action == "optimize":
+        from openssl_tools.development.build_system.optimizer import BuildCacheManager
         cache_dir = Path(args.cache_dir) if args.cache_dir else None
         optimizer = BuildCacheManager(cache_dir, max_cache_size_gb=args.max_size)
         result = optimizer.optimize_cache()
@@ -212,6 +215,7 @@ def handle_build_command(args):
 def handle_conan_command(args):
     """Handle Conan management commands."""
     if args.conan_action == "setup-remote":
+        from openssl_tools.development.package_management.remote_manager import ConanRemoteManager
         manager = ConanRemoteManager(args.token, args.username)
         success = manager.setup_github_packages_remote()
         if success:
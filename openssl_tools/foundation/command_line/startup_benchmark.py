@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+
+Measures the import cost of the openssl-tools CLI entry point with
+``python -X importtime`` in fresh interpreters and checks it against an
+import-time budget. Hooks and wrappers invoke the CLI many times per
+pipeline, so heavy third-party modules must only load on command dispatch.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+CLI_MODULE = "openssl_tools.foundation.command_line.main"
+DEFAULT_BUDGET_MS = 150.0
+# Third-party modules that must not be imported just to start the CLI
+HEAVY_MODULES = (
+    "requests", "github", "yaml", "cryptography", "scipy", "conan",
+    "psutil", "httpx", "psycopg2", "mcp",
+)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+
+def _run_once(module: str) -> Dict:
+    """Import module in a fresh interpreter and return its import profile"""
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, cwd=project_root, check=True,
+    )
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if parts[2] == module:
+            cumulative_us = int(parts[1])
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return {"import_ms": cumulative_us / 1000.0, "heavy_modules": heavy}
+
+
+def measure_startup(module: str = CLI_MODULE, runs: int = 5) -> Dict:
+    """Median import time of module over several fresh interpreters"""
+    samples: List[Dict] = [_run_once(module) for _ in range(runs)]
+    heavy = sorted({name for sample in samples for name in sample["heavy_modules"]})
+    return {
+        "module": module,
+        "runs": runs,
+        "import_ms": statistics.median(sample["import_ms"] for sample in samples),
+        "heavy_modules": heavy,
+    }
+
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark openssl-tools CLI startup")
+    parser.add_argument("--module", default=CLI_MODULE, help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median import time in milliseconds")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    args = parser.parse_args()
+
+    result = measure_startup(args.module, args.runs)
+    result["budget_ms"] = args.budget_ms
+    result["within_budget"] = (
+        result["import_ms"] <= args.budget_ms and not result["heavy_modules"]
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['module']}: {result['import_ms']:.1f} ms "
+              f"(budget {args.budget_ms:.0f} ms, {args.runs} runs)")
+        if result["heavy_modules"]:
+            print(f"Heavy modules loaded at startup: {', '.join(result['heavy_modules'])}")
+    return 0 if result["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,16 @@ Functions:
     config_manager: Configuration management utilities
 """
 
-from .logging import setup_logging, get_logger
-from .config import ConfigManager
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "setup_logging",
     "get_logger",
     "ConfigManager",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "setup_logging": ".logging",
+    "get_logger": ".logging",
+    "ConfigManager": ".config",
+})
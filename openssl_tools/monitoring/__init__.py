@@ -7,12 +7,24 @@ including status reporting, log management, and system monitoring.
 Classes:
     StatusReporter: Reports system and build status
     LogManager: Manages logging and log filtering
+    BuildTrackingStore: Pooled build tracking database (PostgreSQL/SQLite)
+    BuildMetricsStore: Append-only CI build metrics history (SQLite)
 """
 
-from .status_reporter import StatusReporter
-from .log_manager import LogWhitelistManager
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "StatusReporter",
     "LogWhitelistManager",
+    "BuildTrackingStore",
+    "get_build_store",
+    "BuildMetricsStore",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "StatusReporter": ".status_reporter",
+    "LogWhitelistManager": ".log_manager",
+    "BuildTrackingStore": ".build_tracking",
+    "get_build_store": ".build_tracking",
+    "BuildMetricsStore": ".metrics_store",
+})
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Build tracking database access.
+
+A single pooled store is shared by the MCP servers and the build tools:
+
+- PostgreSQL through a psycopg2 ``ThreadedConnectionPool``; each statement
+  is ``PREPARE``d once per pooled connection and then ``EXECUTE``d.
+- SQLite (WAL mode) as a local fallback when no PostgreSQL server is
+  configured or reachable; sqlite3 caches compiled statements itself.
+
+Queries are exposed as coroutines that run on a bounded executor sized to
+the pool, so async servers never block their event loop. Build completion
+updates are queued and written in batches with ``executemany``.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import psycopg2
+    from psycopg2.pool import ThreadedConnectionPool
+except ImportError:  # SQLite backend only
+    psycopg2 = None
+    ThreadedConnectionPool = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = Path.home() / ".openssl-tools" / "builds.db"
+
+# name -> (postgres statement with $n parameters, sqlite statement with ?)
+STATEMENTS: Dict[str, Tuple[str, str]] = {
+    "recent_builds": (
+        """SELECT c.name, b.status, b.build_duration_seconds, b.build_date
+           FROM builds b JOIN components c ON b.component_id = c.id
+           ORDER BY b.build_date DESC LIMIT $1""",
+        """SELECT c.name, b.status, b.build_duration_seconds, b.build_date
+           FROM builds b JOIN components c ON b.component_id = c.id
+           ORDER BY b.build_date DESC LIMIT ?""",
+    ),
+    "component_history": (
+        """SELECT b.status, b.build_duration_seconds, b.build_date, b.platform, b.profile
+           FROM builds b JOIN components c ON b.component_id = c.id
+           WHERE c.name = $1 ORDER BY b.build_date DESC LIMIT $2""",
+        """SELECT b.status, b.build_duration_seconds, b.build_date, b.platform, b.profile
+           FROM builds b JOIN components c ON b.component_id = c.id
+           WHERE c.name = ? ORDER BY b.build_date DESC LIMIT ?""",
+    ),
+    "build_metrics": (
+        """SELECT COUNT(*), COUNT(CASE WHEN status = 'completed' THEN 1 END),
+                  AVG(build_duration_seconds)
+           FROM builds WHERE build_date >= NOW() - make_interval(days => $1)""",
+        """SELECT COUNT(*), COUNT(CASE WHEN status = 'completed' THEN 1 END),
+                  AVG(build_duration_seconds)
+           FROM builds WHERE build_date >= datetime('now', '-' || ? || ' days')""",
+    ),
+    "start_build": (
+        """INSERT INTO build_status
+           (component_name, build_type, platform, compiler, status, started_at)
+           VALUES ($1, $2, $3, $4, $5, NOW()) RETURNING id""",
+        """INSERT INTO build_status
+           (component_name, build_type, platform, compiler, status, started_at)
+           VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+    ),
+    "finish_build": (
+        """UPDATE build_status SET status = $1, completed_at = NOW(), error_message = $2
+           WHERE id = $3""",
+        """UPDATE build_status SET status = ?, completed_at = CURRENT_TIMESTAMP,
+           error_message = ? WHERE id = ?""",
+    ),
+}
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    component_id INTEGER REFERENCES components(id),
+    status TEXT,
+    build_duration_seconds REAL,
+    build_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    platform TEXT,
+    profile TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_builds_date ON builds(build_date);
+CREATE TABLE IF NOT EXISTS build_status (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    component_name TEXT,
+    build_type TEXT,
+    platform TEXT,
+    compiler TEXT,
+    status TEXT,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    error_message TEXT
+);
+"""
+
+
+def postgres_url_from_env() -> Optional[str]:
+    """DATABASE_URL, or a URL assembled from POSTGRES_* variables"""
+    url = os.getenv("DATABASE_URL")
+    if url:
+        return url
+    if not os.getenv("POSTGRES_HOST"):
+        return None
+    return "postgresql://{user}:{password}@{host}:{port}/{db}".format(
+        user=os.getenv("POSTGRES_USER", "openssl_admin"),
+        password=os.getenv("POSTGRES_PASSWORD", "openssl_secure_pass"),
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=os.getenv("POSTGRES_PORT", "5432"),
+        db=os.getenv("POSTGRES_DB", "openssl_builds"),
+    )
+
+
+class BuildTrackingStore:
+    """Pooled build tracking database (PostgreSQL or SQLite)"""
+
+    def __init__(self, url: Optional[str] = None, pool_size: int = 8, batch_size: int = 50):
+        """Initialize with a database URL (postgresql://... or sqlite:///path)."""
+        self.url = url or f"sqlite:///{DEFAULT_SQLITE_PATH}"
+        self.backend = "sqlite" if self.url.startswith("sqlite") else "postgres"
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+
+        self._executor = ThreadPoolExecutor(max_workers=pool_size,
+                                            thread_name_prefix="build-db")
+        self._pending: List[Tuple[str, Optional[str], str]] = []
+        self._pending_lock = threading.Lock()
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # Callers beyond pool_size wait for a connection instead of getting a PoolError
+        self._pool_slots = threading.BoundedSemaphore(pool_size)
+        # Statements prepared per pooled connection; entries go away with their connection
+        self._prepared: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+        self._local = threading.local()
+        self._sqlite_conns: List[sqlite3.Connection] = []
+
+        if self.backend == "sqlite":
+            self.sqlite_path = Path(self.url[len("sqlite:///"):])
+            self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+        elif psycopg2 is None:
+            raise RuntimeError("psycopg2 is required for PostgreSQL build tracking")
+
+    @classmethod
+    def from_env(cls, fallback: bool = True, **kwargs) -> "BuildTrackingStore":
+        """Use the configured PostgreSQL server, falling back to SQLite"""
+        url = postgres_url_from_env()
+        if url and psycopg2 is not None:
+            store = cls(url, **kwargs)
+            if not fallback:
+                return store
+            try:
+                store.ping()
+                return store
+            except Exception as e:
+                logger.warning(f"PostgreSQL unavailable ({e}), using SQLite build tracking")
+                store.close()
+        sqlite_path = os.getenv("OPENSSL_TOOLS_BUILD_DB", str(DEFAULT_SQLITE_PATH))
+        return cls(f"sqlite:///{sqlite_path}", **kwargs)
+
+    @contextmanager
+    def _connection(self):
+        if self.backend == "sqlite":
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                # One connection per thread; close() may close it from another thread
+                conn = sqlite3.connect(str(self.sqlite_path), timeout=30, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SQLITE_SCHEMA)
+                self._local.conn = conn
+                with self._pool_lock:
+                    self._sqlite_conns.append(conn)
+            yield conn
+            return
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadedConnectionPool(1, self.pool_size, self.url)
+        with self._pool_slots:
+            conn = self._pool.getconn()
+            try:
+                yield conn
+            finally:
+                self._pool.putconn(conn)
+
+    def _statement(self, conn, cur, name: str, nparams: int) -> str:
+        postgres_sql, sqlite_sql = STATEMENTS[name]
+        if self.backend == "sqlite":
+            return sqlite_sql
+        with self._pool_lock:
+            prepared = self._prepared.setdefault(conn, set())
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} AS {postgres_sql}")
+            prepared.add(name)
+        if not nparams:
+            return f"EXECUTE {name}"
+        return f"EXECUTE {name} ({', '.join(['%s'] * nparams)})"
+
+    def execute(self, name: str, params: tuple = (), fetch: Optional[str] = None,
+                many: bool = False) -> Any:
+        """Run a named statement; fetch is None, "one", "all" or "lastrowid" """
+        with self._connection() as conn:
+            cur = conn.cursor()
+            try:
+                nparams = len(params[0]) if many and params else len(params)
+                sql = self._statement(conn, cur, name, nparams)
+                if many:
+                    cur.executemany(sql, params)
+                else:
+                    cur.execute(sql, params)
+                if fetch == "all":
+                    result = cur.fetchall()
+                elif fetch == "one":
+                    result = cur.fetchone()
+                elif fetch == "lastrowid":
+                    result = cur.fetchone()[0] if self.backend == "postgres" else cur.lastrowid
+                else:
+                    result = None
+                conn.commit()
+                return result
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cur.close()
+
+    def ping(self):
+        """Open a connection to verify the database is reachable"""
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.close()
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    # Queries (async)
+
+    async def recent_builds(self, limit: int) -> List[tuple]:
+        """(component, status, duration, date) of the most recent builds"""
+        return await self._run(self.execute, "recent_builds", (limit,), "all")
+
+    async def component_history(self, component: str, limit: int) -> List[tuple]:
+        """(status, duration, date, platform, profile) of one component"""
+        return await self._run(self.execute, "component_history", (component, limit), "all")
+
+    async def build_metrics(self, days: int) -> tuple:
+        """(total, successful, average duration) over the last `days` days"""
+        return await self._run(self.execute, "build_metrics", (days,), "one")
+
+    # Build events (sync, used from build tools)
+
+    def start_build(self, component: str, build_type: str = "build",
+                    platform: str = "unknown", compiler: str = "unknown") -> str:
+        """Record a running build and return its ID"""
+        build_id = self.execute(
+            "start_build", (component, build_type, platform, compiler, "running"), "lastrowid"
+        )
+        return str(build_id)
+
+    def finish_build(self, build_id: str, status: str, error: Optional[str] = None):
+        """Queue a build completion; written with the next batch"""
+        with self._pending_lock:
+            self._pending.append((status, error, build_id))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write all queued build updates in one transaction"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self.execute("finish_build", pending, many=True)
+
+    def close(self):
+        """Flush pending updates and release all connections"""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+            with self._pool_lock:
+                conns, self._sqlite_conns = self._sqlite_conns, []
+            for conn in conns:
+                conn.close()
+            self._local = threading.local()
+
+
+_shared_store: Optional[BuildTrackingStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_build_store(**kwargs) -> BuildTrackingStore:
+    """Process-wide store shared by servers and builders"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = BuildTrackingStore.from_env(**kwargs)
+        return _shared_store
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Append-only build metrics store.
+
+Build reports (``performance_report.json`` in each ``openssl-{profile}-{os}``
+artifact directory) are ingested once into a SQLite table, one row per
+build and run. Each report's size and mtime are recorded, so a repeated
+ingest of the same artifacts directory only parses new or changed reports,
+and historical runs are never parsed again. Aggregates - totals, build time
+percentiles, cache-hit ratios, per-profile trends across runs - are answered
+by indexed queries over the stored rows.
+"""
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+REPORT_FILE = 'performance_report.json'
+PERCENTILES = (50, 90, 95)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT UNIQUE NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS builds (
+    run_seq INTEGER NOT NULL REFERENCES runs(seq),
+    artifact TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    os TEXT NOT NULL,
+    status TEXT NOT NULL,
+    build_time NUMERIC NOT NULL,
+    cache_hit INTEGER NOT NULL,
+    packages INTEGER NOT NULL,
+    report_size INTEGER NOT NULL,
+    report_mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (run_seq, artifact)
+);
+CREATE INDEX IF NOT EXISTS builds_profile ON builds (profile, run_seq);
+"""
+
+
+def parse_artifact_name(name: str) -> Tuple[str, str]:
+    """Split an ``openssl-{profile}-{os}`` artifact directory name into (profile, os)."""
+    parts = name.split('-')
+    if len(parts) >= 3:
+        return '-'.join(parts[1:-1]), parts[-1]
+    return 'unknown', 'unknown'
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class BuildMetricsStore:
+    """SQLite-backed, append-only store of per-build CI metrics."""
+
+    def __init__(self, db_path: Union[str, Path] = ':memory:'):
+        """
+        Open (and create if needed) the metrics database.
+
+        Args:
+            db_path: SQLite database file; ``:memory:`` keeps metrics for this
+                process only
+        """
+        if db_path != ':memory:':
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _run_seq(self, run_id: str) -> int:
+        self._conn.execute(
+            'INSERT OR IGNORE INTO runs (run_id, created_at) VALUES (?, ?)', (run_id, time.time())
+        )
+        return self._conn.execute('SELECT seq FROM runs WHERE run_id = ?', (run_id,)).fetchone()[0]
+
+    def _lookup_run(self, run_id: Optional[str]) -> Optional[int]:
+        if run_id is None:
+            row = self._conn.execute('SELECT MAX(seq) FROM runs').fetchone()
+        else:
+            row = self._conn.execute('SELECT seq FROM runs WHERE run_id = ?', (run_id,)).fetchone()
+        return row[0] if row else None
+
+    def ingest(self, artifacts_dir: Union[str, Path], run_id: str) -> int:
+        """
+        Ingest the build reports of one CI run.
+
+        Reports already stored for this run with the same size and mtime are
+        not parsed again.
+
+        Args:
+            artifacts_dir: Directory containing one subdirectory per artifact
+            run_id: Identifier of the CI run the artifacts belong to
+
+        Returns:
+            Number of reports parsed and stored
+        """
+        with self._lock, self._conn:
+            run_seq = self._run_seq(run_id)
+            known = {
+                artifact: (size, mtime_ns)
+                for artifact, size, mtime_ns in self._conn.execute(
+                    'SELECT artifact, report_size, report_mtime_ns FROM builds WHERE run_seq = ?',
+                    (run_seq,)
+                )
+            }
+
+            rows = []
+            with os.scandir(artifacts_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    report_path = os.path.join(entry.path, REPORT_FILE)
+                    try:
+                        stat = os.stat(report_path)
+                    except OSError:
+                        continue
+                    if known.get(entry.name) == (stat.st_size, stat.st_mtime_ns):
+                        continue
+                    try:
+                        with open(report_path) as f:
+                            report = json.load(f)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Error processing {report_path}: {e}")
+                        continue
+
+                    profile, os_name = parse_artifact_name(entry.name)
+                    rows.append((
+                        run_seq, entry.name, profile, os_name,
+                        report.get('status', 'unknown'),
+                        report.get('build_time', 0),
+                        1 if report.get('cache_hit', False) else 0,
+                        report.get('packages', 0),
+                        stat.st_size, stat.st_mtime_ns
+                    ))
+
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows
+            )
+        return len(rows)
+
+    def run_summary(self, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Aggregate the builds of one run (the latest run by default).
+
+        Returns:
+            ``total_jobs``, ``successful_jobs``, ``failed_jobs``, the per-build
+            rows in ``builds`` and a ``performance`` dict with totals, average,
+            percentiles and cache-hit ratio of the build times
+        """
+        summary = {
+            'total_jobs': 0,
+            'successful_jobs': 0,
+            'failed_jobs': 0,
+            'builds': [],
+            'performance': {
+                'total_build_time': 0,
+                'average_build_time': 0,
+                'cache_hits': 0,
+                'cache_misses': 0,
+                'cache_hit_rate': 0,
+                **{f'p{pct}_build_time': 0 for pct in PERCENTILES}
+            }
+        }
+        with self._lock:
+            run_seq = self._lookup_run(run_id)
+            if run_seq is None:
+                return summary
+            total, successful, total_time, cache_hits = self._conn.execute(
+                """SELECT COUNT(*), COUNT(CASE WHEN status = 'success' THEN 1 END),
+                          COALESCE(SUM(build_time), 0), COALESCE(SUM(cache_hit), 0)
+                   FROM builds WHERE run_seq = ?""",
+                (run_seq,)
+            ).fetchone()
+            rows = self._conn.execute(
+                """SELECT profile, os, status, build_time, cache_hit, packages
+                   FROM builds WHERE run_seq = ? ORDER BY artifact""",
+                (run_seq,)
+            ).fetchall()
+            times = [t for (t,) in self._conn.execute(
+                'SELECT build_time FROM builds WHERE run_seq = ? ORDER BY build_time', (run_seq,)
+            )]
+
+        summary['total_jobs'] = total
+        summary['successful_jobs'] = successful
+        summary['failed_jobs'] = total - successful
+        summary['builds'] = [
+            {'profile': profile, 'os': os_name, 'status': status, 'build_time': build_time,
+             'cache_hit': bool(cache_hit), 'packages': packages}
+            for profile, os_name, status, build_time, cache_hit, packages in rows
+        ]
+        performance = summary['performance']
+        performance['total_build_time'] = total_time
+        performance['cache_hits'] = cache_hits
+        performance['cache_misses'] = total - cache_hits
+        if total:
+            performance['average_build_time'] = total_time / total
+            performance['cache_hit_rate'] = cache_hits / total
+        for pct in PERCENTILES:
+            performance[f'p{pct}_build_time'] = _percentile(times, pct)
+        return summary
+
+    def profile_trends(self, runs: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Per-profile average build time and cache-hit ratio over recent runs.
+
+        Args:
+            runs: Number of most recent runs to include
+
+        Returns:
+            Profile -> list of per-run points, oldest run first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT b.profile, r.run_id, AVG(b.build_time), AVG(b.cache_hit), COUNT(*)
+                   FROM builds b JOIN runs r ON b.run_seq = r.seq
+                   WHERE b.run_seq > (SELECT COALESCE(MAX(seq), 0) FROM runs) - ?
+                   GROUP BY b.profile, b.run_seq ORDER BY b.profile, b.run_seq""",
+                (runs,)
+            ).fetchall()
+        trends: Dict[str, List[Dict[str, Any]]] = {}
+        for profile, run_id, avg_time, hit_ratio, builds in rows:
+            trends.setdefault(profile, []).append({
+                'run_id': run_id,
+                'average_build_time': avg_time,
+                'cache_hit_rate': hit_ratio,
+                'builds': builds
+            })
+        return trends
+
+    def run_count(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
@@ -9,7 +9,6 @@ Reports build results back to the OpenSSL repository using GitHub APIs:
 """
 
 import argparse
-import json
 import os
 import sys
 import time
@@ -17,91 +16,37 @@ from typing import Dict, List, Any, Optional
 from github import Github
 from github.GithubException import GithubException
 
+from openssl_tools.monitoring.metrics_store import PERCENTILES, BuildMetricsStore
+
 
 class StatusReporter:
     """Reports build status back to OpenSSL repository."""
     
-    def __init__(self, github_token: str, max_retries: int = 3, retry_delay: float = 1.0):
-        """Initialize with GitHub API token and retry configuration."""
+    def __init__(self, github_token: str, max_retries: int = 3, retry_delay: float = 1.0,
+                 metrics_db: Optional[str] = None, trend_runs: int = 10):
+        """Initialize with GitHub API token, retry configuration and metrics database."""
         self.github = Github(github_token)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.metrics = BuildMetricsStore(metrics_db or ':memory:')
+        self.trend_runs = trend_runs
     
-    def analyze_artifacts(self, artifacts_dir: str) -> Dict[str, Any]:
-        """Analyze build artifacts and generate summary."""
-        results = {
-            'total_jobs': 0,
-            'successful_jobs': 0,
-            'failed_jobs': 0,
-            'builds': [],
-            'performance': {
-                'total_build_time': 0,
-                'average_build_time': 0,
-                'cache_hits': 0,
-                'cache_misses': 0
-            }
-        }
+    def analyze_artifacts(self, artifacts_dir: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Ingest new build reports into the metrics store and summarize the run.
+        
+        Only reports not yet stored for this run are parsed; earlier runs in a
+        persistent metrics database provide the per-profile trends.
+        """
+        run_id = run_id or os.getenv('GITHUB_RUN_ID') or 'local'
         
         if not os.path.exists(artifacts_dir):
             print(f"Warning: Artifacts directory {artifacts_dir} not found", file=sys.stderr)
-            return results
-        
-        # Process each artifact
-        for item in os.listdir(artifacts_dir):
-            item_path = os.path.join(artifacts_dir, item)
-            if not os.path.isdir(item_path):
-                continue
-            
-            # Look for performance reports
-            perf_file = os.path.join(item_path, 'performance_report.json')
-            if os.path.exists(perf_file):
-                try:
-                    with open(perf_file) as f:
-                        perf_data = json.load(f)
-                    
-                    # Extract build info from directory name
-                    # Format: openssl-{profile}-{os}
-                    parts = item.split('-')
-                    if len(parts) >= 3:
-                        profile = '-'.join(parts[1:-1])
-                        os_name = parts[-1]
-                    else:
-                        profile = 'unknown'
-                        os_name = 'unknown'
-                    
-                    build_info = {
-                        'profile': profile,
-                        'os': os_name,
-                        'status': perf_data.get('status', 'unknown'),
-                        'build_time': perf_data.get('build_time', 0),
-                        'cache_hit': perf_data.get('cache_hit', False),
-                        'packages': perf_data.get('packages', 0)
-                    }
-                    
-                    results['builds'].append(build_info)
-                    results['total_jobs'] += 1
-                    
-                    if build_info['status'] == 'success':
-                        results['successful_jobs'] += 1
-                    else:
-                        results['failed_jobs'] += 1
-                    
-                    # Update performance metrics
-                    results['performance']['total_build_time'] += build_info['build_time']
-                    if build_info['cache_hit']:
-                        results['performance']['cache_hits'] += 1
-                    else:
-                        results['performance']['cache_misses'] += 1
-                        
-                except Exception as e:
-                    print(f"Error processing {perf_file}: {e}", file=sys.stderr)
-        
-        # Calculate averages
-        if results['total_jobs'] > 0:
-            results['performance']['average_build_time'] = (
-                results['performance']['total_build_time'] / results['total_jobs']
-            )
+        else:
+            self.metrics.ingest(artifacts_dir, run_id)
         
+        results = self.metrics.run_summary(run_id)
+        results['trends'] = self.metrics.profile_trends(self.trend_runs)
         return results
     
     def _retry_github_api_call(self, func, *args, **kwargs):
@@ -217,6 +162,7 @@ class StatusReporter:
         avg_time = perf['average_build_time']
         cache_hits = perf['cache_hits']
         cache_misses = perf['cache_misses']
+        percentiles = ' / '.join(f"p{pct} {perf[f'p{pct}_build_time']:.1f}s" for pct in PERCENTILES)
         
         summary = f"""## Build Results
         
@@ -224,7 +170,8 @@ class StatusReporter:
 - **Successful**: {success} ✅
 - **Failed**: {failed} {'❌' if failed > 0 else ''}
 - **Average Build Time**: {avg_time:.1f}s
-- **Cache Hit Rate**: {cache_hits}/{cache_hits + cache_misses} ({cache_hits/(cache_hits + cache_misses)*100:.1f}% if total > 0 else 0%)
+- **Build Time Percentiles**: {percentiles}
+- **Cache Hit Rate**: {cache_hits}/{cache_hits + cache_misses} ({perf['cache_hit_rate']*100:.1f}%)
 
 """
         return summary
@@ -253,6 +200,17 @@ class StatusReporter:
         text += f"- **Average Build Time**: {results['performance']['average_build_time']:.1f}s\n"
         text += f"- **Cache Hits**: {results['performance']['cache_hits']}\n"
         text += f"- **Cache Misses**: {results['performance']['cache_misses']}\n"
+        for pct in PERCENTILES:
+            text += f"- **p{pct} Build Time**: {results['performance'][f'p{pct}_build_time']:.1f}s\n"
+        
+        trends = results.get('trends', {})
+        if any(len(points) > 1 for points in trends.values()):
+            text += "\n## Profile Trends\n\n"
+            text += "| Profile | Runs | Average Build Time (oldest → latest) | Cache Hit Rate |\n"
+            text += "|---------|------|--------------------------------------|----------------|\n"
+            for profile, points in sorted(trends.items()):
+                times = " → ".join(f"{point['average_build_time']:.1f}s" for point in points)
+                text += f"| {profile} | {len(points)} | {times} | {points[-1]['cache_hit_rate']*100:.0f}% |\n"
         
         return text
     
@@ -301,7 +259,7 @@ class StatusReporter:
 - **Successful**: {success}
 - **Failed**: {failed}
 - **Average Build Time**: {results['performance']['average_build_time']:.1f}s
-- **Cache Hit Rate**: {results['performance']['cache_hits']}/{results['performance']['cache_hits'] + results['performance']['cache_misses']} ({results['performance']['cache_hits']/(results['performance']['cache_hits'] + results['performance']['cache_misses'])*100:.1f}% if total > 0 else 0%)
+- **Cache Hit Rate**: {results['performance']['cache_hits']}/{results['performance']['cache_hits'] + results['performance']['cache_misses']} ({results['performance']['cache_hit_rate']*100:.1f}%)
 
 ### Build Details
 | Profile | OS | Status | Build Time | Cache | Packages |
@@ -331,6 +289,9 @@ def main() -> None:
     parser.add_argument('--github-token', help='GitHub token (or use GITHUB_TOKEN env var)')
     parser.add_argument('--max-retries', type=int, default=3, help='Maximum retry attempts for GitHub API calls')
     parser.add_argument('--retry-delay', type=float, default=1.0, help='Initial retry delay in seconds')
+    parser.add_argument('--metrics-db', default=os.getenv('OPENSSL_METRICS_DB'),
+                        help='SQLite metrics history database (or use OPENSSL_METRICS_DB env var)')
+    parser.add_argument('--run-id', help='CI run identifier (default: GITHUB_RUN_ID)')
     
     args = parser.parse_args()
     
@@ -342,10 +303,10 @@ def main() -> None:
     
     try:
         # Initialize reporter with retry configuration
-        reporter = StatusReporter(github_token, args.max_retries, args.retry_delay)
+        reporter = StatusReporter(github_token, args.max_retries, args.retry_delay, args.metrics_db)
         
         # Analyze artifacts
-        results = reporter.analyze_artifacts(args.artifacts_dir)
+        results = reporter.analyze_artifacts(args.artifacts_dir, args.run_id)
         print(f"Analyzed {results['total_jobs']} builds: {results['successful_jobs']} successful, {results['failed_jobs']} failed", file=sys.stderr)
         
         # Create status check
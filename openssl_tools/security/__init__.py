@@ -4,8 +4,12 @@ OpenSSL Tools Security Module
 Security and compliance utilities for OpenSSL packages.
 """
 
-from .sbom_generator import generate_openssl_sbom
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     'generate_openssl_sbom'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "generate_openssl_sbom": ".sbom_generator",
+})
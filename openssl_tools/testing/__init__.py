@@ -11,10 +11,7 @@ Classes:
     FuzzManager: Manages fuzz testing and corpora
 """
 
-from .quality_manager import CodeQualityManager
-from .test_harness import NgapyTestHarness
-from .schema_validator import DatabaseSchemaValidator
-from .fuzz_manager import FuzzCorporaManager
+from openssl_tools._lazy import lazy_exports
 
 __all__ = [
     "CodeQualityManager",
@@ -22,3 +19,10 @@ __all__ = [
     "DatabaseSchemaValidator",
     "FuzzCorporaManager",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "CodeQualityManager": ".quality_manager",
+    "NgapyTestHarness": ".test_harness",
+    "DatabaseSchemaValidator": ".schema_validator",
+    "FuzzCorporaManager": ".fuzz_manager",
+})
@@ -3,29 +3,23 @@ OpenSSL Tools Utilities Module
 Utility functions for OpenSSL development tools
 """
 
+from openssl_tools._lazy import lazy_exports
+
+# Imported eagerly: the function shares its name with its (stdlib-only) module
 from .execute_command import execute_command, execute_command_with_output
-from .copy_tools import ensure_target_exists, get_file_metadata, copy_file, copy_folder, remove_directory_tree
-from .file_operations import (
-    find_first_existing_file, 
-    find_executable_in_path, 
-    symlink_with_check, 
-    remove_directory_tree
-)
-from .custom_logging import setup_logging_from_config
-from .conan_python_env import (
-    ConanPythonEnvironment, 
-    setup_conan_python_environment,
-    get_conan_python_interpreter,
-    validate_conan_python_environment
-)
 
 __all__ = [
     'execute_command',
     'execute_command_with_output',
+    'run_process',
+    'ProcessResult',
     'ensure_target_exists',
     'get_file_metadata',
+    'hash_file',
     'copy_file',
     'copy_folder',
+    'sync_folder',
+    'SyncReport',
     'remove_directory_tree',
     'find_first_existing_file',
     'find_executable_in_path',
@@ -35,4 +29,25 @@ __all__ = [
     'setup_conan_python_environment',
     'get_conan_python_interpreter',
     'validate_conan_python_environment'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "run_process": ".process_runner",
+    "ProcessResult": ".process_runner",
+    "ensure_target_exists": ".copy_tools",
+    "get_file_metadata": ".copy_tools",
+    "hash_file": ".copy_tools",
+    "copy_file": ".copy_tools",
+    "copy_folder": ".copy_tools",
+    "sync_folder": ".copy_tools",
+    "SyncReport": ".copy_tools",
+    "remove_directory_tree": ".file_operations",
+    "find_first_existing_file": ".file_operations",
+    "find_executable_in_path": ".file_operations",
+    "symlink_with_check": ".file_operations",
+    "setup_logging_from_config": ".custom_logging",
+    "ConanPythonEnvironment": ".conan_python_env",
+    "setup_conan_python_environment": ".conan_python_env",
+    "get_conan_python_interpreter": ".conan_python_env",
+    "validate_conan_python_environment": ".conan_python_env",
+})
@@ -2,36 +2,241 @@
 """
 OpenSSL Tools Copy Utilities
 Based on openssl-tools patterns for file operations
+
+Folder copies are incremental: source and destination trees are compared by
+(size, mtime) manifests, falling back to a streamed content hash when only
+the mtime differs, and only changed files are copied - in parallel, through
+a temporary file that is atomically renamed into place. File data is cloned
+(reflink) or copied in the kernel with copy_file_range where available.
 """
 
 import hashlib
 import logging
+import mmap
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 log = logging.getLogger('__main__.' + __name__)
 
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# FICLONE ioctl (linux/fs.h); exported by fcntl only from Python 3.12
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if sys.platform.startswith('linux') else None
+
 
 def ensure_target_exists(target):
     """Ensure target directory exists"""
     os.makedirs(os.path.dirname(target), exist_ok=True)
 
 
+def hash_file(filepath, algorithm='md5'):
+    """Hash a file without loading it into memory: mmap for large files, chunked reads otherwise"""
+    digest = hashlib.new(algorithm)
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, HASH_CHUNK_SIZE):
+                        digest.update(view[offset:offset + HASH_CHUNK_SIZE])
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                digest.update(view[:read])
+    return digest.hexdigest()
+
+
 def get_file_metadata(filepath):
     """Get file metadata including MD5 hash"""
-    with open(filepath, 'rb') as f:
-        content = f.read()
-        md5_hash = hashlib.md5(content).hexdigest()
-    
     stat = os.stat(filepath)
     return {
-        'MD5': md5_hash,
+        'MD5': hash_file(filepath, 'md5'),
         'size': stat.st_size,
         'mtime': stat.st_mtime
     }
 
 
+def _scan(root, follow_symlinks=True) -> Tuple[List[str], Dict[str, os.stat_result], List[str]]:
+    """
+    Walk root, following directory symlinks as shutil.copytree does
+    :param follow_symlinks: If False, symlinks are listed as links and never descended into
+    :return: Relative directories (parents first), a map of relative file path to stat result
+        and the relative paths of symlinks (only when not following them)
+    """
+    directories, manifest, links = [], {}, []
+    root_stat = os.stat(root)
+    # Each directory carries the (device, inode) of its ancestors, so symlink cycles are not followed
+    stack = [('', frozenset({(root_stat.st_dev, root_stat.st_ino)}))]
+    while stack:
+        relative, ancestors = stack.pop()
+        with os.scandir(os.path.join(root, relative)) as entries:
+            for entry in entries:
+                path = f'{relative}/{entry.name}' if relative else entry.name
+                if not follow_symlinks and entry.is_symlink():
+                    links.append(path)
+                elif entry.is_dir():
+                    stat = entry.stat()
+                    key = (stat.st_dev, stat.st_ino)
+                    if key in ancestors:
+                        log.warning(f"Skipping symlink cycle: {os.path.join(root, path)}")
+                        continue
+                    directories.append(path)
+                    stack.append((path, ancestors | {key}))
+                elif entry.is_file():
+                    manifest[path] = entry.stat()
+    directories.sort()
+    return directories, manifest, links
+
+
+def build_manifest(root, follow_symlinks=True) -> Dict[str, os.stat_result]:
+    """Map every file below root (relative '/'-separated path) to its stat result"""
+    return _scan(root, follow_symlinks)[1]
+
+
+def _clone_file(source, destination):
+    """Copy file data: reflink, then copy_file_range, then a userspace copy"""
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        if FICLONE is not None:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return
+            except OSError:
+                pass
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return
+            except OSError:
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        shutil.copyfileobj(src, dst, HASH_CHUNK_SIZE)
+
+
+def _copy_atomic(source, destination):
+    """Copy source over destination through a temporary file and an atomic rename"""
+    tmp = os.path.join(os.path.dirname(destination), f'.{os.path.basename(destination)}.{os.getpid()}.tmp')
+    try:
+        _clone_file(source, tmp)
+        shutil.copystat(source, tmp)
+        os.replace(tmp, destination)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+@dataclass
+class SyncReport:
+    """Outcome of a folder sync"""
+    copied: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    bytes_copied: int = 0
+
+
+def _needs_copy(source, destination, src_stat, dst_stat) -> bool:
+    if dst_stat is None or src_stat.st_size != dst_stat.st_size:
+        return True
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return False
+    if hash_file(source) != hash_file(destination):
+        return True
+    # Same content, only the timestamp differs: refresh it so the next sync skips the hash
+    shutil.copystat(source, destination)
+    return False
+
+
+def sync_folder(source, destination, jobs=None, delete=True) -> SyncReport:
+    """
+    Make destination an exact copy of source, copying only changed files
+    :param source: Source folder
+    :param destination: Destination folder, created if missing
+    :param jobs: Number of parallel copies (default: CPU count)
+    :param delete: Remove destination files that are not in source
+    :return: SyncReport
+    """
+    source_dirs, source_manifest, _ = _scan(source)
+    # Symlinks in destination are replaced or removed, never followed: deleting through
+    # one would remove files outside destination
+    destination_manifest, destination_links = {}, set()
+    if os.path.isdir(destination):
+        _, destination_manifest, links = _scan(destination, follow_symlinks=False)
+        destination_links = set(links)
+    report = SyncReport()
+
+    # Directory symlinks in source become real directories, the same walk as the manifest
+    for relative in [''] + source_dirs:
+        target_dir = os.path.join(destination, relative)
+        if os.path.islink(target_dir) or os.path.isfile(target_dir):
+            os.remove(target_dir)
+        os.makedirs(target_dir, exist_ok=True)
+
+    def sync_one(item: Tuple[str, os.stat_result]) -> bool:
+        relative, src_stat = item
+        src_path = os.path.join(source, relative)
+        dst_path = os.path.join(destination, relative)
+        if relative not in destination_links and \
+                not _needs_copy(src_path, dst_path, src_stat, destination_manifest.get(relative)):
+            return False
+        if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+            shutil.rmtree(dst_path)
+        _copy_atomic(src_path, dst_path)
+        return True
+
+    items = sorted(source_manifest.items())
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        for (relative, src_stat), copied in zip(items, executor.map(sync_one, items)):
+            if copied:
+                report.copied.append(relative)
+                report.bytes_copied += src_stat.st_size
+            else:
+                report.unchanged.append(relative)
+
+    if delete:
+        for relative in sorted(set(destination_manifest) - set(source_manifest)):
+            try:
+                os.remove(os.path.join(destination, relative))
+            except (FileNotFoundError, NotADirectoryError):  # replaced by a file from source
+                pass
+            report.removed.append(relative)
+        for relative in sorted(destination_links - set(source_manifest)):
+            link = os.path.join(destination, relative)
+            if os.path.islink(link):  # not already replaced by a source directory
+                os.remove(link)
+                report.removed.append(relative)
+        for directory, _, _ in os.walk(destination, topdown=False):
+            if not os.path.isdir(os.path.join(source, os.path.relpath(directory, destination))):
+                shutil.rmtree(directory)
+
+    log.debug(f"Synced folder: {source} -> {destination} (copied {len(report.copied)}, "
+              f"unchanged {len(report.unchanged)}, removed {len(report.removed)})")
+    return report
+
+
 def copy_file(source, destination):
     """Copy file with proper error handling"""
     try:
@@ -44,11 +249,11 @@ def copy_file(source, destination):
 
 
 def copy_folder(source, destination):
-    """Copy folder with proper error handling"""
+    """Copy folder with proper error handling; only files that changed are copied"""
     try:
-        if os.path.exists(destination):
-            shutil.rmtree(destination)
-        shutil.copytree(source, destination)
+        if os.path.exists(destination) and not os.path.isdir(destination):
+            os.remove(destination)
+        sync_folder(source, destination)
         log.debug(f"Copied folder: {source} -> {destination}")
     except Exception as e:
         log.error(f"Failed to copy folder {source} to {destination}: {e}")
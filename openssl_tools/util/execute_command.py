@@ -9,30 +9,36 @@ import subprocess
 import sys
 from pathlib import Path
 
+from .process_runner import run_process
+
 log = logging.getLogger('__main__.' + __name__)
 
 
-def execute_command(command, cwd=None, continuous_print=True, print_out=True, print_command=True, print_err_code=True):
+def execute_command(command, cwd=None, continuous_print=True, print_out=True, print_command=True, print_err_code=True,
+                    log_file=None, on_line=None):
     """
     Execute command with proper error handling and logging
     Based on openssl-tools patterns
+    
+    Output is streamed while the command runs: stdout is printed as it
+    arrives when continuous_print and print_out are set, stderr when
+    print_err_code is set. Every line can also be teed to a rotating
+    log_file and passed to on_line(stream, line).
     """
     if print_command:
         log.info(f"Executing command: {command}")
     
     try:
-        if isinstance(command, str):
-            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, shell=True)
-        else:
-            result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
-        
-        if continuous_print and print_out:
-            print(result.stdout)
-        
-        if result.stderr and print_err_code:
-            print(result.stderr)
-        
-        return result.returncode, result.stdout.splitlines()
+        result = run_process(
+            command,
+            cwd=cwd,
+            echo_stdout=continuous_print and print_out,
+            echo_stderr=print_err_code,
+            log_file=log_file,
+            keep_stdout=True,
+            on_line=on_line
+        )
+        return result.returncode, result.stdout
     except Exception as e:
         log.error(f"Command execution failed: {e}")
         return 1, [str(e)]
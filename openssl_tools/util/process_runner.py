@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+OpenSSL Tools Streaming Process Runner
+Runs a command while pumping stdout and stderr concurrently, line by line
+
+Output is never accumulated as a whole: each line is teed to the console
+and/or a rotating log file, handed to an optional per-line callback (for
+progress parsing), and kept in a bounded tail buffer for error reports.
+Stdout lines are only retained in full when the caller asks for them.
+"""
+
+import logging
+import subprocess
+import sys
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Callable, List, Optional
+
+log = logging.getLogger('__main__.' + __name__)
+
+STDOUT = 'stdout'
+STDERR = 'stderr'
+
+LineCallback = Callable[[str, str], None]
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of run_process"""
+    returncode: int
+    stdout: List[str] = field(default_factory=list)  # only filled with keep_stdout=True
+    stdout_tail: List[str] = field(default_factory=list)
+    stderr_tail: List[str] = field(default_factory=list)
+
+    @property
+    def error_report(self) -> str:
+        """Last lines of both streams, for failure messages"""
+        parts = []
+        if self.stdout_tail:
+            parts.append('STDOUT (tail):\n' + '\n'.join(self.stdout_tail))
+        if self.stderr_tail:
+            parts.append('STDERR (tail):\n' + '\n'.join(self.stderr_tail))
+        return '\n'.join(parts)
+
+
+def _open_log(log_file, max_bytes, backup_count) -> RotatingFileHandler:
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+    return handler
+
+
+def run_process(command, cwd=None, env=None, echo_stdout=True, echo_stderr=True, log_file=None,
+                log_max_bytes=10 * 1024 * 1024, log_backup_count=3, tail_lines=200,
+                keep_stdout=False, on_line: Optional[LineCallback] = None, timeout=None) -> ProcessResult:
+    """
+    Run command, streaming both pipes without buffering the whole output
+    :param command: Command string (run through the shell) or argument list
+    :param cwd: Working directory
+    :param env: Environment for the process
+    :param echo_stdout: Print stdout lines to the console as they arrive
+    :param echo_stderr: Print stderr lines to the console as they arrive
+    :param log_file: Also append every line to this rotating log file
+    :param log_max_bytes: Size at which the log file is rotated
+    :param log_backup_count: Number of rotated log files to keep
+    :param tail_lines: Lines of each stream kept for error reports
+    :param keep_stdout: Retain all stdout lines in the result (for callers that parse it)
+    :param on_line: Called as on_line(stream, line) for every line, stream being 'stdout' or 'stderr'
+    :param timeout: Seconds before the process is killed and TimeoutExpired raised
+    :return: ProcessResult
+    """
+    handler = _open_log(log_file, log_max_bytes, log_backup_count) if log_file else None
+    if handler:
+        handler.handle(logging.makeLogRecord({'name': 'command', 'msg': f'$ {command}'}))
+
+    tails = {STDOUT: deque(maxlen=tail_lines), STDERR: deque(maxlen=tail_lines)}
+    echo = {STDOUT: sys.stdout if echo_stdout else None, STDERR: sys.stderr if echo_stderr else None}
+    stdout_lines: List[str] = []
+    output_lock = threading.Lock()
+
+    process = subprocess.Popen(
+        command, cwd=cwd, env=env, shell=isinstance(command, str),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, errors='replace', bufsize=1
+    )
+
+    def pump(stream_name, pipe):
+        with pipe:
+            for line in pipe:
+                line = line.rstrip('\r\n')
+                tails[stream_name].append(line)
+                if keep_stdout and stream_name == STDOUT:
+                    stdout_lines.append(line)
+                console = echo[stream_name]
+                if console is not None or handler is not None:
+                    with output_lock:
+                        if console is not None:
+                            print(line, file=console, flush=True)
+                        if handler is not None:
+                            handler.handle(logging.makeLogRecord({'name': stream_name, 'msg': line}))
+                if on_line is not None:
+                    try:
+                        on_line(stream_name, line)
+                    except Exception as e:
+                        log.debug(f"Line callback failed: {e}")
+
+    pumps = [
+        threading.Thread(target=pump, args=(STDOUT, process.stdout), daemon=True),
+        threading.Thread(target=pump, args=(STDERR, process.stderr), daemon=True),
+    ]
+    for thread in pumps:
+        thread.start()
+
+    try:
+        returncode = process.wait(timeout=timeout)
+        for thread in pumps:
+            thread.join()
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        # Grandchildren of a shell may still hold the pipes open
+        for thread in pumps:
+            thread.join(timeout=5)
+        raise
+    finally:
+        if handler:
+            handler.handle(logging.makeLogRecord({'name': 'command', 'msg': f'exit code {process.returncode}'}))
+            handler.close()
+
+    return ProcessResult(
+        returncode=returncode,
+        stdout=stdout_lines,
+        stdout_tail=list(tails[STDOUT]),
+        stderr_tail=list(tails[STDERR]),
+    )
@@ -18,13 +18,16 @@ from typing import Dict, List, Optional, Tuple
 import yaml
 import requests
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from openssl_tools.automation.continuous_integration.health_probe import HealthCheckEngine
+from openssl_tools.automation.deployment.upload_pipeline import UploadPipeline
+
 
 class DeploymentManager:
     """Deployment manager for OpenSSL packages"""
     
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or Path("scripts/ci/ci_config.yaml")
-        self.config = self._load_config()
         
         # Configure logging
         logging.basicConfig(
@@ -33,6 +36,8 @@ class DeploymentManager:
         )
         self.logger = logging.getLogger(__name__)
         
+        self.config = self._load_config()
+        
         # Deployment state
         self.deployment_state = {
             "start_time": datetime.now().isoformat(),
@@ -123,8 +128,8 @@ class DeploymentManager:
                 
         return True
         
-    def upload_packages(self, packages: List[Path], environment: str) -> bool:
-        """Upload packages to registry"""
+    def upload_packages(self, packages: List[Path], environment: str, max_parallel: Optional[int] = None) -> bool:
+        """Upload packages to registry, at most max_parallel (or upload_concurrency) at a time"""
         self.logger.info(f"Uploading {len(packages)} packages to {environment}")
         
         env_config = self.config.get("deployment", {}).get("environments", {}).get(environment)
@@ -138,22 +143,39 @@ class DeploymentManager:
         if not self._setup_conan_remote(remote_name, registry_url):
             return False
             
-        # Upload packages
+        # Binary packages of one recipe share a reference; upload each reference once
+        references = {}
+        for package_path in packages:
+            package_ref = self._extract_package_reference(package_path)
+            if not package_ref:
+                self.logger.error(f"Could not extract package reference from {package_path}")
+            references[package_path] = package_ref
+            
+        # Upload packages concurrently
+        pipeline = UploadPipeline(
+            self._conan_upload,
+            registry_limits={remote_name: max_parallel or env_config.get("upload_concurrency", 4)},
+            retries=env_config.get("upload_retries", 1),
+            log=lambda message, level="INFO": self.logger.log(
+                logging.WARNING if level == "WARN" else getattr(logging, level, logging.INFO), message
+            )
+        )
+        unique_refs = list(dict.fromkeys(ref for ref in references.values() if ref))
+        results = {result.component: result for result in pipeline.run(unique_refs, [remote_name])}
+        
         success_count = 0
         for package_path in packages:
-            if self._upload_single_package(package_path, remote_name):
+            result = results.get(references[package_path])
+            uploaded = result is not None and result.status == "success"
+            if uploaded:
                 success_count += 1
-                self.deployment_state["packages"].append({
-                    "path": str(package_path),
-                    "status": "uploaded",
-                    "timestamp": datetime.now().isoformat()
-                })
-            else:
-                self.deployment_state["packages"].append({
-                    "path": str(package_path),
-                    "status": "failed",
-                    "timestamp": datetime.now().isoformat()
-                })
+            elif result is not None:
+                self.logger.error(f"Failed to upload package {package_path}: {result.error}")
+            self.deployment_state["packages"].append({
+                "path": str(package_path),
+                "status": "uploaded" if uploaded else "failed",
+                "timestamp": datetime.now().isoformat()
+            })
                 
         self.logger.info(f"Successfully uploaded {success_count}/{len(packages)} packages")
         return success_count == len(packages)
@@ -177,28 +199,18 @@ class DeploymentManager:
             self.logger.error(f"Failed to set up Conan remote: {e.stderr}")
             return False
             
-    def _upload_single_package(self, package_path: Path, remote_name: str) -> bool:
-        """Upload a single package"""
-        try:
-            # Extract package reference from conaninfo.txt
-            package_ref = self._extract_package_reference(package_path)
-            if not package_ref:
-                self.logger.error(f"Could not extract package reference from {package_path}")
-                return False
-                
-            # Upload package
-            result = subprocess.run([
-                "conan", "upload", package_ref,
-                "--remote", remote_name,
-                "--confirm"
-            ], capture_output=True, text=True, check=True)
-            
-            self.logger.info(f"Successfully uploaded {package_ref}")
-            return True
+    def _conan_upload(self, package_ref: str, remote_name: str):
+        """Upload a single package reference; raises RuntimeError on failure"""
+        result = subprocess.run([
+            "conan", "upload", package_ref,
+            "--remote", remote_name,
+            "--confirm"
+        ], capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"conan upload exited with {result.returncode}")
             
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to upload package {package_path}: {e.stderr}")
-            return False
+        self.logger.info(f"Successfully uploaded {package_ref}")
             
     def _extract_package_reference(self, package_path: Path) -> Optional[str]:
         """Extract package reference from conaninfo.txt"""
@@ -242,108 +254,22 @@ class DeploymentManager:
             self.logger.info("No health checks configured")
             return True
             
-        all_passed = True
-        for check in health_checks:
-            if not self._run_single_health_check(check):
-                all_passed = False
-                
-        return all_passed
-        
-    def _run_single_health_check(self, check_config: Dict) -> bool:
-        """Run a single health check"""
-        check_type = check_config.get("type")
-        check_name = check_config.get("name", "unnamed")
-        
-        self.logger.info(f"Running health check: {check_name}")
-        
-        try:
-            if check_type == "http":
-                return self._run_http_health_check(check_config)
-            elif check_type == "conan":
-                return self._run_conan_health_check(check_config)
-            elif check_type == "command":
-                return self._run_command_health_check(check_config)
-            else:
-                self.logger.warning(f"Unknown health check type: {check_type}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Health check '{check_name}' failed: {e}")
-            return False
-            
-    def _run_http_health_check(self, check_config: Dict) -> bool:
-        """Run HTTP health check"""
-        url = check_config.get("url")
-        expected_status = check_config.get("expected_status", 200)
-        timeout = check_config.get("timeout", 30)
-        
-        try:
-            response = requests.get(url, timeout=timeout)
-            success = response.status_code == expected_status
-            
-            if success:
-                self.logger.info(f"HTTP health check passed: {url}")
+        # All checks run concurrently, each probed health_probes times
+        remote_urls = {env_config.get("conan_remote", f"{environment}-remote"): env_config.get("registry_url")}
+        with HealthCheckEngine(remote_urls=remote_urls) as engine:
+            reports = engine.run_sync(health_checks, env_config.get("health_probes", 1))
+            
+        self.deployment_state["health_checks"] = [report.to_dict() for report in reports]
+        for report in reports:
+            latency = report.latency_percentiles()
+            summary = f"{report.name} ({len(report.probes)} probes, p50 {latency['p50']:.3f}s, p99 {latency['p99']:.3f}s)"
+            if report.passed:
+                self.logger.info(f"Health check passed: {summary}")
             else:
-                self.logger.error(f"HTTP health check failed: {url} (status: {response.status_code})")
+                last_error = report.to_dict()["last_error"]
+                self.logger.error(f"Health check failed: {summary}, {report.failures} failed: {last_error}")
                 
-            return success
-            
-        except Exception as e:
-            self.logger.error(f"HTTP health check failed: {url} - {e}")
-            return False
-            
-    def _run_conan_health_check(self, check_config: Dict) -> bool:
-        """Run Conan health check"""
-        package_ref = check_config.get("package_reference")
-        remote = check_config.get("remote", "conancenter")
-        
-        try:
-            result = subprocess.run([
-                "conan", "search", package_ref,
-                "--remote", remote
-            ], capture_output=True, text=True, check=True)
-            
-            success = package_ref in result.stdout
-            
-            if success:
-                self.logger.info(f"Conan health check passed: {package_ref}")
-            else:
-                self.logger.error(f"Conan health check failed: {package_ref} not found")
-                
-            return success
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Conan health check failed: {package_ref} - {e.stderr}")
-            return False
-            
-    def _run_command_health_check(self, check_config: Dict) -> bool:
-        """Run command health check"""
-        command = check_config.get("command")
-        expected_output = check_config.get("expected_output")
-        timeout = check_config.get("timeout", 30)
-        
-        try:
-            result = subprocess.run(
-                command.split(),
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            
-            success = result.returncode == 0
-            if expected_output:
-                success = success and expected_output in result.stdout
-                
-            if success:
-                self.logger.info(f"Command health check passed: {command}")
-            else:
-                self.logger.error(f"Command health check failed: {command}")
-                
-            return success
-            
-        except Exception as e:
-            self.logger.error(f"Command health check failed: {command} - {e}")
-            return False
+        return all(report.passed for report in reports)
             
     def send_notifications(self, environment: str, success: bool):
         """Send deployment notifications"""
@@ -444,6 +370,8 @@ def main():
                        help='Perform dry run without actual deployment')
     parser.add_argument('--skip-health-checks', action='store_true',
                        help='Skip health checks after deployment')
+    parser.add_argument('--upload-concurrency', type=int,
+                       help='Maximum concurrent package uploads (default: upload_concurrency from config, or 4)')
     
     args = parser.parse_args()
     
@@ -468,7 +396,7 @@ def main():
             
         # Upload packages
         deployer.logger.info(f"Starting deployment to {args.environment}")
-        upload_success = deployer.upload_packages(packages, args.environment)
+        upload_success = deployer.upload_packages(packages, args.environment, args.upload_concurrency)
         
         if not upload_success:
             deployer.logger.error("Package upload failed")
@@ -207,8 +207,7 @@ class DependencyResolver:
             with tempfile.TemporaryDirectory() as temp_dir:
                 archive_path = os.path.join(temp_dir, "conan.tar.gz")
                 
-                print(f"📥 Downloading Conan from {spec['url']}")
-                urllib.request.urlretrieve(spec['url'], archive_path)
+                self._fetch(spec['url'], archive_path)
                 
                 # Verify checksum
                 if self.config.validate_signatures:
@@ -245,8 +244,7 @@ class DependencyResolver:
             with tempfile.TemporaryDirectory() as temp_dir:
                 archive_path = os.path.join(temp_dir, f"{name}.tar.gz")
                 
-                print(f"📥 Downloading {name} from {spec['url']}")
-                urllib.request.urlretrieve(spec['url'], archive_path)
+                self._fetch(spec['url'], archive_path)
                 
                 # Verify checksum
                 if self.config.validate_signatures:
@@ -269,6 +267,32 @@ class DependencyResolver:
             print(f"❌ Failed to install {name}: {e}")
             return False
     
+    def _fetch(self, url: str, archive_path: str):
+        """Download url to archive_path, reading it from the download cache when present"""
+        if self.config.cache_dir:
+            cached = Path(self.config.cache_dir) / url.rsplit("/", 1)[-1]
+            if cached.is_file():
+                print(f"📦 Using cached {cached.name}")
+                shutil.copyfile(cached, archive_path)
+                return
+        
+        print(f"📥 Downloading {url}")
+        urllib.request.urlretrieve(url, archive_path)
+    
+    def seed_cache(self, cache_dir: Path) -> List[Path]:
+        """Download every dependency archive into cache_dir (skipping those already there)"""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        seeded = []
+        for name, spec in self.dependencies.items():
+            cached = cache_dir / spec['url'].rsplit("/", 1)[-1]
+            if not cached.is_file():
+                print(f"📥 Caching {name} from {spec['url']}")
+                partial = cached.with_name(cached.name + ".part")
+                urllib.request.urlretrieve(spec['url'], partial)
+                os.replace(partial, cached)
+            seeded.append(cached)
+        return seeded
+    
     def _verify_checksum(self, file_path: str, expected_checksum: str) -> bool:
         """Verify file checksum"""
         try:
@@ -694,6 +718,9 @@ def main():
     parser.add_argument("--no-validation", action="store_true", help="Disable validation")
     parser.add_argument("--no-pip", action="store_true", help="Disable pip fallback for dependency resolution")
     parser.add_argument("--check", action="store_true", help="Check installation status without installing")
+    parser.add_argument("--cache-dir", type=Path, help="Read dependency archives from this download cache")
+    parser.add_argument("--seed-cache", type=Path, metavar="DIR",
+                       help="Download all dependency archives into DIR and exit")
     
     args = parser.parse_args()
     
@@ -724,9 +751,20 @@ def main():
         force_reinstall=args.force,
         enable_rollback=not args.no_rollback,
         validate_signatures=not args.no_validation,
-        no_pip=args.no_pip
+        no_pip=args.no_pip,
+        cache_dir=args.cache_dir
     )
     
+    # Seed the shared download cache only
+    if args.seed_cache:
+        try:
+            seeded = DependencyResolver(config).seed_cache(args.seed_cache)
+        except (OSError, urllib.error.URLError) as e:
+            print(f"❌ Failed to seed download cache: {e}")
+            sys.exit(1)
+        print(f"✅ Download cache ready: {len(seeded)} archives in {args.seed_cache}")
+        sys.exit(0)
+    
     # Run bootstrap
     bootstrap = OpenSSLConanBootstrap(config)
     success = bootstrap.run()
@@ -4,11 +4,15 @@ OpenSSL Conan Functions
 Advanced Conan functions for OpenSSL project
 """
 
+import atexit
+import hashlib
+import json
 import logging
 import os
 import re
 import sys
 import tempfile
+import weakref
 from datetime import datetime, timedelta
 from functools import cache
 from pathlib import Path
@@ -88,6 +92,17 @@ def get_conan_home():
         return return_string[-1], Path.home() / '.conan2'
 
 
+def get_conan_cache_home() -> Path:
+    """Conan home resolved from the environment, as Conan does, without starting Conan
+
+    CONAN_HOME (Conan 2) wins, then CONAN_USER_HOME/.conan, then ~/.conan.
+    Used for this module's own files, so cache hits never spawn a process.
+    """
+    if os.environ.get('CONAN_HOME'):
+        return Path(os.path.expanduser(os.environ['CONAN_HOME']))
+    return Path(os.path.expanduser(os.environ.get('CONAN_USER_HOME') or '~')) / '.conan'
+
+
 def get_all_packages_in_cache() -> list:
     """Get all packages in Conan cache"""
     rc, return_string = execute_command(f'{get_default_conan()} search --raw')
@@ -102,13 +117,147 @@ def remove_conan_package_in_cache(package_name):
     return execute_command(f'{get_default_conan()} remove {package_name} --force')
 
 
+def get_configuration_cache_dir() -> Path:
+    """Directory holding resolved configurations keyed by content hash"""
+    return get_conan_cache_home() / 'openssl_configuration_cache'
+
+
+def invalidate_cached_configurations(package_names, cache_dir=None):
+    """Drop cached configurations that resolve any of package_names (name/version)"""
+    removed = set(package_names)
+    if not removed:
+        return
+    try:
+        cache_dir = Path(cache_dir) if cache_dir else get_configuration_cache_dir()
+        cache_files = list(cache_dir.glob('*.json'))
+    except (OSError, OpenSSLRuntimeError):
+        return
+    for cache_file in cache_files:
+        try:
+            with open(cache_file, 'r') as stream:
+                packages = json.load(stream).get('packages', {}).values()
+            if any(f'{name}/{version}' in removed for name, version, _ in packages):
+                cache_file.unlink()
+        except (OSError, ValueError, TypeError):
+            continue
+
+
+def get_package_cache_folder(package_name, conan_home=None) -> Path:
+    """Get the cache data folder of a package reference (name/version[@user/channel])"""
+    if not conan_home:
+        conan_home, _ = get_conan_home()
+    name_version, _, user_channel = package_name.partition('@')
+    name, _, version = name_version.partition('/')
+    user, _, channel = user_channel.partition('/')
+    return Path(conan_home) / 'data' / name / version / (user or '_') / (channel or '_')
+
+
+def get_folder_size(folder) -> int:
+    """Get the total size of all regular files below a folder in bytes"""
+    total = 0
+    stack = [str(folder)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    return total
+
+
+def _conan_api_remove(patterns):
+    """Remove patterns with one in-process Conan API; None if the API is not importable"""
+    try:
+        from conans.client.conan_api import Conan
+    except ImportError:
+        return None
+    conan_api = Conan()
+    results = {}
+    for pattern in patterns:
+        try:
+            conan_api.remove(pattern, force=True)
+            results[pattern] = 0
+        except Exception as e:
+            log.error(f'Failed to remove {pattern} from Conan cache: {e}')
+            results[pattern] = 1
+    return results
+
+
+def remove_conan_packages_in_cache(package_names, cached_packages=None):
+    """Remove many packages from Conan cache with as few Conan processes as possible
+
+    When every cached version of a package is being removed, a single
+    `name/*` pattern replaces the per-version removals; removing the whole
+    cache collapses into one `*` pattern. All patterns are then removed in
+    one process through the Conan API, falling back to one `conan remove`
+    per pattern when the API is not importable. Returns a dict of package
+    name to return code.
+    """
+    package_names = list(dict.fromkeys(package_names))
+    if cached_packages is None:
+        cached_packages = get_all_packages_in_cache()
+    to_remove = set(package_names)
+    
+    # pattern -> package names it removes
+    patterns = {}
+    if cached_packages and to_remove >= set(cached_packages):
+        patterns['*'] = package_names
+    else:
+        versions_by_name = {}
+        for cached_package in cached_packages:
+            versions_by_name.setdefault(cached_package.split('/', 1)[0], set()).add(cached_package)
+        for name, versions in versions_by_name.items():
+            if versions and versions <= to_remove:
+                patterns[f'{name}/*'] = sorted(versions)
+        covered = {package_name for names in patterns.values() for package_name in names}
+        for package_name in package_names:
+            if package_name not in covered:
+                patterns[package_name] = [package_name]
+    
+    pattern_results = _conan_api_remove(list(patterns))
+    if pattern_results is None:
+        pattern_results = {
+            pattern: remove_conan_package_in_cache(f'"{pattern}"' if '*' in pattern else pattern)[0]
+            for pattern in patterns
+        }
+    results = {package_name: pattern_results[pattern]
+               for pattern, names in patterns.items() for package_name in names}
+    invalidate_cached_configurations(name for name, rc in results.items() if rc == 0)
+    return results
+
+
+class ConanNodeRecord:
+    """Slotted record for one node of the `conan info` JSON output"""
+    
+    __slots__ = ('reference', 'display_name', 'provides', 'binary', 'package_folder')
+    
+    def __init__(self, reference=None, display_name='', provides=None, binary=None,
+                 package_folder=None):
+        self.reference = reference
+        self.display_name = display_name
+        self.provides = provides or []
+        self.binary = binary
+        self.package_folder = package_folder
+    
+    @classmethod
+    def from_dict(cls, node):
+        """Build a record from a decoded JSON node, ignoring unused keys"""
+        return cls(node.get('reference'), node.get('display_name', ''), node.get('provides'),
+                   node.get('binary'), node.get('package_folder'))
+
+
 class ConanJsonLoader:
     """Load and parse Conan JSON information"""
     
     def __init__(self, repository_path):
-        import json
-        from types import SimpleNamespace
-        
         temp_out = tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False)
         
         conan_info_command = f'{get_default_conan()} info {repository_path} --paths -j {temp_out.name}'
@@ -120,8 +269,8 @@ class ConanJsonLoader:
             # Try again without remote
             execute_command(f'{conan_info_command} -if .', cwd=repository_path)
         
-        result_json = json.load(temp_out)
-        self.result_munch = json.loads(json.dumps(result_json), object_hook=lambda d: SimpleNamespace(**d))
+        # Decode straight into records; nested values stay plain JSON types
+        self.result_munch = [ConanNodeRecord.from_dict(node) for node in json.load(temp_out)]
         temp_out.close()
         os.unlink(temp_out.name)
         self._get_root_node().package_folder = repository_path
@@ -162,21 +311,79 @@ class ConanJsonLoader:
         return package_dict
 
 
+class CacheEvictionEntry:
+    """A package selected for removal from the Conan cache"""
+    
+    __slots__ = ('package_name', 'reason', 'size', 'last_used')
+    
+    def __init__(self, package_name, reason, size=0, last_used=None):
+        self.package_name = package_name
+        self.reason = reason
+        self.size = size
+        self.last_used = last_used
+    
+    def __repr__(self):
+        return f'CacheEvictionEntry({self.package_name!r}, {self.reason!r}, {self.size})'
+
+
+class CacheEvictionPlan:
+    """Stale packages ordered by reclaimable size"""
+    
+    def __init__(self, entries, cache_size):
+        self.entries = sorted(entries, key=lambda entry: entry.size, reverse=True)
+        self.cache_size = cache_size
+    
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Total bytes freed by executing the plan"""
+        return sum(entry.size for entry in self.entries)
+    
+    @property
+    def package_names(self) -> list:
+        """Package references in the plan"""
+        return [entry.package_name for entry in self.entries]
+    
+    def log_summary(self, dry_run=False):
+        """Log the plan, largest packages first"""
+        prefix = 'Would remove' if dry_run else 'Removing'
+        for entry in self.entries:
+            log.warning(f'{prefix} ({entry.reason}): {entry.package_name} '
+                        f'[{entry.size / (1024 * 1024):.1f} MiB, last used: {entry.last_used}]')
+        log.info(f'{prefix} {len(self.entries)} packages, '
+                 f'{self.reclaimed_bytes / (1024 * 1024):.1f} MiB of '
+                 f'{self.cache_size / (1024 * 1024):.1f} MiB cache')
+
+
+# Trackers with usage updates to write at exit; weak, so the set does not keep them alive
+_trackers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_trackers():
+    for tracker in list(_trackers):
+        tracker.flush()
+
+
 class ConanConfigurationTracker:
     """Track Conan package usage and configuration"""
     
-    def __init__(self):
+    def __init__(self, touch_resolution: timedelta = timedelta(hours=1)):
         self.expected_version = 1.0
         self.__data = {
             'version': self.expected_version,
             'conan_usage': dict(),
         }
+        # last_used is only refreshed when older than this, so repeated lookups
+        # do not rewrite the tracker file
+        self.touch_resolution = touch_resolution
+        self._dirty = False
         self.load_config()
+        _trackers.add(self)
     
     @property
     def config_path(self) -> Path:
         """Get configuration file path"""
-        return Path(get_conan_home()[0]) / 'conan_tracker.yaml'
+        return get_conan_cache_home() / 'conan_tracker.yaml'
     
     @property
     def packages(self) -> dict:
@@ -203,34 +410,114 @@ class ConanConfigurationTracker:
     
     def save_config(self):
         """Save configuration to file"""
-        with open(self.config_path, 'w') as stream:
+        config_path = self.config_path
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = config_path.with_suffix('.yaml.tmp')
+        with open(temp_path, 'w') as stream:
             yaml.safe_dump(self.__data, stream)
+        os.replace(temp_path, config_path)
+        self._dirty = False
     
-    def remove_old_packages(self, time_delta: timedelta):
-        """Remove old packages from cache"""
+    def touch_packages(self, package_names):
+        """Mark packages as used; changes are written by flush()"""
+        now = datetime.now()
+        threshold = now - self.touch_resolution
+        for package_name in package_names:
+            last_used = (self.packages.get(package_name) or {}).get('last_used')
+            if not isinstance(last_used, datetime) or last_used < threshold:
+                self.packages[package_name] = {'last_used': now}
+                self._dirty = True
+    
+    def flush(self):
+        """Write pending usage updates in one go"""
+        if self._dirty:
+            try:
+                self.save_config()
+            except OSError as e:
+                log.warning(f'Unable to save Conan tracker configuration: {e}')
+    
+    def plan_eviction(self, time_delta: timedelta = None, target_size: int = None,
+                      cached=None, conan_home=None) -> CacheEvictionPlan:
+        """Compute the full set of packages to evict from the cache
+        
+        Untracked packages and packages unused for longer than time_delta
+        are always selected. If target_size (bytes) is given, the least
+        recently used remaining packages are added until the cache fits.
+        """
         all_packages = self.packages
-        cached = get_all_packages_in_cache()
+        if cached is None:
+            cached = get_all_packages_in_cache()
+        sizes = {package: get_folder_size(get_package_cache_folder(package, conan_home))
+                 for package in cached}
+        cache_size = sum(sizes.values())
+        threshold = datetime.now() - time_delta if time_delta is not None else None
+        
+        entries = []
+        remaining = []
         for cached_package in cached:
-            if cached_package not in all_packages.keys():
-                log.warning(f'Removing because it is not tracked: {cached_package}')
-                remove_conan_package_in_cache(cached_package)
-            elif all_packages[cached_package]['last_used'] < datetime.now() - time_delta:
-                log.warning(f'Removing because it is old: {cached_package}. '
-                            f'Last Used: {all_packages[cached_package]["last_used"]}')
-                remove_conan_package_in_cache(cached_package)
-                del all_packages[cached_package]
+            last_used = (all_packages.get(cached_package) or {}).get('last_used')
+            if not isinstance(last_used, datetime):
+                last_used = datetime.min
+            if cached_package not in all_packages:
+                entries.append(CacheEvictionEntry(cached_package, 'untracked', sizes[cached_package]))
+            elif threshold is not None and last_used < threshold:
+                entries.append(CacheEvictionEntry(cached_package, 'old', sizes[cached_package], last_used))
+            else:
+                remaining.append(CacheEvictionEntry(cached_package, 'size budget',
+                                                    sizes[cached_package], last_used))
+        
+        if target_size is not None:
+            kept_size = cache_size - sum(entry.size for entry in entries)
+            for entry in sorted(remaining, key=lambda entry: entry.last_used):
+                if kept_size <= target_size:
+                    break
+                entries.append(entry)
+                kept_size -= entry.size
+        
+        return CacheEvictionPlan(entries, cache_size)
+    
+    def remove_old_packages(self, time_delta: timedelta = None, target_size: int = None,
+                            dry_run: bool = False) -> CacheEvictionPlan:
+        """Remove old packages from cache"""
+        cached = get_all_packages_in_cache()
+        plan = self.plan_eviction(time_delta, target_size, cached=cached)
+        plan.log_summary(dry_run=dry_run)
+        if dry_run:
+            return plan
+        
+        # Also drops the cached configurations resolving the removed packages
+        results = remove_conan_packages_in_cache(plan.package_names, cached_packages=cached)
+        for package_name, rc in results.items():
+            if rc == 0:
+                self.packages.pop(package_name, None)
             else:
-                log.info(f'Not removing, active package: {cached_package}. '
-                         f'Last Used: {all_packages[cached_package]["last_used"]}')
+                log.error(f'Failed to remove {package_name} from Conan cache (rc={rc})')
         self.save_config()
         log.info('Executing result code: 0: Cleaning of conan packages finished')
+        return plan
+
+
+@cache
+def default_tracker() -> ConanConfigurationTracker:
+    """Tracker shared by configurations that are not given their own"""
+    return ConanConfigurationTracker()
 
 
 class ConanConfiguration:
     """Conan configuration management"""
     
-    def __init__(self, conan_tracker=ConanConfigurationTracker()):
-        self.conan_tracker = conan_tracker
+    CACHE_VERSION = 1
+    
+    def __init__(self, conan_tracker=None, cache_dir=None):
+        self.conan_tracker = conan_tracker if conan_tracker is not None else default_tracker()
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+    
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding resolved configurations keyed by content hash"""
+        if self._cache_dir is None:
+            self._cache_dir = get_configuration_cache_dir()
+        return self._cache_dir
     
     @staticmethod
     def get_conanfile(repository_path):
@@ -248,7 +535,6 @@ class ConanConfiguration:
     
     def _compute_key(self, **kwargs):
         """Compute configuration key"""
-        import hashlib
         repo_path = Path(kwargs['repository_path']).resolve()
         conan_lock, exists = self.get_conan_lock(repo_path)
         if exists:
@@ -266,20 +552,69 @@ class ConanConfiguration:
         packages_old = {}
         for package in packages:
             name, version = conan_loader.get_package_name_version(package)
-            packages_old[name] = (name, version, Path(package.get('package_folder', '')))
-        
-        for name, version, _ in packages_old.values():
-            self.conan_tracker.packages[f'{name}/{version}'] = {'last_used': datetime.now()}
-        self.conan_tracker.save_config()
+            packages_old[name] = (name, version, Path(package.package_folder or ''))
         return packages_old
     
+    def _cache_file(self, key) -> Path:
+        """On-disk location of a cached configuration"""
+        digest = hashlib.sha256('\0'.join(str(part) for part in key).encode()).hexdigest()
+        return self.cache_dir / f'{digest}.json'
+    
+    @staticmethod
+    def _folders_exist(packages) -> bool:
+        """Whether every package folder of a configuration is still in the Conan cache"""
+        return all(str(folder) in ('', '.') or folder.exists() for _, _, folder in packages.values())
+    
+    def _load_cached_configuration(self, key):
+        """Load a configuration resolved by an earlier process"""
+        try:
+            with open(self._cache_file(key), 'r') as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != self.CACHE_VERSION:
+            return None
+        packages = {name: (name, version, Path(folder))
+                    for name, (_, version, folder) in data['packages'].items()}
+        # Packages evicted from the Conan cache since: resolve again
+        return packages if self._folders_exist(packages) else None
+    
+    def _store_cached_configuration(self, key, packages):
+        """Persist a resolved configuration atomically"""
+        cache_file = self._cache_file(key)
+        data = {
+            'version': self.CACHE_VERSION,
+            'packages': {name: [name, version, str(folder)]
+                         for name, version, folder in packages.values()},
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w') as stream:
+                json.dump(data, stream)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            log.warning(f'Unable to store Conan configuration cache: {e}')
+    
     def get_configuration(self, **kwargs):
-        """Get configuration with caching"""
+        """Get configuration with caching
+        
+        Resolved configurations are kept in memory and on disk, keyed by the
+        repository path and the hashes of conanfile.py and conan.lock, so
+        Conan is only invoked when one of them changes or a resolved package
+        folder has been removed from the cache.
+        """
         key = self._compute_key(**kwargs)
         if not hasattr(self, '_cache'):
             self._cache = {}
-        if key not in self._cache:
-            self._cache[key] = self._create_new_configuration(**kwargs)
+        if key not in self._cache or not self._folders_exist(self._cache[key]):
+            packages = self._load_cached_configuration(key)
+            if packages is None:
+                packages = self._create_new_configuration(**kwargs)
+                self._store_cached_configuration(key, packages)
+            self._cache[key] = packages
+            self.conan_tracker.touch_packages(
+                f'{name}/{version}' for name, version, _ in packages.values())
         return self._cache[key]
 
 
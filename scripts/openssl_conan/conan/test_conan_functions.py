@@ -130,6 +130,168 @@ class TestConanFunctions(unittest.TestCase):
         packages = get_all_packages_in_cache()
         self.assertEqual(len(packages), 0)
 
+    def test_conan_configuration_tracker_touch_is_batched(self):
+        """Test that usage updates are written only on flush"""
+        tracker = ConanConfigurationTracker()
+        
+        with patch.object(tracker, 'save_config') as mock_save:
+            tracker.touch_packages(['test/1.0.0', 'other/2.0.0'])
+            tracker.touch_packages(['test/1.0.0'])
+            mock_save.assert_not_called()
+            tracker.flush()
+            mock_save.assert_called_once()
+        self.assertIn('other/2.0.0', tracker.packages)
+    
+    def test_conan_configuration_disk_cache(self):
+        """Test that resolved configurations are reused across instances"""
+        (self.temp_dir / 'conanfile.py').write_text('from conan import ConanFile')
+        cache_dir = self.temp_dir / 'config-cache'
+        package_folder = self.temp_dir / 'p' / 'zlib'
+        package_folder.mkdir(parents=True)
+        resolved = {'zlib': ('zlib', '1.3', package_folder)}
+        tracker = MagicMock()
+        
+        first = ConanConfiguration(tracker, cache_dir=cache_dir)
+        with patch.object(first, '_create_new_configuration', return_value=resolved) as mock_create:
+            self.assertEqual(first.get_configuration(repository_path=self.temp_dir), resolved)
+            mock_create.assert_called_once()
+        
+        second = ConanConfiguration(tracker, cache_dir=cache_dir)
+        with patch.object(second, '_create_new_configuration') as mock_create:
+            self.assertEqual(second.get_configuration(repository_path=self.temp_dir), resolved)
+            mock_create.assert_not_called()
+        
+        # Changing conanfile.py invalidates the cached configuration
+        (self.temp_dir / 'conanfile.py').write_text('from conan import ConanFile\n# changed')
+        third = ConanConfiguration(tracker, cache_dir=cache_dir)
+        with patch.object(third, '_create_new_configuration', return_value={}) as mock_create:
+            third.get_configuration(repository_path=self.temp_dir)
+            mock_create.assert_called_once()
+
+    def test_conan_configuration_cache_hit_does_not_start_conan(self):
+        """Test that the cache and tracker locations are found without running Conan"""
+        from openssl_conan.conan import conan_functions
+        (self.temp_dir / 'conanfile.py').write_text('from conan import ConanFile')
+        resolved = {'zlib': ('zlib', '1.3', Path(''))}
+        
+        first = ConanConfiguration(ConanConfigurationTracker())
+        with patch.object(first, '_create_new_configuration', return_value=resolved):
+            first.get_configuration(repository_path=self.temp_dir)
+        
+        with patch('openssl_conan.conan.conan_functions.execute_command') as mock_execute:
+            second = ConanConfiguration(ConanConfigurationTracker())
+            with patch.object(second, '_create_new_configuration') as mock_create:
+                self.assertEqual(second.get_configuration(repository_path=self.temp_dir), resolved)
+                mock_create.assert_not_called()
+            mock_execute.assert_not_called()
+        self.assertEqual(conan_functions.get_configuration_cache_dir(),
+                         self.temp_dir / '.conan' / 'openssl_configuration_cache')
+        
+        os.environ['CONAN_HOME'] = str(self.temp_dir / 'conan2')
+        self.assertEqual(second.conan_tracker.config_path, self.temp_dir / 'conan2' / 'conan_tracker.yaml')
+    
+    def test_conan_configuration_cache_drops_evicted_packages(self):
+        """Test that configurations resolving removed packages are not reused"""
+        from openssl_conan.conan.conan_functions import remove_conan_packages_in_cache
+        (self.temp_dir / 'conanfile.py').write_text('from conan import ConanFile')
+        cache_dir = self.temp_dir / 'config-cache'
+        package_folder = self.temp_dir / 'p' / 'zlib'
+        package_folder.mkdir(parents=True)
+        resolved = {'zlib': ('zlib', '1.3', package_folder)}
+        tracker = MagicMock()
+        
+        configuration = ConanConfiguration(tracker, cache_dir=cache_dir)
+        with patch.object(configuration, '_create_new_configuration', return_value=resolved):
+            configuration.get_configuration(repository_path=self.temp_dir)
+        
+        # Folder deleted behind the cache's back: both cache levels resolve again
+        package_folder.rmdir()
+        with patch.object(configuration, '_create_new_configuration', return_value=resolved) as mock_create:
+            configuration.get_configuration(repository_path=self.temp_dir)
+            mock_create.assert_called_once()
+        
+        # Removing the package through Conan drops the cached configuration file
+        package_folder.mkdir()
+        self.assertEqual(len(list(cache_dir.glob('*.json'))), 1)
+        with patch('openssl_conan.conan.conan_functions.remove_conan_package_in_cache', return_value=(0, [])), \
+                patch('openssl_conan.conan.conan_functions.get_configuration_cache_dir', return_value=cache_dir):
+            remove_conan_packages_in_cache(['zlib/1.3'], ['zlib/1.3', 'openssl/3.2'])
+        self.assertEqual(list(cache_dir.glob('*.json')), [])
+    
+    def test_trackers_flush_at_exit_without_per_instance_hooks(self):
+        """Test that trackers are flushed by one module-level exit hook"""
+        from openssl_conan.conan import conan_functions
+        with patch('openssl_conan.conan.conan_functions.atexit.register') as mock_register:
+            tracker = ConanConfigurationTracker()
+            mock_register.assert_not_called()
+        self.assertIn(tracker, conan_functions._trackers)
+        with patch.object(tracker, 'flush') as mock_flush:
+            conan_functions._flush_trackers()
+            mock_flush.assert_called_once()
+    
+    def test_plan_eviction_with_size_budget(self):
+        """Test that the eviction plan honours age and target size"""
+        from datetime import datetime, timedelta
+        conan_home = self.temp_dir / 'home'
+        for package, size in (('old/1.0', 300), ('recent/1.0', 200), ('newest/1.0', 100),
+                              ('untracked/1.0', 50)):
+            folder = conan_home / 'data' / package.split('/')[0] / '1.0' / '_' / '_'
+            folder.mkdir(parents=True)
+            (folder / 'lib.a').write_bytes(b'x' * size)
+        
+        tracker = ConanConfigurationTracker()
+        now = datetime.now()
+        tracker.packages = {
+            'old/1.0': {'last_used': now - timedelta(days=30)},
+            'recent/1.0': {'last_used': now - timedelta(days=2)},
+            'newest/1.0': {'last_used': now},
+        }
+        cached = ['old/1.0', 'recent/1.0', 'newest/1.0', 'untracked/1.0']
+        
+        plan = tracker.plan_eviction(timedelta(days=7), cached=cached, conan_home=conan_home)
+        self.assertEqual(plan.package_names, ['old/1.0', 'untracked/1.0'])
+        self.assertEqual(plan.reclaimed_bytes, 350)
+        self.assertEqual(plan.cache_size, 650)
+        
+        plan = tracker.plan_eviction(timedelta(days=7), target_size=150, cached=cached,
+                                     conan_home=conan_home)
+        self.assertEqual(plan.package_names, ['old/1.0', 'recent/1.0', 'untracked/1.0'])
+    
+    @patch('openssl_conan.conan.conan_functions.remove_conan_package_in_cache')
+    def test_remove_conan_packages_in_cache_batches_patterns(self, mock_remove):
+        """Test that fully stale packages are removed with one pattern call"""
+        from openssl_conan.conan.conan_functions import remove_conan_packages_in_cache
+        mock_remove.return_value = (0, [])
+        cached = ['zlib/1.2', 'zlib/1.3', 'openssl/3.0', 'openssl/3.2']
+        
+        results = remove_conan_packages_in_cache(['zlib/1.2', 'zlib/1.3', 'openssl/3.0'], cached)
+        
+        removed = sorted(call.args[0] for call in mock_remove.call_args_list)
+        self.assertEqual(removed, ['"zlib/*"', 'openssl/3.0'])
+        self.assertEqual(set(results), {'zlib/1.2', 'zlib/1.3', 'openssl/3.0'})
+
+    @patch('openssl_conan.conan.conan_functions.remove_conan_package_in_cache')
+    def test_remove_conan_packages_in_cache_uses_one_process(self, mock_remove):
+        """Test that stale versions of a kept package are removed in-process, not one call each"""
+        from openssl_conan.conan.conan_functions import remove_conan_packages_in_cache
+        cached = ['zlib/1.2', 'zlib/1.3', 'openssl/3.0', 'openssl/3.1', 'openssl/3.2']
+        removed = []
+        
+        class FakeConan:
+            def remove(self, pattern, force=False):
+                removed.append((pattern, force))
+        
+        conans = MagicMock()
+        conans.client.conan_api.Conan = FakeConan
+        with patch.dict(sys.modules, {'conans': conans, 'conans.client': conans.client,
+                                      'conans.client.conan_api': conans.client.conan_api}):
+            results = remove_conan_packages_in_cache(['openssl/3.0', 'openssl/3.1', 'zlib/1.2', 'zlib/1.3'],
+                                                     cached)
+        
+        mock_remove.assert_not_called()
+        self.assertEqual(sorted(removed), [('openssl/3.0', True), ('openssl/3.1', True), ('zlib/*', True)])
+        self.assertEqual(results, {'zlib/1.2': 0, 'zlib/1.3': 0, 'openssl/3.0': 0, 'openssl/3.1': 0})
+
 
 class TestConanJsonLoader(unittest.TestCase):
     """Test cases for ConanJsonLoader"""
@@ -9,17 +9,37 @@ import uuid
 import hashlib
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+SOURCE_EXTENSIONS = ('.cpp', '.c', '.h', '.hpp')
+SKIP_DIRS = {'.git'}
+HASH_CACHE_NAME = '.sbom-source-hashes.json'
+HASH_CACHE_VERSION = 1
+
+
+def _hash_file(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 class SBOMGenerator:
     """Generate Software Bill of Materials for Conan packages"""
     
-    def __init__(self, conanfile_path: str = "conanfile.py"):
+    def __init__(self, conanfile_path: str = "conanfile.py", hash_cache: Optional[str] = None,
+                 jobs: Optional[int] = None, file_hashes: bool = True):
         self.conanfile_path = conanfile_path
         self.project_root = Path(conanfile_path).parent
+        self.hash_cache = Path(hash_cache) if hash_cache else self.project_root / HASH_CACHE_NAME
+        self.jobs = jobs or os.cpu_count() or 1
+        self.file_hashes = file_hashes
+        self._source_tree: Optional[Tuple[Optional[str], Dict[str, str]]] = None
         
     def generate_cyclone_dx(self, output_path: str = "sbom-cyclonedx.json") -> Dict[str, Any]:
         """Generate CycloneDX format SBOM"""
@@ -80,6 +100,17 @@ class SBOMGenerator:
             "relationships": self._convert_to_spdx_relationships(deps_info["dependencies"])
         }
         
+        if self.file_hashes:
+            _, file_hashes = self._source_hash_tree()
+            sbom["files"] = [
+                {
+                    "SPDXID": f"SPDXRef-File-{index}",
+                    "fileName": f"./{path}",
+                    "checksums": [{"algorithm": "SHA256", "checksumValue": digest}]
+                }
+                for index, (path, digest) in enumerate(sorted(file_hashes.items()))
+            ]
+        
         with open(output_path, 'w') as f:
             json.dump(sbom, f, indent=2)
             
@@ -171,13 +202,22 @@ class SBOMGenerator:
             "purl": f"pkg:generic/{project_name}@{project_version}"
         }
         
-        # Add source code hash
-        source_hash = self._calculate_source_hash()
+        # Add source code hash (Merkle root) and per-file hashes
+        source_hash, file_hashes = self._source_hash_tree()
         if source_hash:
             component["hashes"] = [{
                 "alg": "SHA-256", 
                 "content": source_hash
             }]
+        if self.file_hashes and file_hashes:
+            component["components"] = [
+                {
+                    "type": "file",
+                    "name": path,
+                    "hashes": [{"alg": "SHA-256", "content": digest}]
+                }
+                for path, digest in sorted(file_hashes.items())
+            ]
         
         # Add license
         license_file = self._find_license_file()
@@ -279,26 +319,139 @@ class SBOMGenerator:
         return "0.1.0"
     
     def _calculate_source_hash(self) -> Optional[str]:
-        """Calculate hash of source files"""
-        
-        hash_sha256 = hashlib.sha256()
-        source_files = []
-        
-        # Find source files
-        for pattern in ['**/*.cpp', '**/*.c', '**/*.h', '**/*.hpp']:
-            source_files.extend(self.project_root.glob(pattern))
-        
-        # Sort for reproducible hash
-        source_files.sort()
-        
-        for file_path in source_files:
+        """Calculate the Merkle root hash of the source files"""
+        return self._source_hash_tree()[0]
+    
+    def _source_hash_tree(self) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Merkle hash of the C/C++ sources below the project root
+        
+        Leaves are per-file SHA-256 hashes, cached by stat identity (size,
+        mtime, inode) so unchanged files are not read again; changed files
+        are hashed in parallel. A directory's hash covers the sorted names
+        and hashes of its children, and is only recomputed when something
+        below it changed.
+        
+        Returns:
+            (root hash or None without sources, {relative path: file hash})
+        """
+        if self._source_tree is not None:
+            return self._source_tree
+        
+        cache = self._load_hash_cache()
+        cached_files, cached_dirs = cache["files"], cache["dirs"]
+        
+        # One scandir walk: source files grouped by directory
+        tree: Dict[str, List[Tuple[str, List[int]]]] = {}
+        subdirs: Dict[str, List[str]] = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            tree[rel_dir], subdirs[rel_dir] = [], []
             try:
-                with open(file_path, 'rb') as f:
-                    hash_sha256.update(f.read())
-            except (IOError, OSError):
+                with os.scandir(self.project_root / rel_dir) as entries:
+                    for entry in entries:
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                subdirs[rel_dir].append(entry.name)
+                                stack.append(rel_path)
+                        elif entry.name.endswith(SOURCE_EXTENSIONS) and entry.is_file():
+                            st = entry.stat()
+                            tree[rel_dir].append((entry.name, [st.st_size, st.st_mtime_ns, st.st_ino]))
+            except OSError:
                 continue
         
-        return hash_sha256.hexdigest() if source_files else None
+        # Leaves: rehash only files whose stat identity changed
+        file_hashes: Dict[str, str] = {}
+        identities: Dict[str, List[int]] = {}
+        changed = []
+        for rel_dir, files in tree.items():
+            for name, identity in files:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                identities[rel_path] = identity
+                entry = cached_files.get(rel_path)
+                if entry and entry[:3] == identity:
+                    file_hashes[rel_path] = entry[3]
+                else:
+                    changed.append(rel_path)
+        
+        if changed:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                digests = executor.map(lambda rel: self._try_hash(self.project_root / rel), changed)
+                for rel_path, digest in zip(changed, digests):
+                    if digest is not None:
+                        file_hashes[rel_path] = digest
+        changed_set = set(changed)
+        
+        # Interior nodes, deepest first; clean subtrees reuse their cached hash
+        dir_hashes: Dict[str, str] = {}
+        dirty: Dict[str, bool] = {}
+        new_dirs = {}
+        for rel_dir in sorted(tree, key=lambda d: d.count("/") + bool(d), reverse=True):
+            children = []
+            is_dirty = False
+            for name, _ in tree[rel_dir]:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if rel_path in file_hashes:
+                    children.append(f"f {name} {file_hashes[rel_path]}")
+                    is_dirty = is_dirty or rel_path in changed_set
+            for name in subdirs[rel_dir]:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if rel_path in dir_hashes:
+                    children.append(f"d {name} {dir_hashes[rel_path]}")
+                    is_dirty = is_dirty or dirty[rel_path]
+            if not children:
+                dirty[rel_dir] = False
+                continue
+            children.sort()
+            names = "\n".join(child.rsplit(" ", 1)[0] for child in children)
+            cached = cached_dirs.get(rel_dir)
+            if not is_dirty and cached and cached[0] == names:
+                digest = cached[1]
+            else:
+                digest = hashlib.sha256("\n".join(children).encode()).hexdigest()
+                is_dirty = True
+            dir_hashes[rel_dir] = digest
+            dirty[rel_dir] = is_dirty
+            new_dirs[rel_dir] = [names, digest]
+        
+        self._save_hash_cache({
+            "version": HASH_CACHE_VERSION,
+            "files": {rel_path: identities[rel_path] + [digest] for rel_path, digest in file_hashes.items()},
+            "dirs": new_dirs
+        })
+        
+        self._source_tree = (dir_hashes.get(""), file_hashes)
+        return self._source_tree
+    
+    @staticmethod
+    def _try_hash(path: Path) -> Optional[str]:
+        try:
+            return _hash_file(str(path))
+        except (IOError, OSError):
+            return None
+    
+    def _load_hash_cache(self) -> Dict[str, Any]:
+        """Load cached file and directory hashes from a previous run"""
+        try:
+            with open(self.hash_cache, 'r') as f:
+                cache = json.load(f)
+            if cache.get("version") == HASH_CACHE_VERSION:
+                return cache
+        except (IOError, OSError, ValueError):
+            pass
+        return {"version": HASH_CACHE_VERSION, "files": {}, "dirs": {}}
+    
+    def _save_hash_cache(self, cache: Dict[str, Any]) -> None:
+        """Atomically write the hash cache"""
+        tmp_path = self.hash_cache.with_name(self.hash_cache.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.hash_cache)
+        except (IOError, OSError) as e:
+            print(f"Warning: could not save source hash cache: {e}")
     
     def _find_license_file(self) -> Optional[Path]:
         """Find license file in project"""
@@ -397,10 +550,16 @@ def main():
                        default="both", help="SBOM format to generate")
     parser.add_argument("--output-dir", default=".", 
                        help="Output directory for SBOM files")
+    parser.add_argument("--hash-cache", 
+                       help=f"Source hash cache file (default: {HASH_CACHE_NAME} next to the conanfile)")
+    parser.add_argument("--jobs", type=int, 
+                       help="Parallel workers for hashing changed files")
+    parser.add_argument("--no-file-hashes", action="store_true", 
+                       help="Do not list per-file source hashes in the SBOM")
     
     args = parser.parse_args()
     
-    generator = SBOMGenerator(args.conanfile)
+    generator = SBOMGenerator(args.conanfile, args.hash_cache, args.jobs, not args.no_file_hashes)
     output_dir = Path(args.output_dir)
     output_dir.mkdir(exist_ok=True)
     
@@ -10,6 +10,11 @@ This script provides local verification of all bootstrap components:
 - Rollback and recovery mechanisms
 - Reproducibility validation
 - Hardening validation
+
+The scenarios are independent: each runs in its own temporary root on a
+process pool, all reading dependency archives from one download cache that
+is seeded once up front. Per-scenario timings and the critical path of the
+run are included in the report.
 """
 
 import os
@@ -19,18 +24,52 @@ import tempfile
 import json
 import shutil
 import platform
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import argparse
 import time
 
+# Scenarios with their cost in bootstrap runs, used to start the longest first
+SCENARIOS = {
+    "idempotency": 2,
+    "cross_platform": 3,
+    "dependency_resolution": 1,
+    "rollback_mechanisms": 0,
+    "reproducibility": 2,
+    "hardening": 0,
+    "production_scenarios": 2
+}
+
+def _run_scenario(name: str, verbose: bool, work_root: Path, cache_dir: Optional[Path]) -> Dict[str, Any]:
+    """Run one verification scenario in an isolated root (process pool entry point)"""
+    work_root.mkdir(parents=True, exist_ok=True)
+    verifier = BootstrapVerifier(verbose=verbose, work_root=work_root, cache_dir=cache_dir)
+    start = time.time()
+    try:
+        verifier.log(f"Running {name} verification...")
+        passed = getattr(verifier, f"verify_{name}")()
+    except Exception as e:
+        verifier.log(f"Verification {name} failed with exception: {e}", "ERROR")
+        passed = False
+    finally:
+        verifier.cleanup()
+    end = time.time()
+    return {"passed": passed, "start": start, "end": end, "duration": end - start, "worker": os.getpid()}
+
 class BootstrapVerifier:
     """Comprehensive bootstrap verification"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, work_root: Optional[Path] = None,
+                 cache_dir: Optional[Path] = None, jobs: Optional[int] = None):
         self.verbose = verbose
+        self.work_root = work_root
+        self.cache_dir = cache_dir
+        self.jobs = jobs
         self.results = {}
         self.temp_dirs = []
+        self.timings = {}
+        self.critical_path = []
     
     def log(self, message: str, level: str = "INFO"):
         """Log message with timestamp"""
@@ -48,7 +87,7 @@ class BootstrapVerifier:
     
     def create_temp_dir(self) -> Path:
         """Create temporary directory for testing"""
-        temp_dir = Path(tempfile.mkdtemp(prefix="bootstrap_verify_"))
+        temp_dir = Path(tempfile.mkdtemp(prefix="bootstrap_verify_", dir=self.work_root))
         self.temp_dirs.append(temp_dir)
         return temp_dir
     
@@ -381,10 +420,13 @@ finally:
             
             if test_dependencies:
                 cmd.append("--no-validation")
+            if self.cache_dir:
+                cmd.extend(["--cache-dir", str(self.cache_dir)])
             
             result = subprocess.run(
                 cmd,
                 cwd=Path.cwd(),
+                env=self._scenario_env(),
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
@@ -404,30 +446,88 @@ finally:
             self.log(f"Bootstrap execution failed: {e}", "ERROR")
             return False
     
+    def _scenario_env(self) -> Dict[str, str]:
+        """Environment for bootstrap runs, keeping Conan and temp files inside the scenario root"""
+        env = dict(os.environ)
+        if self.work_root:
+            tmp_dir = self.work_root / "tmp"
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            env["TMPDIR"] = str(tmp_dir)
+            env["CONAN_HOME"] = str(self.work_root / ".conan2")
+        if self.cache_dir:
+            env["PIP_FIND_LINKS"] = str(self.cache_dir)
+        return env
+    
+    def seed_cache(self, cache_dir: Path) -> bool:
+        """Download the bootstrap dependency archives once into the shared cache"""
+        self.log(f"Seeding download cache in {cache_dir}...")
+        try:
+            result = subprocess.run(
+                [sys.executable, "scripts/openssl-conan-init.py", "--seed-cache", str(cache_dir)],
+                cwd=Path.cwd(), capture_output=True, text=True, timeout=300
+            )
+        except subprocess.TimeoutExpired:
+            self.log("Seeding the download cache timed out", "WARNING")
+            return False
+        
+        if result.returncode != 0:
+            self.log(f"Could not seed download cache, scenarios will download: {result.stdout}{result.stderr}",
+                     "WARNING")
+            return False
+        return True
+    
     def run_all_verifications(self) -> Dict[str, bool]:
-        """Run all verification tests"""
+        """Run all verification scenarios in parallel, each in its own temporary root"""
         self.log("Starting comprehensive bootstrap verification...")
+        run_root = self.create_temp_dir()
         
-        verifications = [
-            ("idempotency", self.verify_idempotency),
-            ("cross_platform", self.verify_cross_platform),
-            ("dependency_resolution", self.verify_dependency_resolution),
-            ("rollback_mechanisms", self.verify_rollback_mechanisms),
-            ("reproducibility", self.verify_reproducibility),
-            ("hardening", self.verify_hardening),
-            ("production_scenarios", self.verify_production_scenarios)
-        ]
+        # Seed the shared, read-only download cache once
+        cache_dir = self.cache_dir or run_root / "download-cache"
+        start = time.time()
+        seeded = self.seed_cache(cache_dir)
+        end = time.time()
+        self.timings = {"seed_cache": {"passed": seeded, "start": start, "end": end,
+                                       "duration": end - start, "worker": os.getpid()}}
+        
+        # Longest scenarios first, so they do not end up last on the critical path
+        names = sorted(SCENARIOS, key=lambda name: -SCENARIOS[name])
+        jobs = max(1, min(self.jobs or os.cpu_count() or 1, len(names)))
+        self.log(f"Running {len(names)} scenarios on {jobs} worker(s)...")
         
         results = {}
-        for name, verify_func in verifications:
-            self.log(f"Running {name} verification...")
-            try:
-                results[name] = verify_func()
-            except Exception as e:
-                self.log(f"Verification {name} failed with exception: {e}", "ERROR")
-                results[name] = False
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(_run_scenario, name, self.verbose, run_root / name,
+                                cache_dir if seeded else None): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    self.timings[name] = future.result()
+                except Exception as e:
+                    self.log(f"Verification {name} failed with exception: {e}", "ERROR")
+                    now = time.time()
+                    self.timings[name] = {"passed": False, "start": now, "end": now, "duration": 0, "worker": None}
+                results[name] = self.timings[name]["passed"]
+                self.log(f"{name} finished in {self.timings[name]['duration']:.1f}s",
+                         "SUCCESS" if results[name] else "ERROR")
         
-        return results
+        self.critical_path = self._critical_path()
+        return {name: results[name] for name in SCENARIOS}
+    
+    def _critical_path(self) -> List[str]:
+        """Seeding plus the scenarios run by the worker that finished last"""
+        scenarios = {name: timing for name, timing in self.timings.items() if name != "seed_cache"}
+        if not scenarios:
+            return []
+        last = max(scenarios, key=lambda name: scenarios[name]["end"])
+        worker = scenarios[last]["worker"]
+        if worker is None:
+            return ["seed_cache", last]
+        chain = sorted((name for name, timing in scenarios.items() if timing["worker"] == worker),
+                       key=lambda name: scenarios[name]["start"])
+        return ["seed_cache"] + chain
     
     def generate_report(self, results: Dict[str, bool]) -> str:
         """Generate verification report"""
@@ -451,6 +551,20 @@ finally:
             status = "✅ PASS" if result else "❌ FAIL"
             report += f"- **{test_name.replace('_', ' ').title()}**: {status}\n"
         
+        if self.timings:
+            start = min(timing["start"] for timing in self.timings.values())
+            wall_clock = max(timing["end"] for timing in self.timings.values()) - start
+            serial = sum(timing["duration"] for timing in self.timings.values())
+            report += "\n## Timing\n"
+            report += "| Scenario | Duration | Started at |\n|---|---|---|\n"
+            for name, timing in sorted(self.timings.items(), key=lambda item: item[1]["start"]):
+                report += f"| {name} | {timing['duration']:.1f}s | +{timing['start'] - start:.1f}s |\n"
+            report += f"\n- **Wall Clock**: {wall_clock:.1f}s (serial: {serial:.1f}s)\n"
+            if self.critical_path:
+                path_time = sum(self.timings[name]["duration"] for name in self.critical_path)
+                report += (f"- **Critical Path**: {' → '.join(self.critical_path)} "
+                           f"({path_time:.1f}s)\n")
+        
         if failed_tests == 0:
             report += "\n## 🎉 All Tests Passed!\n"
             report += "Bootstrap verification is complete and ready for production deployment.\n"
@@ -470,10 +584,13 @@ def main():
         "production_scenarios", "all"
     ], default="all", help="Specific test to run")
     parser.add_argument("--output", "-o", help="Output report to file")
+    parser.add_argument("--jobs", "-j", type=int, help="Scenarios run in parallel (default: CPU count)")
+    parser.add_argument("--cache-dir", type=Path,
+                       help="Download cache to seed and share between scenarios (default: temporary)")
     
     args = parser.parse_args()
     
-    verifier = BootstrapVerifier(verbose=args.verbose)
+    verifier = BootstrapVerifier(verbose=args.verbose, cache_dir=args.cache_dir, jobs=args.jobs)
     
     try:
         if args.test == "all":
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the reproducible package archive builder.
+"""
+
+import hashlib
+import io
+import os
+import stat
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.deployment import archive_builder
+from openssl_tools.automation.deployment.archive_builder import build_archive
+
+
+@pytest.fixture
+def package(tmp_path):
+    root = tmp_path / 'package'
+    (root / 'lib').mkdir(parents=True)
+    (root / 'bin').mkdir()
+    (root / 'lib' / 'libssl.a').write_bytes(os.urandom(200_000))
+    (root / 'include.h').write_text('#define OPENSSL 3\n' * 5000)
+    (root / 'bin' / 'openssl').write_bytes(b'#!/bin/sh\necho openssl\n')
+    (root / 'bin' / 'openssl').chmod(0o775)
+    (root / 'empty.txt').write_bytes(b'')
+    return root
+
+
+class TestBuildArchive:
+    """Test cases for build_archive."""
+
+    def test_zip_is_valid_and_normalized(self, package, tmp_path):
+        result = build_archive(package, tmp_path / 'a.zip', jobs=3)
+
+        assert result.sha256 == hashlib.sha256((tmp_path / 'a.zip').read_bytes()).hexdigest()
+        assert result.size == (tmp_path / 'a.zip').stat().st_size
+        with zipfile.ZipFile(tmp_path / 'a.zip') as archive:
+            assert archive.testzip() is None
+            infos = archive.infolist()
+            assert [i.filename for i in infos] == ['bin/openssl', 'empty.txt', 'include.h', 'lib/libssl.a']
+            assert {i.date_time for i in infos} == {(1980, 1, 1, 0, 0, 0)}
+            modes = {i.filename: stat.S_IMODE(i.external_attr >> 16) for i in infos}
+            assert modes == {'bin/openssl': 0o755, 'empty.txt': 0o644, 'include.h': 0o644, 'lib/libssl.a': 0o644}
+            assert archive.getinfo('include.h').compress_type == zipfile.ZIP_DEFLATED
+            assert archive.getinfo('lib/libssl.a').compress_type == zipfile.ZIP_STORED
+            assert archive.read('include.h') == (package / 'include.h').read_bytes()
+
+    def test_zip_is_reproducible(self, package, tmp_path):
+        """Timestamps, permissions and worker count do not change the archive bytes."""
+        first = build_archive(package, tmp_path / 'a.zip', jobs=4)
+        os.utime(package / 'include.h', (0, 1_700_000_000))
+        (package / 'lib' / 'libssl.a').chmod(0o600)
+        second = build_archive(package, tmp_path / 'b.zip', jobs=1)
+        assert first.sha256 == second.sha256
+
+        (package / 'include.h').write_text('changed\n')
+        assert build_archive(package, tmp_path / 'c.zip').sha256 != first.sha256
+
+    def test_zip64_records(self, package, tmp_path, monkeypatch):
+        """Archives past the zip64 limits stay readable."""
+        monkeypatch.setattr(archive_builder, 'ZIP64_LIMIT', 1000)
+        monkeypatch.setattr(archive_builder, 'ZIP64_COUNT_LIMIT', 2)
+        build_archive(package, tmp_path / 'big.zip')
+        with zipfile.ZipFile(tmp_path / 'big.zip') as archive:
+            assert archive.testzip() is None
+            assert archive.read('lib/libssl.a') == (package / 'lib' / 'libssl.a').read_bytes()
+
+    def test_streams_to_file_object(self, package):
+        target = io.BytesIO()
+        result = build_archive(package, target)
+        assert result.path is None
+        assert result.sha256 == hashlib.sha256(target.getvalue()).hexdigest()
+
+    def test_tar_zst(self, package, tmp_path):
+        zstandard = pytest.importorskip('zstandard')
+        first = build_archive(package, tmp_path / 'a.tar.zst', 'tar.zst', jobs=2, level=3)
+        os.utime(package / 'include.h', (0, 1_700_000_000))
+        second = build_archive(package, tmp_path / 'b.tar.zst', 'tar.zst', jobs=2, level=3)
+        assert first.sha256 == second.sha256
+
+        data = zstandard.ZstdDecompressor().stream_reader(io.BytesIO((tmp_path / 'a.tar.zst').read_bytes())).read()
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            members = tar.getmembers()
+            assert [m.name for m in members] == ['bin/openssl', 'empty.txt', 'include.h', 'lib/libssl.a']
+            assert {(m.mtime, m.uid, m.uname) for m in members} == {(archive_builder.DEFAULT_EPOCH, 0, '')}
+
+    def test_rejects_unknown_format(self, package, tmp_path):
+        with pytest.raises(ValueError):
+            build_archive(package, tmp_path / 'a.rar', 'rar')
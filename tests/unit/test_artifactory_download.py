@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent Artifactory tree downloader against a local HTTP server.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.core.artifactory_download import ArtifactoryDownloader
+
+REPO = 'generic-local/openssl'
+FILES = {
+    'conanfile.py': b'from conan import ConanFile\n' * 50,
+    'include/openssl/ssl.h': b'#define SSL 1\n' * 200,
+    'lib/libssl.a': bytes(range(256)) * 400,
+}
+
+
+class FakeArtifactory(BaseHTTPRequestHandler):
+    files = {}
+    checksums = {}
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get('Range')))
+        storage = f'/api/storage/{REPO}?'
+        if self.path.startswith(storage):
+            body = json.dumps({'files': [
+                {'uri': '/' + name, 'size': len(data), 'folder': False,
+                 'sha1': hashlib.sha1(data).hexdigest(),
+                 'sha2': self.checksums.get(name, hashlib.sha256(data).hexdigest())}
+                for name, data in self.files.items()
+            ]}).encode()
+            return self._send(200, body)
+
+        data = self.files.get(self.path[len(f'/{REPO}/'):])
+        if data is None:
+            return self._send(404, b'')
+        byte_range = self.headers.get('Range')
+        if byte_range:
+            start = int(byte_range.split('=')[1].rstrip('-'))
+            return self._send(206, data[start:])
+        return self._send(200, data)
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    FakeArtifactory.files = dict(FILES)
+    FakeArtifactory.checksums = {}
+    FakeArtifactory.requests_seen = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeArtifactory)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def file_requests():
+    return [(path, rng) for path, rng in FakeArtifactory.requests_seen if not path.startswith('/api/')]
+
+
+class TestArtifactoryDownloader:
+    """Test cases for ArtifactoryDownloader."""
+
+    def test_download_tree(self, server, tmp_path):
+        """Every file lands at its relative path below target, in one listing request."""
+        report = ArtifactoryDownloader(server, jobs=3, chunk_size=1000).download_tree(REPO, tmp_path)
+
+        assert report.ok
+        assert sorted(report.downloaded) == sorted(FILES)
+        assert report.bytes_downloaded == sum(len(data) for data in FILES.values())
+        for name, data in FILES.items():
+            assert (tmp_path / name).read_bytes() == data
+        assert not list(tmp_path.rglob('*.part'))
+        listings = [path for path, _ in FakeArtifactory.requests_seen if path.startswith('/api/')]
+        assert len(listings) == 1
+
+    def test_existing_files_are_skipped(self, server, tmp_path):
+        """Files whose checksum already matches are not fetched again."""
+        downloader = ArtifactoryDownloader(server, jobs=2)
+        downloader.download_tree(REPO, tmp_path)
+        (tmp_path / 'conanfile.py').write_bytes(b'stale')
+        FakeArtifactory.requests_seen.clear()
+
+        report = downloader.download_tree(REPO, tmp_path)
+
+        assert report.downloaded == ['conanfile.py']
+        assert sorted(report.skipped) == ['include/openssl/ssl.h', 'lib/libssl.a']
+        assert file_requests() == [(f'/{REPO}/conanfile.py', None)]
+
+    def test_checksum_mismatch_fails(self, server, tmp_path):
+        """Corrupt content is retried, then reported, and never moved into place."""
+        FakeArtifactory.checksums = {'lib/libssl.a': '0' * 64}
+
+        delays = []
+        report = ArtifactoryDownloader(server, retries=3, backoff=0.5, max_backoff=0.75,
+                                       sleep=delays.append).download_tree(REPO, tmp_path)
+
+        assert [path for path, _ in report.failed] == ['lib/libssl.a']
+        assert delays == [0.5, 0.75]
+        assert not (tmp_path / 'lib' / 'libssl.a').exists()
+        assert not (tmp_path / 'lib' / 'libssl.a.part').exists()
+        assert len([p for p, _ in file_requests() if p.endswith('libssl.a')]) == 3
+
+    def test_partial_download_resumes(self, server, tmp_path):
+        """An interrupted download continues from its partial file with a Range request."""
+        data = FILES['lib/libssl.a']
+        (tmp_path / 'lib').mkdir()
+        (tmp_path / 'lib' / 'libssl.a.part').write_bytes(data[:1234])
+
+        report = ArtifactoryDownloader(server).download_tree(REPO, tmp_path)
+
+        assert report.ok
+        assert (tmp_path / 'lib' / 'libssl.a').read_bytes() == data
+        assert (f'/{REPO}/lib/libssl.a', 'bytes=1234-') in file_requests()
+        assert report.bytes_downloaded == sum(len(d) for d in FILES.values()) - 1234
+
+    def test_paths_outside_target_are_refused(self, server, tmp_path):
+        """Listed paths escaping the target folder are reported as failed and never requested."""
+        FakeArtifactory.files['../../escaped.txt'] = b'x'
+        FakeArtifactory.files['lib/../../outside.txt'] = b'y'
+        target = tmp_path / 'target'
+
+        report = ArtifactoryDownloader(server, sleep=lambda delay: None).download_tree(REPO, target)
+
+        assert sorted(path for path, _ in report.failed) == ['../../escaped.txt', 'lib/../../outside.txt']
+        assert all('outside the target folder' in error for _, error in report.failed)
+        assert sorted(report.downloaded) == sorted(FILES)
+        assert sorted(p.name for p in tmp_path.rglob('*.txt')) == []
+        assert not any('..' in path for path, _ in file_requests())
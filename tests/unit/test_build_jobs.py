@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the asynchronous build job manager used by the build MCP server.
+"""
+
+import asyncio
+import sys
+import tempfile
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from openssl_tools.automation.ai_agents import build_jobs
+from openssl_tools.automation.ai_agents.build_jobs import BuildJobManager
+
+PYTHON = sys.executable
+
+
+class TestBuildJobManager:
+    """Test cases for BuildJobManager."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_job_runs_and_streams_log(self):
+        """Output is captured line by line and readable incrementally."""
+        async def scenario():
+            manager = BuildJobManager()
+            job = manager.submit("echo", [[PYTHON, "-c", "print('a'); print('b')"]])
+            assert job.status in ("queued", "running")
+            await manager.wait(job.job_id)
+            lines, offset = manager.read_log(job.job_id)
+            more, _ = manager.read_log(job.job_id, since=offset)
+            return job, lines, more
+
+        job, lines, more = asyncio.run(scenario())
+        assert job.status == "succeeded"
+        assert lines[-2:] == ["a", "b"]
+        assert more == []
+
+    def test_event_loop_stays_responsive(self):
+        """Queries are answered while a long job is running, and it can be cancelled."""
+        async def scenario():
+            manager = BuildJobManager(max_concurrent=1)
+            slow = manager.submit("slow", [[PYTHON, "-c", "import time; time.sleep(30)"]])
+            queued = manager.submit("queued", [[PYTHON, "-c", "pass"]])
+            await asyncio.sleep(0.2)
+            states = (slow.status, queued.status)
+            assert manager.cancel(slow.job_id)
+            await manager.wait(slow.job_id)
+            await manager.wait(queued.job_id)
+            return states, slow.status, queued.status
+
+        states, slow_status, queued_status = asyncio.run(asyncio.wait_for(scenario(), 10))
+        assert states == ("running", "queued")
+        assert slow_status == "cancelled"
+        assert queued_status == "succeeded"
+
+    def test_result_cache_by_source_hash(self):
+        """Identical (component, profile, source hash) builds reuse the result."""
+        source = self.temp_dir / "openssl-crypto"
+        source.mkdir()
+        (source / "conanfile.py").write_text("# v1")
+
+        async def scenario():
+            manager = BuildJobManager()
+            key = ("crypto", "Release", await manager.source_hash(source))
+            first = manager.submit("build", [[PYTHON, "-c", "pass"]], cache_key=key)
+            await manager.wait(first.job_id)
+            again = manager.submit("build", [[PYTHON, "-c", "pass"]], cache_key=key)
+            (source / "conanfile.py").write_text("# v2")
+            changed = ("crypto", "Release", await manager.source_hash(source))
+            return first, again, key != changed
+
+        first, again, hash_changed = asyncio.run(scenario())
+        assert again is first
+        assert hash_changed
+
+    def test_timeout(self):
+        """Jobs exceeding their timeout are killed."""
+        async def scenario():
+            manager = BuildJobManager()
+            job = manager.submit("slow", [[PYTHON, "-c", "import time; time.sleep(30)"]],
+                                 timeout=0.5)
+            return await manager.wait(job.job_id)
+
+        job = asyncio.run(asyncio.wait_for(scenario(), 10))
+        assert job.status == "timeout"
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+    def test_timeout_kills_process_tree(self):
+        """The whole process group is killed, including processes the build spawned."""
+        pid_file = self.temp_dir / "child.pid"
+        script = ("import subprocess, sys, time; "
+                  "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+                  f"open({str(pid_file)!r}, 'w').write(str(child.pid)); time.sleep(30)")
+
+        async def scenario():
+            manager = BuildJobManager()
+            job = manager.submit("tree", [[PYTHON, "-c", script]], timeout=1)
+            return await manager.wait(job.job_id)
+
+        job = asyncio.run(asyncio.wait_for(scenario(), 10))
+        assert job.status == "timeout"
+        child = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and _alive(child):
+            time.sleep(0.05)
+        assert not _alive(child)
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="needs /proc")
+    def test_failed_read_kills_process(self, monkeypatch):
+        """A job that fails while reading output (line over the stream limit) is killed, not orphaned."""
+        monkeypatch.setattr(build_jobs, "STREAM_LIMIT", 1024)
+        pid_file = self.temp_dir / "build.pid"
+        script = (f"import os, sys, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+                  "print('x' * 4096, flush=True); time.sleep(30)")
+
+        async def scenario():
+            manager = BuildJobManager()
+            job = manager.submit("long-line", [[PYTHON, "-c", script]])
+            return await manager.wait(job.job_id)
+
+        job = asyncio.run(asyncio.wait_for(scenario(), 10))
+        assert job.status == "failed"
+        assert not _alive(int(pid_file.read_text()))
+
+    def test_finished_jobs_are_evicted(self):
+        """Only the newest max_finished_jobs finished jobs and their cached results are kept."""
+        async def scenario():
+            manager = BuildJobManager(max_finished_jobs=2)
+            jobs = []
+            for i in range(4):
+                job = manager.submit(f"job{i}", [[PYTHON, "-c", "pass"]], cache_key=(str(i),))
+                await manager.wait(job.job_id)
+                jobs.append(job)
+            return manager, jobs
+
+        manager, jobs = asyncio.run(scenario())
+        assert list(manager.jobs) == [job.job_id for job in jobs[2:]]
+        assert set(manager._results) == {("2",), ("3",)}
+
+
+def _alive(pid):
+    """Whether pid is a running (not zombie) process"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the pooled build tracking store (SQLite backend).
+"""
+
+import asyncio
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.monitoring.build_tracking import BuildTrackingStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BuildTrackingStore(f"sqlite:///{tmp_path / 'builds.db'}", pool_size=2, batch_size=3)
+    yield store
+    store.close()
+
+
+class TestBuildTrackingStore:
+    """Test cases for BuildTrackingStore."""
+
+    def test_finish_build_is_batched(self, store):
+        """Completions are queued until the batch fills or flush() is called."""
+        ids = [store.start_build("openssl") for _ in range(4)]
+
+        store.finish_build(ids[0], "success")
+        store.finish_build(ids[1], "failed", "boom")
+        conn = sqlite3.connect(str(store.sqlite_path))
+        assert conn.execute("SELECT COUNT(*) FROM build_status WHERE status = 'running'").fetchone()[0] == 4
+
+        store.finish_build(ids[2], "success")  # batch_size reached
+        assert conn.execute("SELECT COUNT(*) FROM build_status WHERE status = 'running'").fetchone()[0] == 1
+
+        store.finish_build(ids[3], "success")
+        store.flush()
+        statuses = dict(conn.execute("SELECT id, status FROM build_status").fetchall())
+        assert statuses == {1: "success", 2: "failed", 3: "success", 4: "success"}
+        conn.close()
+
+    def test_async_queries(self, store):
+        """Queries run on the executor and return rows."""
+        assert asyncio.run(store.recent_builds(5)) == []
+        conn = sqlite3.connect(str(store.sqlite_path))
+        conn.execute("INSERT INTO components (name) VALUES ('openssl')")
+        conn.executemany(
+            "INSERT INTO builds (component_id, status, build_duration_seconds, platform, profile) "
+            "VALUES (1, ?, ?, 'linux', 'gcc11')",
+            [("completed", 10.0), ("failed", 30.0)],
+        )
+        conn.commit()
+        conn.close()
+
+        async def run():
+            return await asyncio.gather(
+                store.recent_builds(5),
+                store.component_history("openssl", 5),
+                store.build_metrics(7),
+            )
+
+        recent, history, metrics = asyncio.run(run())
+
+        assert len(recent) == 2
+        assert {row[4] for row in history} == {"gcc11"}
+        assert metrics == (2, 1, 20.0)
+
+    def test_close_releases_every_thread_connection(self, store):
+        """Connections opened on executor threads are closed too, not just the caller's."""
+        async def run():
+            await asyncio.gather(*(store.recent_builds(5) for _ in range(4)))
+
+        asyncio.run(run())
+        store.start_build("openssl")
+        conns = list(store._sqlite_conns)
+        assert len(conns) >= 2
+
+        store.close()
+
+        for conn in conns:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_callers_beyond_pool_size_wait(self, store):
+        """More concurrent callers than pool_size block for a connection instead of failing."""
+        class Pool:
+            def __init__(self, size):
+                self.free = [object() for _ in range(size)]
+
+            def getconn(self):
+                if not self.free:
+                    raise RuntimeError("connection pool exhausted")
+                return self.free.pop()
+
+            def putconn(self, conn):
+                self.free.append(conn)
+
+        store.backend, store._pool = "postgres", Pool(store.pool_size)
+        errors = []
+
+        def borrow():
+            try:
+                with store._connection():
+                    time.sleep(0.05)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=borrow) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        store._pool, store.backend = None, "sqlite"
+
+        assert errors == []
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy package loading and the CLI startup budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.foundation.command_line.startup_benchmark import (
+    CLI_MODULE,
+    DEFAULT_BUDGET_MS,
+    HEAVY_MODULES,
+    measure_startup,
+)
+
+# Command implementations the CLI used to import eagerly at startup
+COMMAND_PACKAGES = (
+    "openssl_tools.automation",
+    "openssl_tools.development",
+    "openssl_tools.commands",
+)
+
+
+class TestCliStartup:
+    """Test cases for CLI startup cost."""
+
+    @pytest.mark.performance
+    def test_import_time_budget(self):
+        """The CLI entry point imports within budget and without heavy modules."""
+        result = measure_startup(CLI_MODULE, runs=3)
+
+        assert result["heavy_modules"] == []
+        assert result["import_ms"] <= DEFAULT_BUDGET_MS
+
+    def test_version_does_not_load_commands(self):
+        """--version works without importing command implementations or heavy modules."""
+        probe = (
+            "import runpy, sys; "
+            "sys.argv = ['openssl-tools', '--version']\n"
+            "try:\n"
+            f"    runpy.run_module({CLI_MODULE!r}, run_name='__main__')\n"
+            "except SystemExit as e:\n"
+            "    assert not e.code, e.code\n"
+            f"print(sorted(m for m in sys.modules if m.startswith({COMMAND_PACKAGES!r}) "
+            f"or m.split('.')[0] in {HEAVY_MODULES!r}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, cwd=project_root,
+        )
+
+        assert result.returncode == 0, result.stderr
+        version, loaded = result.stdout.splitlines()
+        assert version.startswith("OpenSSL Tools")
+        assert loaded == "[]"
+
+    def test_lazy_package_attributes(self):
+        """Public names are still reachable and listed after lazy loading."""
+        probe = (
+            "import sys, openssl_tools, openssl_tools.foundation as f; "
+            "assert 'automation' in dir(openssl_tools); "
+            "assert 'openssl_tools.automation' not in sys.modules; "
+            "assert callable(f.parse_openssl_version); "
+            "assert 'parse_openssl_version' in vars(f)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, cwd=project_root,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for artifact and metrics collection from Conan's JSON graph output.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.conan_orchestrator import ConanOrchestrator
+
+
+def create_graph(package_folder, zlib_folder):
+    return {
+        "graph": {
+            "nodes": {
+                "0": {"ref": "conanfile", "recipe": "Cli", "binary": None,
+                      "dependencies": {"1": {"direct": True}, "2": {"direct": False}}},
+                "1": {"ref": "openssl/3.2.0#abc", "rrev": "abc", "package_id": "pid1", "prev": "p1",
+                      "binary": "Build", "package_folder": str(package_folder)},
+                "2": {"ref": "zlib/1.3#def", "rrev": "def", "package_id": "pid2", "prev": "p2",
+                      "binary": "Cache", "package_folder": str(zlib_folder)},
+            }
+        }
+    }
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    orchestrator = ConanOrchestrator(project)
+    (orchestrator.profiles_dir / "default.profile").write_text("[settings]\n")
+    return orchestrator
+
+
+class TestBuildPackage:
+    """Test cases for ConanOrchestrator.build_package."""
+
+    def test_artifacts_and_metrics_from_graph(self, orchestrator, tmp_path, monkeypatch):
+        """Artifacts come from the created package folder only, each file once."""
+        package = tmp_path / "p" / "openssl"
+        (package / "lib").mkdir(parents=True)
+        (package / "bin").mkdir()
+        (package / "lib" / "libssl.so.3").write_bytes(b"x" * 10)  # matches libssl.* and *.so*
+        (package / "lib" / "libcrypto.a").write_bytes(b"y" * 5)
+        (package / "bin" / "openssl").write_bytes(b"z")
+        (package / "include").mkdir()
+        (package / "include" / "ssl.h").write_text("")
+        zlib = tmp_path / "p" / "zlib"
+        zlib.mkdir()
+        (zlib / "libz.a").write_bytes(b"z")
+        (orchestrator.project_root / "stale.so").write_bytes(b"old")
+
+        commands = []
+
+        def fake_run(command, cwd=None, capture_output=False, log_file=None, conan_home=None):
+            commands.append(command)
+            return True, json.dumps(create_graph(package, zlib)), ""
+
+        monkeypatch.setattr(orchestrator, "_run_conan_command", fake_run)
+        result = orchestrator.build_package("default")
+
+        assert result.success
+        assert "--format=json" in commands[0]
+        assert sorted(path.name for path in result.artifacts) == ["libcrypto.a", "libssl.so.3", "openssl"]
+        metrics = result.metrics
+        assert metrics["artifact_count"] == 3
+        assert metrics["artifact_bytes"] == 16
+        assert metrics["dependency_count"] == 2
+        assert metrics["binaries"] == {"Build": 1, "Cache": 1}
+        assert (metrics["packages_built"], metrics["packages_from_cache"]) == (1, 1)
+        assert metrics["package"] == {"ref": "openssl/3.2.0#abc", "recipe_revision": "abc",
+                                      "package_id": "pid1", "package_revision": "p1", "binary": "Build"}
+
+    def test_falls_back_to_project_walk(self, orchestrator, monkeypatch):
+        """Without parsable graph output the project tree is walked once."""
+        (orchestrator.project_root / "build").mkdir()
+        (orchestrator.project_root / "build" / "libssl.so").write_bytes(b"x")
+        monkeypatch.setattr(orchestrator, "_run_conan_command",
+                            lambda command, **kwargs: (True, "not json", ""))
+
+        result = orchestrator.build_package("default")
+
+        assert [path.name for path in result.artifacts] == ["libssl.so"]
+        assert "package" not in result.metrics
+
+
+def dependency_graph(zlib_id, openssl_binary="Missing"):
+    return {
+        "graph": {
+            "nodes": {
+                "0": {"ref": "openssl/3.5.0", "binary": None, "dependencies": {"1": {}, "2": {}}},
+                "1": {"ref": "zlib/1.3#def", "package_id": zlib_id, "binary": "Missing"},
+                "2": {"ref": "nasm/2.16#ghi", "package_id": "nasm", "binary": openssl_binary},
+            }
+        }
+    }
+
+
+class TestBuildCampaign:
+    """Test cases for ConanOrchestrator.build_campaign."""
+
+    def test_shared_dependencies_built_once(self, orchestrator, monkeypatch, tmp_path):
+        """Shared binaries are built once, then every profile is built in its own Conan home."""
+        for name in ("gcc", "clang"):
+            (orchestrator.profiles_dir / f"{name}.profile").write_text("[settings]\n")
+        main_home = tmp_path / "conan-home"
+        (main_home / "profiles").mkdir(parents=True)
+        (main_home / "profiles" / "default").write_text("[settings]\n")
+        (main_home / "remotes.json").write_text("{}")
+        commands = []
+
+        def fake_run(command, cwd=None, capture_output=False, log_file=None, conan_home=None):
+            commands.append((command, conan_home))
+            profile = next((Path(arg).stem for arg in command if arg.endswith(".profile")), None)
+            if command[:2] == ["graph", "info"]:
+                return True, json.dumps(dependency_graph(f"zlib-{profile}")), ""
+            if command[:2] == ["config", "home"]:
+                return True, f"{main_home}\n", ""
+            if command[0] == "install" and "--output-folder" in command:
+                assert log_file.parent.name == profile and conan_home.parent.name == profile
+                graph = dependency_graph(f"zlib-{profile}", openssl_binary="Cache")
+                graph["graph"]["nodes"]["3"] = {"ref": "openssl/3.5.0#abc", "binary": "Build"}
+                graph["graph"]["nodes"]["1"]["binary"] = "Build"
+                return True, json.dumps(graph), ""
+            if command[0] == "install":
+                return True, json.dumps(dependency_graph("nasm")), ""
+            return True, "", ""
+
+        monkeypatch.setattr(orchestrator, "_run_conan_command", fake_run)
+        campaign = orchestrator.build_campaign(["gcc", "clang"], cpu_budget=8)
+
+        assert campaign.success, campaign.error
+        assert campaign.shared_dependencies == ["nasm/2.16#ghi"]
+        shared_builds = [c for c, home in commands if c[0] == "install" and "--output-folder" not in c]
+        assert len(shared_builds) == 1
+        assert "nasm/2.16#ghi" in shared_builds[0] and "tools.build:jobs=8" in shared_builds[0]
+        saves = [c for c, home in commands if c[:2] == ["cache", "save"]]
+        assert len(saves) == 1
+        assert all(home is None for c, home in commands if c[0] in ("graph", "list") or c in shared_builds)
+        archive = saves[0][saves[0].index("--file") + 1]
+
+        profile_builds = [(c, home) for c, home in commands if c[0] == "install" and "--output-folder" in c]
+        assert len(profile_builds) == 2
+        assert all("openssl/3.5.0" in c and "tools.build:jobs=4" in c for c, home in profile_builds)
+        homes = {home for c, home in profile_builds}
+        assert len(homes) == 2
+        for home in homes:
+            # Every home is seeded with the main configuration, the shared binaries and the recipe
+            assert (home / "profiles" / "default").exists() and (home / "remotes.json").exists()
+            assert (["cache", "restore", archive], home) in commands
+            assert (["export", "."], home) in commands
+
+        gcc = campaign.results["gcc"].metrics
+        assert (gcc["packages_built"], gcc["packages_from_cache"]) == (2, 1)
+        assert gcc["cache_reuse"] == pytest.approx(1 / 3)
+
+        report = json.loads(orchestrator.generate_campaign_report(campaign).read_text())
+        assert set(report["profiles"]) == {"gcc", "clang"}
+        assert report["profiles"]["clang"]["jobs"] == 4
+
+    def test_missing_profile(self, orchestrator):
+        campaign = orchestrator.build_campaign(["default", "nope"])
+        assert not campaign.success
+        assert "nope" in campaign.error
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental folder sync in copy_tools.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.util import copy_tools
+from openssl_tools.util.copy_tools import copy_folder, get_file_metadata, hash_file, sync_folder
+
+
+def make_tree(root, files):
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+def read_tree(root):
+    return {
+        str(path.relative_to(root)).replace(os.sep, '/'): path.read_bytes()
+        for path in root.rglob('*') if path.is_file()
+    }
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / 'src'
+    make_tree(root, {
+        'lib/libcrypto.a': os.urandom(300_000),
+        'lib/libssl.a': os.urandom(100_000),
+        'include/openssl/ssl.h': b'#define SSL 1\n',
+        'conaninfo.txt': b'[settings]\n',
+    })
+    return root
+
+
+class TestCopyTools:
+    """Test cases for hashing and incremental folder sync."""
+
+    @pytest.mark.parametrize('mmap_threshold', [0, 1 << 30])
+    def test_hash_file_matches_hashlib(self, source, monkeypatch, mmap_threshold):
+        """Chunked and memory-mapped hashing agree with a whole-file hash."""
+        monkeypatch.setattr(copy_tools, 'MMAP_THRESHOLD', mmap_threshold)
+        monkeypatch.setattr(copy_tools, 'HASH_CHUNK_SIZE', 65536)
+        path = source / 'lib' / 'libcrypto.a'
+        expected = hashlib.md5(path.read_bytes()).hexdigest()
+        assert hash_file(path) == expected
+        assert get_file_metadata(path)['MD5'] == expected
+
+    def test_initial_sync_copies_everything(self, source, tmp_path):
+        """A fresh destination receives an identical tree with source timestamps."""
+        destination = tmp_path / 'dst'
+        report = sync_folder(source, destination, jobs=4)
+
+        assert sorted(report.copied) == sorted(read_tree(source))
+        assert read_tree(destination) == read_tree(source)
+        src_stat = (source / 'lib' / 'libssl.a').stat()
+        assert (destination / 'lib' / 'libssl.a').stat().st_mtime_ns == src_stat.st_mtime_ns
+        assert not list(destination.rglob('*.tmp'))
+
+    def test_resync_copies_only_changes(self, source, tmp_path):
+        """Unchanged files are skipped, changed files copied, stale files removed."""
+        destination = tmp_path / 'dst'
+        sync_folder(source, destination)
+        (source / 'conaninfo.txt').write_bytes(b'[settings]\nos=Linux\n')
+        (source / 'include' / 'openssl' / 'ssl.h').touch()  # new mtime, same content
+        (source / 'lib' / 'libssl.a').unlink()
+        make_tree(source, {'bin/openssl': b'\x7fELF'})
+        make_tree(destination, {'stale/old.txt': b'old'})
+
+        report = sync_folder(source, destination)
+
+        assert sorted(report.copied) == ['bin/openssl', 'conaninfo.txt']
+        assert sorted(report.unchanged) == ['include/openssl/ssl.h', 'lib/libcrypto.a']
+        assert sorted(report.removed) == ['lib/libssl.a', 'stale/old.txt']
+        assert read_tree(destination) == read_tree(source)
+        assert not (destination / 'stale').exists()
+
+        report = sync_folder(source, destination)
+        assert report.copied == [] and report.removed == []
+
+    def test_copy_folder_preserves_destination_inode(self, source, tmp_path):
+        """copy_folder no longer deletes and recopies unchanged files."""
+        destination = tmp_path / 'dst'
+        copy_folder(source, destination)
+        inode = (destination / 'lib' / 'libcrypto.a').stat().st_ino
+        copy_folder(source, destination)
+        assert (destination / 'lib' / 'libcrypto.a').stat().st_ino == inode
+        assert read_tree(destination) == read_tree(source)
+
+    @pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32', reason='needs symlinks')
+    def test_symlinked_directories_are_followed(self, source, tmp_path):
+        """Directory symlinks are copied as directories, like shutil.copytree; cycles are skipped."""
+        (source / 'lib64').symlink_to(source / 'lib', target_is_directory=True)
+        (source / 'include' / 'openssl' / 'loop').symlink_to(source / 'include', target_is_directory=True)
+        destination = tmp_path / 'dst'
+
+        copy_folder(source, destination)
+
+        assert not (destination / 'lib64').is_symlink()
+        assert (destination / 'lib64' / 'libssl.a').read_bytes() == (source / 'lib' / 'libssl.a').read_bytes()
+        assert not (destination / 'include' / 'openssl' / 'loop').exists()
+        assert sync_folder(source, destination).copied == []
+
+    @pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32', reason='needs symlinks')
+    def test_symlinks_in_destination_are_not_followed(self, source, tmp_path):
+        """Destination symlinks are removed or replaced, never deleted through."""
+        outside = tmp_path / 'outside'
+        make_tree(outside, {'precious.txt': b'keep', 'lib/libssl.a': b'keep'})
+        destination = tmp_path / 'dst'
+        copy_folder(source, destination)
+        (destination / 'link').symlink_to(outside, target_is_directory=True)
+        (destination / 'lib').rename(tmp_path / 'old-lib')
+        (destination / 'lib').symlink_to(outside / 'lib', target_is_directory=True)
+        (destination / 'conaninfo.txt').unlink()
+        (destination / 'conaninfo.txt').symlink_to(outside / 'precious.txt')
+
+        report = sync_folder(source, destination)
+
+        assert read_tree(outside) == {'precious.txt': b'keep', 'lib/libssl.a': b'keep'}
+        assert 'link' in report.removed and not os.path.lexists(destination / 'link')
+        assert not (destination / 'lib').is_symlink() and not (destination / 'conaninfo.txt').is_symlink()
+        assert read_tree(destination) == read_tree(source)
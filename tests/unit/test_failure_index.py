@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the workflow failure signature index.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.ai_agents.failure_index import (
+    FailureSignatureIndex, fingerprint, normalize_line
+)
+
+RUN_1 = """2024-05-01T10:00:00.1234567Z ##[group]Run make test
+2024-05-01T10:00:01.0000000Z make: *** [Makefile:42] Error 2 in /home/runner/work/openssl/openssl/build
+2024-05-01T10:00:02.0000000Z curl: (6) timed out fetching https://example.com/a1b2c3d4e5f6
+2024-05-01T10:00:03.0000000Z ok 17 - all good
+"""
+
+RUN_2 = """2024-06-12T08:30:15.7654321Z make: *** [Makefile:57] Error 2 in /home/runner/work/openssl/other/build
+2024-06-12T08:30:16.0000000Z /bin/sh: cmake: command not found
+"""
+
+
+class TestNormalization:
+    """Test cases for log line fingerprints."""
+
+    def test_run_specific_parts_are_stripped(self):
+        line = "2024-05-01T10:00:01.0000000Z fatal: commit 9f3e2a1b0c not found at /tmp/x/y (attempt 3)"
+        assert normalize_line(line) == "fatal: commit <hash> not found at <path> (attempt <n>)"
+
+    def test_same_failure_same_fingerprint(self):
+        assert fingerprint(RUN_1.splitlines()[1]) == fingerprint(RUN_2.splitlines()[0])
+        assert fingerprint(RUN_1.splitlines()[1]) != fingerprint(RUN_2.splitlines()[1])
+
+
+class TestFailureSignatureIndex:
+    """Test cases for FailureSignatureIndex."""
+
+    def test_runs_are_indexed_once_and_classified(self, tmp_path):
+        index = FailureSignatureIndex(tmp_path / "failures.db")
+        assert len(index.add_run(1, RUN_1, repo="openssl/openssl")) == 2  # passing lines are ignored
+        index.add_run(2, RUN_2)
+        index.add_run(2, RUN_2)  # re-indexing does not double count
+        index.close()
+
+        index = FailureSignatureIndex(tmp_path / "failures.db")
+        assert index.has_run(1) and not index.has_run(3)
+        assert index.run_count() == 2
+        assert index.issue_types([1]) == {"timeout_issues"}
+        assert index.issue_types([2]) == {"environment_issues"}
+
+        recurring = index.recurring([2])
+        assert len(recurring) == 1 and recurring[0]["runs"] == 2
+
+    def test_seen_before_and_known_fixes(self):
+        index = FailureSignatureIndex()
+        index.add_run(1, RUN_1)
+        index.add_run(2, RUN_2)
+        line = "make: *** [Makefile:9] Error 2 in /srv/ci/build"
+        index.add_fix(line, "Run make with -j1 to see the failing target")
+
+        history = index.seen_before(line)
+        assert history["runs"] == 2 and history["recent_runs"] == [2, 1]
+        assert history["fix"] == "Run make with -j1 to see the failing target"
+        assert index.seen_before(history["fingerprint"]) == history
+        assert index.seen_before("error: something new") is None
+
+        classified = index.classify(RUN_2 + "\nerror: linker failed on libssl.so.3\n")
+        assert [entry["runs"] for entry in classified["known"]] == [2, 1]
+        assert classified["known"][0]["fix"] is not None
+        assert [entry["sample"] for entry in classified["new"]] == ["error: linker failed on libssl.so.3"]
+
+    def test_issue_pattern_lines_are_indexed(self):
+        """Every line an issue pattern classifies is fingerprinted, not only lines with failure words."""
+        index = FailureSignatureIndex()
+        index.add_run(1, "npm ERR! code ENOTFOUND\n"
+                         "npm ERR! network getaddrinfo ENOTFOUND registry.npmjs.org\n"
+                         "Warning: cmake is not on the PATH\n"
+                         "ok 1 - passed\n")
+
+        assert sorted(index.run_signatures([1]).values()) == [
+            "dependency_issues", "dependency_issues", "environment_issues"
+        ]
+        assert index.issue_types([1]) == {"dependency_issues", "environment_issues"}
+
+
+class TestWorkflowFixerRecordsFixes:
+    """Test cases for recording suggested and applied fixes in the index."""
+
+    def test_fixes_are_recorded_against_signatures(self):
+        pytest.importorskip("mcp")
+        pytest.importorskip("httpx")
+        pytest.importorskip("jinja2")
+        pytest.importorskip("tenacity")
+        from openssl_tools.automation.ai_agents.workflow_fixer import GitHubWorkflowFixer, WorkflowRun
+
+        index = FailureSignatureIndex()
+        fixer = GitHubWorkflowFixer("openssl/openssl", token="t", failure_index=index)
+        logs = {1: RUN_1, 2: RUN_2}
+
+        async def get_workflow_logs(run_id):
+            return logs[run_id]
+
+        fixer.get_workflow_logs = get_workflow_logs
+        runs = [WorkflowRun(id=run_id, name="CI", status="completed", conclusion="failure", workflow_name="CI",
+                            head_branch="main", created_at="", updated_at="", html_url="")
+                for run_id in logs]
+
+        async def analyze_and_apply():
+            analysis = await fixer.analyze_workflow_failures(runs)
+            timeout_fix = next(fix for fix in analysis.suggested_fixes if fix.issue_type == "timeout_issues")
+            await fixer.apply_fix(timeout_fix, dry_run=False)
+            await fixer.client.aclose()
+            return analysis
+
+        analysis = asyncio.run(analyze_and_apply())
+        assert {fix.issue_type for fix in analysis.suggested_fixes} == {"timeout_issues", "environment_issues"}
+        assert "applied to .github/workflows/ci.yml" in index.seen_before(RUN_1.splitlines()[2])["fix"]
+        environment_fix = index.seen_before(RUN_2.splitlines()[1])["fix"]
+        assert environment_fix == "Fix environment setup and PATH issues"
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental full_deploy_enhanced Conan deployer.
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+spec = importlib.util.spec_from_file_location(
+    "full_deploy_enhanced", project_root / "extensions" / "deployers" / "full_deploy_enhanced.py"
+)
+full_deploy_enhanced = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(full_deploy_enhanced)
+
+
+class Output:
+    def info(self, message):
+        pass
+
+
+def make_dep(package_folder, name, version="1.0", prev="p1"):
+    ref = SimpleNamespace(name=name, version=version)
+    return SimpleNamespace(ref=ref, pref=f"{name}/{version}#r1:pid#{prev}", context="host",
+                           package_folder=str(package_folder))
+
+
+def make_graph(deps):
+    conanfile = SimpleNamespace(conf=None, output=Output(),
+                                dependencies={dep.ref.name: dep for dep in deps})
+    return SimpleNamespace(root=SimpleNamespace(conanfile=conanfile))
+
+
+@pytest.fixture
+def package(tmp_path):
+    folder = tmp_path / "cache" / "openssl"
+    (folder / "lib" / "engines").mkdir(parents=True)
+    (folder / "lib" / "libssl.so.3").write_bytes(b"ssl" * 30000)
+    (folder / "lib" / "libssl.so").symlink_to("libssl.so.3")
+    (folder / "lib" / "engines" / "afalg.so").write_bytes(b"engine")
+    (folder / "lib64").symlink_to("lib", target_is_directory=True)
+    return folder
+
+
+def deploy(output, deps, mode="copy"):
+    os.environ["OPENSSL_DEPLOY_MODE"] = mode
+    try:
+        full_deploy_enhanced.deploy(make_graph(deps), str(output))
+    finally:
+        del os.environ["OPENSSL_DEPLOY_MODE"]
+    return json.loads((output / "full_deploy" / full_deploy_enhanced.MANIFEST_NAME).read_text())
+
+
+class TestFullDeployEnhanced:
+    """Test cases for the full_deploy_enhanced deployer."""
+
+    def test_symlinked_directories_are_preserved(self, tmp_path, package):
+        manifest = deploy(tmp_path / "out", [make_dep(package, "openssl")])
+
+        target = tmp_path / "out" / "full_deploy" / "host" / "openssl" / "1.0"
+        assert (target / "lib64").is_symlink() and os.readlink(target / "lib64") == "lib"
+        assert (target / "lib64" / "engines" / "afalg.so").read_bytes() == b"engine"
+        assert os.readlink(target / "lib" / "libssl.so") == "libssl.so.3"
+        entry = manifest["host/openssl/1.0"]
+        assert entry["links"] == {"lib64": "lib", "lib/libssl.so": "libssl.so.3"}
+        assert set(entry["files"]) == {"lib/libssl.so.3", "lib/engines/afalg.so"}
+
+    def test_unchanged_packages_are_skipped(self, tmp_path, package, monkeypatch):
+        output = tmp_path / "out"
+        dep = make_dep(package, "openssl")
+        deploy(output, [dep])
+        target = output / "full_deploy" / "host" / "openssl" / "1.0"
+
+        materialized = []
+        original = full_deploy_enhanced._materialize
+        monkeypatch.setattr(full_deploy_enhanced, "_materialize",
+                            lambda src, dst, mode: materialized.append(src) or original(src, dst, mode))
+        assert deploy(output, [dep])["host/openssl/1.0"]["skipped"]
+        assert materialized == []
+
+        # Same size, different content and mtime: redeployed
+        stat = os.stat(target / "lib" / "engines" / "afalg.so")
+        (target / "lib" / "engines" / "afalg.so").write_bytes(b"ENGINE")
+        os.utime(target / "lib" / "engines" / "afalg.so", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert not deploy(output, [dep])["host/openssl/1.0"]["skipped"]  # small file hash differs
+        assert (target / "lib" / "engines" / "afalg.so").read_bytes() == b"engine"
+
+        (target / "lib" / "libssl.so.3").write_bytes(b"SSL" * 30000)
+        assert not deploy(output, [dep])["host/openssl/1.0"]["skipped"]  # large file: mtime differs
+
+        # A new package revision is always redeployed
+        assert not deploy(output, [make_dep(package, "openssl", prev="p2")])["host/openssl/1.0"]["skipped"]
+
+    def test_removed_dependencies_are_deleted(self, tmp_path, package):
+        output = tmp_path / "out"
+        zlib = tmp_path / "cache" / "zlib"
+        zlib.mkdir()
+        (zlib / "libz.a").write_bytes(b"z")
+        deploy(output, [make_dep(package, "openssl"), make_dep(zlib, "zlib")])
+        assert (output / "full_deploy" / "host" / "zlib" / "1.0" / "libz.a").exists()
+
+        manifest = deploy(output, [make_dep(package, "openssl", version="1.1")])
+
+        assert set(manifest) == {"host/openssl/1.1"}
+        assert not (output / "full_deploy" / "host" / "zlib").exists()
+        assert sorted(os.listdir(output / "full_deploy" / "host" / "openssl")) == ["1.1"]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact dependency graph analyzer used by ``conan openssl:graph``.
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "extensions" / "graph"))
+
+from analyzer import GraphCache, analyze_graph, graph_cache_key, load_graph, save_graph
+
+
+def _node(ref, deps, binary="Cache", recipe="Cache", fips=False, context="host"):
+    name, version = ref.split("/") if ref else (None, None)
+    return {"ref": ref, "name": name, "version": version, "context": context,
+            "binary": binary, "recipe": recipe, "fips": fips, "deps": deps}
+
+
+def _sample_graph():
+    return {
+        "format": 1,
+        "root": "0",
+        "error": None,
+        "nodes": {
+            "0": _node(None, ["1", "2"], binary=None, recipe="Consumer"),
+            "1": _node("openssl/3.2.0", ["3"], binary="Build", fips=True),
+            "2": _node("zlib/1.3", [], recipe="Update available"),
+            "3": _node("perl/5.38", [], binary="Missing", context="build"),
+        },
+    }
+
+
+class TestAnalyzeGraph:
+    """Test cases for analyze_graph."""
+
+    def test_single_pass_results(self):
+        """All findings are computed from the compact graph."""
+        results = analyze_graph(_sample_graph(), build_costs={"openssl": 300, "perl": 60})
+
+        assert results["total_deps"] == 3
+        assert results["fips_enabled"] == ["openssl/3.2.0"]
+        assert results["outdated"] == ["zlib/1.3"]
+        assert sorted(results["to_build"]) == ["openssl/3.2.0", "perl/5.38"]
+        assert results["critical_path"] == ["openssl/3.2.0", "perl/5.38"]
+        assert results["critical_path_cost"] == 360.0
+        assert results["conflicts"] == []
+
+    def test_conflicting_versions(self):
+        """The same package resolved twice in one context is a conflict."""
+        graph = _sample_graph()
+        graph["nodes"]["2"] = _node("perl/5.36", [], context="build")
+        results = analyze_graph(graph)
+
+        assert len(results["conflicts"]) == 1
+        assert "perl/5.36" in results["conflicts"][0]
+
+    def test_shared_dependency_visited_once(self):
+        """Diamond dependencies are only reported once."""
+        graph = _sample_graph()
+        graph["nodes"]["2"]["deps"] = ["3"]
+        results = analyze_graph(graph)
+
+        assert [d["name"] for d in results["dependencies"]].count("perl") == 1
+
+
+class TestGraphCache:
+    """Test cases for the on-disk graph cache."""
+
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_roundtrip(self):
+        """Exported graphs load back unchanged."""
+        path = save_graph(_sample_graph(), self.temp_dir / "graph.json")
+        assert load_graph(path) == _sample_graph()
+
+    def test_cache_key_depends_on_inputs(self):
+        """Different lockfile contents produce different keys."""
+        cache = GraphCache(self.temp_dir / "cache")
+        key = graph_cache_key("conanfile", "lock-a", "profile")
+
+        assert key != graph_cache_key("conanfile", "lock-b", "profile")
+        assert cache.get(key) is None
+        cache.put(key, _sample_graph())
+        assert cache.get(key) == _sample_graph()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent deployment health probing against a local HTTP server.
+"""
+
+import base64
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.continuous_integration.deployment import DeploymentManager
+from openssl_tools.automation.continuous_integration.health_probe import HealthCheckEngine
+
+
+class StandInServer(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so connection reuse is observable
+    connections = set()
+    delay = 0.3
+    authorized = {'Bearer secret', 'Basic ' + base64.b64encode(b'ci:pw').decode()}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.connections.add(self.client_address)
+        authorization = self.headers.get('Authorization')
+        if self.path == '/v2/conans/private/1.0/_/_/latest':
+            status = 200 if authorization in self.authorized else 401
+        elif self.path == '/slow':
+            time.sleep(self.delay)
+            status = 200
+        elif self.path in ('/health', '/v2/conans/openssl/3.5.0/_/_/latest'):
+            status = 200
+        else:
+            status = 503
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+
+@pytest.fixture
+def server():
+    StandInServer.connections = set()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInServer)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHealthCheckEngine:
+    """Test cases for HealthCheckEngine."""
+
+    def test_checks_run_concurrently(self, server):
+        """Slow checks overlap instead of adding up; failures and timeouts are reported per check."""
+        checks = [
+            {'name': 'slow-a', 'type': 'http', 'url': f'{server}/slow'},
+            {'name': 'slow-b', 'type': 'http', 'url': f'{server}/slow'},
+            {'name': 'down', 'type': 'http', 'url': f'{server}/down'},
+            {'name': 'timeout', 'type': 'http', 'url': f'{server}/slow', 'timeout': 0.05},
+            {'name': 'command', 'type': 'command', 'command': f'{sys.executable} -c print(42)',
+             'expected_output': '42'},
+        ]
+        start = time.monotonic()
+        with HealthCheckEngine() as engine:
+            reports = engine.run_sync(checks)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 2 * StandInServer.delay
+        assert [report.passed for report in reports] == [True, True, False, False, True]
+        assert 'status 503' in reports[2].probes[0].error
+        assert 'timed out' in reports[3].probes[0].error
+
+    def test_repeated_probes_reuse_connections(self, server):
+        """Repeated probes share pooled connections and yield latency percentiles."""
+        checks = [{'name': 'health', 'type': 'http', 'url': f'{server}/health', 'probes': 20}]
+        with HealthCheckEngine() as engine:
+            report = engine.run_sync(checks)[0]
+
+        assert report.passed
+        assert len(report.probes) == 20
+        assert len(StandInServer.connections) == 1
+        latency = report.latency_percentiles()
+        assert 0 < latency['p50'] <= latency['p90'] <= latency['p99']
+        assert report.to_dict()['failures'] == 0
+
+    def test_conan_check_uses_remote_api(self, server):
+        """Conan checks query the remote's REST API instead of spawning the client."""
+        checks = [
+            {'name': 'found', 'type': 'conan', 'package_reference': 'openssl/3.5.0', 'remote': 'staging'},
+            {'name': 'missing', 'type': 'conan', 'package_reference': 'zlib/1.3', 'remote': 'staging'},
+        ]
+        with HealthCheckEngine(remote_urls={'staging': server}) as engine:
+            found, missing = engine.run_sync(checks)
+
+        assert found.passed
+        assert not missing.passed and 'zlib/1.3 not found' in missing.probes[0].error
+
+    def test_conan_check_authenticates(self, server, monkeypatch):
+        """Private remotes are queried with the remote's credentials or the check's token."""
+        monkeypatch.setenv('CONAN_LOGIN_USERNAME_PRIVATE_REMOTE', 'ci')
+        monkeypatch.setenv('CONAN_PASSWORD_PRIVATE_REMOTE', 'pw')
+        checks = [
+            {'name': 'env', 'type': 'conan', 'package_reference': 'private/1.0', 'remote': 'private-remote'},
+            {'name': 'token', 'type': 'conan', 'package_reference': 'private/1.0', 'remote': 'other',
+             'token': 'secret'},
+        ]
+        with HealthCheckEngine(remote_urls={'private-remote': server, 'other': server}) as engine:
+            assert [report.passed for report in engine.run_sync(checks)] == [True, True]
+
+    def test_unauthorized_conan_check_falls_back_to_client(self, server, tmp_path, monkeypatch):
+        """A 401 from the REST API is retried through `conan list`, which holds the client's login."""
+        conan = tmp_path / 'conan'
+        conan.write_text('#!/bin/sh\necho "$4: $2"\n')
+        conan.chmod(0o755)
+        monkeypatch.setenv('PATH', f'{tmp_path}{os.pathsep}{os.environ["PATH"]}')
+        for name in ('CONAN_LOGIN_USERNAME', 'CONAN_PASSWORD'):
+            monkeypatch.delenv(name, raising=False)
+        checks = [{'name': 'anonymous', 'type': 'conan', 'package_reference': 'private/1.0', 'remote': 'other'}]
+        with HealthCheckEngine(remote_urls={'other': server}) as engine:
+            report = engine.run_sync(checks)[0]
+
+        assert report.passed, report.probes[0].error
+
+
+class TestDeploymentUploads:
+    """Test cases for DeploymentManager.upload_packages."""
+
+    def test_uploads_are_bounded_and_deduplicated(self, tmp_path, monkeypatch):
+        packages = []
+        for i in range(6):
+            package = tmp_path / f'pkg{i}'
+            package.mkdir()
+            # Two binary packages per recipe reference
+            (package / 'conaninfo.txt').write_text(
+                f'name=lib{i // 2}\nversion=1.0\nuser=ci\nchannel=stable\n')
+            packages.append(package)
+
+        deployer = DeploymentManager(tmp_path / 'missing.yaml')
+        monkeypatch.setattr(deployer, '_setup_conan_remote', lambda name, url: True)
+        active, peak, uploaded = [0], [0], []
+        lock = threading.Lock()
+
+        def fake_upload(package_ref, remote_name):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+                uploaded.append(package_ref)
+            if package_ref.startswith('lib2'):
+                raise RuntimeError('denied')
+
+        monkeypatch.setattr(deployer, '_conan_upload', fake_upload)
+        assert not deployer.upload_packages(packages, 'staging', max_parallel=2)
+
+        assert sorted(uploaded) == ['lib0/1.0@ci/stable', 'lib1/1.0@ci/stable', 'lib2/1.0@ci/stable']
+        assert peak[0] == 2
+        statuses = [entry['status'] for entry in deployer.deployment_state['packages']]
+        assert statuses == ['uploaded'] * 4 + ['failed'] * 2
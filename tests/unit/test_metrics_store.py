@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the append-only CI build metrics store.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.monitoring.metrics_store import BuildMetricsStore
+
+
+def write_report(artifacts, name, **report):
+    directory = artifacts / name
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / 'performance_report.json').write_text(json.dumps(report))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BuildMetricsStore(tmp_path / 'metrics.db')
+    yield store
+    store.close()
+
+
+class TestBuildMetricsStore:
+    """Test cases for BuildMetricsStore."""
+
+    def test_run_summary(self, store, tmp_path):
+        """Totals, percentiles and cache-hit ratio match the ingested reports."""
+        artifacts = tmp_path / 'artifacts'
+        for i, build_time in enumerate([10, 20, 30, 40]):
+            write_report(artifacts, f'openssl-linux-gcc{i}-ubuntu', status='success' if i else 'failure',
+                         build_time=build_time, cache_hit=i % 2 == 0, packages=i)
+        (artifacts / 'logs').mkdir()
+
+        assert store.ingest(artifacts, 'run-1') == 4
+        summary = store.run_summary('run-1')
+
+        assert summary['total_jobs'] == 4
+        assert summary['successful_jobs'] == 3
+        assert summary['failed_jobs'] == 1
+        assert summary['builds'][0] == {'profile': 'linux-gcc0', 'os': 'ubuntu', 'status': 'failure',
+                                        'build_time': 10, 'cache_hit': True, 'packages': 0}
+        perf = summary['performance']
+        assert perf['total_build_time'] == 100
+        assert perf['average_build_time'] == 25
+        assert (perf['p50_build_time'], perf['p90_build_time']) == (20, 40)
+        assert (perf['cache_hits'], perf['cache_misses'], perf['cache_hit_rate']) == (2, 2, 0.5)
+
+    def test_ingest_is_incremental(self, store, tmp_path):
+        """Unchanged reports are not parsed again; changed ones replace their row."""
+        artifacts = tmp_path / 'artifacts'
+        write_report(artifacts, 'openssl-default-linux', status='success', build_time=5)
+        write_report(artifacts, 'openssl-fips-linux', status='success', build_time=7)
+        assert store.ingest(artifacts, 'run-1') == 2
+        assert store.ingest(artifacts, 'run-1') == 0
+
+        write_report(artifacts, 'openssl-fips-linux', status='failure', build_time=70.5)
+        assert store.ingest(artifacts, 'run-1') == 1
+        summary = store.run_summary('run-1')
+        assert (summary['total_jobs'], summary['failed_jobs']) == (2, 1)
+        assert summary['performance']['total_build_time'] == 75.5
+
+    def test_profile_trends_across_runs(self, tmp_path):
+        """History persists in the database and yields per-profile trends."""
+        db_path = tmp_path / 'metrics.db'
+        for run, build_time in enumerate([100, 80, 60]):
+            artifacts = tmp_path / f'run{run}'
+            write_report(artifacts, 'openssl-default-linux', status='success',
+                         build_time=build_time, cache_hit=run > 0)
+            store = BuildMetricsStore(db_path)
+            store.ingest(artifacts, f'run-{run}')
+            store.close()
+
+        store = BuildMetricsStore(db_path)
+        assert store.run_count() == 3
+        assert store.run_summary()['performance']['total_build_time'] == 60
+        trend = store.profile_trends(runs=2)['default']
+        store.close()
+        assert [(p['run_id'], p['average_build_time'], p['cache_hit_rate']) for p in trend] == [
+            ('run-1', 80, 1), ('run-2', 60, 1)
+        ]
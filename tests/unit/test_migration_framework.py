@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the analysis cache and parallel migration of the openssl-migration framework.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("click")
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "openssl-migration"))
+
+from core import migration_framework
+from core.migration_framework import MigrationConfig, MigrationFramework
+
+SHELL_SCRIPT = "#!/bin/sh\n# Build the library\nbuild() {\n    make -j4 all\n}\nbuild\n" + "# padding\n" * 10
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    for directory in ("build", "release"):
+        (repo / directory).mkdir(parents=True)
+    (repo / "build" / "compile.sh").write_text(SHELL_SCRIPT)
+    (repo / "release" / "publish.sh").write_text(SHELL_SCRIPT.replace("make -j4 all", "make dist"))
+    return repo
+
+
+def framework(tmp_path, **kwargs):
+    config = MigrationConfig(source_repo="openssl-tools", target_dir=tmp_path / "out",
+                             script_types=["shell", "perl"], **kwargs)
+    return MigrationFramework(config)
+
+
+class TestAnalysisCache:
+    """Test cases for the content-hash analysis cache."""
+
+    def test_touched_scripts_reuse_content_hash(self, tmp_path, repo, monkeypatch):
+        """Scripts whose mtime changed, or that were copied, are looked up by content before re-analysis."""
+        first = framework(tmp_path).analyze_repository(repo)
+
+        stat = os.stat(repo / "build" / "compile.sh")
+        os.utime(repo / "build" / "compile.sh", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        (repo / "build" / "copy.sh").write_text(SHELL_SCRIPT)
+        analyzed = []
+        original = migration_framework._analyze_file
+        monkeypatch.setattr(migration_framework, "_analyze_file",
+                            lambda path, script_type: analyzed.append(path) or original(path, script_type))
+
+        scripts = framework(tmp_path).analyze_repository(repo)
+        assert analyzed == []
+        by_name = {script.name: script for script in scripts}
+        assert by_name["copy.sh"].functions == by_name["compile.sh"].functions == first[0].functions
+
+        # The refreshed size/mtime entries make the next run a pure fast-path hit
+        monkeypatch.setattr(migration_framework, "_hash_file", lambda path: pytest.fail(f"hashed {path}"))
+        assert len(framework(tmp_path).analyze_repository(repo)) == 3
+
+    def test_changed_content_is_reanalyzed(self, tmp_path, repo):
+        framework(tmp_path).analyze_repository(repo)
+        (repo / "build" / "compile.sh").write_text(SHELL_SCRIPT.replace("build", "compile"))
+
+        scripts = framework(tmp_path).analyze_repository(repo)
+        assert {script.name: script.functions for script in scripts}["compile.sh"] == ["compile"]
+
+
+class TestMigrateAll:
+    """Test cases for MigrationFramework.migrate_all."""
+
+    def test_scripts_with_the_same_target_are_not_raced(self, tmp_path, repo):
+        (repo / "release" / "compile.sh").write_text(SHELL_SCRIPT.replace("make -j4 all", "make release"))
+        migration = framework(tmp_path, preserve_structure=False, jobs=4)
+        scripts = migration.analyze_repository(repo)
+
+        results = migration.migrate_all()
+
+        assert (results["completed"], results["failed"]) == (2, 1)
+        statuses = {str(script.path.relative_to(repo)): script.migration_status for script in scripts}
+        assert statuses == {"build/compile.sh": "completed", "release/compile.sh": "failed",
+                            "release/publish.sh": "completed"}
+        failed = next(script for script in scripts if script.migration_status == "failed")
+        assert "build/compile.sh" in failed.migration_notes
+        assert sorted(path.name for path in (tmp_path / "out").glob("*.py")) == ["compile.py", "publish.py"]
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for harness output parsing, test scheduling and the test watchdog of scripts/conan/openssl_builder.py.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "scripts" / "conan"))
+
+import openssl_builder
+from openssl_builder import HarnessOutputParser, OpenSSLBuilder, RecipeResult
+
+# Captured `make test` output (HARNESS_JOBS=4, HARNESS_TIMER=1), with a
+# progress line overwritten by \r, a duplicated result and truncated lines
+HARNESS_OUTPUT = """make depend && make _tests
+make[1]: Entering directory '/src/openssl'
+( SRCTOP=. BLDTOP=. PERL="perl" EXE_EXT= perl ./test/run_tests.pl  )
+[12:01:02] 01-test_abort.t .................... ok      120 ms
+[12:01:02] 00-prep_fipsmodule_cnf.t ........... skipped: FIPS module config file only supported in a fips build
+03-test_internal_asn1.t .. 1/1 \r03-test_internal_asn1.t ............ ok
+[12:01:05] 05-test_bf.t ..................... skipped: bf is not supported by this OpenSSL build
+[12:01:06] 80-test_ssl_new.t .................. Dubious, test returned 1 (wstat 256, 0x100)
+[12:01:06] 80-test_ssl_new.t .................. Failed 1/30 subtests
+[12:01:07] 90-test_store.t ....
+[12:01:08] 90-test_sto
+[12:01:09] 70-test_tls13messages.t ............ ok     4521 ms
+Test Summary Report
+-------------------
+80-test_ssl_new.t                 (Wstat: 256 (exited 1) Tests: 30 Failed: 1)
+  Failed test:  12
+Files=6, Tests=120, 31 wallclock secs
+Result: FAIL
+"""
+
+
+@pytest.fixture
+def builder(tmp_path):
+    recipes = tmp_path / "openssl-source" / "test" / "recipes"
+    recipes.mkdir(parents=True)
+    for name in ("01-test_abort", "15-test_rsa", "70-test_tls13messages", "80-test_ssl_new", "90-test_store"):
+        (recipes / f"{name}.t").write_text("")
+    return OpenSSLBuilder(None, config_dir=tmp_path / "build", openssl_dir=tmp_path / "openssl-source",
+                          test=True, track_db=False, test_jobs=4)
+
+
+def fake_make_test(monkeypatch, script):
+    """Run `script` with Python instead of `make test`"""
+    popen = subprocess.Popen
+    monkeypatch.setattr(openssl_builder.subprocess, "Popen",
+                        lambda command, **kwargs: popen([sys.executable, "-c", script], **kwargs))
+
+
+class TestHarnessOutputParser:
+    """Test cases for HarnessOutputParser."""
+
+    def test_captured_output(self):
+        parser = HarnessOutputParser()
+        results = [result for line in HARNESS_OUTPUT.splitlines(True) if (result := parser.feed(line))]
+
+        assert results == [
+            RecipeResult("01-test_abort", "passed", 120),
+            RecipeResult("00-prep_fipsmodule_cnf", "skipped", None),
+            RecipeResult("03-test_internal_asn1", "passed", None),
+            RecipeResult("05-test_bf", "skipped", None),
+            RecipeResult("80-test_ssl_new", "failed", None),
+            RecipeResult("70-test_tls13messages", "passed", 4521),
+        ]
+
+    def test_partial_and_garbled_lines(self):
+        parser = HarnessOutputParser()
+        for line in ("01-test_abort.t ....", "01-test_abort.t", "test_abort.t ...... ok", "1-test_x.t .... ok",
+                     "[12:01] 02-test_y.t ..... pending", "", "\r\r"):
+            assert parser.feed(line) is None
+        # A truncated line does not hide the recipe's later result
+        assert parser.feed("02-test_y.t ..... ok\n") == RecipeResult("02-test_y", "passed", None)
+
+    def test_gap_durations_in_serial_runs(self, monkeypatch):
+        clock = iter([100.0, 100.25])
+        monkeypatch.setattr(openssl_builder.time, "monotonic", lambda: next(clock))
+        parser = HarnessOutputParser()
+        assert parser.feed("01-test_abort.t .... ok", measure_gaps=True).duration_ms == 250
+
+
+class TestRunTests:
+    """Test cases for OpenSSLBuilder._run_tests."""
+
+    def test_results_and_timings(self, builder, monkeypatch):
+        fake_make_test(monkeypatch, f"import sys; sys.stdout.write({HARNESS_OUTPUT!r}); sys.exit(1)")
+
+        results = builder._run_tests()
+
+        assert (results.total, results.passed, results.failed, results.skipped) == (6, 3, 1, 2)
+        assert results.failed_recipes == ["80-test_ssl_new"]
+        timings = json.loads(builder.test_timings_file.read_text())
+        assert timings == {"01-test_abort": 120, "70-test_tls13messages": 4521}
+
+    def test_slowest_recipes_are_scheduled_first(self, builder, monkeypatch):
+        builder.test_timings_file.parent.mkdir(parents=True)
+        builder.test_timings_file.write_text(json.dumps(
+            {"01-test_abort": 120, "15-test_rsa": 900, "70-test_tls13messages": 4521, "90-test_store": 15}))
+        assert builder._schedule_tests() == "test_ssl_new test_tls13messages test_rsa test_abort test_store"
+
+        environments = []
+        popen = subprocess.Popen
+
+        def capture(command, **kwargs):
+            environments.append(kwargs["env"])
+            return popen([sys.executable, "-c", "pass"], **kwargs)
+
+        monkeypatch.setattr(openssl_builder.subprocess, "Popen", capture)
+        monkeypatch.delenv("TESTS", raising=False)
+        builder._run_tests()
+        assert environments[0]["TESTS"] == builder._schedule_tests()
+        assert environments[0]["HARNESS_JOBS"] == "4"
+
+    def test_no_schedule_without_history(self, builder):
+        assert builder._schedule_tests() is None
+
+    def test_watchdog_kills_hanging_tests(self, builder, monkeypatch):
+        """A hung recipe is killed with the whole harness, and counted as a failure."""
+        monkeypatch.setattr(builder, "TEST_TIMEOUT", 1)
+        fake_make_test(monkeypatch, (
+            "import subprocess, sys, time\n"
+            "print('01-test_abort.t .... ok   5 ms', flush=True)\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        ))
+
+        start = time.monotonic()
+        results = builder._run_tests()
+
+        assert time.monotonic() - start < 10
+        assert (results.total, results.passed, results.failed) == (2, 1, 1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming process runner.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.util.execute_command import execute_command
+from openssl_tools.util.process_runner import run_process
+
+# Writes more than a pipe buffer to both streams, interleaved
+NOISY = (
+    "import sys\n"
+    "for i in range(20000):\n"
+    "    print(f'out {i}')\n"
+    "    print(f'err {i}', file=sys.stderr)\n"
+    "sys.exit(3)\n"
+)
+
+
+class TestRunProcess:
+    """Test cases for run_process."""
+
+    def test_both_pipes_drained_with_bounded_tail(self):
+        """Heavy output on both pipes neither deadlocks nor is retained in full."""
+        seen = {'stdout': 0, 'stderr': 0}
+        result = run_process([sys.executable, '-c', NOISY], echo_stdout=False, echo_stderr=False,
+                             tail_lines=5, on_line=lambda stream, line: seen.__setitem__(stream, seen[stream] + 1))
+
+        assert result.returncode == 3
+        assert seen == {'stdout': 20000, 'stderr': 20000}
+        assert result.stdout == []
+        assert result.stdout_tail == [f'out {i}' for i in range(19995, 20000)]
+        assert result.stderr_tail[-1] == 'err 19999'
+        assert 'STDERR (tail):' in result.error_report
+
+    def test_echo_keep_stdout_and_rotating_log(self, tmp_path, capsys):
+        """Lines are echoed, optionally kept, and teed to a rotating log file."""
+        log_file = tmp_path / 'logs' / 'command.log'
+        script = "import sys\nprint('hello')\nprint('warning', file=sys.stderr)\n"
+        result = run_process([sys.executable, '-c', script], log_file=log_file, keep_stdout=True)
+
+        captured = capsys.readouterr()
+        assert (result.returncode, result.stdout) == (0, ['hello'])
+        assert captured.out == 'hello\n'
+        assert captured.err == 'warning\n'
+        logged = log_file.read_text()
+        assert 'stdout hello' in logged and 'stderr warning' in logged and 'exit code 0' in logged
+
+        for _ in range(3):
+            run_process([sys.executable, '-c', NOISY], echo_stdout=False, echo_stderr=False,
+                        log_file=log_file, log_max_bytes=100_000, log_backup_count=2)
+        assert sorted(p.name for p in log_file.parent.iterdir()) == [
+            'command.log', 'command.log.1', 'command.log.2'
+        ]
+
+    def test_timeout_kills_process(self):
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_process([sys.executable, '-c', 'import time; time.sleep(30)'], timeout=0.5)
+
+    def test_execute_command_returns_stdout_lines(self, capsys):
+        rc, output = execute_command('echo first; echo second', print_command=False)
+        assert (rc, output) == (0, ['first', 'second'])
+        assert capsys.readouterr().out == 'first\nsecond\n'
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process Conan remote metadata index.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.development.package_management.remote_index import RemoteMetadataIndex
+
+
+class FakeRemote:
+    """Answers `conan list` like a remote holding `recipes` (ref -> {revision: timestamp})."""
+
+    def __init__(self, recipes):
+        self.recipes = recipes
+        self.calls = []
+
+    def __call__(self, args):
+        self.calls.append(args)
+        pattern = args[1]
+        listing = {}
+        for ref, revisions in self.recipes.items():
+            if pattern == "*#latest":
+                revision = max(revisions, key=revisions.get)
+                revisions = {revision: revisions[revision]}
+            listing[ref] = {"revisions": {rev: {"timestamp": ts} for rev, ts in revisions.items()}}
+        return json.dumps({"staging": listing})
+
+
+@pytest.fixture
+def remote():
+    return FakeRemote({
+        "openssl/3.0.13": {"a1": 100.0},
+        "openssl/3.5.0": {"b1": 200.0, "b2": 300.0},
+        "openssl/3.10.0@ci/stable": {"c1": 150.0},
+        "zlib/1.3": {"z1": 50.0},
+    })
+
+
+class TestRemoteMetadataIndex:
+    """Test cases for RemoteMetadataIndex."""
+
+    def test_queries_answered_in_process(self, remote):
+        """One listing populates the index; later queries spawn nothing."""
+        index = RemoteMetadataIndex("staging", max_age=None, runner=remote)
+
+        assert [p["version"] for p in index.search("openssl")] == ["3.0.13", "3.10.0", "3.5.0"]
+        assert [p["reference"] for p in index.search("openssl/3.5*")] == ["openssl/3.5.0"]
+        assert [p["name"] for p in index.search("*")] == ["openssl"] * 3 + ["zlib"]
+        assert index.latest_version("openssl") == "3.10.0"
+        assert index.latest_version("libpng") is None
+        info = index.info("openssl/3.5.0")
+        assert (info["revision"], info["timestamp"], info["revisions"]) == ("b2", 300.0, 2)
+        assert index.info("openssl/3.5.0#b1")["timestamp"] == 200.0
+        assert index.info("openssl/3.5.0#zz") is None
+        assert index.info("openssl/9.9") is None
+        assert remote.calls == [["list", "*#*", "--format=json", "-r", "staging"]]
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            index.info("openssl/3.5.0")
+            index.latest_version("openssl")
+        assert (time.perf_counter() - start) / 2000 < 0.001
+
+    def test_incremental_refresh(self, remote):
+        """Stale indexes merge the latest revisions and drop deleted recipes."""
+        index = RemoteMetadataIndex("staging", max_age=0, runner=remote)
+        index.refresh()
+        remote.recipes["zlib/1.3"]["z2"] = 400.0
+        remote.recipes["libpng/1.6"] = {"p1": 10.0}
+        del remote.recipes["openssl/3.0.13"]
+
+        assert index.refresh() == 2
+        assert remote.calls[-1][1] == "*#latest"
+        zlib = index.info("zlib/1.3")
+        assert (zlib["revision"], zlib["revisions"]) == ("z2", 2)
+        assert index.info("openssl/3.0.13") is None
+        assert index.info("openssl/3.5.0")["revisions"] == 2  # unchanged history kept
+
+    def test_persisted_index_is_reused(self, remote, tmp_path):
+        """A saved index serves queries in a new process without listing the remote again."""
+        cache = tmp_path / "staging.json"
+        RemoteMetadataIndex("staging", runner=remote).refresh()
+        RemoteMetadataIndex("staging", cache_path=cache, runner=remote).refresh()
+        calls = len(remote.calls)
+
+        index = RemoteMetadataIndex("staging", max_age=60, cache_path=cache, runner=remote)
+        assert index.latest_version("zlib") == "1.3"
+        assert len(remote.calls) == calls
+
+    def test_invalidate_forces_incremental_refresh(self, remote, tmp_path):
+        """An invalidated index refreshes on its next query, also when reloaded from disk."""
+        cache = tmp_path / "staging.json"
+        index = RemoteMetadataIndex("staging", max_age=None, cache_path=cache, runner=remote)
+        index.refresh()
+        remote.recipes["zlib/1.3"]["z2"] = 400.0
+
+        index.invalidate()
+        reloaded = RemoteMetadataIndex("staging", max_age=None, cache_path=cache, runner=remote)
+
+        assert index.info("zlib/1.3")["revision"] == "z2"
+        assert remote.calls[-1][1] == "*#latest"
+        assert reloaded.info("zlib/1.3")["revision"] == "z2"
+        assert len(remote.calls) == 3
+
+
+class TestUploadInvalidatesIndex:
+    """Uploads through the managers invalidate the uploaded remote's index."""
+
+    def test_remote_manager_upload(self, remote, monkeypatch):
+        from openssl_tools.development.package_management import remote_manager
+
+        manager = remote_manager.ConanRemoteManager(index_max_age=None)
+        manager._indexes["staging"] = RemoteMetadataIndex("staging", max_age=None, runner=remote)
+        manager.remote_index("staging").refresh()
+        monkeypatch.setattr(remote_manager.subprocess, "run", lambda cmd, check: None)
+
+        assert manager.upload_packages(["zlib/1.3"], remote="staging")
+        assert manager.remote_index("staging").updated_at == 0.0
+
+    def test_registry_manager_upload(self, remote, monkeypatch):
+        from openssl_tools.development.package_management import registry_manager
+
+        class Revisions:
+            def present(self, registry, references):
+                return set()
+
+        monkeypatch.setattr(registry_manager, "ConanRevisionIndex", Revisions)
+        monkeypatch.setattr(registry_manager, "conan_package_bytes", lambda reference: 1)
+        manager = registry_manager.PackageRegistryManager(index_max_age=None)
+        monkeypatch.setattr(manager, "configure_registry", lambda name: True)
+        monkeypatch.setattr(manager, "upload_package", lambda ref, name, force: name == "artifactory")
+        for name in ("artifactory", "conan-center"):
+            manager._indexes[name] = RemoteMetadataIndex(name, max_age=None, runner=remote)
+            manager._indexes[name].refresh()
+
+        results = manager.upload_to_all_registries("zlib/1.3", ["artifactory", "conan-center"], retries=1)
+
+        assert results == {"artifactory": True, "conan-center": False}
+        assert manager._indexes["artifactory"].updated_at == 0.0
+        assert manager._indexes["conan-center"].updated_at > 0
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests pinning the single-pass rewrite engine and the script converter's rule tables.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "openssl-migration"))
+
+from core.rewrite_engine import LINE_START, RewriteRule, RuleTable
+from core.script_converter import PERL_RULES, SHELL_RULES, ScriptConverter
+
+SHELL_SCRIPT = """#!/bin/bash
+build_all() {
+    cd $BUILD_DIR
+    if [ -f ${CONFIG} ]; then
+        echo "Using $CONFIG"
+    fi
+    for arch in $ARCHS; do
+        mkdir out_$arch
+    done
+    VERSION=$(git describe --tags)
+    echo $VERSION
+    cp libssl.a $DEST
+    rm tmpfile
+    pwd
+}
+"""
+
+SHELL_CONVERTED = """def build_all():
+    os.chdir("BUILD_DIR")
+    if  Path("CONFIG").is_file() :; then
+        print("Using CONFIG")
+    fi
+    for arch in ARCHS:; do
+        Path("out_").mkdir(parents=True, exist_ok=True)arch
+    done
+    VERSION=subprocess.check_output("git describe --tags", shell=True, text=True).strip()
+    print(VERSION)
+    cp libssl.a DEST
+    Path("tmpfile").unlink()
+    os.getcwd()
+}
+"""
+
+PERL_SCRIPT = """#!/usr/bin/perl
+use strict;
+use File::Copy;
+use Foo::Bar;
+sub configure {
+    my @args = @_;
+    if (-f $config) {
+        open(FH, "config.txt");
+    } elsif (-d $dir) {
+        close(FH);
+    }
+    for (my $i = 0; $i < $n; $i++) {
+        read(FH, $buf, 1024);
+        write(OUT, $buf);
+    }
+}
+"""
+
+PERL_CONVERTED = """import strict;
+import shutil;
+import foo.bar;
+def configure(): {
+    my args = _;
+    if Path("config").is_file(): {
+        FH = open("config.txt", "r");
+    } elif Path("dir").is_dir(): {
+        FH.close();
+    }
+    for i < n: {
+        buf = FH.read(1024);
+        OUT.write(buf);
+    }
+}
+"""
+
+BATCH_SCRIPT = """@echo off
+set BUILD_DIR=%~dp0build
+if exist %BUILD_DIR% rmdir /s /q %BUILD_DIR%
+mkdir %BUILD_DIR%
+"""
+
+
+class TestRuleTable:
+    """Test cases for RuleTable rule precedence and triggers."""
+
+    def test_first_matching_rule_wins(self):
+        table = RuleTable([
+            RewriteRule('specific', '$', r'\$HOME', 'home()'),
+            RewriteRule('generic', '$', r'\$(\w+)', r'env("\1")'),
+            RewriteRule('never', '$', r'\$(\w+)', 'unreachable'),
+        ])
+        assert table.rewrite('$HOME $HOMEDIR $PATH') == 'home() home()DIR env("PATH")'
+
+    def test_keyword_triggers_match_whole_words(self):
+        table = RuleTable([RewriteRule('rm', 'rm', r'rm[ \t]+(\w+)', r'unlink("\1")')])
+        assert table.rewrite('rm a; rmdir b; xrm c; rm_all d') == 'unlink("a"); rmdir b; xrm c; rm_all d'
+
+    def test_line_start_rules_take_precedence(self):
+        table = RuleTable([
+            RewriteRule('word', 'def', r'def', 'DEF'),
+            RewriteRule('definition', LINE_START, r'def (\w+)', r'function \1'),
+        ], flags=re.MULTILINE)
+        assert table.rewrite('def f\n  def g\nx def') == 'function f\n  DEF g\nx DEF'
+
+    def test_no_match_returns_text_unchanged(self):
+        table = RuleTable([RewriteRule('variable', '$', r'\$(\w+)', r'\1')])
+        text = 'cost: $ 5'
+        assert table.rewrite(text) is text
+
+
+class TestScriptConverterOutput:
+    """Pinned conversions of representative scripts."""
+
+    def test_shell_script(self):
+        converter = ScriptConverter()
+        assert converter.convert_shell_script(SHELL_SCRIPT, 'build.sh') == (
+            converter._generate_python_wrapper(SHELL_CONVERTED, 'build.sh', 'shell')
+        )
+
+    def test_perl_script(self):
+        converter = ScriptConverter()
+        assert converter.convert_perl_script(PERL_SCRIPT, 'configure.pl') == (
+            converter._generate_python_wrapper(PERL_CONVERTED, 'configure.pl', 'perl')
+        )
+
+    def test_overlapping_shell_rules(self):
+        # echo_string and echo_variable share the echo trigger; keywords only match whole words
+        assert SHELL_RULES.rewrite('echo $HOME\necho "$HOME"\nrmdir x\nechoes foo\nwithcd dir\n') == (
+            'print(HOME)\nprint("HOME")\nrmdir x\nechoes foo\nwithcd dir\n'
+        )
+
+    def test_overlapping_perl_rules(self):
+        assert PERL_RULES.rewrite('subroutine x\nuser($x)\nmy %h; print @list;\n') == (
+            'subroutine x\nuser(x)\nmy h; print list;\n'
+        )
+
+    def test_streamed_file_matches_whole_text(self, tmp_path):
+        for name, script, converted in (('build.sh', SHELL_SCRIPT, SHELL_CONVERTED),
+                                        ('configure.pl', PERL_SCRIPT, PERL_CONVERTED)):
+            source = tmp_path / name
+            source.write_text(script)
+            target = ScriptConverter().convert_file(source, tmp_path / 'out' / f'{source.stem}.py')
+            head, tail = ScriptConverter()._wrapper_parts(name, ScriptConverter.detect_script_type(source))
+            assert target.read_text() == head + converted + tail
+
+    def test_batch_scripts_are_not_converted(self, tmp_path):
+        """There are no batch rules: .bat/.cmd files are rejected rather than mangled."""
+        source = tmp_path / 'build.bat'
+        source.write_text(BATCH_SCRIPT)
+        assert ScriptConverter.detect_script_type(source) is None
+        with pytest.raises(ValueError, match='Cannot convert None script'):
+            ScriptConverter().convert_file(source, tmp_path / 'build.py')
+        assert not (tmp_path / 'build.py').exists()
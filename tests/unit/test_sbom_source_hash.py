@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental Merkle source hash in scripts/sbom_generator.py.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "scripts"))
+
+import sbom_generator
+from sbom_generator import SBOMGenerator
+
+
+@pytest.fixture
+def project(tmp_path):
+    for i in range(20):
+        (tmp_path / 'crypto' / 'aes').mkdir(parents=True, exist_ok=True)
+        (tmp_path / 'ssl').mkdir(exist_ok=True)
+        (tmp_path / 'crypto' / 'aes' / f'aes{i}.c').write_text(f'int aes{i};\n')
+        (tmp_path / 'ssl' / f'ssl{i}.h').write_text(f'int ssl{i};\n')
+    (tmp_path / 'README.md').write_text('not a source file\n')
+    (tmp_path / 'conanfile.py').write_text('')
+    return tmp_path
+
+
+def source_tree(project):
+    return SBOMGenerator(str(project / 'conanfile.py'), jobs=4)._source_hash_tree()
+
+
+class TestSourceHashTree:
+    """Test cases for SBOMGenerator._source_hash_tree."""
+
+    def test_leaves_and_root(self, project):
+        root, files = source_tree(project)
+        assert len(files) == 40
+        assert files['ssl/ssl3.h'] == sbom_generator._hash_file(str(project / 'ssl' / 'ssl3.h'))
+        assert root == source_tree(project)[0]
+
+    def test_only_changed_files_are_rehashed(self, project, monkeypatch):
+        root, _ = source_tree(project)
+        (project / 'crypto' / 'aes' / 'aes7.c').write_text('int changed;\n')
+        hashed = []
+        original = sbom_generator._hash_file
+        monkeypatch.setattr(sbom_generator, '_hash_file', lambda path: hashed.append(path) or original(path))
+
+        new_root, files = source_tree(project)
+
+        assert hashed == [str(project / 'crypto' / 'aes' / 'aes7.c')]
+        assert new_root != root
+        (project / '.sbom-source-hashes.json').unlink()
+        assert source_tree(project)[0] == new_root  # cache never changes the result
+
+    def test_file_hashes_in_sbom_components(self, project):
+        component = SBOMGenerator(str(project / 'conanfile.py'))._get_main_component()
+        names = [c['name'] for c in component['components']]
+        assert names == sorted(names) and 'crypto/aes/aes0.c' in names
+        assert component['hashes'][0]['content'] == source_tree(project)[0]
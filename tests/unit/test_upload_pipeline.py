@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent multi-registry upload pipeline.
+"""
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.deployment import upload_pipeline
+from openssl_tools.automation.deployment.upload_pipeline import (
+    ConanRevisionIndex,
+    UploadPipeline,
+    upload_stats_entries,
+)
+
+
+class ConcurrencyProbe:
+    """Fake uploader that tracks the peak number of in-flight uploads per registry."""
+
+    def __init__(self, delay=0.05, failures=None):
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.active = {}
+        self.peak = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, reference, registry):
+        with self.lock:
+            self.calls.append((reference, registry))
+            self.active[registry] = self.active.get(registry, 0) + 1
+            self.peak[registry] = max(self.peak.get(registry, 0), self.active[registry])
+            fail = self.failures.get((reference, registry), 0)
+            if fail:
+                self.failures[(reference, registry)] = fail - 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[registry] -= 1
+        if fail:
+            raise RuntimeError("connection reset")
+
+
+class TestUploadPipeline:
+    """Test cases for UploadPipeline."""
+
+    def test_fan_out_respects_registry_limits(self):
+        """Registries upload in parallel, each within its own concurrency limit."""
+        probe = ConcurrencyProbe()
+        pipeline = UploadPipeline(probe, size_fn=lambda reference: 1_000_000,
+                                  registry_limits={'artifactory': 3, 'github': 1}, log=lambda *a: None)
+        components = [f'pkg{i}' for i in range(6)]
+
+        start = time.monotonic()
+        results = pipeline.run(components, ['artifactory', 'github'])
+        elapsed = time.monotonic() - start
+
+        assert [(r.component, r.registry) for r in results] == [
+            (c, r) for c in components for r in ['artifactory', 'github']
+        ]
+        assert all(r.status == 'success' and r.attempts == 1 for r in results)
+        assert probe.peak == {'artifactory': 3, 'github': 1}
+        assert elapsed < 12 * probe.delay  # serial would take 12 delays
+        assert all(r.bytes == 1_000_000 and r.throughput_bytes_per_s > 0 for r in results)
+
+    def test_retries_with_exponential_backoff(self):
+        """Transient failures are retried with doubling delays; persistent ones reported."""
+        probe = ConcurrencyProbe(delay=0, failures={('a', 'r'): 2, ('b', 'r'): 5})
+        sleeps = []
+        pipeline = UploadPipeline(probe, retries=3, backoff=0.5, log=lambda *a: None, sleep=sleeps.append)
+
+        a, b = pipeline.run(['a', 'b'], ['r'])
+
+        assert (a.status, a.attempts) == ('success', 3)
+        assert (b.status, b.attempts, b.error) == ('failed', 3, 'connection reset')
+        assert sorted(sleeps) == [0.5, 0.5, 1.0, 1.0]
+
+    def test_existing_revisions_are_skipped(self):
+        """One batched existence query per registry; present references are not uploaded."""
+        probe = ConcurrencyProbe(delay=0)
+        queries = []
+
+        def exists(registry, references):
+            queries.append((registry, tuple(references)))
+            return {'a'} if registry == 'r1' else set()
+
+        results = UploadPipeline(probe, exists_fn=exists, log=lambda *a: None).run(['a', 'b'], ['r1', 'r2'])
+
+        assert sorted(queries) == [('r1', ('a', 'b')), ('r2', ('a', 'b'))]
+        assert sorted(probe.calls) == [('a', 'r2'), ('b', 'r1'), ('b', 'r2')]
+        assert [r.status for r in results] == ['skipped', 'success', 'success', 'success']
+        assert upload_stats_entries(results)[0] == {
+            'component': 'a', 'registry': 'r1', 'status': 'skipped', 'attempts': 0,
+            'duration': 0.0, 'timestamp': results[0].timestamp
+        }
+
+    def test_first_upload_of_a_reference_runs_alone(self):
+        """Uploads of one reference wait for its first success, then fan out to the other registries."""
+        state = {'active': 0, 'succeeded': 0}
+        starts = []
+        lock = threading.Lock()
+
+        def upload(reference, registry):
+            with lock:
+                state['active'] += 1
+                starts.append((state['succeeded'], state['active']))
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+                if registry == 'broken':
+                    raise RuntimeError('connection reset')
+                state['succeeded'] += 1
+
+        registries = ['broken', 'r1', 'r2', 'r3']
+        results = UploadPipeline(upload, retries=1, log=lambda *a: None).run(['a'], registries)
+
+        assert [r.status for r in results] == ['failed', 'success', 'success', 'success']
+        assert all(active == 1 for succeeded, active in starts if succeeded == 0)
+        assert max(active for succeeded, active in starts if succeeded > 0) > 1
+
+
+def package(*prevs):
+    return {'revisions': {prev: {} for prev in prevs}}
+
+
+def test_revision_index_uses_one_list_per_remote(monkeypatch):
+    """Local and remote revisions come from a single `conan list` call each."""
+    listings = {
+        None: {'Local Cache': {
+            'openssl-ssl/3.2.0': {'revisions': {'r2': {'packages': {'p1': package('b1')}}}},
+            'openssl-crypto/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b1')}}}},
+            'openssl-fips/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b1'), 'p2': package('b2')}}}},
+            'openssl-tools/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b2')}}}},
+        }},
+        'artifactory': {'artifactory': {
+            'openssl-crypto/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b1', 'b0')}}, 'r0': {}}},
+            'openssl-ssl/3.2.0': {'revisions': {'r1': {}}},
+            # Same recipe revision, but a binary built for a new profile is missing
+            'openssl-fips/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b1')}}}},
+            # Same package id, rebuilt into a new package revision locally
+            'openssl-tools/3.2.0': {'revisions': {'r1': {'packages': {'p1': package('b1')}}}},
+            'openssl-other/1.0': {'revisions': {'r9': {}}},
+        }},
+    }
+    commands = []
+
+    def fake_run(command, **kwargs):
+        commands.append(command)
+        remote = command[command.index('-r') + 1] if '-r' in command else None
+        return subprocess.CompletedProcess(command, 0, stdout=json.dumps(listings[remote]))
+
+    monkeypatch.setattr(upload_pipeline.subprocess, 'run', fake_run)
+    references = ['openssl-crypto/3.2.0', 'openssl-ssl/3.2.0', 'openssl-fips/3.2.0', 'openssl-tools/3.2.0']
+
+    assert ConanRevisionIndex().present('artifactory', references) == {'openssl-crypto/3.2.0'}
+    assert [c[2] for c in commands] == ['openssl-*/*#*:*#*', 'openssl-*/*#*:*#*']
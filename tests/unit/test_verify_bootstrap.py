@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel bootstrap verification timings and the shared download cache.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), project_root / "scripts" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+verify_bootstrap = load_script("verify-bootstrap")
+conan_init = load_script("openssl-conan-init")
+
+
+def timing(start, end, worker, passed=True):
+    return {"passed": passed, "start": start, "end": end, "duration": end - start, "worker": worker}
+
+
+class TestBootstrapVerifierTiming:
+    """Test cases for the critical path and timing report."""
+
+    def test_critical_path_follows_last_worker(self):
+        verifier = verify_bootstrap.BootstrapVerifier()
+        verifier.timings = {
+            "seed_cache": timing(0, 2, 1),
+            "cross_platform": timing(2, 12, 10),
+            "hardening": timing(12, 13, 10),
+            "idempotency": timing(2, 9, 11),
+            "rollback_mechanisms": timing(9, 15, 11),
+        }
+
+        assert verifier._critical_path() == ["seed_cache", "idempotency", "rollback_mechanisms"]
+
+        verifier.critical_path = verifier._critical_path()
+        report = verifier.generate_report({"idempotency": True, "rollback_mechanisms": False})
+        assert "| cross_platform | 10.0s | +2.0s |" in report
+        assert "**Wall Clock**: 15.0s (serial: 26.0s)" in report
+        assert "seed_cache → idempotency → rollback_mechanisms (15.0s)" in report
+
+    def test_scenarios_are_isolated(self, tmp_path):
+        verifier = verify_bootstrap.BootstrapVerifier(work_root=tmp_path / "root", cache_dir=tmp_path / "cache")
+        (tmp_path / "root").mkdir()
+        env = verifier._scenario_env()
+
+        assert verifier.create_temp_dir().parent == tmp_path / "root"
+        assert env["CONAN_HOME"] == str(tmp_path / "root" / ".conan2")
+        assert env["PIP_FIND_LINKS"] == str(tmp_path / "cache")
+
+
+class TestDownloadCache:
+    """Test cases for the bootstrap's read-only download cache."""
+
+    def test_fetch_prefers_cache(self, tmp_path, monkeypatch):
+        cache = tmp_path / "cache"
+        cache.mkdir()
+        (cache / "requests-2.31.0.tar.gz").write_bytes(b"cached")
+        config = conan_init.BootstrapConfig(platform="linux", arch="x86_64", compiler="gcc11", cache_dir=cache)
+        resolver = conan_init.DependencyResolver(config)
+        downloads = []
+        monkeypatch.setattr(conan_init.urllib.request, "urlretrieve",
+                            lambda url, path: downloads.append(url) or Path(path).write_bytes(b"fresh"))
+
+        resolver._fetch(resolver.dependencies["requests"]["url"], str(tmp_path / "requests.tar.gz"))
+        resolver._fetch(resolver.dependencies["pyyaml"]["url"], str(tmp_path / "pyyaml.tar.gz"))
+
+        assert (tmp_path / "requests.tar.gz").read_bytes() == b"cached"
+        assert downloads == [resolver.dependencies["pyyaml"]["url"]]
+
+        seeded = resolver.seed_cache(cache)
+        assert len(seeded) == 3 and all(path.is_file() for path in seeded)
+        assert len(downloads) == 3  # requests was already cached
+        assert not list(cache.glob("*.part"))
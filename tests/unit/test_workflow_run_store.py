@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the workflow run time-series store and incremental health syncs.
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("yaml")
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from openssl_tools.automation.workflow_management.health_check import WorkflowHealthChecker
+from openssl_tools.automation.workflow_management.run_store import WorkflowRunStore
+
+DAY = 86400
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def make_run(run_id, created_at, conclusion='success', duration=600, queue=30, name='CI'):
+    return {
+        'id': run_id, 'name': name, 'status': 'completed' if conclusion else 'in_progress',
+        'conclusion': conclusion, 'created_at': iso(created_at),
+        'run_started_at': iso(created_at + queue), 'updated_at': iso(created_at + queue + duration),
+    }
+
+
+class FakeChecker(WorkflowHealthChecker):
+    """Health checker serving the GitHub API from memory, newest run first, recording calls."""
+
+    def __init__(self, runs, store):
+        super().__init__('openssl', 'openssl', token='t', store=store)
+        self.runs = runs
+        self.calls = []
+        self.fail_pages = set()
+
+    def _fetch(self, url, params=None):
+        path = url[len(self.base_url):]
+        if path == '/actions/runs':
+            page, limit = params['page'], params['per_page']
+            self.calls.append(('runs', page))
+            if page in self.fail_pages:
+                raise requests.ConnectionError('connection reset')
+            ordered = sorted(self.runs.values(), key=lambda run: run['id'], reverse=True)
+            return {'workflow_runs': ordered[(page - 1) * limit:page * limit]}
+        run_id = int(path.split('/')[3])
+        if path.endswith('/jobs'):
+            self.calls.append(('jobs', run_id))
+            return {'jobs': [
+                {'id': run_id * 10, 'name': 'build', 'status': 'completed', 'conclusion': 'failure'},
+                {'id': run_id * 10 + 1, 'name': 'test', 'status': 'completed', 'conclusion': 'success'},
+            ]}
+        self.calls.append(('run', run_id))
+        return self.runs[run_id]
+
+
+class TestWorkflowRunStore:
+    """Test cases for WorkflowRunStore rollups."""
+
+    def test_daily_rollups(self):
+        store = WorkflowRunStore()
+        base = time.time() - 2 * DAY
+        store.record_runs([
+            make_run(1, base, duration=100, queue=10),
+            make_run(2, base + 60, duration=300, queue=20),
+            make_run(3, base + 120, conclusion='failure', duration=200, queue=30),
+            make_run(4, base + 180, conclusion=None, queue=40),
+            make_run(5, base + DAY, duration=50, name='Docs'),
+        ])
+
+        ci = store.daily_rollups(base, workflow='CI')
+        assert len(ci) == 1
+        assert (ci[0]['runs'], ci[0]['completed'], ci[0]['failed'], ci[0]['in_progress']) == (4, 3, 1, 1)
+        assert ci[0]['success_rate'] == pytest.approx(200 / 3)
+        assert (ci[0]['duration_p50'], ci[0]['duration_p95']) == (200, 300)
+        assert (ci[0]['queue_p50'], ci[0]['queue_p95']) == (20, 40)
+
+        # A run completing later updates its day's rollup
+        store.record_runs([make_run(4, base + 180, conclusion='success', duration=400, queue=40)])
+        ci = store.daily_rollups(base, workflow='CI')[0]
+        assert (ci['completed'], ci['in_progress'], ci['duration_p95']) == (4, 0, 400)
+
+        metrics = store.health_metrics(base)
+        assert metrics['total_runs'] == 5 and metrics['failed_runs'] == 1
+        assert metrics['success_rate'] == pytest.approx(80.0)
+        assert set(metrics['workflows']) == {'CI', 'Docs'}
+        assert store.health_metrics(base + DAY)['total_runs'] == 1
+
+
+class TestIncrementalSync:
+    """Test cases for WorkflowHealthChecker syncing into the run store."""
+
+    def test_only_new_and_pending_runs_are_fetched(self, tmp_path):
+        now = time.time()
+        runs = {i: make_run(i, now - (300 - i) * 3600, conclusion='failure' if i % 50 == 0 else 'success')
+                for i in range(1, 251)}
+        runs[250] = make_run(250, now - 3600, conclusion=None)
+        checker = FakeChecker(runs, WorkflowRunStore(tmp_path / 'runs.db'))
+
+        metrics = checker.analyze_workflow_health(days_back=30)
+        assert metrics['total_runs'] == 250
+        assert metrics['in_progress_runs'] == 1
+        assert metrics['failure_patterns'] == {'build': 4}
+        assert [call for call in checker.calls if call[0] == 'runs'] == [('runs', 1), ('runs', 2), ('runs', 3)]
+
+        # Second sync: one new run, the pending run has completed
+        checker.calls = []
+        runs[250] = make_run(250, now - 3600, conclusion='failure')
+        runs[251] = make_run(251, now - 60)
+        metrics = checker.analyze_workflow_health(days_back=30)
+        assert metrics['total_runs'] == 251 and metrics['in_progress_runs'] == 0
+        assert metrics['failure_patterns'] == {'build': 5}
+        assert checker.calls == [('runs', 1), ('run', 250), ('jobs', 250)]
+
+    def test_failed_listing_keeps_sync_state(self, tmp_path):
+        """A listing interrupted by an API error records nothing, so the next sync fetches everything."""
+        now = time.time()
+        runs = {i: make_run(i, now - (300 - i) * 3600) for i in range(1, 251)}
+        checker = FakeChecker(runs, WorkflowRunStore(tmp_path / 'runs.db'))
+        checker.fail_pages = {2}
+
+        assert checker.sync_runs(days_back=30) == 0
+        assert checker.store.last_run_id() == 0 and checker.store.synced_since() is None
+
+        checker.fail_pages = set()
+        assert checker.analyze_workflow_health(days_back=30)['total_runs'] == 250
+
+    def test_ninety_day_report_is_fast(self, tmp_path):
+        now = time.time()
+        store = WorkflowRunStore(tmp_path / 'runs.db')
+        store.record_runs(make_run(i, now - i * 300, conclusion='failure' if i % 7 == 0 else 'success',
+                                   duration=300 + i % 900, name=f'wf{i % 8}')
+                          for i in range(1, 25000))
+        checker = FakeChecker({}, store)
+
+        start = time.monotonic()
+        report = checker.generate_health_report(days_back=90)
+        assert time.monotonic() - start < 1.0
+        assert '| wf3 |' in report and 'Duration p50 / p95' in report